@@ -4,7 +4,6 @@ from enum import Enum
 from pathlib import Path
 from typing import List
 
-import airr
 import pandas as pd
 
 from immuneML.IO.dataset_export.DataExporter import DataExporter
@@ -35,6 +34,8 @@ class AIRRExporter(DataExporter):
 
     @staticmethod
     def export(dataset: Dataset, path: Path, region_type=RegionType.IMGT_CDR3):
+        import airr
+
         PathBuilder.build(path)
 
         if isinstance(dataset, RepertoireDataset):
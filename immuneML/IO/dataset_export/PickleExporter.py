@@ -10,6 +10,7 @@ from typing import List
 import pandas as pd
 
 from immuneML.IO.dataset_export.DataExporter import DataExporter
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
@@ -106,5 +107,7 @@ class PickleExporter(DataExporter):
             if not new_file.is_file():
                 shutil.copyfile(old_file, new_file)
             return new_file
+        elif old_file is not None and ColumnarStorage.is_columnar(old_file):
+            return ColumnarStorage.copy(old_file, path / old_file.name)
         else:
             raise RuntimeError(f"{PickleExporter.__name__}: tried exporting file {old_file}, but it does not exist.")
@@ -1,4 +1,3 @@
-import airr
 import pandas as pd
 
 from immuneML.IO.dataset_import.DataImport import DataImport
@@ -61,6 +60,10 @@ class AIRRImport(DataImport):
         import_empty_aa_sequences (bool): imports sequences which have an empty amino acid sequence field; can be True or False; for analysis on
         amino acid sequences, this parameter should be False (import only non-empty amino acid sequences). By default, import_empty_aa_sequences is set to False.
 
+        import_chunk_size (int): if set, each repertoire file is read, preprocessed and stored in chunks of this many rows, so that the
+        memory needed to import a repertoire does not depend on the size of the file. This also applies to unpaired sequence datasets, where
+        the chunks are streamed into the dataset batch files. By default, the whole file is read at once.
+
         region_type (str): Which part of the sequence to import. By default, this value is set to IMGT_CDR3. This means the
         first and last amino acids are removed from the CDR3 sequence, as AIRR uses the IMGT junction. Specifying
         any other value will result in importing the sequences as they are.
@@ -113,6 +116,7 @@ class AIRRImport(DataImport):
                 import_illegal_characters: False # remove sequences with illegal characters for the sequence_type being used
                 import_empty_nt_sequences: True # keep sequences even if the `sequences` column is empty (provided that other fields are as specified here)
                 import_empty_aa_sequences: False # remove all sequences with empty `sequence_aas` column
+                import_chunk_size: 100000 # optional: read each repertoire file in chunks of this many rows to limit the memory usage
                 # Optional fields with AIRR-specific defaults, only change when different behavior is required:
                 separator: "\\t" # column separator
                 region_type: IMGT_CDR3 # what part of the sequence to import
@@ -177,15 +181,31 @@ class AIRRImport(DataImport):
 
     @staticmethod
     def alternative_load_func(filename, params):
+        import airr
         df = airr.load_rearrangement(filename)
         df = ImportHelper.standardize_none_values(df)
         df.dropna(axis="columns", how="all", inplace=True)
         return df
 
     @staticmethod
-    def import_receptors(df, params):
+    def alternative_chunk_load_func(filename, params):
+        # reads the file with the column types from the AIRR schema as airr.load_rearrangement does, but in chunks
+        from airr.schema import RearrangementSchema
+        for df in pd.read_csv(filename, sep="\t", header=0, index_col=None, dtype=RearrangementSchema.pandas_types(),
+                              true_values=RearrangementSchema.true_values, false_values=RearrangementSchema.false_values,
+                              chunksize=params.import_chunk_size):
+            df = ImportHelper.standardize_none_values(df.convert_dtypes())
+            df.dropna(axis="columns", how="all", inplace=True)
+            yield df
+
+    @staticmethod
+    def import_receptor_columns(df, params):
         df["receptor_identifiers"] = df["cell_id"]
-        return ImportHelper.import_receptors(df, params)
+        return ImportHelper.make_receptor_columns(df, params)
+
+    @staticmethod
+    def import_receptors(df, params):
+        return ImportHelper.build_receptors_from_columns(AIRRImport.import_receptor_columns(df, params))
 
     @staticmethod
     def get_documentation():
@@ -143,9 +143,13 @@ class GenericImport(DataImport):
         return df
 
     @staticmethod
-    def import_receptors(df, params):
+    def import_receptor_columns(df, params):
         df["receptor_identifiers"] = df["sequence_identifiers"]
-        return ImportHelper.import_receptors(df, params)
+        return ImportHelper.make_receptor_columns(df, params)
+
+    @staticmethod
+    def import_receptors(df, params):
+        return ImportHelper.build_receptors_from_columns(GenericImport.import_receptor_columns(df, params))
 
     @staticmethod
     def get_documentation():
@@ -4,7 +4,6 @@ import shutil
 import zipfile
 from pathlib import Path
 
-import airr
 import pandas as pd
 
 from immuneML.IO.dataset_import.AIRRImport import AIRRImport
@@ -321,6 +320,7 @@ class IReceptorImport(DataImport):
 
     @staticmethod
     def _split_airr_files(airr_file: Path, metadata_df: pd.DataFrame, result_path: Path):
+        import airr
         airr_df = airr.load_rearrangement(airr_file)
         files_written = []
 
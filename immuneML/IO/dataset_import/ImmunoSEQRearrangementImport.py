@@ -100,6 +100,10 @@ class ImmunoSEQRearrangementImport(DataImport):
         import_empty_aa_sequences (bool): imports sequences which have an empty amino acid sequence field; can be True or False; for analysis on
         amino acid sequences, this parameter will typically be False (import only non-empty amino acid sequences)
 
+        import_chunk_size (int): if set, each repertoire file is read, preprocessed and stored in chunks of this many rows, so that the
+        memory needed to import a repertoire does not depend on the size of the file. This also applies to unpaired sequence datasets, where
+        the chunks are streamed into the dataset batch files. By default, the whole file is read at once.
+
 
     YAML specification:
 
@@ -121,6 +125,7 @@ class ImmunoSEQRearrangementImport(DataImport):
                 import_illegal_characters: False # remove sequences with illegal characters for the sequence_type being used
                 import_empty_nt_sequences: True # keep sequences even though the nucleotide sequence might be empty
                 import_empty_aa_sequences: False # filter out sequences if they don't have sequence_aa set
+                import_chunk_size: 100000 # optional: read each repertoire file in chunks of this many rows to limit the memory usage
                 # Optional fields with ImmunoSEQ rearrangement-specific defaults, only change when different behavior is required:
                 separator: "\\t" # column separator
                 columns_to_load: # subset of columns to load
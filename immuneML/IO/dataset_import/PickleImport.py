@@ -8,6 +8,7 @@ import pandas as pd
 
 from immuneML.IO.dataset_import.DataImport import DataImport
 from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.dataset.ElementDataset import ElementDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
@@ -114,7 +115,8 @@ class PickleImport(DataImport):
     def _update_receptor_paths(pickle_params, dataset: ElementDataset):
         dataset_dir = PickleImport._discover_dataset_dir(pickle_params)
 
-        if len(list(dataset_dir.glob("*.pickle"))) == len(dataset.get_filenames()):
+        batch_file_count = len(list(dataset_dir.glob("*.pickle"))) + len(list(dataset_dir.glob(f"*{ColumnarStorage.SUFFIX}")))
+        if batch_file_count == len(dataset.get_filenames()):
             path = dataset_dir
             new_filenames = []
             for file in dataset.get_filenames():
@@ -123,13 +125,17 @@ class PickleImport(DataImport):
 
         return dataset
 
+    @staticmethod
+    def _count_repertoire_files(path: Path) -> int:
+        return len(list(path.glob("*.npy"))) + len(list(path.glob(f"*{ColumnarStorage.SUFFIX}")))
+
     @staticmethod
     def _discover_repertoire_path(pickle_params, dataset):
         dataset_dir = PickleImport._discover_dataset_dir(pickle_params)
 
-        if len(list(dataset_dir.glob("*.npy"))) == len(dataset.repertoires):
+        if PickleImport._count_repertoire_files(dataset_dir) == len(dataset.repertoires):
             path = dataset_dir
-        elif len(list(dataset_dir.glob("repertoires/*.npy"))) == len(dataset.repertoires):
+        elif PickleImport._count_repertoire_files(dataset_dir / "repertoires/") == len(dataset.repertoires):
             path = dataset_dir / "repertoires/"
         else:
             path = None
@@ -151,9 +151,13 @@ class TenxGenomicsImport(DataImport):
         return df
 
     @staticmethod
-    def import_receptors(df, params):
+    def import_receptor_columns(df, params):
         df["receptor_identifiers"] = df["cell_ids"]
-        return ImportHelper.import_receptors(df, params)
+        return ImportHelper.make_receptor_columns(df, params)
+
+    @staticmethod
+    def import_receptors(df, params):
+        return ImportHelper.build_receptors_from_columns(TenxGenomicsImport.import_receptor_columns(df, params))
 
     @staticmethod
     def get_documentation():
@@ -198,6 +198,10 @@ class VDJdbImport(DataImport):
                 sequence_identifiers.loc[sequence_identifiers == id] = unique_ids
         return sequence_identifiers
 
+    @staticmethod
+    def import_receptor_columns(df, params):
+        return ImportHelper.make_receptor_columns(df, params)
+
     @staticmethod
     def import_receptors(df, params):
         return ImportHelper.import_receptors(df, params)
@@ -27,8 +27,6 @@ class UtilIO:
             comp_data = pickle.load(file)
 
         comp_data.path = comp_data_path
-        for batch in comp_data.batches:
-            batch.path = comp_data_path
 
         return comp_data
 
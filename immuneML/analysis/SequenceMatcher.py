@@ -1,12 +1,15 @@
-from multiprocessing.pool import Pool
+from functools import partial
 
 import numpy as np
 from editdistance import eval as edit_distance
 
+from immuneML.analysis.SequenceMatchingIndex import SequenceMatchingIndex
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.encodings.reference_encoding.SequenceMatchingSummaryType import SequenceMatchingSummaryType
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class SequenceMatcher:
@@ -33,15 +36,19 @@ class SequenceMatcher:
 
     CORES = 4
 
-    def match(self, dataset: RepertoireDataset, reference_sequences: list, max_distance: int, summary_type: SequenceMatchingSummaryType) -> dict:
-
-        matched = {"repertoires": []}
-
-        for index, repertoire in enumerate(dataset.get_data()):
-            matched["repertoires"].append(self.match_repertoire(repertoire, index,
-                                                                reference_sequences, max_distance, summary_type))
+    def match(self, dataset: RepertoireDataset, reference_sequences: list, max_distance: int, summary_type: SequenceMatchingSummaryType,
+              number_of_processes: int = None) -> dict:
+        """
+        Matches all repertoires of the dataset to the reference sequences: the references are indexed once (see SequenceMatchingIndex) and
+        the index is sent once to the worker processes, which then match one repertoire at a time; if number_of_processes is not set,
+        SequenceMatcher.CORES processes are used
+        """
+        index = SequenceMatchingIndex(reference_sequences, max_distance)
+        repertoires = WorkerPool.map(partial(self._match_repertoire_to_index, sequence_index=index, summary_type=summary_type),
+                                     enumerate(dataset.get_data()),
+                                     number_of_processes if number_of_processes is not None else SequenceMatcher.CORES)
 
-        return matched
+        return {"repertoires": repertoires}
 
     def matches_gene(self, gene1, gene2):
         if gene1 == gene2:
@@ -64,32 +71,44 @@ class SequenceMatcher:
     def match_repertoire(self, repertoire: Repertoire, index: int, reference_sequences: list, max_distance: int,
                          summary_type: SequenceMatchingSummaryType) -> dict:
 
+        return self._match_repertoire_to_index((index, repertoire), SequenceMatchingIndex(reference_sequences, max_distance), summary_type)
+
+    def _match_repertoire_to_index(self, indexed_repertoire: tuple, sequence_index: SequenceMatchingIndex,
+                                   summary_type: SequenceMatchingSummaryType) -> dict:
+        index, repertoire = indexed_repertoire
+        element_count = repertoire.get_element_count()
+        sequences = repertoire.get_attribute(EnvironmentSettings.get_sequence_type().value)
+        v_genes, j_genes, chains = repertoire.get_v_genes(), repertoire.get_j_genes(), repertoire.get_chains()
+        sequences, v_genes, j_genes, chains = [column if column is not None else [None] * element_count
+                                               for column in [sequences, v_genes, j_genes, chains]]
+
         matched = {"sequences": [], "repertoire": repertoire.identifier, "repertoire_index": index}
-        arguments = [(seq, reference_sequences, max_distance) for seq in repertoire.sequences]
+        matches_per_key = {}
 
-        with Pool(SequenceMatcher.CORES) as pool:
-            matched["sequences"] = pool.starmap(self.match_sequence, arguments)
+        for key in zip(sequences, v_genes, j_genes, chains):
+            if key not in matches_per_key:
+                matches_per_key[key] = [sequence_index.sequences[reference_index] for reference_index in sequence_index.find_matches(*key)]
+            matched["sequences"].append({
+                "matching_sequences": matches_per_key[key],
+                "sequence": key[0],
+                "v_gene": key[1],
+                "j_gene": key[2],
+                "chain": key[3]
+            })
+
+        is_matched = np.array([len(sequence["matching_sequences"]) > 0 for sequence in matched["sequences"]], dtype=bool)
 
         if summary_type == SequenceMatchingSummaryType.CLONAL_PERCENTAGE:
-            total_count = np.sum([sequence.metadata.count for sequence in repertoire.sequences])
-            matched["clonal_percentage"] = np.sum([sequence.metadata.count for index, sequence in enumerate(repertoire.sequences) if len(matched["sequences"][index]["matching_sequences"]) > 0]) / total_count
+            counts = repertoire.get_counts()
+            # sequences without a count are counted once, as in SequenceMatchingIndex
+            counts = np.array([count if count is not None else 1 for count in counts], dtype=float) if counts is not None \
+                else np.ones(len(matched["sequences"]))
+            matched["clonal_percentage"] = np.sum(counts[is_matched]) / np.sum(counts)
         else:
-            matched["count"] = len([r for r in matched["sequences"] if len(r["matching_sequences"]) > 0])
+            matched["count"] = int(np.sum(is_matched))
             matched["percentage"] = matched["count"] / len(matched["sequences"])
         matched["metadata"] = repertoire.metadata
         matched["patient_id"] = repertoire.identifier
-        matched["chains"] = list(set([sequence.metadata.chain for sequence in repertoire.sequences]))
+        matched["chains"] = list(set(chains))
 
         return matched
-
-    def match_sequence(self, sequence: ReceptorSequence, reference_sequences: list, max_distance: int) -> dict:
-        matching_sequences = [seq.get_sequence() for seq in reference_sequences
-                              if self.matches_sequence(sequence, seq, max_distance)]
-
-        return {
-            "matching_sequences": matching_sequences,
-            "sequence": sequence.get_sequence(),
-            "v_gene": sequence.metadata.v_gene,
-            "j_gene": sequence.metadata.j_gene,
-            "chain": sequence.metadata.chain
-        }
@@ -0,0 +1,145 @@
+import numpy as np
+from editdistance import eval as edit_distance
+
+from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
+from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class SequenceMatchingIndex:
+    """
+    Index of reference sequences (a list of ReceptorSequence objects) for finding all references matching the sequences of a repertoire,
+    where a repertoire sequence matches a reference sequence under the same rules as in SequenceMatcher.matches_sequence: the chains are
+    the same, V and J genes are the same or one of them is the gene family (the part before '-') of the other and the Levenshtein distance
+    between the sequences is at most the max distance of the reference.
+
+    Instead of comparing every repertoire sequence to every reference, the references are grouped by chain and V and J gene family, and
+    within each group by all variants of the sequence with up to max distance deleted positions (the deletion neighbourhood, as in the
+    SymSpell algorithm): two sequences within Levenshtein distance d always share a variant with at most d deletions in each of them, so
+    only the references sharing a variant with the repertoire sequence are compared to it. For max distance 0, this is a lookup of the
+    exact sequence.
+
+    Arguments:
+
+        reference_sequences (list): list of ReceptorSequence objects to match against
+
+        max_distances: max allowed Levenshtein distance for all references (int) or a list with the distance per reference
+
+    """
+
+    def __init__(self, reference_sequences: list, max_distances):
+        self.max_distances = [max_distances] * len(reference_sequences) if isinstance(max_distances, int) else list(max_distances)
+        assert len(self.max_distances) == len(reference_sequences), \
+            f"{SequenceMatchingIndex.__name__}: the number of max distances ({len(self.max_distances)}) does not match the number of " \
+            f"reference sequences ({len(reference_sequences)})."
+
+        self.reference_count = len(reference_sequences)
+        self.sequences = [reference.get_sequence() for reference in reference_sequences]
+        self.v_genes = [SequenceMatchingIndex._normalize_gene(reference.metadata.v_gene) for reference in reference_sequences]
+        self.j_genes = [SequenceMatchingIndex._normalize_gene(reference.metadata.j_gene) for reference in reference_sequences]
+        self.index = self._build_index([SequenceMatchingIndex._normalize_chain(reference.metadata.chain) for reference in reference_sequences])
+
+    def _build_index(self, chains: list) -> dict:
+        index = {}
+        for reference_index, (sequence, v_gene, j_gene, chain, max_distance) in enumerate(zip(self.sequences, self.v_genes, self.j_genes,
+                                                                                              chains, self.max_distances)):
+            if isinstance(sequence, str):
+                group = index.setdefault(max_distance, {}).setdefault(SequenceMatchingIndex._make_group_key(chain, v_gene, j_gene), {})
+                for variant in SequenceMatchingIndex.get_deletion_variants(sequence, max_distance):
+                    group.setdefault(variant, []).append(reference_index)
+        return index
+
+    def find_matches(self, sequence: str, v_gene: str, j_gene: str, chain) -> list:
+        """
+        Returns:
+            sorted list of indices of the references matching the given sequence
+        """
+        matches = []
+        if not isinstance(sequence, str):
+            return matches
+
+        v_gene, j_gene = SequenceMatchingIndex._normalize_gene(v_gene), SequenceMatchingIndex._normalize_gene(j_gene)
+        group_key = SequenceMatchingIndex._make_group_key(SequenceMatchingIndex._normalize_chain(chain), v_gene, j_gene)
+
+        for max_distance, groups in self.index.items():
+            group = groups.get(group_key, None)
+            if group is not None:
+                candidates = set()
+                for variant in SequenceMatchingIndex.get_deletion_variants(sequence, max_distance):
+                    candidates.update(group.get(variant, ()))
+
+                matches.extend(reference_index for reference_index in candidates
+                               if SequenceMatchingIndex.matches_gene(self.v_genes[reference_index], v_gene)
+                               and SequenceMatchingIndex.matches_gene(self.j_genes[reference_index], j_gene)
+                               and (max_distance == 0 or edit_distance(sequence, self.sequences[reference_index]) <= max_distance))
+
+        return sorted(matches)
+
+    def count_matches(self, sequences, v_genes, j_genes, chains, counts) -> np.ndarray:
+        """
+        Matches all given sequences (e.g. of one repertoire) at once, where each distinct combination of sequence, genes and chain is
+        looked up only once
+
+        Returns:
+            array with the sum of counts of the matching sequences for each reference
+        """
+        grouped_counts = {}
+        for key, count in zip(zip(sequences, v_genes, j_genes, chains), counts):
+            grouped_counts[key] = grouped_counts.get(key, 0) + count
+
+        matches = np.zeros(self.reference_count, dtype=int)
+        for (sequence, v_gene, j_gene, chain), count in grouped_counts.items():
+            for reference_index in self.find_matches(sequence, v_gene, j_gene, chain):
+                matches[reference_index] += count
+
+        return matches
+
+    def count_repertoire_matches(self, repertoire: Repertoire) -> np.ndarray:
+        """
+        Returns:
+            array with the sum of counts of the repertoire sequences matching each reference, where sequences without count are counted once
+        """
+        sequence_attribute = EnvironmentSettings.get_sequence_type().value
+        columns = repertoire.get_attributes([sequence_attribute, "v_genes", "j_genes", "chains", "counts"])
+        element_count = repertoire.get_element_count()
+        missing = [None] * element_count
+
+        counts = columns["counts"] if "counts" in columns else missing
+        counts = [int(count) if count is not None and count == count else 1 for count in counts]
+
+        return self.count_matches(columns.get(sequence_attribute, missing), columns.get("v_genes", missing), columns.get("j_genes", missing),
+                                  columns.get("chains", missing), counts)
+
+    @staticmethod
+    def get_deletion_variants(sequence: str, max_deletions: int) -> set:
+        """
+        Returns:
+            the set of all sequences obtained by deleting up to max_deletions positions from the sequence, including the sequence itself
+        """
+        variants = {sequence}
+        current_variants = {sequence}
+        for _ in range(max_deletions):
+            current_variants = {variant[:position] + variant[position + 1:] for variant in current_variants for position in range(len(variant))}
+            variants.update(current_variants)
+        return variants
+
+    @staticmethod
+    def matches_gene(gene1, gene2) -> bool:
+        if gene1 == gene2:
+            return True
+        elif gene1 is None or gene2 is None:
+            return False
+        else:
+            return gene2.split("-", 1)[0] == gene1 or gene1.split("-", 1)[0] == gene2
+
+    @staticmethod
+    def _make_group_key(chain, v_gene, j_gene) -> tuple:
+        return chain, v_gene.split("-", 1)[0] if v_gene is not None else None, j_gene.split("-", 1)[0] if j_gene is not None else None
+
+    @staticmethod
+    def _normalize_gene(gene):
+        return str(gene) if gene is not None and gene == gene and gene != "" else None
+
+    @staticmethod
+    def _normalize_chain(chain):
+        return Chain.get_chain(chain) if chain and isinstance(chain, str) else chain if isinstance(chain, Chain) else None
@@ -3,9 +3,14 @@ import datetime
 import logging
 import os
 import shutil
+import subprocess
+import sys
 import warnings
 from pathlib import Path
 
+import pandas as pd
+
+from immuneML.caching.CacheHandler import CacheHandler
 from immuneML.caching.CacheType import CacheType
 from immuneML.dsl.ImmuneMLParser import ImmuneMLParser
 from immuneML.dsl.semantic_model.SemanticModel import SemanticModel
@@ -14,6 +19,7 @@ from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 from immuneML.util.ReflectionHandler import ReflectionHandler
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class ImmuneMLApp:
@@ -50,7 +56,10 @@ class ImmuneMLApp:
         model = SemanticModel([instruction.item for instruction in instructions], self._result_path, output)
         result = model.run()
 
+        logging.info(f"ImmuneMLApp: in-memory cache statistics: {CacheHandler.get_memory_cache().get_stats()}")
+
         self.clear_cache()
+        WorkerPool.shutdown()
 
         print(f"{datetime.datetime.now()}: ImmuneML: finished analysis.\n", flush=True)
 
@@ -74,17 +83,55 @@ def run_immuneML(namespace: argparse.Namespace):
     app.run()
 
 
+def run_with_import_profiling(namespace: argparse.Namespace) -> pd.DataFrame:
+    """
+    Runs immuneML in a new process with Python's import time profiling (-X importtime) and stores the import time of each module
+    (self and cumulative, in microseconds) to import_times.csv in the result path; the modules with the longest import times are also
+    printed when the analysis is finished.
+    """
+    arguments = [sys.executable, "-X", "importtime", "-m", "immuneML.app.ImmuneMLApp", str(namespace.specification_path),
+                 str(namespace.result_path)] + (["--tool", namespace.tool] if namespace.tool is not None else [])
+
+    import_times = []
+    with subprocess.Popen(arguments, stderr=subprocess.PIPE, text=True) as process:
+        for line in process.stderr:
+            if line.startswith("import time:") and "[us]" not in line:
+                self_time, cumulative_time, module = line[len("import time:"):].split("|")
+                import_times.append({"module": module.strip(), "depth": (len(module) - len(module.lstrip()) - 1) // 2,
+                                     "self_time": int(self_time), "cumulative_time": int(cumulative_time)})
+            else:
+                sys.stderr.write(line)
+
+    if process.returncode != 0:
+        sys.exit(process.returncode)
+
+    df = pd.DataFrame(import_times, columns=["module", "depth", "self_time", "cumulative_time"])
+    df.to_csv(namespace.result_path / "import_times.csv", index=False)
+
+    print(f"ImmuneML: {df['self_time'].sum() / 1e6:.2f}s spent importing {df.shape[0]} modules, the slowest top-level imports were:\n"
+          f"{df[df['depth'] == 0].nlargest(10, 'cumulative_time').to_string(index=False)}\n"
+          f"Import times per module (in microseconds) are stored in {namespace.result_path / 'import_times.csv'}.", flush=True)
+
+    return df
+
+
 def main():
     parser = argparse.ArgumentParser(description="immuneML command line tool")
     parser.add_argument("specification_path", help="Path to specification YAML file. Always used to define the analysis.")
     parser.add_argument("result_path", help="Output directory path.")
     parser.add_argument("--tool", help="Name of the tool which calls immuneML. This name will be used to invoke appropriate API call, "
                                        "which will then do additional work in tool-dependent way before running standard immuneML.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Run the analysis while measuring how long importing each module takes and store the import times in "
+                             "import_times.csv in the result path.")
     namespace = parser.parse_args()
     namespace.specification_path = Path(namespace.specification_path)
     namespace.result_path = Path(namespace.result_path)
 
-    run_immuneML(namespace)
+    if namespace.profile_startup:
+        run_with_import_profiling(namespace)
+    else:
+        run_immuneML(namespace)
 
 
 if __name__ == "__main__":
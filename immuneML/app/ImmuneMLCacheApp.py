@@ -0,0 +1,80 @@
+import argparse
+import datetime
+from pathlib import Path
+
+from immuneML.caching.CacheEvictionPolicy import CacheEvictionPolicy
+from immuneML.caching.CacheIndex import CacheIndex
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class ImmuneMLCacheApp:
+    """
+    Command line tool to inspect and prune an immuneML cache directory, e.g. a cache shared between multiple runs.
+
+    Usage:
+
+    .. code-block:: console
+
+        immune-ml-cache stats --cache_path /path/to/cache/
+        immune-ml-cache prune --cache_path /path/to/cache/ --max_size 20GB --policy lfu
+
+    """
+
+    def __init__(self, cache_path: Path):
+        self._cache_path = Path(cache_path)
+        assert self._cache_path.is_dir(), f"{ImmuneMLCacheApp.__name__}: cache directory {self._cache_path} does not exist."
+
+    def stats(self) -> dict:
+        CacheIndex.synchronize(self._cache_path)
+        stats = CacheIndex.get_stats(self._cache_path)
+
+        print(f"Cache at {self._cache_path}: {stats['entry_count']} entries, {ImmuneMLCacheApp._format_size(stats['size'])}, "
+              f"{stats['hit_count']} hits", flush=True)
+        if stats["entry_count"] > 0:
+            print(f"Oldest access: {datetime.datetime.fromtimestamp(stats['oldest_access'])}, "
+                  f"latest access: {datetime.datetime.fromtimestamp(stats['latest_access'])}", flush=True)
+        for entry_type, type_stats in sorted(stats["types"].items()):
+            print(f"  {entry_type}: {type_stats['entry_count']} entries, {ImmuneMLCacheApp._format_size(type_stats['size'])}, "
+                  f"{type_stats['hit_count']} hits", flush=True)
+
+        return stats
+
+    def prune(self, max_size, policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU) -> list:
+        CacheIndex.synchronize(self._cache_path)
+        removed = CacheIndex.evict(self._cache_path, CacheIndex.parse_size(max_size), policy)
+
+        print(f"Removed {len(removed)} entries from the cache at {self._cache_path}, remaining size: "
+              f"{ImmuneMLCacheApp._format_size(CacheIndex.get_total_size(self._cache_path))}", flush=True)
+
+        return removed
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        for unit in ["B", "KB", "MB", "GB"]:
+            if size < 1024:
+                return f"{size:.1f}{unit}"
+            size /= 1024
+        return f"{size:.1f}TB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="immuneML cache command line tool")
+    parser.add_argument("command", choices=["stats", "prune"], help="Show cache statistics or remove entries until the cache fits max_size.")
+    parser.add_argument("--cache_path", default=str(EnvironmentSettings.cache_path), help="Path to the cache directory.")
+    parser.add_argument("--max_size", help="Size budget for the prune command in bytes or with a unit, e.g. 500M or 20GB.")
+    parser.add_argument("--policy", default=CacheEvictionPolicy.LRU.name, choices=[policy.name for policy in CacheEvictionPolicy],
+                        type=str.upper, help="Which entries are removed first when pruning: least recently (LRU) or least frequently (LFU) used.")
+    namespace = parser.parse_args()
+
+    app = ImmuneMLCacheApp(namespace.cache_path)
+
+    if namespace.command == "stats":
+        app.stats()
+    else:
+        if namespace.max_size is None:
+            parser.error("--max_size is required for the prune command")
+        app.prune(namespace.max_size, CacheEvictionPolicy[namespace.policy])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import json
+import pickle
+import struct
+import warnings
+import zlib
+from pathlib import Path
+
+import dill
+
+from immuneML.caching.CacheCompression import CacheCompression
+from immuneML.caching.CacheSerializer import CacheSerializer
+
+
+class ArraySerializer(CacheSerializer):
+    """
+    Stores objects with pickle protocol 5 where the data of NumPy arrays (and so also of scipy.sparse matrices and pandas data frames
+    which are built on NumPy arrays) is written out-of-band as raw buffers, optionally compressed, instead of being copied into the
+    pickle stream. Loading reads the raw buffers directly into the arrays. Objects which cannot be pickled with the standard pickle
+    module (e.g. lambdas) are stored with dill instead.
+
+    File layout: magic bytes, length of the JSON header (uint32), JSON header (pickler, compression, stored and raw size of each part),
+    the pickle stream and the array buffers.
+
+    On Python versions without pickle protocol 5 (Python 3.7), the arrays are stored in the pickle stream with the highest available
+    protocol instead.
+
+    Compression with LZ4 or zstd requires the lz4 or zstandard package to be installed; if it is not, zlib is used instead.
+    """
+
+    MAGIC = b"IMLCACHE"
+    VERSION = 1
+    COMPRESSION_PACKAGES = {CacheCompression.LZ4: "lz4", CacheCompression.ZSTD: "zstandard"}
+    OUT_OF_BAND_BUFFERS = pickle.HIGHEST_PROTOCOL >= 5
+
+    def __init__(self, compression: CacheCompression = CacheCompression.NONE):
+        self.compression = ArraySerializer._check_compression(compression)
+
+    @staticmethod
+    def _check_compression(compression: CacheCompression) -> CacheCompression:
+        if compression in ArraySerializer.COMPRESSION_PACKAGES:
+            try:
+                __import__(ArraySerializer.COMPRESSION_PACKAGES[compression])
+            except ImportError:
+                warnings.warn(f"{ArraySerializer.__name__}: {compression.name} compression of cached objects was chosen, but the package "
+                              f"{ArraySerializer.COMPRESSION_PACKAGES[compression]} is not installed. Using zlib compression instead.")
+                return CacheCompression.ZLIB
+        return compression
+
+    def dump(self, obj, path: Path):
+        buffers = []
+        try:
+            if ArraySerializer.OUT_OF_BAND_BUFFERS:
+                stream, pickler = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append), "pickle"
+            else:
+                stream, pickler = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), "pickle"
+        except (pickle.PicklingError, AttributeError, TypeError):
+            buffers = []
+            stream, pickler = dill.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), "dill"
+
+        raw_parts = [memoryview(stream)] + [buffer.raw() for buffer in buffers]
+        stored_parts = [ArraySerializer._compress(part, self.compression) for part in raw_parts]
+
+        header = json.dumps({"version": ArraySerializer.VERSION, "pickler": pickler, "compression": self.compression.value,
+                             "parts": [[len(stored_part) if isinstance(stored_part, bytes) else stored_part.nbytes, raw_part.nbytes]
+                                       for stored_part, raw_part in zip(stored_parts, raw_parts)]}).encode("utf-8")
+
+        with path.open("wb") as file:
+            file.write(ArraySerializer.MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            for part in stored_parts:
+                file.write(part)
+
+    def load(self, path: Path):
+        with path.open("rb") as file:
+            assert file.read(len(ArraySerializer.MAGIC)) == ArraySerializer.MAGIC, \
+                f"{ArraySerializer.__name__}: {path} is not a file stored by {ArraySerializer.__name__}."
+            header_length = struct.unpack("<I", file.read(4))[0]
+            header = json.loads(file.read(header_length).decode("utf-8"))
+            compression = CacheCompression(header["compression"])
+
+            parts = []
+            for stored_size, raw_size in header["parts"]:
+                if compression == CacheCompression.NONE:
+                    part = bytearray(raw_size)
+                    file.readinto(part)
+                else:
+                    part = bytearray(ArraySerializer._decompress(file.read(stored_size), compression))
+                parts.append(part)
+
+        if header["pickler"] == "pickle" and len(parts) > 1:
+            return pickle.loads(parts[0], buffers=parts[1:])
+        elif header["pickler"] == "pickle":
+            return pickle.loads(parts[0])
+        else:
+            return dill.loads(parts[0])
+
+    @staticmethod
+    def can_load(file_start: bytes) -> bool:
+        return file_start.startswith(ArraySerializer.MAGIC)
+
+    @staticmethod
+    def _compress(data: memoryview, compression: CacheCompression):
+        if compression == CacheCompression.NONE:
+            return data
+        elif compression == CacheCompression.ZLIB:
+            return zlib.compress(data, 1)
+        elif compression == CacheCompression.LZ4:
+            import lz4.frame
+            return lz4.frame.compress(data)
+        else:
+            import zstandard
+            return zstandard.ZstdCompressor().compress(data)
+
+    @staticmethod
+    def _decompress(data: bytes, compression: CacheCompression) -> bytes:
+        if compression == CacheCompression.ZLIB:
+            return zlib.decompress(data)
+        elif compression == CacheCompression.LZ4:
+            import lz4.frame
+            return lz4.frame.decompress(data)
+        else:
+            import zstandard
+            return zstandard.ZstdDecompressor().decompress(data)
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class CacheCompression(Enum):
+
+    NONE = "none"
+    ZLIB = "zlib"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CacheEvictionPolicy(Enum):
+
+    LRU = "lru"
+    LFU = "lfu"
@@ -1,21 +1,36 @@
+import copy
+import functools
 import hashlib
 import logging
 import os
-import pickle
-from pathlib import Path
+import types
+from enum import Enum
+from pathlib import Path, PurePath
 
-import dill
+import numpy as np
+import pandas as pd
+from scipy import sparse
 
+from immuneML.caching.ArraySerializer import ArraySerializer
+from immuneML.caching.CacheIndex import CacheIndex
 from immuneML.caching.CacheObjectType import CacheObjectType
+from immuneML.caching.CacheSerializer import CacheSerializer
+from immuneML.caching.DillSerializer import DillSerializer
+from immuneML.caching.MemoryCache import MemoryCache
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 
 
 class CacheHandler:
 
+    SERIALIZERS = {CacheObjectType.ENCODING_STEP: ArraySerializer, CacheObjectType.ENCODING: ArraySerializer,
+                   CacheObjectType.OTHER: DillSerializer}
+
+    _memory_cache = None
+
     @staticmethod
     def get_file_path(cache_type=None):
-        file_path = EnvironmentSettings.get_cache_path(cache_type) / "files"
+        file_path = EnvironmentSettings.get_cache_path(cache_type) / CacheIndex.FILES_DIRECTORY
         PathBuilder.build(file_path)
         return file_path
 
@@ -24,15 +39,63 @@ class CacheHandler:
         h = CacheHandler._hash(params)
         return CacheHandler.get_by_key(h, object_type, cache_type)
 
+    @staticmethod
+    def get_memory_cache() -> MemoryCache:
+        """
+        :return: in-memory cache of the current process which is used in front of the cache on disk; its size is set by the
+                 cache_memory_max_size environment variable and it is not used by default
+        """
+        max_size = EnvironmentSettings.get_cache_memory_max_size()
+        if CacheHandler._memory_cache is None or CacheHandler._memory_cache.max_size != max_size:
+            CacheHandler._memory_cache = MemoryCache(max_size)
+        return CacheHandler._memory_cache
+
     @staticmethod
     def get_by_key(cache_key: str, object_type, cache_type=None):
         filename = CacheHandler._build_filename(cache_key, object_type, cache_type)
-        obj = None
-        if filename.is_file():
-            with filename.open("rb") as file:
-                obj = dill.load(file)
+        version = CacheHandler._get_file_version(filename)
+        if version is None:
+            return None
+
+        memory_cache = CacheHandler.get_memory_cache()
+        obj = memory_cache.get(str(filename), version)
+
+        if obj is None:
+            try:
+                obj = CacheHandler._load(filename)
+            except FileNotFoundError:  # the entry was evicted by another process in the meantime
+                return None
+
+            CacheIndex.record_hit(EnvironmentSettings.get_cache_path(cache_type), filename)
+
+            # the loaded object is kept in memory as it is, while the caller gets a copy the same as on the later hits
+            if memory_cache.put(str(filename), obj, version):
+                obj = copy.deepcopy(obj)
+
         return obj
 
+    @staticmethod
+    def _load(filename: Path):
+        with filename.open("rb") as file:
+            file_start = file.read(len(ArraySerializer.MAGIC))
+        serializer_class = ArraySerializer if ArraySerializer.can_load(file_start) else DillSerializer
+        return serializer_class().load(filename)
+
+    @staticmethod
+    def _create_serializer(serializer_class) -> CacheSerializer:
+        if serializer_class == ArraySerializer:
+            return ArraySerializer(EnvironmentSettings.get_cache_compression())
+        else:
+            return serializer_class()
+
+    @staticmethod
+    def _get_file_version(filename: Path):
+        try:
+            stat = filename.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
     @staticmethod
     def _build_filename(cache_key: str, object_type: CacheObjectType, cache_type=None) -> Path:
         path = EnvironmentSettings.get_cache_path(cache_type) / object_type.name.lower()
@@ -41,28 +104,120 @@ class CacheHandler:
 
     @staticmethod
     def add(params: tuple, caching_object, object_type: CacheObjectType = CacheObjectType.OTHER, cache_type=None):
-        PathBuilder.build(EnvironmentSettings.get_cache_path(cache_type))
         h = CacheHandler.generate_cache_key(params)
-        filename = CacheHandler._build_filename(cache_key=h, object_type=object_type, cache_type=cache_type)
-        with filename.open("wb") as file:
-            dill.dump(caching_object, file, protocol=pickle.HIGHEST_PROTOCOL)
+        CacheHandler.add_by_key(h, caching_object, object_type, cache_type)
 
     @staticmethod
     def add_by_key(cache_key: str, caching_object, object_type: CacheObjectType = CacheObjectType.OTHER, cache_type=None):
         PathBuilder.build(EnvironmentSettings.get_cache_path(cache_type))
         filename = CacheHandler._build_filename(cache_key=cache_key, object_type=object_type, cache_type=cache_type)
+        # the object is written to a temporary file first, so that other processes never load a partially written entry
+        tmp_filename = filename.with_name(f"{filename.name}.{os.getpid()}.tmp")
         try:
-            with filename.open("wb") as file:
-                dill.dump(caching_object, file, protocol=pickle.HIGHEST_PROTOCOL)
+            CacheHandler._create_serializer(CacheHandler.SERIALIZERS.get(object_type, DillSerializer)).dump(caching_object, tmp_filename)
+            os.replace(tmp_filename, filename)
         except AttributeError:
-            os.remove(filename)
             logging.warning(f"CacheHandler: could not cache object of class {type(caching_object).__name__} with key {cache_key}. "
                             f"Object: {caching_object}\n"
                             f"Next time this object is needed, it will be recomputed which will take more time but should not influence results.")
+            return
+        finally:
+            if tmp_filename.is_file():
+                tmp_filename.unlink()
+
+        CacheHandler._register(filename, cache_type)
+
+    @staticmethod
+    def _register(filename: Path, cache_type=None):
+        cache_path = EnvironmentSettings.get_cache_path(cache_type)
+        total_size = CacheIndex.add_entry(cache_path, filename)
+
+        max_size = EnvironmentSettings.get_cache_max_size()
+        if max_size is not None and total_size > max_size:
+            CacheIndex.evict(cache_path, max_size, EnvironmentSettings.get_cache_eviction_policy())
 
     @staticmethod
     def generate_cache_key(params: tuple):
-        return hashlib.sha256(str(params).encode('utf-8')).hexdigest()
+        """
+        creates a key from the parameters which is stable across processes and runs: the parameters are first converted to a canonical
+        string where dictionaries and sets are sorted, enums, paths, numpy arrays and functions are described by their content instead
+        of their (possibly memory-address dependent) representation, and objects without a custom representation are described by
+        their class and attributes (including the ones stored in __slots__)
+
+        :param params: parameters describing the cached object (usually a tuple of (name, value) tuples)
+        :return: sha256 hex digest of the canonical form of the parameters
+        """
+        return hashlib.sha256(CacheHandler._to_canonical_string(params, set()).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _to_canonical_string(obj, visited: set) -> str:
+        if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+            return f"{type(obj).__name__}:{obj!r}"
+        elif isinstance(obj, Enum):
+            return f"{type(obj).__module__}.{type(obj).__qualname__}.{obj.name}"
+        elif isinstance(obj, PurePath):
+            return f"path:{obj.as_posix()!r}"
+        elif isinstance(obj, np.ndarray):
+            content = hashlib.sha256(np.ascontiguousarray(obj).tobytes() if obj.dtype != object else repr(obj.tolist()).encode('utf-8'))
+            return f"ndarray:{obj.dtype.str}:{obj.shape}:{content.hexdigest()}"
+        elif sparse.issparse(obj):
+            matrix = obj.tocsr()
+            content = hashlib.sha256(b"".join(np.ascontiguousarray(array).tobytes() for array in [matrix.data, matrix.indices, matrix.indptr]))
+            return f"sparse:{matrix.dtype.str}:{matrix.shape}:{content.hexdigest()}"
+        elif isinstance(obj, (pd.DataFrame, pd.Series)):
+            return f"{type(obj).__name__}:{hashlib.sha256(obj.to_csv().encode('utf-8')).hexdigest()}"
+        elif isinstance(obj, np.generic):
+            return CacheHandler._to_canonical_string(obj.item(), visited)
+        elif isinstance(obj, (types.BuiltinFunctionType, type)):
+            return f"{type(obj).__name__}:{getattr(obj, '__module__', '')}.{obj.__qualname__}"
+
+        if id(obj) in visited:
+            return f"cycle:{type(obj).__qualname__}"
+        visited = visited | {id(obj)}
+
+        if isinstance(obj, types.FunctionType):
+            code = obj.__code__
+            code_hash = hashlib.sha256(code.co_code + repr(code.co_consts).encode('utf-8')).hexdigest()
+            closure = ','.join(CacheHandler._cell_to_canonical_string(cell, visited) for cell in obj.__closure__ or ())
+            return f"{type(obj).__name__}:{obj.__module__}.{obj.__qualname__}:{code_hash}:" \
+                   f"{CacheHandler._to_canonical_string(obj.__defaults__, visited)}:" \
+                   f"{CacheHandler._to_canonical_string(obj.__kwdefaults__, visited)}:closure[{closure}]"
+        elif isinstance(obj, functools.partial):
+            return f"partial:{CacheHandler._to_canonical_string(obj.func, visited)}:{CacheHandler._to_canonical_string(obj.args, visited)}:" \
+                   f"{CacheHandler._to_canonical_string(obj.keywords, visited)}"
+        elif isinstance(obj, dict):
+            items = sorted(f"{CacheHandler._to_canonical_string(key, visited)}={CacheHandler._to_canonical_string(value, visited)}"
+                           for key, value in obj.items())
+            return f"{type(obj).__name__}{{{','.join(items)}}}"
+        elif isinstance(obj, (set, frozenset)):
+            return f"{type(obj).__name__}{{{','.join(sorted(CacheHandler._to_canonical_string(item, visited) for item in obj))}}}"
+        elif isinstance(obj, (list, tuple)):
+            return f"{type(obj).__name__}[{','.join(CacheHandler._to_canonical_string(item, visited) for item in obj)}]"
+        elif type(obj).__repr__ is not object.__repr__:
+            return f"{type(obj).__qualname__}:{obj!r}"
+        else:
+            attributes = CacheHandler._to_canonical_string(CacheHandler._get_attributes(obj), visited)
+            return f"{type(obj).__module__}.{type(obj).__qualname__}{attributes}"
+
+    @staticmethod
+    def _cell_to_canonical_string(cell, visited: set) -> str:
+        try:
+            contents = cell.cell_contents
+        except ValueError:  # the variable of the cell is not assigned yet
+            return "empty_cell"
+        return CacheHandler._to_canonical_string(contents, visited)
+
+    @staticmethod
+    def _get_attributes(obj) -> dict:
+        """returns the attributes of the object stored both in its __dict__ and in the __slots__ of its class and base classes"""
+        attributes = dict(vars(obj)) if hasattr(obj, "__dict__") else {}
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in [slots] if isinstance(slots, str) else slots:
+                name = f"_{cls.__name__.lstrip('_')}{slot}" if slot.startswith("__") and not slot.endswith("__") else slot
+                if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                    attributes[name] = getattr(obj, name)
+        return attributes
 
     @staticmethod
     def memo(cache_key: str, fn, object_type: CacheObjectType = CacheObjectType.OTHER, cache_type=None):
@@ -79,4 +234,4 @@ class CacheHandler:
 
     @staticmethod
     def _hash(params: tuple) -> str:
-        return hashlib.sha256(str(params).encode('utf-8')).hexdigest()
+        return CacheHandler.generate_cache_key(params)
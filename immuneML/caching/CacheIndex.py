@@ -0,0 +1,211 @@
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from immuneML.caching.CacheEvictionPolicy import CacheEvictionPolicy
+
+
+class CacheIndex:
+    """
+    Keeps track of the entries stored in a cache directory (size in bytes, creation time, time of last access and number of hits per
+    entry) in an SQLite index file in the cache directory, so that the cache can be kept within a size budget by evicting the least
+    recently used (LRU) or least frequently used (LFU) entries. SQLite is used so that multiple processes writing to the same cache can
+    update the index concurrently.
+
+    Entries are identified by their path relative to the cache directory (e.g. `encoding_step/<cache_key>.pickle`). Files which are
+    present in the cache directory but not in the index (e.g. written by an older immuneML version) and index entries without the
+    corresponding file are reconciled by synchronize(). The files directory of the cache (see CacheHandler.get_file_path()) holds files
+    which are used directly by the running components (e.g. the HDF5 files for DeepRC), so it is never indexed or evicted.
+    """
+
+    FILENAME = "cache_index.sqlite"
+    FILES_DIRECTORY = "files"
+    SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2, "G": 1024 ** 3, "GB": 1024 ** 3,
+                  "T": 1024 ** 4, "TB": 1024 ** 4}
+
+    _connections = {}
+    _pid = None
+
+    @staticmethod
+    def _connect(cache_path: Path) -> sqlite3.Connection:
+        """
+        returns the connection to the index of the cache directory for the current process and thread; the connection is opened once
+        and reused until the index file is removed or replaced (e.g. when the cache is cleared)
+        """
+        if CacheIndex._pid != os.getpid():  # connections inherited from the parent process (e.g. after fork) cannot be used
+            CacheIndex._connections = {}
+            CacheIndex._pid = os.getpid()
+
+        index_path = Path(cache_path) / CacheIndex.FILENAME
+        key = (str(index_path), threading.get_ident())
+        connection, inode = CacheIndex._connections.get(key, (None, None))
+
+        if connection is not None and inode != CacheIndex._get_inode(index_path):
+            connection.close()
+            connection = None
+
+        if connection is None:
+            connection = sqlite3.connect(str(index_path), timeout=60, isolation_level=None)
+            CacheIndex._create_tables(connection)
+            CacheIndex._connections[key] = (connection, CacheIndex._get_inode(index_path))
+
+        return connection
+
+    @staticmethod
+    def _create_tables(connection: sqlite3.Connection):
+        # the total size of all entries is kept up to date by triggers, so that it can be checked after each write without summing up
+        # the sizes of all entries
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (name TEXT PRIMARY KEY, size INTEGER NOT NULL, created REAL NOT NULL, "
+                               "last_access REAL NOT NULL, hit_count INTEGER NOT NULL DEFAULT 0)")
+            connection.execute("CREATE TABLE IF NOT EXISTS total (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)")
+            connection.execute("INSERT OR IGNORE INTO total (id, size) VALUES (0, (SELECT COALESCE(SUM(size), 0) FROM entries))")
+            connection.execute("CREATE TRIGGER IF NOT EXISTS entry_inserted AFTER INSERT ON entries "
+                               "BEGIN UPDATE total SET size = size + NEW.size; END")
+            connection.execute("CREATE TRIGGER IF NOT EXISTS entry_deleted AFTER DELETE ON entries "
+                               "BEGIN UPDATE total SET size = size - OLD.size; END")
+            connection.execute("CREATE TRIGGER IF NOT EXISTS entry_updated AFTER UPDATE OF size ON entries "
+                               "BEGIN UPDATE total SET size = size - OLD.size + NEW.size; END")
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _get_inode(path: Path):
+        try:
+            return path.stat().st_ino
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def close():
+        """closes the connections of the current process to the cache indices"""
+        if CacheIndex._pid == os.getpid():
+            for connection, _ in CacheIndex._connections.values():
+                connection.close()
+        CacheIndex._connections = {}
+
+    @staticmethod
+    def get_entry_name(cache_path: Path, filename: Path) -> str:
+        return Path(filename).relative_to(cache_path).as_posix()
+
+    @staticmethod
+    def add_entry(cache_path: Path, filename: Path) -> int:
+        """
+        adds the file to the index or updates its size if it is already there (as if it was newly created)
+
+        :return: total size of the entries in the index in bytes after adding the file
+        """
+        now = time.time()
+        connection = CacheIndex._connect(cache_path)
+        connection.execute("INSERT INTO entries (name, size, created, last_access, hit_count) VALUES (?, ?, ?, ?, 0) "
+                           "ON CONFLICT(name) DO UPDATE SET size = excluded.size, created = excluded.created, "
+                           "last_access = excluded.last_access, hit_count = 0",
+                           (CacheIndex.get_entry_name(cache_path, filename), CacheIndex._get_size(filename), now, now))
+        return CacheIndex.get_total_size(cache_path)
+
+    @staticmethod
+    def record_hit(cache_path: Path, filename: Path):
+        now = time.time()
+        CacheIndex._connect(cache_path).execute("INSERT INTO entries (name, size, created, last_access, hit_count) VALUES (?, ?, ?, ?, 1) "
+                                                "ON CONFLICT(name) DO UPDATE SET last_access = excluded.last_access, hit_count = hit_count + 1",
+                                                (CacheIndex.get_entry_name(cache_path, filename), CacheIndex._get_size(filename), now, now))
+
+    @staticmethod
+    def get_total_size(cache_path: Path) -> int:
+        return CacheIndex._connect(cache_path).execute("SELECT size FROM total").fetchone()[0]
+
+    @staticmethod
+    def evict(cache_path: Path, max_size: int, policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU) -> list:
+        """
+        removes entries from the cache directory and the index until the total size of the cache is at most max_size bytes
+
+        :return: list of names of removed entries
+        """
+        order = "last_access ASC" if policy == CacheEvictionPolicy.LRU else "hit_count ASC, last_access ASC"
+        removed = []
+
+        connection = CacheIndex._connect(cache_path)
+        total_size = CacheIndex.get_total_size(cache_path)
+        if total_size > max_size:
+            for name, size in connection.execute(f"SELECT name, size FROM entries WHERE name NOT LIKE ? ORDER BY {order}",
+                                                 (f"{CacheIndex.FILES_DIRECTORY}/%",)).fetchall():
+                if total_size <= max_size:
+                    break
+                CacheIndex._remove_file(Path(cache_path) / name)
+                connection.execute("DELETE FROM entries WHERE name = ?", (name,))
+                total_size -= size
+                removed.append(name)
+
+        return removed
+
+    @staticmethod
+    def synchronize(cache_path: Path):
+        """adds the entries present in the cache directory which are missing from the index and removes index entries without files"""
+        cache_path = Path(cache_path)
+        entries = {CacheIndex.get_entry_name(cache_path, path): path for directory in cache_path.iterdir()
+                   if directory.is_dir() and directory.name != CacheIndex.FILES_DIRECTORY for path in directory.iterdir()}
+
+        connection = CacheIndex._connect(cache_path)
+        indexed_names = {row[0] for row in connection.execute("SELECT name FROM entries").fetchall()}
+        connection.executemany("DELETE FROM entries WHERE name = ?", [(name,) for name in indexed_names if name not in entries])
+        connection.executemany("INSERT INTO entries (name, size, created, last_access, hit_count) VALUES (?, ?, ?, ?, 0)",
+                               [(name, CacheIndex._get_size(path), os.path.getmtime(path), os.path.getmtime(path))
+                                for name, path in entries.items() if name not in indexed_names])
+
+    @staticmethod
+    def get_stats(cache_path: Path) -> dict:
+        """
+        :return: dictionary with the number of entries, total size in bytes and total number of hits, overall and per entry type (top
+                 level directory in the cache, e.g. encoding_step), and the times of the oldest and latest access
+        """
+        rows = CacheIndex._connect(cache_path).execute("SELECT name, size, hit_count, last_access FROM entries").fetchall()
+
+        stats = {"entry_count": len(rows), "size": sum(row[1] for row in rows), "hit_count": sum(row[2] for row in rows),
+                 "oldest_access": min([row[3] for row in rows], default=None), "latest_access": max([row[3] for row in rows], default=None),
+                 "types": {}}
+
+        for name, size, hit_count, _ in rows:
+            type_stats = stats["types"].setdefault(name.split("/")[0], {"entry_count": 0, "size": 0, "hit_count": 0})
+            type_stats["entry_count"] += 1
+            type_stats["size"] += size
+            type_stats["hit_count"] += hit_count
+
+        return stats
+
+    @staticmethod
+    def parse_size(size) -> int:
+        """converts a size given as a number of bytes or as a string with a unit (e.g. 500M, 20GB) to the number of bytes"""
+        if isinstance(size, int):
+            return size
+        match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]*)\s*", str(size))
+        assert match is not None and match.group(2).upper() in CacheIndex.SIZE_UNITS, \
+            f"{CacheIndex.__name__}: invalid cache size {size}, expected a number of bytes or a number with unit " \
+            f"(one of {', '.join(unit for unit in CacheIndex.SIZE_UNITS if unit != '')})."
+        return int(float(match.group(1)) * CacheIndex.SIZE_UNITS[match.group(2).upper()])
+
+    @staticmethod
+    def _get_size(path: Path) -> int:
+        path = Path(path)
+        if path.is_dir():
+            return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+        elif path.is_file():
+            return path.stat().st_size
+        else:
+            return 0
+
+    @staticmethod
+    def _remove_file(path: Path):
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
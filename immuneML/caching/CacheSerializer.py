@@ -0,0 +1,23 @@
+import abc
+from pathlib import Path
+
+
+class CacheSerializer(metaclass=abc.ABCMeta):
+    """
+    Stores objects to and loads them from cache files; which serializer is used for which type of cached objects is defined in
+    CacheHandler.SERIALIZERS. When loading, the serializer is chosen based on the beginning of the file (see can_load()), so that
+    files written with any serializer (or by older immuneML versions) can be read regardless of the current settings.
+    """
+
+    @abc.abstractmethod
+    def dump(self, obj, path: Path):
+        pass
+
+    @abc.abstractmethod
+    def load(self, path: Path):
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def can_load(file_start: bytes) -> bool:
+        pass
@@ -0,0 +1,22 @@
+import pickle
+from pathlib import Path
+
+import dill
+
+from immuneML.caching.CacheSerializer import CacheSerializer
+
+
+class DillSerializer(CacheSerializer):
+    """Stores any object (including lambdas and locally defined classes) as a dill pickle."""
+
+    def dump(self, obj, path: Path):
+        with path.open("wb") as file:
+            dill.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path: Path):
+        with path.open("rb") as file:
+            return dill.load(file)
+
+    @staticmethod
+    def can_load(file_start: bytes) -> bool:
+        return True
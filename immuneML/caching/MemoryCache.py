@@ -0,0 +1,120 @@
+import copy
+import sys
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class MemoryCache:
+    """
+    Bounded in-process LRU cache in front of the on-disk cache: it keeps the most recently used objects in memory so that repeated
+    lookups of the same cache entry within one process skip reading, decompressing and deserializing the file.
+
+    The size of each object is its estimated size in memory (see get_size()) and the least recently used objects are removed when the
+    total size exceeds max_size. Each entry also stores a version (e.g. modification time and size of the file on disk) so that an
+    entry is not used if the file on disk was changed or removed in the meantime.
+
+    Objects are stored as they are and the cache returns a copy on every hit, so that callers which modify the returned object (e.g.
+    fit a model or add an encoding to a dataset) do not change what later callers get, the same as when each caller loads the file.
+    Callers therefore have to put objects which are not used anywhere else, such as objects just loaded from disk.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, version=None):
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] == version:
+            self._entries.move_to_end(key)
+            self.hit_count += 1
+            return copy.deepcopy(entry[0])
+        else:
+            if entry is not None:
+                self.remove(key)
+            self.miss_count += 1
+            return None
+
+    def put(self, key, obj, version=None, size: int = None) -> bool:
+        """
+        stores the object without copying it, so it should not be modified afterwards
+
+        :return: whether the object was stored (it is not if it is larger than the size budget)
+        """
+        self.remove(key)
+
+        if obj is None or self.max_size <= 0:
+            return False
+
+        size = MemoryCache.get_size(obj) if size is None else size
+        if size > self.max_size:
+            return False
+
+        self._entries[key] = (obj, size, version)
+        self.size += size
+
+        while self.size > self.max_size:
+            _, (_, removed_size, _) = self._entries.popitem(last=False)
+            self.size -= removed_size
+
+        return True
+
+    def remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    def get_stats(self) -> dict:
+        return {"entry_count": len(self._entries), "size": self.size, "max_size": self.max_size, "hit_count": self.hit_count,
+                "miss_count": self.miss_count}
+
+    @staticmethod
+    def get_size(obj) -> int:
+        """
+        estimates the size of the object in memory in bytes: the data of NumPy arrays, scipy.sparse matrices and pandas objects is
+        counted by their buffer sizes, and containers and objects are measured recursively (objects referenced multiple times are
+        counted once)
+        """
+        size, stack, visited = 0, [obj], set()
+
+        while stack:
+            item = stack.pop()
+            if id(item) in visited:
+                continue
+            visited.add(id(item))
+
+            if isinstance(item, np.ndarray):
+                size += sys.getsizeof(item) if item.base is None else item.nbytes
+                if item.dtype == object:
+                    stack.extend(item.ravel().tolist())
+            elif sparse.issparse(item):
+                size += sys.getsizeof(item)
+                stack.extend(array for array in vars(item).values() if isinstance(array, np.ndarray))
+            elif isinstance(item, (pd.DataFrame, pd.Series)):
+                size += int(np.sum(item.memory_usage(deep=True)))
+            elif isinstance(item, type):
+                continue
+            else:
+                size += sys.getsizeof(item)
+                if isinstance(item, dict):
+                    stack.extend(item.keys())
+                    stack.extend(item.values())
+                elif isinstance(item, (list, tuple, set, frozenset)):
+                    stack.extend(item)
+                if hasattr(item, "__dict__") and not callable(item):
+                    stack.append(vars(item))
+                slots = getattr(type(item), "__slots__", ())
+                for slot in [slots] if isinstance(slots, str) else slots:
+                    if hasattr(item, slot):
+                        stack.append(getattr(item, slot))
+
+        return size
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ColumnType(Enum):
+
+    STRING = "STRING"
+    CATEGORICAL = "CATEGORICAL"
+    INTEGER = "INTEGER"
+    FLOAT = "FLOAT"
+    OBJECT = "OBJECT"
@@ -0,0 +1,457 @@
+import importlib
+import json
+import shutil
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
+
+from immuneML.data_model.ColumnType import ColumnType
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class ColumnarStorage:
+    """
+    Stores a table of equally long columns on disk as a directory with one typed numpy file per column, so that each column can be
+    loaded (and memory-mapped) on its own without deserializing the rest of the table.
+
+    Column types (see ColumnType):
+        - STRING: all values concatenated into one utf-8 encoded uint8 buffer (<name>.npy) with int64 offsets (<name>_offsets.npy)
+        - CATEGORICAL: integer codes (<name>.npy) into a list of categories stored in the header; -1 denotes a missing value; if the
+          values are members of an Enum with string values (e.g. Chain), the enum class is stored in the header and the members are
+          restored when reading
+        - INTEGER / FLOAT: numeric array (<name>.npy)
+        - OBJECT: fallback for arbitrary python objects, stored as a pickled numpy object array (<name>.npy)
+
+    Missing values (None) in STRING, INTEGER and FLOAT columns are recorded in a boolean mask (<name>_none.npy) which is only written if
+    there are missing values. The header (header.json) stores the number of elements, the column order and types and the categories;
+    it is written last, so a directory without a header is not a valid storage.
+
+    As the column names are used as file names, they cannot contain path separators and a column cannot be named as another column
+    followed by one of the suffixes of the additional files (e.g. counts and counts_none).
+    """
+
+    SUFFIX = ".iml_columns"
+    HEADER_FILENAME = "header.json"
+    HELPER_FILE_SUFFIXES = ["_offsets", "_none"]
+    VERSION = 1
+
+    @staticmethod
+    def is_columnar(path: Path) -> bool:
+        return path is not None and (Path(path) / ColumnarStorage.HEADER_FILENAME).is_file()
+
+    @staticmethod
+    def write(path: Path, columns: dict, column_types: dict = None) -> Path:
+        """
+        Writes the columns to the directory given by path
+
+        Arguments:
+            path: directory where the columns will be stored; it will be created if it does not exist
+            columns: a dictionary of column names and values (lists, numpy arrays or pandas series) of equal length
+            column_types: optional dictionary of column names and preferred ColumnType (e.g. CATEGORICAL for gene columns); if the values
+                          cannot be stored as the preferred type, the type is inferred from the values
+
+        Returns:
+            the path to the storage directory
+        """
+        ColumnarStorage._check_column_names(list(columns.keys()))
+        path = PathBuilder.build(path)
+        column_types = column_types if column_types is not None else {}
+        header = {"version": ColumnarStorage.VERSION, "element_count": None, "columns": {}}
+
+        for name, values in columns.items():
+            values = ColumnarStorage._to_array(values)
+            if header["element_count"] is None:
+                header["element_count"] = values.shape[0]
+            assert header["element_count"] == values.shape[0], \
+                f"{ColumnarStorage.__name__}: column {name} has {values.shape[0]} elements, expected {header['element_count']}."
+
+            header["columns"][name] = ColumnarStorage._write_column(path, name, values, column_types.get(name, None))
+
+        header["element_count"] = 0 if header["element_count"] is None else int(header["element_count"])
+        ColumnarStorage._write_header(path, header)
+
+        return path
+
+    @staticmethod
+    def read_header(path: Path) -> dict:
+        with (Path(path) / ColumnarStorage.HEADER_FILENAME).open("r") as file:
+            header = json.load(file)
+        return header
+
+    @staticmethod
+    def get_element_count(path: Path) -> int:
+        return ColumnarStorage.read_header(path)["element_count"]
+
+    @staticmethod
+    def get_column_names(path: Path) -> list:
+        return list(ColumnarStorage.read_header(path)["columns"].keys())
+
+    @staticmethod
+    def get_column_type(path: Path, name: str) -> ColumnType:
+        header = ColumnarStorage.read_header(path)
+        return ColumnType[header["columns"][name]["type"]] if name in header["columns"] else None
+
+    @staticmethod
+    def read_column(path: Path, name: str, header: dict = None):
+        """
+        Reads one column from the storage; numeric columns are memory-mapped (copy-on-write), string and categorical columns are returned
+        as numpy object arrays of python strings (None for missing values), as in the rest of immuneML
+
+        Returns:
+            numpy array with the column values or None if the column does not exist
+        """
+        header = ColumnarStorage.read_header(path) if header is None else header
+        if name not in header["columns"]:
+            return None
+
+        path = Path(path)
+        column_info = header["columns"][name]
+        column_type = ColumnType[column_info["type"]]
+
+        if column_type == ColumnType.STRING:
+            buffer, offsets = ColumnarStorage.read_string_buffer(path, name)
+            values = ColumnarStorage._decode_strings(buffer, offsets, column_info["ascii"])
+        elif column_type == ColumnType.CATEGORICAL:
+            codes = ColumnarStorage._load(path / f"{name}.npy")
+            categories = np.array(ColumnarStorage._make_categories(column_info) + [None], dtype=object)
+            values = categories[codes]
+        elif column_type == ColumnType.OBJECT:
+            values = np.load(path / f"{name}.npy", allow_pickle=True)
+        else:
+            values = ColumnarStorage._load(path / f"{name}.npy")
+
+        if column_info.get("has_none", False) and column_type in [ColumnType.STRING, ColumnType.INTEGER, ColumnType.FLOAT]:
+            values = values.astype(object)
+            values[ColumnarStorage._load(path / f"{name}_none.npy")] = None
+
+        return values
+
+    @staticmethod
+    def read_columns(path: Path, names: list = None) -> dict:
+        header = ColumnarStorage.read_header(path)
+        names = list(header["columns"].keys()) if names is None else names
+        return {name: ColumnarStorage.read_column(path, name, header) for name in names if name in header["columns"]}
+
+    @staticmethod
+    def read_string_buffer(path: Path, name: str):
+        """
+        Returns the raw content of a STRING column without creating python string objects: a memory-mapped uint8 buffer with all values
+        concatenated and an int64 array of offsets of length element_count + 1, so that the i-th value is buffer[offsets[i]:offsets[i+1]]
+        """
+        path = Path(path)
+        return ColumnarStorage._load(path / f"{name}.npy"), ColumnarStorage._load(path / f"{name}_offsets.npy")
+
+    @staticmethod
+    def encode_strings(values):
+        """
+        Encodes a list of strings in the same layout as STRING columns are stored in (see read_string_buffer); None values are encoded
+        as empty strings
+        """
+        encoded = [value.encode("utf-8") if value is not None else b"" for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+    @staticmethod
+    def read_structured_array(path: Path) -> np.ndarray:
+        """
+        Returns all columns as a numpy structured array with object fields, the layout which was used for storing repertoires before
+        the columnar storage was introduced
+        """
+        header = ColumnarStorage.read_header(path)
+        data = np.empty(header["element_count"], dtype=np.dtype([(name, object) for name in header["columns"]]))
+        for name in header["columns"]:
+            data[name] = ColumnarStorage.read_column(path, name, header)
+        return data
+
+    @staticmethod
+    def take(path: Path, indices, result_path: Path) -> Path:
+        """
+        Creates a new storage in result_path with the rows given by indices; the column files are gathered directly without decoding the
+        values to python objects
+        """
+        path, result_path = Path(path), PathBuilder.build(result_path)
+        header = ColumnarStorage.read_header(path)
+        indices = np.asarray(indices)
+        indices = np.flatnonzero(indices) if indices.dtype == bool else indices.astype(np.int64)
+
+        for name, column_info in header["columns"].items():
+            column_type = ColumnType[column_info["type"]]
+            if column_type == ColumnType.STRING:
+                buffer, offsets = ColumnarStorage.read_string_buffer(path, name)
+                new_buffer, new_offsets = ColumnarStorage._take_strings(buffer, offsets, indices)
+                np.save(result_path / f"{name}.npy", new_buffer)
+                np.save(result_path / f"{name}_offsets.npy", new_offsets)
+            else:
+                values = np.load(path / f"{name}.npy", allow_pickle=column_type == ColumnType.OBJECT)
+                np.save(result_path / f"{name}.npy", values[indices], allow_pickle=column_type == ColumnType.OBJECT)
+
+            if column_info.get("has_none", False):
+                none_mask = ColumnarStorage._load(path / f"{name}_none.npy")[indices]
+                column_info["has_none"] = bool(none_mask.any())
+                if column_info["has_none"]:
+                    np.save(result_path / f"{name}_none.npy", none_mask)
+
+        header["element_count"] = int(indices.shape[0])
+        ColumnarStorage._write_header(result_path, header)
+
+        return result_path
+
+    @staticmethod
+    def concatenate(paths: list, result_path: Path, column_types: dict = None) -> Path:
+        """
+        Creates a new storage in result_path with the rows of all storages in paths, in the given order; the columns are merged one at a
+        time and written through memory-mapped files, so the memory needed does not depend on the total number of rows. Columns missing
+        from some of the storages are filled with missing values there. If a column was stored with different types in different
+        storages (e.g. INTEGER and FLOAT), the type is inferred again from all values.
+        """
+        paths, result_path = [Path(path) for path in paths], PathBuilder.build(result_path)
+        headers = [ColumnarStorage.read_header(path) for path in paths]
+        counts = [header["element_count"] for header in headers]
+        names = list(dict.fromkeys(name for header in headers for name in header["columns"]))
+        ColumnarStorage._check_column_names(names)
+        column_types = column_types if column_types is not None else {}
+
+        result_header = {"version": ColumnarStorage.VERSION, "element_count": int(sum(counts)), "columns": {}}
+        for name in names:
+            infos = [header["columns"].get(name) for header in headers]
+            types = {info["type"] for info in infos if info is not None}
+            if len(types) > 1 and types == {ColumnType.INTEGER.name, ColumnType.FLOAT.name}:
+                types = {ColumnType.FLOAT.name}
+
+            if len(types) == 1 and next(iter(types)) != ColumnType.OBJECT.name:
+                column_info = ColumnarStorage._concatenate_column(paths, infos, counts, name, ColumnType[types.pop()], result_path)
+            else:
+                values = np.concatenate([ColumnarStorage.read_column(path, name, header) if info is not None
+                                         else np.full(count, None, dtype=object)
+                                         for path, header, info, count in zip(paths, headers, infos, counts)]).astype(object)
+                column_info = ColumnarStorage._write_column(result_path, name, values, column_types.get(name, None))
+
+            result_header["columns"][name] = column_info
+
+        ColumnarStorage._write_header(result_path, result_header)
+
+        return result_path
+
+    @staticmethod
+    def _concatenate_column(paths: list, infos: list, counts: list, name: str, column_type: ColumnType, result_path: Path) -> dict:
+        column_info = {"type": column_type.name}
+        total_count = sum(counts)
+        none_masks = [ColumnarStorage._load(path / f"{name}_none.npy") if info is not None and info.get("has_none", False)
+                      else np.full(count, info is None) for path, info, count in zip(paths, infos, counts)]
+
+        if column_type == ColumnType.STRING:
+            parts = [ColumnarStorage.read_string_buffer(path, name) if info is not None
+                     else (np.zeros(0, dtype=np.uint8), np.zeros(count + 1, dtype=np.int64)) for path, info, count in zip(paths, infos, counts)]
+            buffer = np.lib.format.open_memmap(result_path / f"{name}.npy", mode="w+", dtype=np.uint8,
+                                               shape=(sum(part[0].shape[0] for part in parts),))
+            offsets = np.lib.format.open_memmap(result_path / f"{name}_offsets.npy", mode="w+", dtype=np.int64, shape=(total_count + 1,))
+            offsets[0], buffer_start, row_start = 0, 0, 0
+            for part_buffer, part_offsets in parts:
+                buffer[buffer_start: buffer_start + part_buffer.shape[0]] = part_buffer
+                offsets[row_start + 1: row_start + part_offsets.shape[0]] = part_offsets[1:] + buffer_start
+                buffer_start, row_start = buffer_start + part_buffer.shape[0], row_start + part_offsets.shape[0] - 1
+            column_info["ascii"] = all(info["ascii"] for info in infos if info is not None)
+            buffer.flush()
+            offsets.flush()
+
+        elif column_type == ColumnType.CATEGORICAL:
+            enums = {info.get("enum") for info in infos if info is not None}
+            if len(enums) == 1 and None not in enums:
+                column_info["enum"] = enums.pop()
+            categories = sorted({category for info in infos if info is not None for category in info["categories"]})
+            category_index = {category: index for index, category in enumerate(categories)}
+            codes = np.lib.format.open_memmap(result_path / f"{name}.npy", mode="w+", shape=(total_count,),
+                                              dtype=np.int16 if len(categories) < np.iinfo(np.int16).max else np.int32)
+            start = 0
+            for path, info, count in zip(paths, infos, counts):
+                if info is not None:
+                    part_codes = ColumnarStorage._load(path / f"{name}.npy")
+                    mapping = np.array([category_index[category] for category in info["categories"]] + [-1], dtype=codes.dtype)
+                    codes[start: start + count] = mapping[part_codes]
+                else:
+                    codes[start: start + count] = -1
+                start += count
+            column_info["categories"] = categories
+            codes.flush()
+
+        else:
+            parts = [ColumnarStorage._load(path / f"{name}.npy") if info is not None else np.zeros(count, dtype=np.int32)
+                     for path, info, count in zip(paths, infos, counts)]
+            dtype = np.float64 if column_type == ColumnType.FLOAT else np.result_type(*[part.dtype for part in parts])
+            values = np.lib.format.open_memmap(result_path / f"{name}.npy", mode="w+", dtype=dtype, shape=(total_count,))
+            start = 0
+            for part, none_mask in zip(parts, none_masks):
+                values[start: start + part.shape[0]] = part
+                if column_type == ColumnType.FLOAT:
+                    values[start: start + part.shape[0]][none_mask] = np.nan
+                start += part.shape[0]
+            values.flush()
+
+        if column_type in [ColumnType.STRING, ColumnType.INTEGER, ColumnType.FLOAT]:
+            column_info["has_none"] = bool(any(none_mask.any() for none_mask in none_masks))
+            if column_info["has_none"]:
+                np.save(result_path / f"{name}_none.npy", np.concatenate(none_masks))
+
+        return column_info
+
+    @staticmethod
+    def copy(path: Path, result_path: Path) -> Path:
+        if not Path(result_path).is_dir():
+            shutil.copytree(path, result_path)
+        return Path(result_path)
+
+    @staticmethod
+    def _check_column_names(names: list):
+        for name in names:
+            assert isinstance(name, str) and name != "" and not any(character in name for character in ["/", "\\", "\0"]), \
+                f"{ColumnarStorage.__name__}: invalid column name {name!r}, column names have to be non-empty strings without path separators."
+            assert not any(name.endswith(suffix) and name[:-len(suffix)] in names for suffix in ColumnarStorage.HELPER_FILE_SUFFIXES), \
+                f"{ColumnarStorage.__name__}: column name {name} conflicts with the files of column {name.rsplit('_', 1)[0]}, please " \
+                f"rename one of the columns."
+
+    @staticmethod
+    def _write_header(path: Path, header: dict):
+        with (path / ColumnarStorage.HEADER_FILENAME).open("w") as file:
+            json.dump(header, file)
+
+    @staticmethod
+    def _load(file_path: Path):
+        return np.load(file_path, mmap_mode="c", allow_pickle=False)
+
+    @staticmethod
+    def _to_array(values) -> np.ndarray:
+        if isinstance(values, np.ndarray):
+            array = values
+        elif hasattr(values, "to_numpy"):
+            array = values.to_numpy()
+        else:
+            values = list(values)
+            array = np.empty(len(values), dtype=object)
+            for index, value in enumerate(values):
+                array[index] = value
+
+        assert array.ndim == 1, f"{ColumnarStorage.__name__}: only one-dimensional columns can be stored, got shape {array.shape}."
+        return array
+
+    @staticmethod
+    def _infer_type(values: np.ndarray, none_mask: np.ndarray, preferred_type: ColumnType):
+        if values.dtype.kind in "iu":
+            return ColumnType.INTEGER, values, {}
+        elif values.dtype.kind == "f":
+            return ColumnType.FLOAT, values, {}
+        elif values.dtype.kind in "US":
+            return ColumnType.CATEGORICAL if preferred_type == ColumnType.CATEGORICAL else ColumnType.STRING, values.astype(object), {}
+        elif values.dtype.kind != "O":
+            return ColumnType.OBJECT, values, {}
+
+        present_values = values[~none_mask]
+
+        if preferred_type == ColumnType.CATEGORICAL and present_values.shape[0] > 0 and isinstance(present_values[0], Enum) \
+                and all(type(value) == type(present_values[0]) and isinstance(value.value, str) for value in present_values):
+            values = values.copy()
+            values[~none_mask] = [value.value for value in present_values]
+            return ColumnType.CATEGORICAL, values, {"enum": f"{type(present_values[0]).__module__}.{type(present_values[0]).__name__}"}
+
+        if preferred_type == ColumnType.INTEGER and all(isinstance(value, (str, int, float, np.number)) for value in present_values):
+            try:
+                converted_values = values.copy()
+                converted_values[~none_mask] = [ColumnarStorage._to_integer(value) for value in present_values]
+                return ColumnType.INTEGER, converted_values, {}
+            except ValueError:
+                pass
+
+        if all(isinstance(value, str) for value in present_values):
+            return ColumnType.CATEGORICAL if preferred_type == ColumnType.CATEGORICAL else ColumnType.STRING, values, {}
+        elif all(isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)) for value in present_values):
+            return ColumnType.INTEGER, values, {}
+        elif all(isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+                 for value in present_values):
+            return ColumnType.FLOAT, values, {}
+        else:
+            return ColumnType.OBJECT, values, {}
+
+    @staticmethod
+    def _to_integer(value) -> int:
+        """converts the value to int if it represents a whole number (e.g. 3, 3.0 or "3") and raises ValueError otherwise"""
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        elif isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError(f"{ColumnarStorage.__name__}: {value!r} is not a whole number.")
+        return int(number)
+
+    @staticmethod
+    def _write_column(path: Path, name: str, values: np.ndarray, preferred_type: ColumnType) -> dict:
+        none_mask = np.equal(values, None) if values.dtype.kind == "O" else np.zeros(values.shape[0], dtype=bool)
+        column_type, values, column_info = ColumnarStorage._infer_type(values, none_mask, preferred_type)
+        column_info["type"] = column_type.name
+
+        if column_type == ColumnType.STRING:
+            buffer, offsets = ColumnarStorage.encode_strings(values)
+            column_info["ascii"] = bool(buffer.size == 0 or buffer.max() < 128)
+            np.save(path / f"{name}.npy", buffer)
+            np.save(path / f"{name}_offsets.npy", offsets)
+        elif column_type == ColumnType.CATEGORICAL:
+            categories, inverse = np.unique(values[~none_mask].astype(str), return_inverse=True)
+            codes = np.full(values.shape[0], -1, dtype=np.int16 if categories.shape[0] < np.iinfo(np.int16).max else np.int32)
+            codes[~none_mask] = inverse
+            column_info["categories"] = categories.tolist()
+            np.save(path / f"{name}.npy", codes)
+        elif column_type == ColumnType.INTEGER:
+            numbers = np.zeros(values.shape[0], dtype=np.int64)
+            numbers[~none_mask] = values[~none_mask]
+            if numbers.size == 0 or (numbers.min() >= np.iinfo(np.int32).min and numbers.max() <= np.iinfo(np.int32).max):
+                numbers = numbers.astype(np.int32)
+            np.save(path / f"{name}.npy", numbers)
+        elif column_type == ColumnType.FLOAT:
+            numbers = np.full(values.shape[0], np.nan, dtype=np.float64)
+            numbers[~none_mask] = values[~none_mask]
+            np.save(path / f"{name}.npy", numbers)
+        else:
+            np.save(path / f"{name}.npy", values, allow_pickle=True)
+
+        if column_type in [ColumnType.STRING, ColumnType.INTEGER, ColumnType.FLOAT]:
+            column_info["has_none"] = bool(none_mask.any())
+            if column_info["has_none"]:
+                np.save(path / f"{name}_none.npy", none_mask)
+
+        return column_info
+
+    @staticmethod
+    def _make_categories(column_info: dict) -> list:
+        if "enum" in column_info:
+            module_name, class_name = column_info["enum"].rsplit(".", 1)
+            enum_class = getattr(importlib.import_module(module_name), class_name)
+            return [enum_class(category) for category in column_info["categories"]]
+        else:
+            return column_info["categories"]
+
+    @staticmethod
+    def _decode_strings(buffer: np.ndarray, offsets: np.ndarray, is_ascii: bool) -> np.ndarray:
+        values = np.empty(offsets.shape[0] - 1, dtype=object)
+        raw, starts, ends = buffer.tobytes(), offsets[:-1].tolist(), offsets[1:].tolist()
+
+        if is_ascii:
+            text = raw.decode("ascii")
+            values[:] = [text[start:end] for start, end in zip(starts, ends)]
+        else:
+            values[:] = [raw[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+
+        return values
+
+    @staticmethod
+    def _take_strings(buffer: np.ndarray, offsets: np.ndarray, indices: np.ndarray):
+        starts = offsets[:-1][indices]
+        lengths = offsets[1:][indices] - starts
+        new_offsets = np.zeros(indices.shape[0] + 1, dtype=np.int64)
+        np.cumsum(lengths, out=new_offsets[1:])
+        positions = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+        return np.asarray(buffer)[positions], new_offsets
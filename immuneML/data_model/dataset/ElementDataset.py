@@ -37,18 +37,31 @@ class ElementDataset(Dataset):
         return self._filenames
 
     def set_filenames(self, filenames):
-        self._filenames = filenames
+        self._filenames = sorted(filenames)
+        self.element_generator = ElementGenerator(self._filenames, self.file_size)
+        self.element_ids = None
 
     def get_example_count(self):
-        return len(self.get_example_ids())
+        self._filenames.sort()
+        self.element_generator.file_list = self._filenames
+        return self.element_generator.get_element_count()
 
     def get_example_ids(self):
         if self.element_ids is None or (isinstance(self.element_ids, list) and len(self.element_ids) == 0):
-            self.element_ids = []
-            for element in self.get_data():
-                self.element_ids.append(element.identifier)
+            self._filenames.sort()
+            self.element_generator.file_list = self._filenames
+            self.element_ids = self.element_generator.get_identifiers()
         return self.element_ids
 
+    def get_attributes(self, attributes: list) -> dict:
+        """
+        Returns the values of the given attributes for all examples as a dictionary of numpy arrays; for datasets stored in the columnar
+        format only the needed columns are loaded (see ElementGenerator.get_attributes for attribute names)
+        """
+        self._filenames.sort()
+        self.element_generator.file_list = self._filenames
+        return self.element_generator.get_attributes(attributes)
+
     def make_subset(self, example_indices, path, dataset_type: str):
         """
         Creates a new dataset object with only those examples (receptors or receptor sequences) available which were given by index in example_indices argument.
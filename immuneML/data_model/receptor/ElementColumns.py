@@ -0,0 +1,189 @@
+from pathlib import Path
+
+import numpy as np
+
+from immuneML.data_model.ColumnType import ColumnType
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
+from immuneML.data_model.receptor.BCKReceptor import BCKReceptor
+from immuneML.data_model.receptor.BCReceptor import BCReceptor
+from immuneML.data_model.receptor.ChainPair import ChainPair
+from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
+from immuneML.data_model.receptor.TCGDReceptor import TCGDReceptor
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
+from immuneML.data_model.repertoire.Repertoire import Repertoire
+
+
+class ElementColumns:
+    """
+    Converts batches of receptor sequences and receptors to columns (see ColumnarStorage) and back, so that the batches of
+    SequenceDataset and ReceptorDataset can be stored in a column-oriented format instead of pickled lists of objects.
+
+    A batch of sequences has the same columns as a repertoire: the attributes from Repertoire.FIELDS (only those which are set for at
+    least one sequence), one column per custom parameter and, if any sequence is annotated, an object column with the annotations.
+
+    A batch of receptors has the columns receptor_identifiers and receptor_classes (name of the receptor class, e.g. TCABReceptor), one
+    column per receptor metadata key and for each chain the columns of its sequences prefixed by the chain name and a dot (e.g.
+    alpha.sequence_aas, beta.v_genes).
+    """
+
+    ANNOTATION_COLUMN = "annotations"
+    RECEPTOR_IDENTIFIER_COLUMN = "receptor_identifiers"
+    RECEPTOR_CLASS_COLUMN = "receptor_classes"
+    CHAIN_SEPARATOR = "."
+
+    SEQUENCE_ATTRIBUTES = {"sequence_aas": "amino_acid_sequence", "sequences": "nucleotide_sequence", "sequence_identifiers": "identifier"}
+    METADATA_ATTRIBUTES = {"v_genes": "v_gene", "j_genes": "j_gene", "v_subgroups": "v_subgroup", "j_subgroups": "j_subgroup",
+                           "v_alleles": "v_allele", "j_alleles": "j_allele", "chains": "chain", "counts": "count",
+                           "region_types": "region_type", "frame_types": "frame_type", "cell_ids": "cell_id"}
+
+    RECEPTOR_CLASSES = {TCABReceptor: ["alpha", "beta"], TCGDReceptor: ["gamma", "delta"], BCReceptor: ["heavy", "light"],
+                        BCKReceptor: ["heavy", "kappa"]}
+    CHAIN_PAIR_CLASSES = {ChainPair.TRA_TRB: TCABReceptor, ChainPair.TRG_TRD: TCGDReceptor, ChainPair.IGH_IGL: BCReceptor,
+                          ChainPair.IGH_IGK: BCKReceptor}
+
+    @staticmethod
+    def write(elements: list, path: Path) -> Path:
+        """
+        Stores a batch of ReceptorSequence or Receptor objects to path in the columnar format
+        """
+        return ElementColumns.write_columns(ElementColumns.to_columns(elements), path)
+
+    @staticmethod
+    def to_columns(elements: list) -> dict:
+        if len(elements) > 0 and not isinstance(elements[0], ReceptorSequence):
+            return ElementColumns.receptors_to_columns(elements)
+        else:
+            return ElementColumns.sequences_to_columns(elements)
+
+    @staticmethod
+    def write_columns(columns: dict, path: Path) -> Path:
+        column_types = {name: Repertoire.FIELD_TYPES.get(name.split(ElementColumns.CHAIN_SEPARATOR)[-1], ColumnType.CATEGORICAL)
+                        for name in columns.keys()}
+        column_types[ElementColumns.ANNOTATION_COLUMN] = ColumnType.OBJECT
+        return ColumnarStorage.write(path, columns, column_types)
+
+    @staticmethod
+    def read(path: Path) -> list:
+        """
+        Loads the batch stored in path and creates ReceptorSequence or Receptor objects from its columns
+        """
+        columns = {name: values.tolist() for name, values in ColumnarStorage.read_columns(path).items()}
+        count = ColumnarStorage.get_element_count(path)
+        if ElementColumns.RECEPTOR_CLASS_COLUMN in columns:
+            return ElementColumns.columns_to_receptors(columns, count)
+        else:
+            return ElementColumns.columns_to_sequences(columns, count)
+
+    @staticmethod
+    def read_attributes(path: Path, attributes: list) -> dict:
+        """
+        Loads only the columns of the given attributes from the batch stored in path; the values of attributes which are not stored are
+        None for all elements
+        """
+        header = ColumnarStorage.read_header(path)
+        return {attribute: ColumnarStorage.read_column(path, attribute, header) if attribute in header["columns"]
+                else np.full(header["element_count"], None, dtype=object) for attribute in attributes}
+
+    @staticmethod
+    def select_attributes(columns: dict, attributes: list, count: int) -> dict:
+        return {attribute: np.asarray(columns[attribute], dtype=object) if attribute in columns else np.full(count, None, dtype=object)
+                for attribute in attributes}
+
+    @staticmethod
+    def get_identifiers(path: Path) -> list:
+        """
+        Returns the identifiers of the receptors or sequences in the batch stored in path without loading the other columns
+        """
+        header = ColumnarStorage.read_header(path)
+        identifier_column = ElementColumns.RECEPTOR_IDENTIFIER_COLUMN if ElementColumns.RECEPTOR_CLASS_COLUMN in header["columns"] \
+            else "sequence_identifiers"
+        return ElementColumns.read_attributes(path, [identifier_column])[identifier_column].tolist()
+
+    @staticmethod
+    def sequences_to_columns(sequences: list) -> dict:
+        columns = {}
+        for field, attribute in ElementColumns.SEQUENCE_ATTRIBUTES.items():
+            columns[field] = [getattr(sequence, attribute) for sequence in sequences]
+        for field, attribute in ElementColumns.METADATA_ATTRIBUTES.items():
+            columns[field] = [getattr(sequence.metadata, attribute, None) for sequence in sequences]
+
+        columns = {field: values for field, values in columns.items() if any(value is not None for value in values)}
+
+        custom_keys = list(dict.fromkeys(key for sequence in sequences if sequence.metadata is not None
+                                         for key in sequence.metadata.custom_params))
+        for key in custom_keys:
+            columns[key] = [sequence.metadata.custom_params.get(key, None) if sequence.metadata is not None else None
+                            for sequence in sequences]
+
+        if any(sequence.annotation is not None for sequence in sequences):
+            columns[ElementColumns.ANNOTATION_COLUMN] = [sequence.annotation for sequence in sequences]
+
+        return columns
+
+    @staticmethod
+    def columns_to_sequences(columns: dict, count: int) -> list:
+        fields = list(ElementColumns.SEQUENCE_ATTRIBUTES.keys()) + list(ElementColumns.METADATA_ATTRIBUTES.keys())
+        custom_keys = [name for name in columns if name not in fields and name != ElementColumns.ANNOTATION_COLUMN]
+        missing = [None] * count
+
+        values = {field: columns.get(field, missing) for field in fields + [ElementColumns.ANNOTATION_COLUMN]}
+        custom_values = [columns[key] for key in custom_keys]
+
+        sequences = []
+        for index in range(count):
+            count_value = values["counts"][index]
+            metadata = SequenceMetadata(**{attribute: values[field][index] for field, attribute in ElementColumns.METADATA_ATTRIBUTES.items()
+                                           if field != "counts"},
+                                        count=int(count_value) if count_value is not None else None,
+                                        custom_params={key: custom[index] for key, custom in zip(custom_keys, custom_values)})
+            sequences.append(ReceptorSequence(**{attribute: values[field][index] for field, attribute in ElementColumns.SEQUENCE_ATTRIBUTES.items()},
+                                              annotation=values[ElementColumns.ANNOTATION_COLUMN][index], metadata=metadata))
+
+        return sequences
+
+    @staticmethod
+    def receptors_to_columns(receptors: list) -> dict:
+        columns = {ElementColumns.RECEPTOR_IDENTIFIER_COLUMN: [receptor.identifier for receptor in receptors],
+                   ElementColumns.RECEPTOR_CLASS_COLUMN: [type(receptor).__name__ for receptor in receptors]}
+
+        metadata_keys = list(dict.fromkeys(key for receptor in receptors if receptor.metadata is not None for key in receptor.metadata))
+        for key in metadata_keys:
+            columns[key] = [receptor.metadata.get(key, None) if receptor.metadata is not None else None for receptor in receptors]
+
+        chains = list(dict.fromkeys(chain for receptor in receptors for chain in receptor.get_chains()))
+        for chain in chains:
+            indices = [index for index, receptor in enumerate(receptors) if chain in receptor.get_chains() and receptor.get_chain(chain) is not None]
+            chain_columns = ElementColumns.sequences_to_columns([receptors[index].get_chain(chain) for index in indices])
+            for field, values in chain_columns.items():
+                column = np.full(len(receptors), None, dtype=object)
+                column[indices] = values
+                columns[f"{chain}{ElementColumns.CHAIN_SEPARATOR}{field}"] = column
+
+        return columns
+
+    @staticmethod
+    def columns_to_receptors(columns: dict, count: int) -> list:
+        classes = {receptor_class.__name__: receptor_class for receptor_class in ElementColumns.RECEPTOR_CLASSES}
+        chain_names = set(chain for chains in ElementColumns.RECEPTOR_CLASSES.values() for chain in chains)
+
+        chain_columns = {chain: {} for chain in chain_names}
+        metadata_columns = {}
+        for name, values in columns.items():
+            chain, _, field = name.partition(ElementColumns.CHAIN_SEPARATOR)
+            if chain in chain_names and field != "":
+                chain_columns[chain][field] = values
+            elif name not in [ElementColumns.RECEPTOR_IDENTIFIER_COLUMN, ElementColumns.RECEPTOR_CLASS_COLUMN]:
+                metadata_columns[name] = values
+
+        sequences = {chain: ElementColumns.columns_to_sequences(chain_columns[chain], count) for chain in chain_names
+                     if len(chain_columns[chain]) > 0}
+
+        receptors = []
+        for index in range(count):
+            receptor_class = classes[columns[ElementColumns.RECEPTOR_CLASS_COLUMN][index]]
+            chains = {chain: sequences[chain][index] if chain in sequences else None for chain in ElementColumns.RECEPTOR_CLASSES[receptor_class]}
+            receptors.append(receptor_class(**chains, identifier=columns[ElementColumns.RECEPTOR_IDENTIFIER_COLUMN][index],
+                                            metadata={key: values[index] for key, values in metadata_columns.items()}))
+
+        return receptors
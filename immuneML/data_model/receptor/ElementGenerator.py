@@ -2,6 +2,12 @@ import math
 import pickle
 from pathlib import Path
 
+import numpy as np
+
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
+from immuneML.data_model.receptor.ElementColumns import ElementColumns
+
+
 class ElementGenerator:
 
     def __init__(self, file_list: list, file_size: int = 1000):
@@ -11,6 +17,9 @@ class ElementGenerator:
 
     def _load_batch(self, current_file: int):
 
+        if ColumnarStorage.is_columnar(self.file_list[current_file]):
+            return ElementColumns.read(self.file_list[current_file])
+
         with self.file_list[current_file].open("rb") as file:
             elements = pickle.load(file)
 
@@ -18,9 +27,9 @@ class ElementGenerator:
 
     def _get_element_count(self, file_index: int):
 
-        # TODO: make this abstract and move implementation to specific generator: count elements in file for new format
-
-        if self.file_lengths[file_index] == -1:
+        if self.file_lengths[file_index] == -1 and ColumnarStorage.is_columnar(self.file_list[file_index]):
+            self.file_lengths[file_index] = ColumnarStorage.get_element_count(self.file_list[file_index])
+        elif self.file_lengths[file_index] == -1:
             with self.file_list[file_index].open("rb") as file:
                 count = len(pickle.load(file))
             self.file_lengths[file_index] = count
@@ -33,6 +42,35 @@ class ElementGenerator:
                 self._get_element_count(index)
         return sum(self.file_lengths)
 
+    def get_identifiers(self) -> list:
+        """
+        Returns the identifiers of all elements; for batches in the columnar format, only the identifier column is loaded
+        """
+        identifiers = []
+        for index in range(len(self.file_list)):
+            if ColumnarStorage.is_columnar(self.file_list[index]):
+                identifiers.extend(ElementColumns.get_identifiers(self.file_list[index]))
+            else:
+                identifiers.extend(element.identifier for element in self._load_batch(index))
+        return identifiers
+
+    def get_attributes(self, attributes: list) -> dict:
+        """
+        Returns the values of the given attributes for all elements as a dictionary of numpy arrays, without creating sequence or receptor
+        objects for batches in the columnar format; the attribute names are the column names from ElementColumns (e.g. sequence_aas,
+        alpha.v_genes or the name of a custom parameter or receptor metadata key)
+        """
+        parts = []
+        for index in range(len(self.file_list)):
+            if ColumnarStorage.is_columnar(self.file_list[index]):
+                parts.append(ElementColumns.read_attributes(self.file_list[index], attributes))
+            else:
+                batch = self._load_batch(index)
+                parts.append(ElementColumns.select_attributes(ElementColumns.to_columns(batch), attributes, len(batch)))
+
+        return {attribute: np.concatenate([part[attribute] for part in parts]) if len(parts) > 0 else np.array([], dtype=object)
+                for attribute in attributes}
+
     def build_batch_generator(self):
         """
         creates a generator which will return one batch of elements at the time
@@ -59,13 +97,16 @@ class ElementGenerator:
         if example_indices is None or len(example_indices) == 0:
             raise RuntimeError(f"{ElementGenerator.__name__}: no examples were specified to create the dataset subset. "
                                f"Dataset type was {dataset_type}, dataset identifier: {dataset_identifier}.")
+        example_indices.sort()
+
+        if all(ColumnarStorage.is_columnar(filename) for filename in self.file_list):
+            return self._take_subset(np.array(example_indices, dtype=np.int64), path, dataset_type, dataset_identifier)
+
         batch_size = self.file_size
         elements = []
         file_count = 1
 
-        example_indices.sort()
-
-        batch_filenames = self._prepare_batch_filenames(len(example_indices), path, dataset_type, dataset_identifier)
+        batch_filenames = self._prepare_batch_filenames(math.ceil(len(example_indices) / self.file_size), path, dataset_type, dataset_identifier)
 
         for index, batch in enumerate(self.build_batch_generator()):
             extracted_elements = self._extract_elements_from_batch(index, batch_size, batch, example_indices)
@@ -81,10 +122,29 @@ class ElementGenerator:
 
         return batch_filenames
 
-    def _prepare_batch_filenames(self, example_count: int, path: Path, dataset_type: str, dataset_identifier: str):
-        batch_count = math.ceil(example_count / self.file_size)
+    def _take_subset(self, example_indices: np.ndarray, path: Path, dataset_type: str, dataset_identifier: str) -> list:
+        """
+        Gathers the rows given by example_indices from each columnar batch directly from the column files, without loading the other
+        rows or creating objects; the subset has one batch per original batch with at least one selected element
+        """
+        offsets = np.concatenate([[0], np.cumsum([self._get_element_count(index) for index in range(len(self.file_list))])])
+        assert example_indices.shape[0] == 0 or (example_indices[0] >= 0 and example_indices[-1] < offsets[-1]), \
+            f"{ElementGenerator.__name__}: example indices have to be between 0 and {offsets[-1] - 1}, got {example_indices.tolist()}."
+
+        file_indices = np.searchsorted(offsets, example_indices, side="right") - 1
+        used_file_indices = np.unique(file_indices)
+
+        batch_filenames = self._prepare_batch_filenames(used_file_indices.shape[0], path, dataset_type, dataset_identifier,
+                                                        ColumnarStorage.SUFFIX)
+
+        for batch_filename, file_index in zip(batch_filenames, used_file_indices):
+            ColumnarStorage.take(self.file_list[file_index], example_indices[file_indices == file_index] - offsets[file_index], batch_filename)
+
+        return batch_filenames
+
+    def _prepare_batch_filenames(self, batch_count: int, path: Path, dataset_type: str, dataset_identifier: str, suffix: str = ".pkl"):
         digits_count = len(str(batch_count)) + 1
-        filenames = [path / f"{dataset_identifier}_{dataset_type}_batch{''.join(['0' for i in range(digits_count-len(str(index)))])}{index}.pkl"
+        filenames = [path / f"{dataset_identifier}_{dataset_type}_batch{''.join(['0' for i in range(digits_count-len(str(index)))])}{index}{suffix}"
                      for index in range(batch_count)]
         return filenames
 
@@ -10,6 +10,8 @@ from uuid import uuid4
 
 import numpy as np
 
+from immuneML.data_model.ColumnType import ColumnType
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.DatasetItem import DatasetItem
 from immuneML.data_model.cell.Cell import Cell
 from immuneML.data_model.cell.CellList import CellList
@@ -21,6 +23,7 @@ from immuneML.data_model.receptor.receptor_sequence.ReceptorSequenceList import
 from immuneML.data_model.receptor.receptor_sequence.SequenceAnnotation import SequenceAnnotation
 from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.SequenceType import SequenceType
 from immuneML.simulation.implants.ImplantAnnotation import ImplantAnnotation
 from immuneML.util.NumpyHelper import NumpyHelper
 from immuneML.util.PathBuilder import PathBuilder
@@ -29,22 +32,27 @@ from immuneML.util.PathBuilder import PathBuilder
 class Repertoire(DatasetItem):
     """
     Repertoire object consisting of sequence objects, each sequence attribute is stored as a list across all sequences and can be
-    loaded separately. Internally, this class relies on numpy to store/import_dataset the data.
+    loaded separately. Internally, this class relies on numpy to store/import_dataset the data: each attribute is stored as a separate
+    typed column (see ColumnarStorage), so that one attribute can be loaded without loading the rest of the repertoire. Repertoires
+    stored in the older format (one structured numpy array with all attributes in an .npy file) can still be loaded.
     """
 
     FIELDS = tuple(
         "sequence_aas,sequences,v_genes,j_genes,v_subgroups,j_subgroups,v_alleles,j_alleles,chains,counts,region_types,frame_types,"
         "sequence_identifiers,cell_ids".split(","))
 
+    FIELD_TYPES = {**{field: ColumnType.CATEGORICAL for field in ["v_genes", "j_genes", "v_subgroups", "j_subgroups", "v_alleles",
+                                                                  "j_alleles", "chains", "region_types", "frame_types"]},
+                   "counts": ColumnType.INTEGER}
+
     @staticmethod
     def process_custom_lists(custom_lists):
         if custom_lists:
             field_list = list(custom_lists.keys())
             values = [custom_lists[field] for field in custom_lists.keys()]
-            dtype = [(field, np.object) for field in custom_lists.keys()]
         else:
-            field_list, values, dtype = [], [], []
-        return field_list, values, dtype
+            field_list, values = [], []
+        return field_list, values
 
     @staticmethod
     def check_count(sequence_aas: list = None, sequences: list = None, custom_lists: dict = None) -> int:
@@ -77,28 +85,23 @@ class Repertoire(DatasetItem):
 
         filename_base = filename_base if filename_base is not None else identifier
 
-        data_filename = path / f"{filename_base}.npy"
+        data_filename = path / f"{filename_base}{ColumnarStorage.SUFFIX}"
 
-        field_list, values, dtype = Repertoire.process_custom_lists(custom_lists)
+        field_list, values = Repertoire.process_custom_lists(custom_lists)
 
         if signals:
             signals_filtered = {signal: signals[signal] for signal in signals if signal not in metadata["field_list"]}
-            field_list_signals, values_signals, dtype_signals = Repertoire.process_custom_lists(signals_filtered)
+            field_list_signals, values_signals = Repertoire.process_custom_lists(signals_filtered)
 
             field_list.extend(field_list_signals)
             values.extend(values_signals)
-            dtype.extend(dtype_signals)
 
         for field in Repertoire.FIELDS:
             if eval(field) is not None and not all(el is None for el in eval(field)):
                 field_list.append(field)
                 values.append(eval(field))
-                dtype.append((field, np.object))
-
-        dtype = np.dtype(dtype)
 
-        repertoire_matrix = np.array(list(map(tuple, zip(*values))), order='F', dtype=dtype)
-        np.save(str(data_filename), repertoire_matrix)
+        ColumnarStorage.write(data_filename, dict(zip(field_list, values)), Repertoire.FIELD_TYPES)
 
         metadata_filename = path / f"{filename_base}_metadata.pickle"
         metadata = {} if metadata is None else metadata
@@ -114,13 +117,15 @@ class Repertoire(DatasetItem):
         if indices_to_keep is not None and len(indices_to_keep) > 0:
             PathBuilder.build(result_path)
 
-            data = repertoire.load_data()
-            data = data[indices_to_keep]
             identifier = uuid4().hex
             filename_base = filename_base if filename_base is not None else identifier
 
-            data_filename = result_path / f"{filename_base}.npy"
-            np.save(str(data_filename), data)
+            data_filename = result_path / f"{filename_base}{ColumnarStorage.SUFFIX}"
+            if repertoire.is_columnar():
+                ColumnarStorage.take(repertoire.data_filename, indices_to_keep, data_filename)
+            else:
+                data = repertoire.load_data()[indices_to_keep]
+                ColumnarStorage.write(data_filename, {field: data[field] for field in data.dtype.names}, Repertoire.FIELD_TYPES)
 
             metadata_filename = result_path / f"{filename_base}_metadata.pickle"
             shutil.copyfile(repertoire.metadata_filename, metadata_filename)
@@ -130,6 +135,64 @@ class Repertoire(DatasetItem):
         else:
             return None
 
+    @classmethod
+    def build_from_columns(cls, columns: dict, path: Path, metadata: dict, filename_base: str = None):
+        """
+        Creates a repertoire directly from the attribute arrays (e.g. as returned by get_attributes) without creating sequence objects;
+        all arrays have to have the same length and attributes not in Repertoire.FIELDS are stored as custom attributes
+        """
+        identifier = uuid4().hex
+        filename_base = filename_base if filename_base is not None else identifier
+
+        data_filename = path / f"{filename_base}{ColumnarStorage.SUFFIX}"
+        ColumnarStorage.write(data_filename, columns, Repertoire.FIELD_TYPES)
+
+        metadata_filename = path / f"{filename_base}_metadata.pickle"
+        metadata = {} if metadata is None else metadata
+        metadata["field_list"] = list(columns.keys())
+        with metadata_filename.open("wb") as file:
+            pickle.dump(metadata, file)
+
+        return Repertoire(data_filename, metadata_filename, identifier)
+
+    @classmethod
+    def build_from_column_chunks(cls, chunks, path: Path, metadata: dict, filename_base: str = None):
+        """
+        Creates a repertoire from an iterable of attribute dictionaries (as for build_from_columns), each with the next rows of the
+        repertoire; every chunk is written to disk before the next one is requested and the chunks are concatenated at the end, so only
+        one chunk has to be in memory at a time. As in build, the attributes from Repertoire.FIELDS which are missing for all sequences in
+        a chunk are not stored and sequence identifiers are set to the sequence index if they are missing.
+        """
+        identifier = uuid4().hex
+        filename_base = filename_base if filename_base is not None else identifier
+
+        chunk_path = PathBuilder.build(path / f"{filename_base}_chunks")
+        chunk_filenames, element_count = [], 0
+
+        for index, columns in enumerate(chunks):
+            columns = {field: values for field, values in columns.items()
+                       if field not in Repertoire.FIELDS or not all(value is None for value in values)}
+            count = len(next(iter(columns.values()))) if len(columns) > 0 else 0
+            if "sequence_identifiers" not in columns or any(value is None for value in columns["sequence_identifiers"]):
+                columns["sequence_identifiers"] = np.arange(element_count, element_count + count)
+
+            chunk_filenames.append(ColumnarStorage.write(chunk_path / f"chunk_{index}{ColumnarStorage.SUFFIX}", columns, Repertoire.FIELD_TYPES))
+            element_count += count
+
+        data_filename = path / f"{filename_base}{ColumnarStorage.SUFFIX}"
+        ColumnarStorage.concatenate(chunk_filenames, data_filename, Repertoire.FIELD_TYPES)
+        shutil.rmtree(chunk_path)
+
+        field_names = ColumnarStorage.get_column_names(data_filename)
+        metadata_filename = path / f"{filename_base}_metadata.pickle"
+        metadata = {} if metadata is None else metadata
+        metadata["field_list"] = [field for field in field_names if field not in Repertoire.FIELDS] + \
+                                 [field for field in Repertoire.FIELDS if field in field_names]
+        with metadata_filename.open("wb") as file:
+            pickle.dump(metadata, file)
+
+        return Repertoire(data_filename, metadata_filename, identifier)
+
     @classmethod
     def build_from_sequence_objects(cls, sequence_objects: list, path: Path, metadata: dict, filename_base: str = None):
 
@@ -174,8 +237,9 @@ class Repertoire(DatasetItem):
         data_filename = Path(data_filename)
         metadata_filename = Path(metadata_filename) if metadata_filename is not None else None
 
-        assert data_filename.suffix == ".npy", \
-            f"Repertoire: the file representing the repertoire has to be in numpy binary format. Got {data_filename.suffix} instead."
+        assert data_filename.suffix in [".npy", ColumnarStorage.SUFFIX], \
+            f"Repertoire: the file representing the repertoire has to be in numpy binary format ({ColumnarStorage.SUFFIX} directory or .npy " \
+            f"file). Got {data_filename.suffix} instead."
 
         self.data_filename = data_filename
 
@@ -203,8 +267,15 @@ class Repertoire(DatasetItem):
 
     def get_counts(self):
         counts = self.get_attribute("counts")
-        if counts is not None:
-            counts = np.array([int(count) if count is not None else None for count in counts])
+        if counts is None or np.issubdtype(counts.dtype, np.integer):
+            return counts
+
+        missing = np.array([count is None for count in counts], dtype=bool) if counts.dtype == object else np.zeros(len(counts), dtype=bool)
+        if missing.any():
+            # an object array is only needed to keep the missing values as None
+            counts = np.array([int(count) if count is not None else None for count in counts], dtype=object)
+        else:
+            counts = counts.astype(np.int64)
         return counts
 
     def get_chains(self):
@@ -213,15 +284,44 @@ class Repertoire(DatasetItem):
             chains = np.array([Chain.get_chain(chain_str) if chain_str is not None else None for chain_str in chains])
         return chains
 
+    def is_columnar(self) -> bool:
+        return self.data_filename.suffix == ColumnarStorage.SUFFIX
+
+    def get_sequence_buffer(self, sequence_type: SequenceType = None):
+        """
+        Returns sequences without creating a python string object per sequence: a uint8 buffer with all sequences concatenated and an
+        array of offsets of length element_count + 1, so that the i-th sequence is buffer[offsets[i]:offsets[i+1]]; for repertoires in
+        columnar format, both arrays are memory-mapped from disk and can be shared between processes
+
+        Args:
+            sequence_type: which sequences to return, if not set, the sequence type from EnvironmentSettings is used
+
+        Returns:
+            a tuple (buffer, offsets) or (None, None) if the sequences are not present in the repertoire
+        """
+        attribute = (sequence_type if sequence_type is not None else EnvironmentSettings.get_sequence_type()).value
+
+        if self.is_columnar() and ColumnarStorage.get_column_type(self.data_filename, attribute) == ColumnType.STRING:
+            return ColumnarStorage.read_string_buffer(self.data_filename, attribute)
+        else:
+            sequences = self.get_attribute(attribute)
+            return ColumnarStorage.encode_strings(sequences) if sequences is not None else (None, None)
+
     def load_data(self):
         if self.data is None or (isinstance(self.data, weakref.ref) and self.data() is None):
-            data = np.load(self.data_filename, allow_pickle=True)
+            if self.is_columnar():
+                data = ColumnarStorage.read_structured_array(self.data_filename)
+            else:
+                data = np.load(self.data_filename, allow_pickle=True)
             self.data = weakref.ref(data) if EnvironmentSettings.low_memory else data
         data = self.data() if EnvironmentSettings.low_memory else self.data
         self.element_count = data.shape[0]
         return data
 
     def get_attribute(self, attribute):
+        if self.is_columnar():
+            return ColumnarStorage.read_column(self.data_filename, attribute)
+
         data = self.load_data()
         if attribute in data.dtype.names:
             tmp = data[attribute]
@@ -230,12 +330,14 @@ class Repertoire(DatasetItem):
             return None
 
     def get_attributes(self, attributes: list):
-        data = self.load_data()
-        result = {}
+        if self.is_columnar():
+            result = ColumnarStorage.read_columns(self.data_filename, attributes)
+        else:
+            data = self.load_data()
+            result = {attribute: data[attribute] for attribute in attributes if attribute in data.dtype.names}
+
         for attribute in attributes:
-            if attribute in data.dtype.names:
-                result[attribute] = data[attribute]
-            else:
+            if attribute not in result:
                 logging.warning(f"{Repertoire.__name__}: attribute {attribute} is not present in the repertoire {self.identifier}, skipping...")
         return result
 
@@ -253,7 +355,10 @@ class Repertoire(DatasetItem):
 
     def get_element_count(self):
         if self.element_count is None:
-            self.load_data()
+            if self.is_columnar():
+                self.element_count = ColumnarStorage.get_element_count(self.data_filename)
+            else:
+                self.load_data()
         return self.element_count
 
     def _make_sequence_object(self, row, load_implants: bool = False):
@@ -321,7 +426,7 @@ class Repertoire(DatasetItem):
 
         data = self.load_data()
 
-        for i in range(len(self.get_sequence_identifiers())):
+        for i in range(data.shape[0]):
             seq = self._make_sequence_object(data[i], load_implants)
             seqs.append(seq)
 
@@ -14,7 +14,6 @@ from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.PathBuilder import PathBuilder
 from immuneML.util.ReflectionHandler import ReflectionHandler
 from immuneML.workflows.instructions.Instruction import Instruction
-from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
 from scripts.DocumentatonFormat import DocumentationFormat
 from scripts.specification_util import write_class_docs
 
@@ -102,6 +101,8 @@ class InstructionParser:
 
     @staticmethod
     def make_trainmlmodel_docs(path):
+        from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
+
         file_path = path / "hp.rst"
         with file_path.open("w") as file:
             write_class_docs(DocumentationFormat(TrainMLModelInstruction, "", DocumentationFormat.LEVELS[1]), file)
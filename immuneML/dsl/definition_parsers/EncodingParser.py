@@ -4,6 +4,7 @@ from immuneML.dsl.ObjectParser import ObjectParser
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
 from immuneML.encodings.DatasetEncoder import DatasetEncoder
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.Logger import log
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.ReflectionHandler import ReflectionHandler
@@ -24,7 +25,7 @@ class EncodingParser:
     @log
     def parse_encoder(key: str, specs: dict):
         class_path = "encodings"
-        valid_encoders = ReflectionHandler.all_nonabstract_subclass_basic_names(DatasetEncoder, "Encoder", class_path)
+        valid_encoders = LazySubclassNames(DatasetEncoder, "Encoder", class_path)
         encoder = ObjectParser.get_class(specs, valid_encoders, "Encoder", class_path, "EncodingParser", key)
         params = ObjectParser.get_all_params(specs, class_path, encoder.__name__[:-7], key)
 
@@ -4,6 +4,7 @@ from immuneML.dsl.DefaultParamsLoader import DefaultParamsLoader
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
 from immuneML.ml_methods.MLMethod import MLMethod
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.Logger import log
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.ReflectionHandler import ReflectionHandler
@@ -25,7 +26,7 @@ class MLParser:
     @log
     def _parse_ml_method(ml_method_id: str, ml_specification) -> tuple:
 
-        valid_class_values = ReflectionHandler.all_nonabstract_subclass_basic_names(MLMethod, "", "ml_methods/")
+        valid_class_values = LazySubclassNames(MLMethod, "", "ml_methods/")
 
         if type(ml_specification) is str:
             ml_specification = {ml_specification: {}}
@@ -33,8 +34,10 @@ class MLParser:
         ml_specification = {**DefaultParamsLoader.load("ml_methods/", "MLMethod"), **ml_specification}
         ml_specification_keys = list(ml_specification.keys())
 
-        ParameterValidator.assert_all_in_valid_list(list(ml_specification_keys), ["model_selection_cv", "model_selection_n_folds"] +
-                                                    valid_class_values, "MLParser", ml_method_id)
+        for key in ml_specification_keys:
+            if key not in ["model_selection_cv", "model_selection_n_folds"] and key not in valid_class_values:
+                ParameterValidator.assert_in_valid_list(key, ["model_selection_cv", "model_selection_n_folds"] + list(valid_class_values),
+                                                        "MLParser", ml_method_id)
 
         non_default_keys = [key for key in ml_specification.keys() if key not in ["model_selection_cv", "model_selection_n_folds"]]
 
@@ -6,9 +6,9 @@ from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
 from immuneML.simulation.implants.Motif import Motif
 from immuneML.simulation.motif_instantiation_strategy.MotifInstantiationStrategy import MotifInstantiationStrategy
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.Logger import log
 from immuneML.util.ParameterValidator import ParameterValidator
-from immuneML.util.ReflectionHandler import ReflectionHandler
 
 
 class MotifParser:
@@ -32,7 +32,7 @@ class MotifParser:
 
         motif_dict = copy.deepcopy(motif_item)
 
-        valid_values = ReflectionHandler.all_nonabstract_subclass_basic_names(MotifInstantiationStrategy, "Instantiation", "motif_instantiation_strategy/")
+        valid_values = LazySubclassNames(MotifInstantiationStrategy, "Instantiation", "motif_instantiation_strategy/")
         instantiation_object = ObjectParser.parse_object(motif_item["instantiation"], valid_values, "Instantiation",
                                                          "motif_instantiation_strategy", "MotifParser", key)
         motif_dict["instantiation"] = instantiation_object
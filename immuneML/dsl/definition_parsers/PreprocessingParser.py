@@ -2,8 +2,8 @@ from immuneML.dsl.ObjectParser import ObjectParser
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
 from immuneML.preprocessing.Preprocessor import Preprocessor
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.Logger import log
-from immuneML.util.ReflectionHandler import ReflectionHandler
 
 
 class PreprocessingParser:
@@ -22,7 +22,7 @@ class PreprocessingParser:
 
         sequence = []
 
-        valid_preprocessing_classes = ReflectionHandler.all_nonabstract_subclass_basic_names(Preprocessor, "", "preprocessing/")
+        valid_preprocessing_classes = LazySubclassNames(Preprocessor, "", "preprocessing/")
 
         for item in preproc_sequence:
             for step_key, step in item.items():
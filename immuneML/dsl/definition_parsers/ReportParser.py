@@ -2,8 +2,8 @@ from immuneML.dsl.ObjectParser import ObjectParser
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
 from immuneML.reports.Report import Report
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.Logger import log
-from immuneML.util.ReflectionHandler import ReflectionHandler
 
 
 class ReportParser:
@@ -21,7 +21,7 @@ class ReportParser:
     @staticmethod
     @log
     def _parse_report(key: str, params: dict, symbol_table: SymbolTable):
-        valid_values = ReflectionHandler.all_nonabstract_subclass_basic_names(Report, "", "reports/")
+        valid_values = LazySubclassNames(Report, "", "reports/")
         report_object, params = ObjectParser.parse_object(params, valid_values, "", "reports/", "ReportParser", key, builder=True,
                                                           return_params_dict=True)
 
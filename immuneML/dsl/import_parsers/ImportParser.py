@@ -7,6 +7,7 @@ from immuneML.data_model.receptor.ChainPair import ChainPair
 from immuneML.dsl.DefaultParamsLoader import DefaultParamsLoader
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.Logger import log
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.ReflectionHandler import ReflectionHandler
@@ -34,7 +35,7 @@ class ImportParser:
 
         ParameterValidator.assert_keys(list(dataset_specs.keys()), ImportParser.valid_keys, location, f"datasets:{key}", False)
 
-        valid_formats = ReflectionHandler.all_nonabstract_subclass_basic_names(DataImport, "Import", "IO/dataset_import/")
+        valid_formats = LazySubclassNames(DataImport, "Import", "IO/dataset_import/")
         ParameterValidator.assert_in_valid_list(dataset_specs["format"], valid_formats, location, "format")
 
         import_cls = ReflectionHandler.get_class_by_name("{}Import".format(dataset_specs["format"]))
@@ -56,6 +57,9 @@ class ImportParser:
                     assert "receptor_chains" in params, f"{location}: Missing parameter: receptor_chains under {key}/params/"
                     ParameterValidator.assert_in_valid_list(params["receptor_chains"], ["_".join(cp.value) for cp in ChainPair], location, "receptor_chains")
 
+        if params.get("import_chunk_size") is not None:
+            ParameterValidator.assert_type_and_value(params["import_chunk_size"], int, location, "import_chunk_size", min_inclusive=1)
+
         try:
             dataset = import_cls.import_dataset(params, key)
             dataset.name = key
@@ -3,6 +3,7 @@ from pathlib import Path
 from immuneML.IO.dataset_export.DataExporter import DataExporter
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.ReflectionHandler import ReflectionHandler
 from immuneML.workflows.instructions.SimulationInstruction import SimulationInstruction
@@ -65,11 +66,16 @@ class SimulationParser:
                 dataset: my_dataset
                 simulation: sim1
                 export_formats: [AIRR, Pickle]
+                number_of_processes: 4
+                batch_size: 1
 
     """
 
     def parse(self, key: str, instruction: dict, symbol_table: SymbolTable, path: Path = None) -> SimulationInstruction:
-        ParameterValidator.assert_keys(instruction.keys(), ["dataset", "simulation", "type", "export_formats"], "SimulationParser", key)
+        ParameterValidator.assert_keys(instruction.keys(), ["dataset", "simulation", "type", "export_formats", "number_of_processes", "batch_size"],
+                                       "SimulationParser", key)
+        for parameter in ["number_of_processes", "batch_size"]:
+            ParameterValidator.assert_type_and_value(instruction[parameter], int, "SimulationParser", f"{key}: {parameter}", min_inclusive=1)
 
         signals = [signal.item for signal in symbol_table.get_by_type(SymbolType.SIGNAL)]
         simulation = symbol_table.get(instruction["simulation"])
@@ -77,14 +83,15 @@ class SimulationParser:
 
         exporters = self.parse_exporters(instruction)
 
-        process = SimulationInstruction(signals=signals, simulation=simulation, dataset=dataset, name=key, exporters=exporters)
+        process = SimulationInstruction(signals=signals, simulation=simulation, dataset=dataset, name=key, exporters=exporters,
+                                        number_of_processes=instruction["number_of_processes"], batch_size=instruction["batch_size"])
         return process
 
     def parse_exporters(self, instruction):
         if instruction["export_formats"] is not None:
             class_path = "dataset_export/"
             ParameterValidator.assert_all_in_valid_list(instruction["export_formats"],
-                                                        ReflectionHandler.all_nonabstract_subclass_basic_names(DataExporter, 'Exporter', class_path),
+                                                        LazySubclassNames(DataExporter, 'Exporter', class_path),
                                                         location="SimulationParser", parameter_name="export_formats")
             exporters = [ReflectionHandler.get_class_by_name(f"{item}Exporter", class_path) for item in instruction["export_formats"]]
         else:
@@ -3,6 +3,7 @@ from pathlib import Path
 from immuneML.IO.dataset_export.DataExporter import DataExporter
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.ReflectionHandler import ReflectionHandler
 from immuneML.workflows.instructions.subsampling.SubsamplingInstruction import SubsamplingInstruction
@@ -22,7 +23,7 @@ class SubsamplingParser:
         ParameterValidator.assert_all_type_and_value(instruction['subsampled_dataset_sizes'], int, SubsamplingParser.__name__,
                                                      f'{key}/subsampled_dataset_sizes', 1, dataset.get_example_count())
 
-        valid_export_formats = ReflectionHandler.all_nonabstract_subclass_basic_names(DataExporter, 'Exporter', "dataset_export/")
+        valid_export_formats = LazySubclassNames(DataExporter, 'Exporter', "dataset_export/")
         ParameterValidator.assert_type_and_value(instruction['dataset_export_formats'], list, SubsamplingParser.__name__, f"{key}/dataset_export_formats")
         ParameterValidator.assert_all_in_valid_list(instruction['dataset_export_formats'], valid_export_formats, SubsamplingParser.__name__, f"{key}/dataset_export_formats")
 
@@ -6,6 +6,7 @@ from typing import Tuple
 
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.dsl.DefaultParamsLoader import DefaultParamsLoader
+from immuneML.dsl.ObjectParser import ObjectParser
 from immuneML.dsl.definition_parsers.PreprocessingParser import PreprocessingParser
 from immuneML.dsl.symbol_table.SymbolTable import SymbolTable
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
@@ -17,7 +18,9 @@ from immuneML.hyperparameter_optimization.config.ManualSplitConfig import Manual
 from immuneML.hyperparameter_optimization.config.ReportConfig import ReportConfig
 from immuneML.hyperparameter_optimization.config.SplitConfig import SplitConfig
 from immuneML.hyperparameter_optimization.config.SplitType import SplitType
+from immuneML.hyperparameter_optimization.strategy.HPOptimizationStrategy import HPOptimizationStrategy
 from immuneML.reports.train_ml_model_reports.TrainMLModelReport import TrainMLModelReport
+from immuneML.util.LazySubclassNames import LazySubclassNames
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.ReflectionHandler import ReflectionHandler
 from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
@@ -35,7 +38,6 @@ class TrainMLModelParser:
         ParameterValidator.assert_type_and_value(instruction['metrics'], list, TrainMLModelParser.__name__, 'metrics')
         ParameterValidator.assert_type_and_value(instruction['optimization_metric'], str, TrainMLModelParser.__name__, 'optimization_metric')
         ParameterValidator.assert_type_and_value(instruction['number_of_processes'], int, TrainMLModelParser.__name__, 'number_of_processes')
-        ParameterValidator.assert_type_and_value(instruction['strategy'], str, TrainMLModelParser.__name__, 'strategy')
         ParameterValidator.assert_type_and_value(instruction['store_encoded_data'], bool, TrainMLModelParser.__name__, 'store_encoded_data')
         if instruction["reports"] is not None:
             ParameterValidator.assert_type_and_value(instruction['reports'], list, TrainMLModelParser.__name__, 'reports')
@@ -46,16 +48,16 @@ class TrainMLModelParser:
         selection = self._parse_split_config(key, instruction, "selection", symbol_table, len(settings))
         assessment, selection = self._update_split_configs(assessment, selection, dataset)
         label_config = self._create_label_config(instruction, dataset, key)
-        strategy = ReflectionHandler.get_class_by_name(instruction["strategy"], "hyperparameter_optimization/")
         metrics = {Metric[metric.upper()] for metric in instruction["metrics"]}
         optimization_metric = Metric[instruction["optimization_metric"].upper()]
         metric_search_criterion = Metric.get_search_criterion(optimization_metric)
+        strategy = self._parse_strategy(instruction["strategy"], settings, metric_search_criterion)
         path = self._prepare_path(instruction)
         context = self._prepare_context(instruction, symbol_table)
         reports = self._prepare_reports(instruction["reports"], symbol_table)
 
-        hp_instruction = TrainMLModelInstruction(dataset=dataset, hp_strategy=strategy(settings, metric_search_criterion),
-                                                 hp_settings=settings, assessment=assessment, selection=selection, metrics=metrics,
+        hp_instruction = TrainMLModelInstruction(dataset=dataset, hp_strategy=strategy, hp_settings=settings,
+                                                 assessment=assessment, selection=selection, metrics=metrics,
                                                  optimization_metric=optimization_metric, refit_optimal_model=instruction['refit_optimal_model'],
                                                  label_configuration=label_config, path=path, context=context,
                                                  store_encoded_data=instruction['store_encoded_data'],
@@ -63,6 +65,20 @@ class TrainMLModelParser:
 
         return hp_instruction
 
+    def _parse_strategy(self, specs, settings: list, search_criterion) -> HPOptimizationStrategy:
+        valid_strategies = LazySubclassNames(HPOptimizationStrategy, "", "hyperparameter_optimization/strategy/")
+        strategy_name = ObjectParser.get_class_name(specs, valid_strategies, "", TrainMLModelParser.__name__, "strategy")
+        ParameterValidator.assert_in_valid_list(strategy_name, valid_strategies, TrainMLModelParser.__name__, "strategy")
+
+        strategy = ReflectionHandler.get_class_by_name(strategy_name, "hyperparameter_optimization/")
+        params = ObjectParser.get_params(specs, strategy_name)
+        ParameterValidator.assert_type_and_value(params, dict, TrainMLModelParser.__name__, f"strategy: {strategy_name}")
+        ParameterValidator.assert_keys(params.keys(), [name for name in signature(strategy.__init__).parameters.keys()
+                                                       if name not in ["self", "hp_settings", "search_criterion"]],
+                                       TrainMLModelParser.__name__, f"strategy: {strategy_name}", exclusive=False)
+
+        return strategy(settings, search_criterion, **params)
+
     def _update_split_configs(self, assessment: SplitConfig, selection: SplitConfig, dataset: Dataset) -> Tuple[SplitConfig, SplitConfig]:
 
         if assessment.split_strategy == SplitType.LOOCV:
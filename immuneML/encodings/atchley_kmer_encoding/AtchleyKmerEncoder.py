@@ -1,6 +1,6 @@
 import logging
 import math
-from multiprocessing import Pool
+from functools import partial
 from pathlib import Path
 from typing import Tuple, List
 
@@ -18,6 +18,7 @@ from immuneML.encodings.atchley_kmer_encoding.Util import Util
 from immuneML.encodings.preprocessing.FeatureScaler import FeatureScaler
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.WorkerPool import WorkerPool
 from scripts.specification_util import update_docs_per_mapping
 
 
@@ -120,11 +121,9 @@ class AtchleyKmerEncoder(DatasetEncoder):
         keys = set()
         example_count = dataset.get_example_count()
 
-        arguments = [(repertoire, index, example_count) for index, repertoire in enumerate(dataset.repertoires)]
-
-        with Pool(params.pool_size) as pool:
-            chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
-            examples = pool.starmap(self._process_repertoire_cached, arguments, chunksize=chunksize)
+        chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
+        examples = WorkerPool.map(partial(self._process_repertoire_cached, example_count=example_count), enumerate(dataset.repertoires),
+                                  params.pool_size, chunksize=chunksize)
 
         for example in examples:
             keys.update(list(example.keys()))
@@ -133,7 +132,8 @@ class AtchleyKmerEncoder(DatasetEncoder):
 
         return examples, keys, labels
 
-    def _process_repertoire_cached(self, repertoire, index, example_count):
+    def _process_repertoire_cached(self, indexed_repertoire: tuple, example_count: int):
+        index, repertoire = indexed_repertoire
         return CacheHandler.memo_by_params((('repertoire', repertoire.identifier), ('encoder', AtchleyKmerEncoder.__name__),
                                             (self.abundance, self.skip_last_n_aa, self.skip_first_n_aa, self.k)),
                                            lambda: self._process_repertoire(repertoire, index, example_count), CacheObjectType.ENCODING_STEP)
@@ -1,22 +1,28 @@
-
 from pathlib import Path
 
-import pandas as pd
+import h5py
+import numpy as np
 
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.encodings.DatasetEncoder import DatasetEncoder
 from immuneML.encodings.EncoderParams import EncoderParams
+from immuneML.util.EncoderHelper import EncoderHelper
 from immuneML.util.PathBuilder import PathBuilder
 
 
 class DeepRCEncoder(DatasetEncoder):
     """
     DeepRCEncoder should be used in combination with the DeepRC ML method (:ref:`DeepRC`).
-    This encoder writes the data in a RepertoireDataset to .tsv files.
-    For each repertoire, one .tsv file is created containing the amino acid sequences and the counts.
-    Additionally, one metadata .tsv file is created, which describes the subset of repertoires that is encoded by
-    a given instance of the DeepRCEncoder.
+    This encoder writes the data in a RepertoireDataset to the HDF5 format used by DeepRC. The HDF5 file is created only once for the full
+    dataset (e.g., the dataset of the TrainMLModel instruction) and the given labels and is stored in the result path of the first encoding
+    which needs it. Each encoded part of the dataset (e.g., the training or test part of one data split) then refers to the repertoires in
+    that file by their indices, so the file is shared by all data splits which are encoded with the same encoder.
+
+    The HDF5 file is written directly from the amino acid sequence and count columns of the repertoires in the layout which DeepRC's
+    RepertoireDataReaderBinary reads (the layout of the files created by DeepRC's DatasetToHDF5 converter): the sequences are stored as
+    amino acid indices padded with -1, together with the sequence lengths, sequence counts (missing counts are set to 1) and the position
+    of each repertoire's sequences, and the label values of each repertoire are stored as strings.
 
     YAML specification:
 
@@ -26,16 +32,13 @@ class DeepRCEncoder(DatasetEncoder):
         my_deeprc_encoder: DeepRC
 
     """
-    ID_COLUMN = "ID"
-    SEQUENCE_COLUMN = "amino_acid"
-    COUNTS_COLUMN = "templates"
-    SEP = "\t"
-    EXTENSION = "tsv"
+    AMINO_ACIDS = sorted("ACDEFGHIKLMNPQRSTVWY")
+    PADDING_VALUE = -1
 
     def __init__(self, context: dict = None, name: str = None):
         self.context = context
         self.name = name
-        self.max_sequence_length = 0
+        self.hdf5_filepaths = {}
 
     def set_context(self, context: dict):
         self.context = context
@@ -54,43 +57,108 @@ class DeepRCEncoder(DatasetEncoder):
         else:
             raise ValueError("DeepRCEncoder is not defined for dataset types which are not RepertoireDataset.")
 
-    def export_repertoire_tsv_files(self, output_folder: Path):
-        repertoires = self.context["dataset"].repertoires
+    def export_hdf5_file(self, dataset: RepertoireDataset, labels: list, result_path: Path) -> Path:
+        """
+        Writes the HDF5 file for all repertoires in the dataset with the given labels to the result path, unless it was already written
+        by this encoder.
 
-        for repertoire in repertoires:
-            filepath = output_folder / f"{repertoire.identifier}.{DeepRCEncoder.EXTENSION}"
+        Returns:
+            path to the HDF5 file
+        """
+        key = (dataset.identifier, tuple(labels))
+        hdf5_filepath = self.hdf5_filepaths.get(key, None)
 
-            if not filepath.is_file():
-                df = pd.DataFrame({DeepRCEncoder.SEQUENCE_COLUMN: repertoire.get_sequence_aas(), DeepRCEncoder.COUNTS_COLUMN: repertoire.get_counts()})
-                df.to_csv(path_or_buf=filepath, sep=DeepRCEncoder.SEP, index=False)
+        if hdf5_filepath is None or not hdf5_filepath.is_file():
+            hdf5_filepath = PathBuilder.build(result_path) / f"{dataset.identifier}_{'_'.join(labels)}.hdf5"
+            DeepRCEncoder.write_hdf5_file(dataset, labels, hdf5_filepath)
+            self.hdf5_filepaths[key] = hdf5_filepath
 
-                max_sequence_length = max(df[DeepRCEncoder.SEQUENCE_COLUMN].str.len())
-                self.max_sequence_length = max(self.max_sequence_length, max_sequence_length)
+        return hdf5_filepath
+
+    @staticmethod
+    def write_hdf5_file(dataset: RepertoireDataset, labels: list, hdf5_filepath: Path):
+        seq_lens, counts_per_sequence = [], []
+        for repertoire in dataset.repertoires:
+            sequences = repertoire.get_sequence_aas()
+            counts = repertoire.get_counts()
+            seq_lens.append(np.array([len(sequence) for sequence in sequences], dtype=np.int64))
+            counts_per_sequence.append(np.array([count if count is not None else 1 for count in counts], dtype=np.int64)
+                                       if counts is not None else np.ones(len(sequences), dtype=np.int64))
+
+        n_sequences_per_sample = np.array([len(lengths) for lengths in seq_lens], dtype=np.int64)
+        sample_sequences_start_end = np.zeros((dataset.get_example_count(), 2), dtype=np.int64)
+        sample_sequences_start_end[:, 1] = np.cumsum(n_sequences_per_sample)
+        sample_sequences_start_end[1:, 0] = sample_sequences_start_end[:-1, 1]
+
+        seq_lens = np.concatenate(seq_lens) if len(seq_lens) > 0 else np.zeros(0, dtype=np.int64)
+        counts_per_sequence = np.concatenate(counts_per_sequence) if len(counts_per_sequence) > 0 else np.zeros(0, dtype=np.int64)
+        max_seq_len = int(seq_lens.max()) if seq_lens.shape[0] > 0 else 0
 
-    def export_metadata_file(self, dataset, labels, output_folder):
-        metadata_filepath = output_folder / f"{dataset.identifier}_metadata.{DeepRCEncoder.EXTENSION}"
         metadata = dataset.get_metadata(labels, return_df=True)
-        metadata[DeepRCEncoder.ID_COLUMN] = dataset.get_repertoire_ids()
+        sample_keys = dataset.get_repertoire_ids()
+        string_dtype = h5py.special_dtype(vlen=str)
+
+        with h5py.File(str(hdf5_filepath), 'w') as hf:
+            sampledata = hf.create_group('sampledata')
+            sampledata.create_dataset('seq_lens', data=seq_lens)
+            sampledata.create_dataset('counts_per_sequence', data=counts_per_sequence)
+            sampledata.create_dataset('n_sequences_per_sample', data=n_sequences_per_sample)
+            sampledata.create_dataset('sample_sequences_start_end', data=sample_sequences_start_end)
+            amino_acid_sequences = sampledata.create_dataset('amino_acid_sequences', shape=(seq_lens.shape[0], max_seq_len), dtype=np.int8,
+                                                             fillvalue=DeepRCEncoder.PADDING_VALUE)
+
+            for repertoire, (start, end) in zip(dataset.repertoires, sample_sequences_start_end):
+                if end > start:
+                    amino_acid_sequences[start:end] = DeepRCEncoder._encode_sequences(repertoire.get_sequence_aas(), seq_lens[start:end],
+                                                                                      max_seq_len, repertoire.identifier)
+
+            hf_metadata = hf.create_group('metadata')
+            hf_metadata.create_dataset('sample_keys', data=np.array(sample_keys, dtype=object), dtype=string_dtype)
+            hf_metadata.create_dataset('n_samples', data=len(sample_keys))
+            hf_metadata.create_dataset('target_feature_names', data=np.array(labels, dtype=object), dtype=string_dtype)
+            hf_metadata.create_dataset('target_features', dtype=string_dtype,
+                                       data=np.array([[str(value) for value in metadata[label]] for label in labels], dtype=object)
+                                       .reshape(len(labels), len(sample_keys)).T)
+            hf_metadata.create_dataset('aas', data=np.array(DeepRCEncoder.AMINO_ACIDS, dtype=object), dtype=string_dtype)
+            hf_metadata.create_dataset('stats', data=f"{len(sample_keys)} samples with {seq_lens.shape[0]} sequences; "
+                                                     f"sequence lengths: min {int(seq_lens.min()) if seq_lens.shape[0] > 0 else 0}, "
+                                                     f"max {max_seq_len}, mean {float(seq_lens.mean()) if seq_lens.shape[0] > 0 else 0.}")
 
-        metadata.to_csv(path_or_buf=metadata_filepath, sep="\t", index=False)
+    @staticmethod
+    def _encode_sequences(sequences, seq_lens, max_seq_len: int, repertoire_id: str) -> np.ndarray:
+        lookup = np.full(256, DeepRCEncoder.PADDING_VALUE, dtype=np.int8)
+        lookup[[ord(amino_acid) for amino_acid in DeepRCEncoder.AMINO_ACIDS]] = np.arange(len(DeepRCEncoder.AMINO_ACIDS))
 
-        return metadata_filepath
+        characters = np.frombuffer("".join(sequences).encode("ascii", errors="replace"), dtype=np.uint8)
+        indices = lookup[characters]
+        if np.any(indices == DeepRCEncoder.PADDING_VALUE):
+            invalid = sorted(set(chr(character) for character in characters[indices == DeepRCEncoder.PADDING_VALUE]))
+            raise ValueError(f"{DeepRCEncoder.__name__}: repertoire {repertoire_id} contains characters which are not amino acids "
+                             f"({', '.join(invalid)}); DeepRC supports only the 20 standard amino acids.")
+
+        encoded = np.full((len(seq_lens), max_seq_len), DeepRCEncoder.PADDING_VALUE, dtype=np.int8)
+        encoded[np.arange(max_seq_len)[np.newaxis, :] < seq_lens[:, np.newaxis]] = indices
+        return encoded
 
     def encode(self, dataset, params: EncoderParams) -> RepertoireDataset:
-        result_path = params.result_path / "encoding"
-        PathBuilder.build(result_path)
+        full_dataset = EncoderHelper.get_current_dataset(dataset, self.context)
+        labels = params.label_config.get_labels_by_name()
 
-        self.export_repertoire_tsv_files(result_path)
+        hdf5_filepath = self.export_hdf5_file(full_dataset, labels, params.result_path)
 
-        labels = params.label_config.get_labels_by_name()
-        metadata_filepath = self.export_metadata_file(dataset, labels, result_path)
+        full_repertoire_indices = {identifier: index for index, identifier in enumerate(full_dataset.get_repertoire_ids())}
+        indices = [full_repertoire_indices[identifier] for identifier in dataset.get_repertoire_ids()]
+
+        with h5py.File(str(hdf5_filepath), 'r') as hf:
+            max_sequence_length = int(hf['sampledata']['seq_lens'][:].max())
 
         encoded_dataset = dataset.clone()
         encoded_dataset.encoded_data = EncodedData(examples=None, labels=dataset.get_metadata(labels) if params.encode_labels else None,
                                                    example_ids=dataset.repertoire_ids,
                                                    encoding=DeepRCEncoder.__name__,
-                                                   info={"metadata_filepath": metadata_filepath,
-                                                         "max_sequence_length": self.max_sequence_length})
+                                                   info={"hdf5_filepath": hdf5_filepath,
+                                                         "indices": indices,
+                                                         "max_sequence_length": max_sequence_length})
 
         return encoded_dataset
 
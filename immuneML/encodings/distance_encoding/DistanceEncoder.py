@@ -29,6 +29,8 @@ class DistanceEncoder(DatasetEncoder):
 
         distance_metric (:py:mod:`immuneML.encodings.distance_encoding.DistanceMetricType`): The metric used to calculate the
         distance between two repertoires. Names of different distance metric types are allowed values in the specification.
+        JACCARD uses only the presence of the elements in the repertoires, while MORISITA_HORN also takes into account their
+        counts.
 
         attributes_to_match: The attributes to consider when determining whether a sequence is present in both repertoires.
         Only the fields defined under attributes_to_match will be considered, all other fields are ignored.
@@ -52,10 +54,12 @@ class DistanceEncoder(DatasetEncoder):
 
     """
 
+    COUNT_BASED_METRICS = [DistanceMetricType.MORISITA_HORN]
+
     def __init__(self, distance_metric: DistanceMetricType, attributes_to_match: list, sequence_batch_size: int, context: dict = None,
                  name: str = None):
         self.distance_metric = distance_metric
-        self.distance_fn = ReflectionHandler.import_function(self.distance_metric.value, DistanceMetrics)
+        self.distance_fn = ReflectionHandler.import_function(f"{self.distance_metric.value}_matrix", DistanceMetrics)
         self.attributes_to_match = attributes_to_match
         self.sequence_batch_size = sequence_batch_size
         self.context = context
@@ -87,16 +91,15 @@ class DistanceEncoder(DatasetEncoder):
             raise ValueError("DistanceEncoder is not defined for dataset types which are not RepertoireDataset.")
 
     def build_distance_matrix(self, dataset: RepertoireDataset, params: EncoderParams, train_repertoire_ids: list):
+        value_attribute = "counts" if self.distance_metric in DistanceEncoder.COUNT_BASED_METRICS else None
         self.comparison = PairwiseRepertoireComparison(self.attributes_to_match, self.attributes_to_match, params.result_path,
-                                                  sequence_batch_size=self.sequence_batch_size)
+                                                       sequence_batch_size=self.sequence_batch_size, pool_size=params.pool_size,
+                                                       value_attribute=value_attribute)
 
         current_dataset = dataset if self.context is None or "dataset" not in self.context else self.context["dataset"]
 
-        distance_matrix = self.comparison.compare(current_dataset, self.distance_fn, self.distance_metric.value)
-
-        repertoire_ids = dataset.get_repertoire_ids()
-
-        distance_matrix = distance_matrix.loc[repertoire_ids, train_repertoire_ids]
+        distance_matrix = self.comparison.compare_matrices(current_dataset, self.distance_fn, self.distance_metric.value,
+                                                           row_ids=dataset.get_repertoire_ids(), column_ids=train_repertoire_ids)
 
         return distance_matrix
 
@@ -4,3 +4,4 @@ from enum import Enum
 class DistanceMetricType(Enum):
 
     JACCARD = "jaccard"
+    MORISITA_HORN = "morisita_horn"
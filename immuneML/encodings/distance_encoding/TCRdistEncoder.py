@@ -7,6 +7,8 @@ from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.encodings.DatasetEncoder import DatasetEncoder
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.util.EncoderHelper import EncoderHelper
+from immuneML.util.ParameterValidator import ParameterValidator
+from immuneML.util.PathBuilder import PathBuilder
 
 
 class TCRdistEncoder(DatasetEncoder):
@@ -18,10 +20,21 @@ class TCRdistEncoder(DatasetEncoder):
     For the implementation, `TCRdist3 <https://tcrdist3.readthedocs.io/en/latest/>`_ library was used (source code available
     `here <https://github.com/kmayerb/tcrdist3>`_).
 
+    The distances are computed only between the encoded receptors and the receptors of the training dataset (training x training when
+    fitting the encoder, test x training otherwise), in blocks of `block_size` receptors. The full distance matrix is written to a
+    memory-mapped file in the result path, so that it does not have to fit into memory. Alternatively, only the distances to the
+    `nearest_neighbours` closest training receptors can be kept for each receptor in a sparse matrix, which is enough for TCRdistClassifier
+    if nearest_neighbours is at least the number of neighbours the classifier uses (percentage of the training dataset size).
+
     Arguments:
 
         cores (int): number of processes to use for the computation
 
+        block_size (int): how many receptors to compare to all training receptors at once; by default 1000
+
+        nearest_neighbours (int): if set, only the distances to this many nearest training receptors are kept per receptor in a sparse matrix
+        instead of the full distance matrix; by default None
+
     YAML specification:
 
     .. indent with spaces
@@ -30,14 +43,21 @@ class TCRdistEncoder(DatasetEncoder):
         my_tcr_dist_enc: # user-defined name
             TCRdist:
                 cores: 4
+                block_size: 1000
+                nearest_neighbours: 100
 
     """
 
-    def __init__(self, cores: int, name: str = None):
+    def __init__(self, cores: int, block_size: int = 1000, nearest_neighbours: int = None, name: str = None):
+        ParameterValidator.assert_type_and_value(block_size, int, TCRdistEncoder.__name__, "block_size", min_inclusive=1)
+        if nearest_neighbours is not None:
+            ParameterValidator.assert_type_and_value(nearest_neighbours, int, TCRdistEncoder.__name__, "nearest_neighbours", min_inclusive=1)
+
         self.cores = cores
+        self.block_size = block_size
+        self.nearest_neighbours = nearest_neighbours
         self.name = name
-        self.distance_matrix = None
-        self.context = None
+        self.train_tcr_rep = None
 
     @staticmethod
     def build_object(dataset, **params):
@@ -46,31 +66,32 @@ class TCRdistEncoder(DatasetEncoder):
         else:
             raise ValueError("TCRdistEncoder is not defined for dataset types which are not ReceptorDataset.")
 
-    def set_context(self, context: dict):
-        self.context = context
-        return self
-
     def encode(self, dataset, params: EncoderParams):
         train_receptor_ids = EncoderHelper.prepare_training_ids(dataset, params)
-        if params.learn_model:
-            self._build_tcr_dist_matrix(dataset, params.label_config.get_labels_by_name())
-
-        distance_matrix = self.distance_matrix.loc[dataset.get_example_ids(), train_receptor_ids]
+        distances = self._build_distances(dataset, params)
         labels = self._build_labels(dataset, params) if params.encode_labels else None
 
+        if self.nearest_neighbours is None:
+            examples = pd.DataFrame(distances, index=dataset.get_example_ids(), columns=train_receptor_ids, copy=False)
+        else:
+            examples = distances
+
         encoded_dataset = dataset.clone()
-        encoded_dataset.encoded_data = EncodedData(examples=distance_matrix, labels=labels, example_ids=distance_matrix.index.values,
-                                                   encoding=TCRdistEncoder.__name__)
+        encoded_dataset.encoded_data = EncodedData(examples=examples, labels=labels, example_ids=dataset.get_example_ids(),
+                                                   feature_names=train_receptor_ids, encoding=TCRdistEncoder.__name__)
 
         return encoded_dataset
 
-    def _build_tcr_dist_matrix(self, dataset: ReceptorDataset, labels):
+    def _build_distances(self, dataset: ReceptorDataset, params: EncoderParams):
         from immuneML.util.TCRdistHelper import TCRdistHelper
 
-        current_dataset = dataset if self.context is None or "dataset" not in self.context else self.context["dataset"]
-        tcr_rep = TCRdistHelper.compute_tcr_dist(current_dataset, labels, self.cores)
-        self.distance_matrix = pd.DataFrame(tcr_rep.pw_alpha + tcr_rep.pw_beta, index=tcr_rep.clone_df.clone_id.values,
-                                            columns=tcr_rep.clone_df.clone_id.values)
+        tcr_rep = TCRdistHelper.prepare_tcr_rep(dataset, params.label_config.get_labels_by_name(), self.cores)
+        if params.learn_model:
+            self.train_tcr_rep = tcr_rep
+
+        PathBuilder.build(params.result_path)
+        return TCRdistHelper.compute_distance_blocks(tcr_rep, self.train_tcr_rep, self.block_size,
+                                                     params.result_path / f"tcrdist_distances_{dataset.identifier}.npy", self.nearest_neighbours)
 
     def _build_labels(self, dataset: ReceptorDataset, params: EncoderParams) -> dict:
         labels = {label: [] for label in params.label_config.get_labels_by_name()}
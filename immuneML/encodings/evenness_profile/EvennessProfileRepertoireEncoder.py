@@ -1,6 +1,6 @@
 import hashlib
 import math
-from multiprocessing.pool import Pool
+from functools import partial
 
 import numpy as np
 
@@ -12,6 +12,7 @@ from immuneML.data_model.receptor.receptor_sequence.SequenceFrameType import Seq
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.evenness_profile.EvennessProfileEncoder import EvennessProfileEncoder
 from immuneML.util.Logger import log
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class EvennessProfileRepertoireEncoder(EvennessProfileEncoder):
@@ -31,11 +32,9 @@ class EvennessProfileRepertoireEncoder(EvennessProfileEncoder):
     @log
     def _encode_examples(self, dataset, params: EncoderParams):
 
-        arguments = [(repertoire, params) for repertoire in dataset.repertoires]
-
-        with Pool(params.pool_size) as pool:
-            chunksize = math.floor(dataset.get_example_count()/params.pool_size) + 1
-            repertoires = pool.starmap(self.get_encoded_repertoire, arguments, chunksize=chunksize)
+        chunksize = math.floor(dataset.get_example_count()/params.pool_size) + 1
+        repertoires = WorkerPool.map(partial(self.get_encoded_repertoire, params=params), dataset.repertoires, params.pool_size,
+                                     chunksize=chunksize)
 
         encoded_repertoire_list, repertoire_names, labels = zip(*repertoires)
 
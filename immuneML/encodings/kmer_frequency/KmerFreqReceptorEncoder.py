@@ -16,11 +16,10 @@ class KmerFreqReceptorEncoder(KmerFrequencyEncoder):
         return encoded_dataset
 
     def _encode_examples(self, dataset: ReceptorDataset, params: EncoderParams):
-        encoded_receptors_counts, encoded_receptors = [], []
+        vectorizer = self._prepare_vectorizer(params)
         receptor_ids = []
         label_config = params.label_config
         labels = {label: [] for label in label_config.get_labels_by_name()} if params.encode_labels else None
-        chains = []
 
         sequence_encoder = self._prepare_sequence_encoder()
         feature_names = sequence_encoder.get_feature_names(params)
@@ -29,7 +28,9 @@ class KmerFreqReceptorEncoder(KmerFrequencyEncoder):
             chains = receptor.get_chains()
             for chain in receptor.get_chains():
                 counts[chain] = self._encode_sequence(receptor.get_chain(chain), params, sequence_encoder, counts[chain])
-            encoded_receptors_counts.append(counts)
+            counts = [self._add_chain_to_name(counts[chain], chain) for chain in chains]
+            encoded_receptor = counts[0] + counts[1]
+            vectorizer.add_row(encoded_receptor.keys(), encoded_receptor.values())
             receptor_ids.append(receptor.identifier)
 
             if params.encode_labels:
@@ -37,11 +38,9 @@ class KmerFreqReceptorEncoder(KmerFrequencyEncoder):
                     label = receptor.metadata[label_name]
                     labels[label_name].append(label)
 
-        for encoded_receptor_count in encoded_receptors_counts:
-            counts = [self._add_chain_to_name(encoded_receptor_count[chain], chain) for chain in chains]
-            encoded_receptors.append(counts[0] + counts[1])
+        vectorized_examples, vectorized_feature_names = self._vectorize_encoded(vectorizer, params)
 
-        return encoded_receptors, receptor_ids, labels, feature_names
+        return vectorized_examples, vectorized_feature_names, receptor_ids, labels, feature_names
 
     def _add_chain_to_name(self, count: Counter, chain: str) -> Counter:
         new_counter = Counter()
@@ -1,12 +1,16 @@
 from collections import Counter
-from multiprocessing.pool import Pool
+from functools import partial
+
+import numpy as np
 
 from immuneML.caching.CacheHandler import CacheHandler
 from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.kmer_frequency.KmerFrequencyEncoder import KmerFrequencyEncoder
+from immuneML.encodings.kmer_frequency.ReadsType import ReadsType
 from immuneML.util.Logger import log
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class KmerFreqRepertoireEncoder(KmerFrequencyEncoder):
@@ -26,33 +30,41 @@ class KmerFreqRepertoireEncoder(KmerFrequencyEncoder):
     @log
     def _encode_examples(self, dataset, params: EncoderParams):
 
-        arguments = [(repertoire, params) for repertoire in dataset.repertoires]
+        vectorizer = self._prepare_vectorizer(params)
+        repertoire_names, labels, feature_annotation_names = [], [], None
 
-        with Pool(params.pool_size) as pool:
-            repertoires = pool.starmap(self.get_encoded_repertoire, arguments)
+        for features, counts, repertoire_name, repertoire_labels, feature_annotation_names \
+                in WorkerPool.imap(partial(self.get_encoded_repertoire, params=params), dataset.repertoires, params.pool_size):
+            vectorizer.add_row(features, counts)
+            repertoire_names.append(repertoire_name)
+            labels.append(repertoire_labels)
 
-        encoded_repertoire_list, repertoire_names, labels, feature_annotation_names = zip(*repertoires)
+        vectorized_examples, feature_names = self._vectorize_encoded(vectorizer, params)
 
         encoded_labels = {k: [dic[k] for dic in labels] for k in labels[0]} if params.encode_labels else None
 
-        feature_annotation_names = feature_annotation_names[0]
-
-        return list(encoded_repertoire_list), list(repertoire_names), encoded_labels, feature_annotation_names
+        return vectorized_examples, feature_names, repertoire_names, encoded_labels, feature_annotation_names
 
     def get_encoded_repertoire(self, repertoire, params: EncoderParams):
         params.model = vars(self)
 
-        return CacheHandler.memo_by_params((("encoding_model", params.model), ("type", "kmer_encoding"),
+        return CacheHandler.memo_by_params((("encoding_model", self.get_encoding_params()), ("type", "kmer_encoding_row"),
                                             ("labels", params.label_config.get_labels_by_name()),
                                             ("repertoire_id", repertoire.identifier)),
                                            lambda: self.encode_repertoire(repertoire, params), CacheObjectType.ENCODING_STEP)
 
     def encode_repertoire(self, repertoire, params: EncoderParams):
-        counts = Counter()
         sequence_encoder = self._prepare_sequence_encoder()
         feature_names = sequence_encoder.get_feature_names(params)
-        for sequence in repertoire.sequences:
-            counts = self._encode_sequence(sequence, params, sequence_encoder, counts)
+
+        params.model = vars(self)
+
+        if sequence_encoder.supports_sequence_buffer():
+            counts = self._encode_sequence_buffer(repertoire, params, sequence_encoder)
+        else:
+            counts = Counter()
+            for sequence in repertoire.sequences:
+                counts = self._encode_sequence(sequence, params, sequence_encoder, counts)
 
         label_config = params.label_config
         labels = dict() if params.encode_labels else None
@@ -62,5 +74,14 @@ class KmerFreqRepertoireEncoder(KmerFrequencyEncoder):
                 label = repertoire.metadata[label_name]
                 labels[label_name] = label
 
-        # TODO: refactor this not to return 4 values but e.g. a dict or split into different functions?
-        return counts, repertoire.identifier, labels, feature_names
+        features = np.array(list(counts.keys()), dtype=str)
+        counts = np.fromiter(counts.values(), dtype=float, count=len(counts))
+
+        # TODO: refactor this not to return 5 values but e.g. a dict or split into different functions?
+        return features, counts, repertoire.identifier, labels, feature_names
+
+    def _encode_sequence_buffer(self, repertoire, params: EncoderParams, sequence_encoder) -> Counter:
+        buffer, offsets = repertoire.get_sequence_buffer()
+        weights = repertoire.get_counts() if self.reads == ReadsType.ALL else None
+
+        return Counter(sequence_encoder.encode_sequence_buffer(buffer, offsets, params, weights))
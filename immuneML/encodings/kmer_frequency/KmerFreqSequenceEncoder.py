@@ -19,7 +19,7 @@ class KmerFreqSequenceEncoder(KmerFrequencyEncoder):
 
     def _encode_examples(self, dataset, params: EncoderParams):
 
-        encoded_sequences = []
+        vectorizer = self._prepare_vectorizer(params)
         sequence_ids = []
         label_config = params.label_config
         labels = {label: [] for label in label_config.get_labels_by_name()} if params.encode_labels else None
@@ -28,7 +28,7 @@ class KmerFreqSequenceEncoder(KmerFrequencyEncoder):
         feature_names = sequence_encoder.get_feature_names(params)
         for sequence in dataset.get_data(params.pool_size):
             counts = self._encode_sequence(sequence, params, sequence_encoder, Counter())
-            encoded_sequences.append(counts)
+            vectorizer.add_row(counts.keys(), counts.values())
             sequence_ids.append(sequence.identifier)
 
             if params.encode_labels:
@@ -36,4 +36,6 @@ class KmerFreqSequenceEncoder(KmerFrequencyEncoder):
                     label = sequence.metadata.custom_params[label_name]
                     labels[label_name].append(label)
 
-        return encoded_sequences, sequence_ids, labels, feature_names
+        vectorized_examples, vectorized_feature_names = self._vectorize_encoded(vectorizer, params)
+
+        return vectorized_examples, vectorized_feature_names, sequence_ids, labels, feature_names
@@ -1,10 +1,10 @@
 import abc
+import hashlib
 import pickle
 from pathlib import Path
 from typing import List
 
 import pandas as pd
-from sklearn.feature_extraction import DictVectorizer
 
 from immuneML.analysis.data_manipulation.NormalizationType import NormalizationType
 from immuneML.caching.CacheHandler import CacheHandler
@@ -12,6 +12,7 @@ from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.data_model.receptor.receptor_sequence import ReceptorSequence
 from immuneML.encodings.DatasetEncoder import DatasetEncoder
 from immuneML.encodings.EncoderParams import EncoderParams
+from immuneML.encodings.kmer_frequency.KmerVectorizer import KmerVectorizer
 from immuneML.encodings.kmer_frequency.ReadsType import ReadsType
 from immuneML.encodings.kmer_frequency.sequence_encoding.SequenceEncodingType import SequenceEncodingType
 from immuneML.encodings.preprocessing.FeatureScaler import FeatureScaler
@@ -97,11 +98,12 @@ class KmerFrequencyEncoder(DatasetEncoder):
 
     """
 
-    STEP_ENCODED = "encoded"
     STEP_VECTORIZED = "vectorized"
     STEP_NORMALIZED = "normalized"
     STEP_SCALED = "scaled"
 
+    FITTED_MODEL_PATH_ATTRIBUTES = ["vectorizer_path", "scaler_path"]
+
     dataset_mapping = {
         "RepertoireDataset": "KmerFreqRepertoireEncoder",
         "SequenceDataset": "KmerFreqSequenceEncoder",
@@ -168,8 +170,10 @@ class KmerFrequencyEncoder(DatasetEncoder):
 
     def encode(self, dataset, params: EncoderParams):
 
-        encoded_dataset = CacheHandler.memo_by_params(self._prepare_caching_params(dataset, params),
-                                                      lambda: self._encode_new_dataset(dataset, params))
+        self._set_fitted_model_paths(params)
+
+        encoded_dataset = self._memo_with_fitted_models(self._prepare_caching_params(dataset, params),
+                                                        lambda: self._encode_new_dataset(dataset, params), params, self._get_fitted_model_paths())
 
         return encoded_dataset
 
@@ -179,16 +183,51 @@ class KmerFrequencyEncoder(DatasetEncoder):
                 ("encoding", KmerFrequencyEncoder.__name__),
                 ("learn_model", params.learn_model),
                 ("step", step),
-                ("encoding_params", tuple(vars(self).items())))
+                ("encoding_params", self.get_encoding_params()),
+                ("fitted_models", self._get_fitted_model_hashes() if not params.learn_model else None))
+
+    def get_encoding_params(self) -> tuple:
+        """
+        Returns the parameters of the encoder without the paths to the fitted vectorizer and scaler, which differ between encoders with
+        the same parameters used in different hyperparameter settings or splits and therefore should not be a part of cache keys
+        """
+        return tuple((key, value) for key, value in vars(self).items() if key not in KmerFrequencyEncoder.FITTED_MODEL_PATH_ATTRIBUTES)
+
+    def _set_fitted_model_paths(self, params: EncoderParams):
+        if self.vectorizer_path is None:
+            self.vectorizer_path = params.result_path / FilenameHandler.get_filename(KmerVectorizer.__name__, "pickle")
+        if self.scaler_path is None and self.scale_to_unit_variance:
+            self.scaler_path = params.result_path / 'scaler.pickle'
+
+    def _get_fitted_model_paths(self) -> list:
+        return [getattr(self, attribute) for attribute in KmerFrequencyEncoder.FITTED_MODEL_PATH_ATTRIBUTES if getattr(self, attribute) is not None]
+
+    def _get_fitted_model_hashes(self) -> tuple:
+        return tuple(hashlib.sha256(path.read_bytes()).hexdigest() for path in self._get_fitted_model_paths() if path.is_file())
+
+    def _memo_with_fitted_models(self, caching_params: tuple, fn, params: EncoderParams, fitted_model_paths: list):
+        """
+        Memoizes fn; when the encoder is fitted, the models stored by fn to fitted_model_paths are cached together with the result and
+        written to the paths of this encoder (replacing any existing files) on a cache hit, as the cache key does not depend on the paths
+        """
+        if not params.learn_model:
+            return CacheHandler.memo_by_params(caching_params, fn)
+
+        result, fitted_models = CacheHandler.memo_by_params(caching_params,
+                                                            lambda: (fn(), [path.read_bytes() for path in fitted_model_paths]))
+
+        for path, content in zip(fitted_model_paths, fitted_models):
+            PathBuilder.build(path.parent)
+            path.write_bytes(content)
+
+        return result
 
     def _encode_data(self, dataset, params: EncoderParams) -> EncodedData:
-        encoded_example_list, example_ids, encoded_labels, feature_annotation_names = CacheHandler.memo_by_params(
-            self._prepare_caching_params(dataset, params, KmerFrequencyEncoder.STEP_ENCODED),
-            lambda: self._encode_examples(dataset, params))
+        self._set_fitted_model_paths(params)
 
-        vectorized_examples, feature_names = CacheHandler.memo_by_params(
+        vectorized_examples, feature_names, example_ids, encoded_labels, feature_annotation_names = self._memo_with_fitted_models(
             self._prepare_caching_params(dataset, params, KmerFrequencyEncoder.STEP_VECTORIZED),
-            lambda: self._vectorize_encoded(examples=encoded_example_list, params=params))
+            lambda: self._encode_examples(dataset, params), params, [self.vectorizer_path])
 
         normalized_examples = CacheHandler.memo_by_params(
             self._prepare_caching_params(dataset, params, KmerFrequencyEncoder.STEP_NORMALIZED),
@@ -213,9 +252,11 @@ class KmerFrequencyEncoder(DatasetEncoder):
     def scale_normalized(self, params, dataset, normalized_examples):
         self.scaler_path = params.result_path / 'scaler.pickle' if self.scaler_path is None else self.scaler_path
 
-        examples = CacheHandler.memo_by_params(
+        examples = self._memo_with_fitted_models(
             self._prepare_caching_params(dataset, params, step=KmerFrequencyEncoder.STEP_SCALED),
-            lambda: FeatureScaler.standard_scale(self.scaler_path, normalized_examples, with_mean=self.scale_to_zero_mean))
+            lambda: FeatureScaler.standard_scale(self.scaler_path, normalized_examples, with_mean=self.scale_to_zero_mean,
+                                                 learn_model=params.learn_model), params,
+            [self.scaler_path])
 
         return examples
 
@@ -225,25 +266,38 @@ class KmerFrequencyEncoder(DatasetEncoder):
 
     @abc.abstractmethod
     def _encode_examples(self, dataset, params: EncoderParams):
+        """
+        encodes the examples and adds their k-mer counts to the vectorizer (see _prepare_vectorizer()) one by one
+
+        :return: vectorized examples, feature names, example ids, encoded labels and feature annotation names
+        """
         pass
 
-    def _vectorize_encoded(self, examples: list, params: EncoderParams):
+    def _prepare_vectorizer(self, params: EncoderParams) -> KmerVectorizer:
 
         if self.vectorizer_path is None:
-            self.vectorizer_path = params.result_path / FilenameHandler.get_filename(DictVectorizer.__name__, "pickle")
+            self.vectorizer_path = params.result_path / FilenameHandler.get_filename(KmerVectorizer.__name__, "pickle")
 
         if params.learn_model:
-            vectorizer = DictVectorizer(sparse=True, dtype=float)
-            vectorized_examples = vectorizer.fit_transform(examples)
-            PathBuilder.build(params.result_path)
-            with self.vectorizer_path.open('wb') as file:
-                pickle.dump(vectorizer, file)
+            vectorizer = KmerVectorizer()
         else:
             with self.vectorizer_path.open('rb') as file:
                 vectorizer = pickle.load(file)
-            vectorized_examples = vectorizer.transform(examples)
+            if not isinstance(vectorizer, KmerVectorizer):  # sklearn's DictVectorizer stored by older versions
+                vectorizer = KmerVectorizer(vocabulary=vectorizer.get_feature_names())
+
+        return vectorizer
+
+    def _vectorize_encoded(self, vectorizer: KmerVectorizer, params: EncoderParams):
+
+        vectorized_examples, feature_names = vectorizer.build()
+
+        if params.learn_model:
+            PathBuilder.build(params.result_path)
+            with self.vectorizer_path.open('wb') as file:
+                pickle.dump(vectorizer, file)
 
-        return vectorized_examples, vectorizer.get_feature_names()
+        return vectorized_examples, feature_names
 
     def _get_feature_annotations(self, feature_names, feature_annotation_names):
         feature_annotations = pd.DataFrame({"feature": feature_names})
@@ -0,0 +1,81 @@
+import numpy as np
+from scipy import sparse
+
+
+class KmerVectorizer:
+    """
+    Builds a sparse (CSR) design matrix row by row from the feature counts of each example as soon as the example is encoded, so that
+    the counts of all examples never have to be kept in memory as dictionaries at the same time.
+
+    If no vocabulary is given, the vocabulary is learned from the rows that are added and the columns of the resulting matrix are sorted
+    by feature name (same as in sklearn's DictVectorizer). If the vocabulary is given (e.g. the one learned on the training dataset),
+    the features which are not in the vocabulary are ignored.
+    """
+
+    def __init__(self, vocabulary: list = None):
+        self.learn_vocabulary = vocabulary is None
+        self.vocabulary = {} if vocabulary is None else {feature: index for index, feature in enumerate(vocabulary)}
+        self._reset_rows()
+
+    def _reset_rows(self):
+        self._indices, self._data, self._indptr = [], [], [0]
+
+    def add_row(self, features, counts):
+        """
+        :param features: iterable of feature names present in the example
+        :param counts: iterable of counts of the features, in the same order as features
+        """
+        features = list(features)
+        counts = np.fromiter(counts, dtype=float, count=len(features))
+
+        if self.learn_vocabulary:
+            indices = np.fromiter((self.vocabulary.setdefault(feature, len(self.vocabulary)) for feature in features), dtype=np.int64,
+                                  count=len(features))
+        else:
+            indices = np.fromiter((self.vocabulary.get(feature, -1) for feature in features), dtype=np.int64, count=len(features))
+            counts = counts[indices >= 0]
+            indices = indices[indices >= 0]
+
+        self._indices.append(indices)
+        self._data.append(counts)
+        self._indptr.append(self._indptr[-1] + indices.shape[0])
+
+    def build(self):
+        """
+        creates the design matrix from all rows added so far and releases the rows
+
+        :return: sparse matrix of shape n_examples x n_features and the list of feature names for the columns
+        """
+        feature_names = self.get_feature_names()
+        indices = np.concatenate(self._indices) if len(self._indices) > 0 else np.array([], dtype=np.int64)
+        data = np.concatenate(self._data) if len(self._data) > 0 else np.array([], dtype=float)
+
+        if self.learn_vocabulary:
+            order = np.argsort(np.array(feature_names, dtype=str), kind="stable")
+            new_indices = np.empty(len(feature_names), dtype=np.int64)
+            new_indices[order] = np.arange(len(feature_names))
+            indices = new_indices[indices]
+            feature_names = [feature_names[index] for index in order]
+            self.vocabulary = {feature: index for index, feature in enumerate(feature_names)}
+            self.learn_vocabulary = False
+
+        matrix = sparse.csr_matrix((data, indices, np.array(self._indptr, dtype=np.int64)),
+                                   shape=(len(self._indptr) - 1, len(feature_names)))
+        matrix.sort_indices()
+
+        self._reset_rows()
+
+        return matrix, feature_names
+
+    def get_feature_names(self) -> list:
+        feature_names = [None] * len(self.vocabulary)
+        for feature, index in self.vocabulary.items():
+            feature_names[index] = feature
+        return feature_names
+
+    def __getstate__(self):
+        return {"vocabulary": self.get_feature_names(), "learn_vocabulary": self.learn_vocabulary}
+
+    def __setstate__(self, state):
+        self.__init__(state["vocabulary"])
+        self.learn_vocabulary = state["learn_vocabulary"]
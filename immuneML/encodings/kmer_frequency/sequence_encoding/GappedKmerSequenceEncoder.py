@@ -34,6 +34,21 @@ class GappedKmerSequenceEncoder(SequenceEncodingStrategy):
 
         return gapped_kmers
 
+    @staticmethod
+    def supports_sequence_buffer() -> bool:
+        return True
+
+    @staticmethod
+    def encode_sequence_buffer(buffer, offsets, params: EncoderParams, weights=None) -> dict:
+        k_left = params.model.get('k_left')
+        k_right = params.model.get('k_right', k_left)
+        max_gap = params.model.get('max_gap')
+        min_gap = params.model.get('min_gap', 0)
+        SequenceEncodingStrategy._warn_about_short_sequences(offsets, k_left + k_right + max_gap, "k_left + k_right + max_gap")
+
+        return KmerHelper.count_gapped_kmers_in_buffer(buffer, offsets, k_left=k_left, max_gap=max_gap, min_gap=min_gap, k_right=k_right,
+                                                       weights=weights)
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         return ["sequence"]
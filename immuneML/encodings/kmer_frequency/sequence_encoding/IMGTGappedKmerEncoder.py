@@ -37,6 +37,23 @@ class IMGTGappedKmerEncoder(SequenceEncodingStrategy):
 
         return gapped_kmers
 
+    @staticmethod
+    def supports_sequence_buffer() -> bool:
+        return True
+
+    @staticmethod
+    def encode_sequence_buffer(buffer, offsets, params: EncoderParams, weights=None) -> dict:
+        k_left = params.model.get('k_left')
+        k_right = params.model.get('k_right', k_left)
+        max_gap = params.model.get('max_gap')
+        min_gap = params.model.get('min_gap', 0)
+        SequenceEncodingStrategy._warn_about_short_sequences(offsets, k_left + k_right + max_gap, "k_left + k_right + max_gap")
+
+        gapped_kmers = KmerHelper.count_IMGT_gapped_kmers_in_buffer(buffer, offsets, k_left=k_left, max_gap=max_gap, min_gap=min_gap,
+                                                                    k_right=k_right, weights=weights)
+
+        return {Constants.FEATURE_DELIMITER.join([kmer, str(position)]): count for (kmer, position), count in gapped_kmers.items()}
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         return ["sequence", "imgt_position"]
@@ -31,6 +31,19 @@ class IMGTKmerSequenceEncoder(SequenceEncodingStrategy):
 
         return kmers
 
+    @staticmethod
+    def supports_sequence_buffer() -> bool:
+        return True
+
+    @staticmethod
+    def encode_sequence_buffer(buffer, offsets, params: EncoderParams, weights=None) -> dict:
+        k = params.model["k"]
+        SequenceEncodingStrategy._warn_about_short_sequences(offsets, k, "k", warn=logging.warning)
+
+        kmers = KmerHelper.count_IMGT_kmers_in_buffer(buffer, offsets, k, weights)
+
+        return {Constants.FEATURE_DELIMITER.join([kmer, str(position)]): count for (kmer, position), count in kmers.items()}
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         return ["sequence", "imgt_position"]
@@ -28,6 +28,17 @@ class KmerSequenceEncoder(SequenceEncodingStrategy):
 
         return kmers
 
+    @staticmethod
+    def supports_sequence_buffer() -> bool:
+        return True
+
+    @staticmethod
+    def encode_sequence_buffer(buffer, offsets, params: EncoderParams, weights=None) -> dict:
+        k = params.model["k"]
+        SequenceEncodingStrategy._warn_about_short_sequences(offsets, k, "k", warn=logging.warning, prefix="KmerSequenceEncoder: ")
+
+        return KmerHelper.count_kmers_in_buffer(buffer, offsets, k, weights)
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         return ["sequence"]
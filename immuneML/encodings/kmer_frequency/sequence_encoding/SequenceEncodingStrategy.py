@@ -1,4 +1,7 @@
 import abc
+import warnings
+
+import numpy as np
 
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.encodings.EncoderParams import EncoderParams
@@ -11,6 +14,36 @@ class SequenceEncodingStrategy(metaclass=abc.ABCMeta):
     def encode_sequence(sequence: ReceptorSequence, params: EncoderParams):
         pass
 
+    @staticmethod
+    def supports_sequence_buffer() -> bool:
+        """
+        :return: whether the strategy implements encode_sequence_buffer; strategies which do not are applied sequence by sequence
+                 through encode_sequence instead
+        """
+        return False
+
+    @staticmethod
+    def encode_sequence_buffer(buffer, offsets, params: EncoderParams, weights=None) -> dict:
+        """
+        counts the features of all sequences at once, where sequences are given as a uint8 buffer of concatenated sequences and
+        offsets of each sequence in the buffer (as returned by Repertoire.get_sequence_buffer()); only available if
+        supports_sequence_buffer() returns True
+        :param buffer: uint8 array with concatenated sequences
+        :param offsets: array of length n_sequences + 1 with the start of each sequence in the buffer and the end of the last one
+        :param params: EncoderParams, same object as passed into encode_sequence
+        :param weights: optional weight per sequence (e.g. sequence counts); if not set, each feature occurrence is counted once
+        :return: dictionary of features (same as the ones returned by encode_sequence) and their counts
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _warn_about_short_sequences(offsets, min_length: int, min_length_description: str, warn=warnings.warn, prefix: str = ""):
+        """warns about sequences in the buffer which are shorter than min_length and so are ignored by encode_sequence_buffer"""
+        short_sequence_count = int(np.sum(np.diff(offsets) < min_length))
+
+        if short_sequence_count > 0:
+            warn(f'{prefix}{short_sequence_count} sequences have length less than {min_length_description}. Ignoring these sequences')
+
     @staticmethod
     @abc.abstractmethod
     def get_feature_names(params: EncoderParams):
@@ -2,10 +2,10 @@ import abc
 import math
 
 import numpy as np
-from sklearn.preprocessing import OneHotEncoder as SklearnOneHotEncoder
 
 from immuneML.IO.dataset_export.PickleExporter import PickleExporter
 from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.encodings.DatasetEncoder import DatasetEncoder
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
@@ -162,28 +162,41 @@ class OneHotEncoder(DatasetEncoder):
         PickleExporter.export(encoded_dataset, params.result_path)
 
     def _encode_sequence_list(self, sequences, pad_n_sequences, pad_sequence_len):
-        char_array = np.array(sequences, dtype=str)
-        char_array = char_array.view('U1').reshape((char_array.size, -1))
+        buffer, offsets = ColumnarStorage.encode_strings(sequences)
+        return self._encode_sequence_buffer(buffer, offsets, pad_n_sequences, pad_sequence_len)
+
+    def _encode_sequence_buffer(self, buffer, offsets, pad_n_sequences, pad_sequence_len):
+        """
+        One-hot encodes sequences given as a uint8 buffer with concatenated sequences and an array of sequence offsets into the buffer
+        (as returned by Repertoire.get_sequence_buffer()) directly, without creating string objects per sequence; characters which are
+        not in the alphabet are encoded as all zeros
+        """
+        lengths = np.diff(offsets)
+        n_sequences = lengths.shape[0]
+        positional_dims = int(self.use_positional_info) * 3
 
-        n_sequences, sequence_len = char_array.shape
+        encoded_data = np.zeros((pad_n_sequences, pad_sequence_len, len(OneHotEncoder.ALPHABET) + positional_dims))
 
-        sklearn_enc = SklearnOneHotEncoder(categories=[OneHotEncoder.ALPHABET for i in range(sequence_len)], handle_unknown='ignore')
-        encoded_data = sklearn_enc.fit_transform(char_array).toarray()
+        sequence_indices = np.repeat(np.arange(n_sequences), lengths)
+        positions = np.arange(offsets[-1] - offsets[0]) - np.repeat(offsets[:-1] - offsets[0], lengths)
+        character_indices = OneHotEncoder._get_character_lookup()[np.asarray(buffer[offsets[0]:offsets[-1]])]
+        is_known = character_indices >= 0
 
-        encoded_data = np.pad(encoded_data, pad_width=((0, pad_n_sequences - n_sequences), (0, 0)))
-        encoded_data = encoded_data.reshape((pad_n_sequences, sequence_len, len(OneHotEncoder.ALPHABET)))
-        positional_dims = int(self.use_positional_info) * 3
-        encoded_data = np.pad(encoded_data, pad_width=((0, 0), (0, pad_sequence_len - sequence_len), (0, positional_dims)))
+        encoded_data[sequence_indices[is_known], positions[is_known], character_indices[is_known]] = 1
 
         if self.use_positional_info:
-            pos_info = [self._get_imgt_position_weights(len(sequence), pad_length=pad_sequence_len).T for sequence in sequences]
-            pos_info = np.stack(pos_info)
-            pos_info = np.pad(pos_info, pad_width=((0, pad_n_sequences - n_sequences), (0, 0), (0, 0)))
-
-            encoded_data[:, :, len(OneHotEncoder.ALPHABET):] = pos_info
+            for length in np.unique(lengths):
+                encoded_data[:n_sequences][lengths == length, :, len(OneHotEncoder.ALPHABET):] = \
+                    self._get_imgt_position_weights(int(length), pad_length=pad_sequence_len).T
 
         return encoded_data
 
+    @staticmethod
+    def _get_character_lookup():
+        lookup = np.full(256, -1, dtype=np.int64)
+        lookup[[ord(character) for character in OneHotEncoder.ALPHABET]] = np.arange(len(OneHotEncoder.ALPHABET))
+        return lookup
+
     def _get_imgt_position_weights(self, seq_length, pad_length=None):
         start_weights = self._get_imgt_start_weights(seq_length)
         mid_weights = self._get_imgt_mid_weights(seq_length)
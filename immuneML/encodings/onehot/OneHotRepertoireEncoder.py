@@ -1,6 +1,6 @@
 import hashlib
 import math
-from multiprocessing.pool import Pool
+from functools import partial
 
 import numpy as np
 
@@ -10,7 +10,7 @@ from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.onehot.OneHotEncoder import OneHotEncoder
-from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class OneHotRepertoireEncoder(OneHotEncoder):
@@ -39,9 +39,9 @@ class OneHotRepertoireEncoder(OneHotEncoder):
         max_seq_len = 0
 
         for repertoire in dataset.repertoires:
-            sequences = repertoire.get_attribute(EnvironmentSettings.get_sequence_type().value)
-            max_rep_len = max(len(sequences), max_rep_len)
-            max_seq_len = max(max([len(seq) for seq in sequences]), max_seq_len)
+            sequence_lengths = np.diff(repertoire.get_sequence_buffer()[1])
+            max_rep_len = max(len(sequence_lengths), max_rep_len)
+            max_seq_len = max(int(sequence_lengths.max()), max_seq_len)
 
         self.max_rep_len = max_rep_len
         self.max_seq_len = max_seq_len
@@ -49,15 +49,12 @@ class OneHotRepertoireEncoder(OneHotEncoder):
     def _encode_data(self, dataset, params: EncoderParams):
         self._set_max_dims(dataset)
 
-        arguments = [(repertoire, params) for repertoire in dataset.repertoires]
+        chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
+        examples, repertoires = WorkerPool.map_to_array(partial(self._get_encoded_repertoire_to_array, params=params), dataset.repertoires,
+                                                        params.pool_size, shape=(self.max_rep_len, self.max_seq_len, len(self.onehot_dimensions)),
+                                                        dtype=float, chunksize=chunksize)
 
-        with Pool(params.pool_size) as pool:
-            chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
-            repertoires = pool.starmap(self._get_encoded_repertoire, arguments, chunksize=chunksize)
-
-        encoded_repertoires, repertoire_names, labels = zip(*repertoires)
-
-        examples = np.stack(encoded_repertoires, axis=0)
+        repertoire_names, labels = zip(*repertoires)
 
         labels = {k: [dic[k] for dic in labels] for k in labels[0]}
 
@@ -79,19 +76,23 @@ class OneHotRepertoireEncoder(OneHotEncoder):
         return [[[f"{seq}_{pos}_{dim}" for dim in self.onehot_dimensions] for pos in range(max_seq_len)] for seq in range(max_rep_len)]
 
 
+    def _get_encoded_repertoire_to_array(self, repertoire, params: EncoderParams):
+        onehot_encoded, example_id, labels = self._get_encoded_repertoire(repertoire, params)
+        return onehot_encoded, (example_id, labels)
+
     def _get_encoded_repertoire(self, repertoire, params: EncoderParams):
         params.model = vars(self)
 
         return CacheHandler.memo_by_params((("encoding_model", params.model),
                                             ("labels", params.label_config.get_labels_by_name()),
                                             ("repertoire_id", repertoire.identifier),
-                                            ("repertoire_data", hashlib.sha256(np.ascontiguousarray(repertoire.get_sequence_aas())).hexdigest())),
+                                            ("repertoire_data", hashlib.sha256(np.ascontiguousarray(repertoire.get_sequence_buffer()[0])).hexdigest())),
                                            lambda: self._encode_repertoire(repertoire, params), CacheObjectType.ENCODING)
 
     def _encode_repertoire(self, repertoire, params: EncoderParams):
-        sequences = repertoire.get_attribute(EnvironmentSettings.get_sequence_type().value)
+        buffer, offsets = repertoire.get_sequence_buffer()
 
-        onehot_encoded = self._encode_sequence_list(sequences, pad_n_sequences=self.max_rep_len, pad_sequence_len=self.max_seq_len)
+        onehot_encoded = self._encode_sequence_buffer(buffer, offsets, pad_n_sequences=self.max_rep_len, pad_sequence_len=self.max_seq_len)
         example_id = repertoire.identifier
         labels = self._get_repertoire_labels(repertoire, params) if params.encode_labels else None
 
@@ -3,6 +3,7 @@ from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.onehot.OneHotEncoder import OneHotEncoder
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 
 
 class OneHotSequenceEncoder(OneHotEncoder):
@@ -26,19 +27,21 @@ class OneHotSequenceEncoder(OneHotEncoder):
         return encoded_dataset
 
     def _encode_data(self, dataset: SequenceDataset, params: EncoderParams):
-        sequence_objs = [obj for obj in dataset.get_data(params.pool_size)]
+        sequence_field = EnvironmentSettings.get_sequence_type().value
+        label_names = params.label_config.get_labels_by_name() if params.encode_labels else []
+        attributes = dataset.get_attributes([sequence_field] + label_names)
 
-        sequences = [obj.get_sequence() for obj in sequence_objs]
+        sequences = attributes[sequence_field].tolist()
         example_ids = dataset.get_example_ids()
         max_seq_len = max([len(seq) for seq in sequences])
-        labels = self._get_labels(sequence_objs, params) if params.encode_labels else None
+        labels = {name: attributes[name].tolist() for name in label_names} if params.encode_labels else None
 
-        examples = self._encode_sequence_list(sequences, pad_n_sequences=len(sequence_objs), pad_sequence_len=max_seq_len)
+        examples = self._encode_sequence_list(sequences, pad_n_sequences=len(sequences), pad_sequence_len=max_seq_len)
 
         feature_names = self._get_feature_names(max_seq_len)
 
         if self.flatten:
-            examples = examples.reshape((len(sequence_objs), max_seq_len*len(self.onehot_dimensions)))
+            examples = examples.reshape((len(sequences), max_seq_len*len(self.onehot_dimensions)))
             feature_names = [item for sublist in feature_names for item in sublist]
 
         encoded_data = EncodedData(examples=examples,
@@ -51,16 +54,3 @@ class OneHotSequenceEncoder(OneHotEncoder):
 
     def _get_feature_names(self, max_seq_len):
         return [[f"{pos}_{dim}" for dim in self.onehot_dimensions] for pos in range(max_seq_len)]
-
-
-    def _get_labels(self, sequence_objs, params: EncoderParams):
-        label_names = params.label_config.get_labels_by_name()
-        labels = {name: [None] * len(sequence_objs) for name in label_names}
-
-        for idx, sequence in enumerate(sequence_objs):
-            for name in label_names:
-                labels[name][idx] = sequence.get_attribute(name)
-
-        return labels
-
-
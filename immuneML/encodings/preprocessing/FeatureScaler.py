@@ -12,12 +12,14 @@ class FeatureScaler:
     SKLEARN_NORMALIZATION_TYPES = ["l1", "l2", "max"]
 
     @staticmethod
-    def standard_scale(scaler_file: Path, design_matrix, with_mean: bool = True):
+    def standard_scale(scaler_file: Path, design_matrix, with_mean: bool = True, learn_model: bool = None):
         """
         scale to zero mean and unit variance on feature level
         :param scaler_file: path to scaler file fitted on train set or where the resulting scaler file will be stored
         :param design_matrix: rows -> examples, columns -> features
         :param with_mean: whether to scale to zero mean or not (could lose sparsity if scaled)
+        :param learn_model: whether to fit a new scaler (replacing the scaler file if it exists) or load the existing one; if not set,
+                            the scaler is fitted only if the scaler file does not exist
         :return: scaled design matrix
         """
 
@@ -26,7 +28,10 @@ class FeatureScaler:
         else:
             scaled_design_matrix = design_matrix
 
-        if scaler_file.is_file():
+        if learn_model is None:
+            learn_model = not scaler_file.is_file()
+
+        if not learn_model:
             with scaler_file.open('rb') as file:
                 scaler = pickle.load(file)
                 scaled_design_matrix = scaler.transform(scaled_design_matrix)
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 
-from immuneML.analysis.SequenceMatcher import SequenceMatcher
+from immuneML.analysis.SequenceMatchingIndex import SequenceMatchingIndex
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.data_model.repertoire.Repertoire import Repertoire
@@ -84,8 +84,10 @@ class MatchedReceptorsRepertoireEncoder(MatchedReceptorsEncoder):
                                        dtype=int)
         labels = {label: [] for label in params.label_config.get_labels_by_name()} if params.encode_labels else None
 
+        index = self._build_index()
+
         for i, repertoire in enumerate(dataset.get_data()):
-            encoded_repertories[i] = self._match_repertoire_to_receptors(repertoire)
+            encoded_repertories[i] = self._match_repertoire_to_receptors(repertoire, index)
 
             if labels is not None:
                 for label in params.label_config.get_labels_by_name():
@@ -93,23 +95,18 @@ class MatchedReceptorsRepertoireEncoder(MatchedReceptorsEncoder):
 
         return encoded_repertories, labels, dataset.get_repertoire_ids()
 
-    def _match_repertoire_to_receptors(self, repertoire: Repertoire):
-        matcher = SequenceMatcher()
-        matches = np.zeros(len(self.reference_receptors) * 2, dtype=int)
-        rep_seqs = repertoire.sequences
-
-        for i, ref_receptor in enumerate(self.reference_receptors):
-            chain_names = ref_receptor.get_chains()
-            first_chain = ref_receptor.get_chain(chain_names[0])
-            second_chain = ref_receptor.get_chain(chain_names[1])
+    def _build_index(self) -> SequenceMatchingIndex:
+        # Both chains of each receptor are indexed in the order of the columns: first chain in even, second chain in odd columns
+        chains, max_distances = [], []
+        for ref_receptor in self.reference_receptors:
+            for chain_name in ref_receptor.get_chains()[:2]:
+                chains.append(ref_receptor.get_chain(chain_name))
+                max_distances.append(self.max_edit_distances[chain_name])
 
-            for rep_seq in rep_seqs:
-                # Match with first chain: add to even columns in matches.
-                # Match with second chain: add to odd columns
-                if matcher.matches_sequence(first_chain, rep_seq, max_distance=self.max_edit_distances[chain_names[0]]):
-                    matches[i * 2] += rep_seq.metadata.count
-                if matcher.matches_sequence(second_chain, rep_seq, max_distance=self.max_edit_distances[chain_names[1]]):
-                    matches[i * 2 + 1] += rep_seq.metadata.count
+        return SequenceMatchingIndex(chains, max_distances)
 
-        return matches
+    def _match_repertoire_to_receptors(self, repertoire: Repertoire, index: SequenceMatchingIndex = None):
+        if index is None:
+            index = self._build_index()
 
+        return index.count_repertoire_matches(repertoire)
@@ -1,16 +1,19 @@
-import datetime
 import re
 import warnings
+from functools import partial
 
 import numpy as np
 import pandas as pd
 
+from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.reference_encoding.MatchedRegexEncoder import MatchedRegexEncoder
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class MatchedRegexRepertoireEncoder(MatchedRegexEncoder):
@@ -71,22 +74,26 @@ class MatchedRegexRepertoireEncoder(MatchedRegexEncoder):
                                        dtype=int)
         labels = {label: [] for label in params.label_config.get_labels_by_name()} if params.encode_labels else None
 
-        n_repertoires = dataset.get_example_count()
+        regex_groups = self._prepare_regex_groups()
 
-        for i, repertoire in enumerate(dataset.get_data()):
-            print(f"{datetime.datetime.now()}: Encoding repertoire {i+1}/{n_repertoires}")
-            encoded_repertoires[i] = self._match_repertoire_to_regexes(repertoire)
+        for i, matches in enumerate(WorkerPool.imap(partial(self._get_encoded_repertoire, regex_groups=regex_groups), dataset.repertoires,
+                                                    params.pool_size)):
+            encoded_repertoires[i] = matches
 
-            if labels is not None:
+        if labels is not None:
+            for repertoire in dataset.get_data():
                 for label in params.label_config.get_labels_by_name():
                     labels[label].append(repertoire.metadata[label])
 
         return encoded_repertoires, labels
 
-    def _match_repertoire_to_regexes(self, repertoire: Repertoire):
-        matches = np.zeros(self.feature_count, dtype=int)
-        rep_seqs = repertoire.sequences
-
+    def _prepare_regex_groups(self) -> list:
+        """
+        returns the regexes grouped by chain and V gene, as tuples (chain_type, v_gene, patterns, combined_pattern), where patterns is a
+        list of (feature index, compiled regex) and combined_pattern is a single compiled regex matching if any of the patterns matches
+        (None if the patterns cannot be combined because they use numbered groups)
+        """
+        groups = {}
         match_idx = 0
 
         for index, row in self.regex_df.iterrows():
@@ -95,26 +102,74 @@ class MatchedRegexRepertoireEncoder(MatchedRegexEncoder):
 
                 if regex is not None:
                     v_gene = row[f"{chain_type}V"] if f"{chain_type}V" in row else None
-
-                    for rep_seq in rep_seqs:
-                        if rep_seq.metadata.chain is not None:
-                            if rep_seq.metadata.chain.value == chain_type:
-                                if self._matches(rep_seq, regex, v_gene):
-                                    n_matches = 1 if not self.sum_counts else rep_seq.metadata.count
-                                    if n_matches is None:
-                                        warnings.warn(f"MatchedRegexRepertoireEncoder: count not defined for sequence with id {rep_seq.identifier} in repertoire {repertoire.identifier}, ignoring sequence...")
-                                        n_matches = 0
-                                    matches[match_idx] += n_matches
-                        else:
-                            warnings.warn(f"{MatchedRegexRepertoireEncoder.__class__.__name__}: chain was not set for sequence {rep_seq.identifier}, skipping the sequence for matching...")
+                    groups.setdefault((chain_type, v_gene), []).append((match_idx, re.compile(regex)))
                     match_idx += 1
 
-        return matches
+        return [(chain_type, v_gene, patterns, self._combine_patterns(patterns)) for (chain_type, v_gene), patterns in groups.items()]
 
-    def _matches(self, receptor_sequence, regex, v_gene=None):
-        if v_gene is not None and receptor_sequence.metadata.v_gene != v_gene:
-            matches = False
+    def _combine_patterns(self, patterns: list):
+        if len(patterns) > 1 and all(pattern.groups == 0 for _, pattern in patterns):
+            return re.compile("|".join(f"(?:{pattern.pattern})" for _, pattern in patterns))
         else:
-            matches = bool(re.search(regex, receptor_sequence.amino_acid_sequence))
+            return None
+
+    def _get_encoded_repertoire(self, repertoire: Repertoire, regex_groups: list):
+        return CacheHandler.memo_by_params((("encoding", MatchedRegexEncoder.__name__), ("type", "matched_regex_row"),
+                                            ("regexes", tuple((chain_type, v_gene, tuple((match_idx, pattern.pattern) for match_idx, pattern in patterns))
+                                                              for chain_type, v_gene, patterns, _ in regex_groups)),
+                                            ("sum_counts", self.sum_counts), ("feature_count", self.feature_count),
+                                            ("repertoire_id", repertoire.identifier)),
+                                           lambda: self._match_repertoire_to_regexes(repertoire, regex_groups), CacheObjectType.ENCODING_STEP)
+
+    def _match_repertoire_to_regexes(self, repertoire: Repertoire, regex_groups: list = None):
+        if regex_groups is None:
+            regex_groups = self._prepare_regex_groups()
+
+        matches = np.zeros(self.feature_count, dtype=int)
+        columns = repertoire.get_attributes(["sequence_aas", "v_genes", "chains", "counts"])
+        missing = np.full(repertoire.get_element_count(), None, dtype=object)
+
+        sequences = columns.get("sequence_aas", missing)
+        v_genes = columns.get("v_genes", missing)
+        chains = self._get_chain_values(columns.get("chains", missing))
+        weights = self._get_weights(columns.get("counts", missing), repertoire) if self.sum_counts else np.ones(len(sequences), dtype=int)
+
+        missing_chain_count = np.sum(chains == None)
+        if missing_chain_count > 0:
+            warnings.warn(f"{MatchedRegexRepertoireEncoder.__name__}: chain was not set for {missing_chain_count} sequence(s) in repertoire "
+                          f"{repertoire.identifier}, skipping these sequences for matching...")
+
+        for chain_type, v_gene, patterns, combined_pattern in regex_groups:
+            mask = chains == chain_type
+            if v_gene is not None:
+                mask = np.logical_and(mask, v_genes == v_gene)
+
+            for sequence, weight in self._get_unique_sequences(sequences[mask], weights[mask]):
+                if combined_pattern is None or combined_pattern.search(sequence):
+                    for match_idx, pattern in patterns:
+                        if pattern.search(sequence):
+                            matches[match_idx] += weight
 
         return matches
+
+    def _get_chain_values(self, chains) -> np.ndarray:
+        chain_values = {chain: Chain.get_chain(chain).value if chain else None for chain in set(chains)}
+        return np.array([chain_values[chain] for chain in chains], dtype=object)
+
+    def _get_weights(self, counts, repertoire: Repertoire) -> np.ndarray:
+        weights = np.array([int(count) if count is not None and count == count else -1 for count in counts], dtype=int)
+
+        if np.any(weights == -1):
+            warnings.warn(f"{MatchedRegexRepertoireEncoder.__name__}: count not defined for {np.sum(weights == -1)} sequence(s) in repertoire "
+                          f"{repertoire.identifier}, ignoring these sequences...")
+            weights[weights == -1] = 0
+
+        return weights
+
+    def _get_unique_sequences(self, sequences: np.ndarray, weights: np.ndarray):
+        valid = np.array([isinstance(sequence, str) for sequence in sequences], dtype=bool)
+        if np.sum(valid) == 0:
+            return []
+
+        unique_sequences, inverse = np.unique(sequences[valid].astype(str), return_inverse=True)
+        return zip(unique_sequences.tolist(), np.bincount(inverse, weights=weights[valid], minlength=len(unique_sequences)).astype(int).tolist())
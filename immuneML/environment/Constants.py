@@ -9,3 +9,7 @@ class Constants:
     CACHE_TYPE = "cache_type"
     COMMENT_SIGN = "#"
     NOT_COMPUTED = "not computed"
+    CACHE_MAX_SIZE = "cache_max_size"
+    CACHE_EVICTION_POLICY = "cache_eviction_policy"
+    CACHE_MEMORY_MAX_SIZE = "cache_memory_max_size"
+    CACHE_COMPRESSION = "cache_compression"
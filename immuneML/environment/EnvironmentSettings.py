@@ -3,6 +3,9 @@ import datetime
 import os
 from pathlib import Path
 
+from immuneML.caching.CacheCompression import CacheCompression
+from immuneML.caching.CacheEvictionPolicy import CacheEvictionPolicy
+from immuneML.caching.CacheIndex import CacheIndex
 from immuneML.caching.CacheType import CacheType
 from immuneML.environment.Constants import Constants
 from immuneML.environment.SequenceType import SequenceType
@@ -54,6 +57,37 @@ class EnvironmentSettings:
         else:
             raise RuntimeError("Cache is not set up.")
 
+    @staticmethod
+    def get_cache_max_size():
+        """
+        :return: size budget of the cache in bytes as set in the cache_max_size environment variable (e.g. 500M or 20GB),
+                 or None if the cache size is not limited
+        """
+        if os.environ.get(Constants.CACHE_MAX_SIZE, "") == "":
+            return None
+        return CacheIndex.parse_size(os.environ[Constants.CACHE_MAX_SIZE])
+
+    @staticmethod
+    def get_cache_memory_max_size() -> int:
+        """
+        :return: size budget in bytes of the in-memory cache in front of the cache on disk as set in the cache_memory_max_size
+                 environment variable; the budget applies to each process separately (including each worker process) and the in-memory
+                 cache is not used by default (size 0)
+        """
+        return CacheIndex.parse_size(os.environ.get(Constants.CACHE_MEMORY_MAX_SIZE, "") or "0")
+
+    @staticmethod
+    def get_cache_compression() -> CacheCompression:
+        """
+        :return: compression of cached NumPy/scipy.sparse/pandas data as set in the cache_compression environment variable (none, zlib,
+                 lz4 or zstd), no compression by default
+        """
+        return CacheCompression[os.environ.get(Constants.CACHE_COMPRESSION, CacheCompression.NONE.name).upper()]
+
+    @staticmethod
+    def get_cache_eviction_policy() -> CacheEvictionPolicy:
+        return CacheEvictionPolicy[os.environ.get(Constants.CACHE_EVICTION_POLICY, CacheEvictionPolicy.LRU.name).upper()]
+
     @staticmethod
     def set_sequence_type(sequence_type: SequenceType):
         EnvironmentSettings.sequence_type = sequence_type
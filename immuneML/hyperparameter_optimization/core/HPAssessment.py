@@ -1,13 +1,11 @@
 import datetime
-from pathlib import Path
 
-from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.hyperparameter_optimization.HPSetting import HPSetting
+from immuneML.hyperparameter_optimization.core.HPScheduler import HPScheduler
 from immuneML.hyperparameter_optimization.core.HPSelection import HPSelection
 from immuneML.hyperparameter_optimization.core.HPUtil import HPUtil
 from immuneML.hyperparameter_optimization.states.HPAssessmentState import HPAssessmentState
 from immuneML.hyperparameter_optimization.states.TrainMLModelState import TrainMLModelState
-from immuneML.ml_methods.MLMethod import MLMethod
 from immuneML.reports.ReportUtil import ReportUtil
 from immuneML.util.PathBuilder import PathBuilder
 from immuneML.workflows.instructions.MLProcess import MLProcess
@@ -22,8 +20,18 @@ class HPAssessment:
         train_val_datasets, test_datasets = HPUtil.split_data(state.dataset, state.assessment, state.path)
         n_splits = len(train_val_datasets)
 
+        print(f'{datetime.datetime.now()}: Training ML model: running outer CV loop: started {n_splits} split(s).\n', flush=True)
+
         for index in range(n_splits):
-            state = HPAssessment.run_assessment_split(state, train_val_datasets[index], test_datasets[index], index, n_splits)
+            HPAssessment.create_assessment_state(state, train_val_datasets[index], test_datasets[index], index)
+
+        state = HPSelection.run_selection(state)
+        state = HPAssessment.run_assessment_per_label(state)
+
+        for assessment_state in state.assessment_states:
+            HPAssessment.run_data_reports(state, assessment_state)
+
+        print(f'{datetime.datetime.now()}: Training ML model: running outer CV loop: finished {n_splits} split(s).\n', flush=True)
 
         return state
 
@@ -34,71 +42,59 @@ class HPAssessment:
         return state
 
     @staticmethod
-    def run_assessment_split(state, train_val_dataset, test_dataset, split_index: int, n_splits):
-        """run inner CV loop (selection) and retrain on the full train_val_dataset after optimal model is chosen"""
-
-        print(f'{datetime.datetime.now()}: Training ML model: running outer CV loop: started split {split_index + 1}/{n_splits}.\n', flush=True)
-
+    def create_assessment_state(state: TrainMLModelState, train_val_dataset, test_dataset, split_index: int) -> HPAssessmentState:
         current_path = HPAssessment.create_assessment_path(state, split_index)
 
         assessment_state = HPAssessmentState(split_index, train_val_dataset, test_dataset, current_path, state.label_configuration)
         state.assessment_states.append(assessment_state)
 
-        state = HPSelection.run_selection(state, train_val_dataset, current_path, split_index)
-        state = HPAssessment.run_assessment_split_per_label(state, split_index)
-
-        assessment_state.train_val_data_reports = ReportUtil.run_data_reports(train_val_dataset, state.assessment.reports.data_split_reports.values(),
-                                                                              current_path / "data_report_train", state.context)
-        assessment_state.test_data_reports = ReportUtil.run_data_reports(test_dataset, state.assessment.reports.data_split_reports.values(),
-                                                                         current_path / "data_report_test", state.context)
-
-        print(f'{datetime.datetime.now()}: Training ML model: running outer CV loop: finished split {split_index + 1}/{n_splits}.\n', flush=True)
-
-        return state
+        return assessment_state
 
     @staticmethod
-    def run_assessment_split_per_label(state: TrainMLModelState, split_index: int):
-        """iterate through labels and hp_settings and retrain all models"""
-        n_labels = state.label_configuration.get_label_count()
+    def run_data_reports(state: TrainMLModelState, assessment_state: HPAssessmentState):
+        assessment_state.train_val_data_reports = ReportUtil.run_data_reports(assessment_state.train_val_dataset,
+                                                                              state.assessment.reports.data_split_reports.values(),
+                                                                              assessment_state.path / "data_report_train", state.context)
+        assessment_state.test_data_reports = ReportUtil.run_data_reports(assessment_state.test_dataset,
+                                                                         state.assessment.reports.data_split_reports.values(),
+                                                                         assessment_state.path / "data_report_test", state.context)
 
-        for idx, label in enumerate(state.label_configuration.get_labels_by_name()):
-
-            print(f"{datetime.datetime.now()}: Training ML model: running the inner loop of nested CV: "
-                  f"retrain models for label {label} (label {idx + 1} / {n_labels}).\n", flush=True)
+    @staticmethod
+    def run_assessment_per_label(state: TrainMLModelState) -> TrainMLModelState:
+        """retrain models for all assessment splits, labels and hp_settings on the train_val_datasets and assess them on the test datasets"""
 
-            path = state.assessment_states[split_index].path
+        print(f"{datetime.datetime.now()}: Training ML model: running the inner loop of nested CV: retrain models for "
+              f"{state.label_configuration.get_label_count()} label(s).\n", flush=True)
 
-            for index, hp_setting in enumerate(state.hp_settings):
+        units = [(split_index, label, hp_setting) for split_index in range(len(state.assessment_states))
+                 for label in state.label_configuration.get_labels_by_name() for hp_setting in state.hp_settings]
 
-                if hp_setting != state.assessment_states[split_index].label_states[label].optimal_hp_setting:
-                    setting_path = path / f"{label}_{hp_setting}/"
-                else:
-                    setting_path = path / f"{label}_{hp_setting}_optimal/"
+        ml_processes = [HPAssessment.create_ml_process(state, hp_setting, label, split_index) for split_index, label, hp_setting in units]
+        hp_items = HPScheduler.run(ml_processes, [split_index for split_index, label, hp_setting in units], state.number_of_processes)
 
-                train_val_dataset = state.assessment_states[split_index].train_val_dataset
-                test_dataset = state.assessment_states[split_index].test_dataset
-                state = HPAssessment.reeval_on_assessment_split(state, train_val_dataset, test_dataset, hp_setting, setting_path, label, split_index)
+        for (split_index, label, hp_setting), assessment_item in zip(units, hp_items):
+            state.assessment_states[split_index].label_states[label].assessment_items[str(hp_setting)] = assessment_item
 
-            print(f"{datetime.datetime.now()}: Training ML model: running the inner loop of nested CV: completed retraining models "
-                  f"for label {label} (label {idx + 1} / {n_labels}).\n", flush=True)
+        print(f"{datetime.datetime.now()}: Training ML model: running the inner loop of nested CV: completed retraining models.\n", flush=True)
 
         return state
 
     @staticmethod
-    def reeval_on_assessment_split(state, train_val_dataset: Dataset, test_dataset: Dataset, hp_setting: HPSetting, path: Path, label: str,
-                                   split_index: int) -> MLMethod:
-        """retrain model for specific label, assessment split and hp_setting"""
+    def create_ml_process(state: TrainMLModelState, hp_setting: HPSetting, label: str, split_index: int) -> MLProcess:
+        """creates the process to retrain model for specific label, assessment split and hp_setting"""
 
-        assessment_item = MLProcess(train_dataset=train_val_dataset, test_dataset=test_dataset, label=label, metrics=state.metrics,
-                                    optimization_metric=state.optimization_metric, path=path, hp_setting=hp_setting, report_context=state.context,
-                                    ml_reports=state.assessment.reports.model_reports.values(), number_of_processes=state.number_of_processes,
-                                    encoding_reports=state.assessment.reports.encoding_reports.values(), label_config=state.label_configuration,
-                                    store_encoded_data=state.store_encoded_data) \
-            .run(split_index)
+        assessment_state = state.assessment_states[split_index]
 
-        state.assessment_states[split_index].label_states[label].assessment_items[str(hp_setting)] = assessment_item
+        if hp_setting != assessment_state.label_states[label].optimal_hp_setting:
+            path = assessment_state.path / f"{label}_{hp_setting}/"
+        else:
+            path = assessment_state.path / f"{label}_{hp_setting}_optimal/"
 
-        return state
+        return MLProcess(train_dataset=assessment_state.train_val_dataset, test_dataset=assessment_state.test_dataset, label=label,
+                         metrics=state.metrics, optimization_metric=state.optimization_metric, path=path, hp_setting=hp_setting,
+                         report_context=state.context, ml_reports=state.assessment.reports.model_reports.values(),
+                         number_of_processes=state.number_of_processes, encoding_reports=state.assessment.reports.encoding_reports.values(),
+                         label_config=state.label_configuration, store_encoded_data=state.store_encoded_data)
 
     @staticmethod
     def create_assessment_path(state, split_index):
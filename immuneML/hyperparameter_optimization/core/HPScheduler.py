@@ -0,0 +1,87 @@
+import datetime
+
+from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.util.WorkerPool import WorkerPool
+from immuneML.workflows.instructions.MLProcess import MLProcess
+
+
+class HPScheduler:
+    """
+    Runs independent units of the nested cross-validation (MLProcess objects, one per data split, label and hyperparameter setting)
+    concurrently and returns the resulting HPItems in the order of the units, so that they can be merged back into the TrainMLModelState
+    in the main process.
+
+    Processes which share the training and test datasets, the label, the preprocessing and the encoder (i.e. differ only in the ML method)
+    are run together as one group: the datasets are preprocessed and encoded once by the first process of the group and the encoded data
+    and the fitted encoder are then used to train and assess all ML methods of the group.
+
+    The number of processes of the instruction is used as a global core budget: min(number of groups, number_of_processes) groups run at
+    the same time in the worker processes of WorkerPool and the cores are divided between them, so each group gets
+    number_of_processes // worker count cores (at least one) for its ML methods. Parallel steps within a group which use WorkerPool (e.g.
+    encoding repertoires) run in the worker process itself. If there is only one group, it is run in the main process and can use all
+    cores. Groups are dispatched in order of their training dataset, preprocessing and encoding, so that groups which encode the same
+    data are run close to each other and can reuse the cached encoding.
+    """
+
+    @staticmethod
+    def run(ml_processes: list, split_indices: list, number_of_processes: int) -> list:
+        """
+        Arguments:
+
+            ml_processes (list): MLProcess objects to run
+
+            split_indices (list): split index to be passed to MLProcess.run for each of the processes
+
+            number_of_processes (int): the maximum number of cores to be used
+
+        Returns:
+            list of HPItems, one per MLProcess in the same order as the processes
+        """
+        groups = HPScheduler.group_by_encoding(ml_processes, split_indices)
+        worker_count = max(1, min(len(groups), number_of_processes))
+        cores_per_worker = max(1, number_of_processes // worker_count)
+
+        for ml_process in ml_processes:
+            ml_process.number_of_processes = cores_per_worker
+
+        if worker_count > 1:
+            print(f"{datetime.datetime.now()}: {HPScheduler.__name__}: running {len(ml_processes)} hyperparameter settings in {len(groups)} "
+                  f"encoding groups on {worker_count} processes.\n", flush=True)
+
+        results = WorkerPool.map(HPScheduler._run_group, [[(ml_processes[index], split_indices[index]) for index in group] for group in groups],
+                                 worker_count)
+
+        hp_items = [None] * len(ml_processes)
+        for group, group_hp_items in zip(groups, results):
+            for index, hp_item in zip(group, group_hp_items):
+                hp_items[index] = hp_item
+
+        return hp_items
+
+    @staticmethod
+    def group_by_encoding(ml_processes: list, split_indices: list) -> list:
+        """
+        Returns:
+            lists of indices of the processes which can share the encoded data, in the order in which they should be dispatched
+        """
+        groups = {}
+        for index, (ml_process, split_index) in enumerate(zip(ml_processes, split_indices)):
+            groups.setdefault(HPScheduler._get_encoding_key(ml_process, split_index), []).append(index)
+
+        return [groups[key] for key in sorted(groups.keys(), key=lambda key: key[:-2])]
+
+    @staticmethod
+    def _run_group(units: list) -> list:
+        first_process, split_index = units[0]
+        encoding = first_process.encode_datasets()
+        return [ml_process.run(split_index, encoding) for ml_process, split_index in units]
+
+    @staticmethod
+    def _get_encoding_key(ml_process: MLProcess, split_index: int) -> tuple:
+        hp_setting = ml_process.hp_setting
+        return (str(ml_process.train_dataset.identifier), split_index, str(hp_setting.preproc_sequence_name), str(hp_setting.encoder_name),
+                str(ml_process.label), CacheHandler.generate_cache_key((("preprocessing", hp_setting.preproc_sequence),
+                                                                        ("encoder", hp_setting.encoder),
+                                                                        ("encoder_params", hp_setting.encoder_params),
+                                                                        ("labels", ml_process.label_config.get_labels_by_name()))),
+                id(ml_process.train_dataset), id(ml_process.test_dataset))
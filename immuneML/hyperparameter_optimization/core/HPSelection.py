@@ -4,6 +4,7 @@ from pathlib import Path
 from immuneML.environment.LabelConfiguration import LabelConfiguration
 from immuneML.hyperparameter_optimization.HPSetting import HPSetting
 from immuneML.hyperparameter_optimization.config.SplitType import SplitType
+from immuneML.hyperparameter_optimization.core.HPScheduler import HPScheduler
 from immuneML.hyperparameter_optimization.core.HPUtil import HPUtil
 from immuneML.hyperparameter_optimization.states.HPSelectionState import HPSelectionState
 from immuneML.hyperparameter_optimization.states.TrainMLModelState import TrainMLModelState
@@ -21,62 +22,84 @@ class HPSelection:
         return state
 
     @staticmethod
-    def run_selection(state: TrainMLModelState, train_val_dataset, current_path: Path, split_index: int) -> TrainMLModelState:
+    def run_selection(state: TrainMLModelState) -> TrainMLModelState:
+        """
+        runs the inner loop of nested CV for all assessment splits and labels: in each round, the settings proposed by the hyperparameter
+        optimization strategies of all assessment splits and labels are evaluated together on their inner splits using HPScheduler, and the
+        performances are then passed back to the strategies to get the settings for the next round
+        """
+        selection_states = HPSelection.create_selection_states(state)
 
-        path = HPSelection.create_selection_path(state, current_path)
-        state = HPSelection.update_split_count(state, train_val_dataset)
-        train_datasets, val_datasets = HPUtil.split_data(train_val_dataset, state.selection, path)
+        print(f"{datetime.datetime.now()}: Hyperparameter optimization: running the inner loop of nested CV: selection for "
+              f"{len(state.assessment_states)} assessment split(s) and {state.label_configuration.get_label_count()} label(s).\n", flush=True)
 
-        n_labels = state.label_configuration.get_label_count()
+        hp_settings = {key: selection_state.hp_strategy.generate_next_settings() for key, selection_state in selection_states.items()}
 
-        for idx, label in enumerate(state.label_configuration.get_labels_by_name()):
+        while any(len(settings) > 0 for settings in hp_settings.values()):
+            performances = HPSelection.evaluate_hp_settings(state, hp_settings, selection_states)
+            hp_settings = {key: selection_states[key].hp_strategy.generate_next_settings(settings, performances[key]) if len(settings) > 0 else []
+                           for key, settings in hp_settings.items()}
 
-            print(f"{datetime.datetime.now()}: Hyperparameter optimization: running the inner loop of nested CV: selection for label {label} "
-                  f"(label {idx + 1} / {n_labels}).\n", flush=True)
+        for (split_index, label), selection_state in selection_states.items():
+            HPUtil.run_selection_reports(state, state.assessment_states[split_index].train_val_dataset, selection_state.train_datasets,
+                                         selection_state.val_datasets, selection_state)
 
-            selection_state = HPSelectionState(train_datasets, val_datasets, path, state.hp_strategy)
-            state.assessment_states[split_index].label_states[label].selection_state = selection_state
-
-            hp_setting = selection_state.hp_strategy.generate_next_setting()
-            while hp_setting is not None:
-                performance = HPSelection.evaluate_hp_setting(state, hp_setting, train_datasets, val_datasets,
-                                                              path, label, split_index)
-                hp_setting = selection_state.hp_strategy.generate_next_setting(hp_setting, performance)
-
-            HPUtil.run_selection_reports(state, train_val_dataset, train_datasets, val_datasets, selection_state)
-
-            print(f"{datetime.datetime.now()}: Hyperparameter optimization: running the inner loop of nested CV: completed selection for "
-                  f"label {label} (label {idx + 1} / {n_labels}).\n", flush=True)
+        print(f"{datetime.datetime.now()}: Hyperparameter optimization: running the inner loop of nested CV: completed selection.\n", flush=True)
 
         return state
 
     @staticmethod
-    def evaluate_hp_setting(state: TrainMLModelState, hp_setting: HPSetting, train_datasets: list, val_datasets: list,
-                            current_path: Path, label: str, assessment_split_index: int):
+    def create_selection_states(state: TrainMLModelState) -> dict:
+        """splits the train_val_dataset of each assessment split and creates a selection state per assessment split and label"""
+        selection_states = {}
+
+        for split_index, assessment_state in enumerate(state.assessment_states):
+            path = HPSelection.create_selection_path(state, assessment_state.path)
+            state = HPSelection.update_split_count(state, assessment_state.train_val_dataset)
+            train_datasets, val_datasets = HPUtil.split_data(assessment_state.train_val_dataset, state.selection, path)
 
-        performances = []
-        for index in range(state.selection.split_count):
-            performance = HPSelection.run_setting(state, hp_setting, train_datasets[index], val_datasets[index], index + 1,
-                                                  current_path / f"split_{index + 1}" / f"{label}_{hp_setting.get_key()}",
-                                                  label, assessment_split_index)
-            performances.append(performance)
+            for label in state.label_configuration.get_labels_by_name():
+                selection_state = HPSelectionState(train_datasets, val_datasets, path, state.hp_strategy)
+                assessment_state.label_states[label].selection_state = selection_state
+                selection_states[(split_index, label)] = selection_state
 
-        return HPUtil.get_average_performance(performances)
+        return selection_states
 
     @staticmethod
-    def run_setting(state: TrainMLModelState, hp_setting, train_dataset, val_dataset, split_index: int,
-                    current_path: Path, label: str, assessment_index: int):
+    def evaluate_hp_settings(state: TrainMLModelState, hp_settings: dict, selection_states: dict) -> dict:
+        """
+        evaluates the settings for each (assessment split index, label) key on the inner splits of the corresponding selection state chosen
+        by its hyperparameter optimization strategy (by default all inner splits)
 
-        hp_item = MLProcess(train_dataset=train_dataset, test_dataset=val_dataset, encoding_reports=state.selection.reports.encoding_reports.values(),
-                            label_config=LabelConfiguration([state.label_configuration.get_label_object(label)]), report_context=state.context,
-                            number_of_processes=state.number_of_processes, metrics=state.metrics, optimization_metric=state.optimization_metric,
-                            ml_reports=state.selection.reports.model_reports.values(), label=label, path=current_path, hp_setting=hp_setting,
-                            store_encoded_data=state.store_encoded_data)\
-            .run(split_index)
+        Returns:
+            the average performance of each setting over the evaluated inner splits per (assessment split index, label) key
+        """
+        units = [(key, hp_setting, index) for key, settings in hp_settings.items() for hp_setting in settings
+                 for index in selection_states[key].hp_strategy.get_split_indices(hp_setting, len(selection_states[key].train_datasets))]
 
-        state.assessment_states[assessment_index].label_states[label].selection_state.hp_items[hp_setting.get_key()].append(hp_item)
+        ml_processes = [HPSelection.create_ml_process(state, hp_setting, selection_states[key], index, key[1]) for key, hp_setting, index in units]
+        hp_items = HPScheduler.run(ml_processes, [index + 1 for key, hp_setting, index in units], state.number_of_processes)
 
-        return hp_item.performance[state.optimization_metric.name.lower()] if hp_item.performance is not None else None
+        performances = {key: {hp_setting.get_key(): [] for hp_setting in settings} for key, settings in hp_settings.items()}
+        for (key, hp_setting, index), hp_item in zip(units, hp_items):
+            selection_states[key].hp_items[hp_setting.get_key()].append(hp_item)
+            performances[key][hp_setting.get_key()].append(hp_item.performance[state.optimization_metric.name.lower()]
+                                                           if hp_item.performance is not None else None)
+
+        return {key: [HPUtil.get_average_performance(performances[key][hp_setting.get_key()]) for hp_setting in settings]
+                for key, settings in hp_settings.items()}
+
+    @staticmethod
+    def create_ml_process(state: TrainMLModelState, hp_setting: HPSetting, selection_state: HPSelectionState, split_index: int,
+                          label: str) -> MLProcess:
+
+        return MLProcess(train_dataset=selection_state.train_datasets[split_index], test_dataset=selection_state.val_datasets[split_index],
+                         encoding_reports=state.selection.reports.encoding_reports.values(),
+                         label_config=LabelConfiguration([state.label_configuration.get_label_object(label)]), report_context=state.context,
+                         number_of_processes=state.number_of_processes, metrics=state.metrics, optimization_metric=state.optimization_metric,
+                         ml_reports=state.selection.reports.model_reports.values(), label=label,
+                         path=selection_state.path / f"split_{split_index + 1}" / f"{label}_{hp_setting.get_key()}", hp_setting=hp_setting,
+                         store_encoded_data=state.store_encoded_data)
 
     @staticmethod
     def create_selection_path(state: TrainMLModelState, current_path: Path) -> str:
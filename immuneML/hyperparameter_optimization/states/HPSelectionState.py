@@ -10,6 +10,7 @@ class HPSelectionState:
         self.val_datasets = val_datasets
         self.path = path
         self.hp_strategy = hp_strategy.clone()
+        self.hp_strategy.set_split_count(len(train_datasets))
         self.hp_items = {str(hp_setting): [] for hp_setting in self.hp_strategy.hp_settings}
         self.train_data_reports = []
         self.val_data_reports = []
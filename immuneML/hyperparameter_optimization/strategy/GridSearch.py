@@ -21,6 +21,16 @@ class GridSearch(HPOptimizationStrategy):
 
         return copy.deepcopy(next_setting)
 
+    def generate_next_settings(self, hp_settings: list = None, metrics: list = None) -> list:
+        """
+        Returns all settings which were not evaluated so far, as the order of evaluation does not depend on the performance of other settings
+        """
+        if hp_settings is not None:
+            for hp_setting, metric in zip(hp_settings, metrics):
+                self.search_space_metric[hp_setting.get_key()] = metric
+
+        return [copy.deepcopy(self.hp_settings[key]) for key in self.search_space_metric if self.search_space_metric[key] is None]
+
     def get_optimal_hps(self) -> HPSetting:
         """
         Finds the optimal hyperparameter setting, where the optimal is the one with max/min value of the search metric.
@@ -28,6 +28,38 @@ class HPOptimizationStrategy(metaclass=abc.ABCMeta):
         """
         pass
 
+    def generate_next_settings(self, hp_settings: list = None, metrics: list = None) -> list:
+        """
+        returns the next hyper-parameter settings which can be evaluated independently of each other (e.g. in parallel); by default,
+        the settings are generated one at a time by generate_next_setting
+        :param hp_settings: settings returned by the previous call (None in the first iteration)
+        :param metrics: performance metric for each of the previous settings
+        :return: list of settings to be evaluated next, empty if the end is reached
+        """
+        if hp_settings is None or len(hp_settings) == 0:
+            next_setting = self.generate_next_setting()
+        else:
+            next_setting = self.generate_next_setting(hp_settings[0], metrics[0])
+        return [next_setting] if next_setting is not None else []
+
+    def set_split_count(self, split_count: int):
+        """
+        sets the number of data splits the settings will be evaluated on, before the first setting is generated; by default, the strategy
+        does not depend on it
+        :param split_count: the number of data splits available for the evaluation
+        """
+        pass
+
+    def get_split_indices(self, hp_setting: HPSetting, split_count: int) -> list:
+        """
+        returns the indices of the data splits on which the setting should be evaluated in the current iteration; by default, each setting
+        is evaluated on all splits at once
+        :param hp_setting: setting returned by the last call to generate_next_setting(s)
+        :param split_count: the number of data splits available for the evaluation
+        :return: list of split indices
+        """
+        return list(range(split_count))
+
     @abc.abstractmethod
     def get_optimal_hps(self) -> HPSetting:
         pass
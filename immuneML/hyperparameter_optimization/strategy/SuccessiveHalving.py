@@ -0,0 +1,164 @@
+import copy
+import math
+
+from immuneML.hyperparameter_optimization.HPSetting import HPSetting
+from immuneML.hyperparameter_optimization.HPSettingResult import HPSettingResult
+from immuneML.hyperparameter_optimization.strategy.HPOptimizationStrategy import HPOptimizationStrategy
+
+
+class SuccessiveHalving(HPOptimizationStrategy):
+    """
+    Successive halving evaluates the hyperparameter settings in rounds (rungs) on a growing number of inner data splits: in the first rung
+    all settings are evaluated on `min_split_count` splits, then only the best 1/`reduction_factor` of the settings are kept and evaluated
+    on `reduction_factor` times more splits and so on, until the remaining settings are evaluated on all splits. Performance of a setting
+    is its average performance over all splits it was evaluated on so far. If only one setting is left after a rung, it is directly
+    evaluated on all splits.
+
+    The optimal setting is chosen among the settings which were evaluated on all splits. Compared to grid search, the settings which
+    perform poorly on the first splits are not evaluated on the remaining splits, so more settings can be explored with the same number
+    of trained models.
+
+    Arguments:
+
+        reduction_factor (int): the number of settings is divided by this value after each rung, while the number of splits the remaining
+        settings are evaluated on is multiplied by it; by default 2
+
+        min_split_count (int): the number of splits all settings are evaluated on in the first rung; by default 1
+
+    YAML specification:
+
+    .. indent with spaces
+    .. code-block:: yaml
+
+        strategy: SuccessiveHalving
+
+        # or with parameters:
+
+        strategy:
+            SuccessiveHalving:
+                reduction_factor: 3
+                min_split_count: 2
+
+    """
+
+    def __init__(self, hp_settings: list, search_criterion=max, reduction_factor: int = 2, min_split_count: int = 1):
+        super().__init__(hp_settings, search_criterion)
+
+        assert isinstance(reduction_factor, int) and reduction_factor >= 2, \
+            f"{SuccessiveHalving.__name__}: reduction_factor has to be an integer greater than 1, got {reduction_factor} instead."
+        assert isinstance(min_split_count, int) and min_split_count >= 1, \
+            f"{SuccessiveHalving.__name__}: min_split_count has to be a positive integer, got {min_split_count} instead."
+
+        self.reduction_factor = reduction_factor
+        self.min_split_count = min_split_count
+        self.split_count = None
+        self.rung = 0
+        self.survivors = list(self.hp_settings.keys())
+        self.evaluated_split_count = {key: 0 for key in self.hp_settings}
+
+    def generate_next_setting(self, hp_setting: HPSetting = None, metric: float = None) -> HPSetting:
+        if hp_setting is not None:
+            self._update_metric(hp_setting, metric)
+
+        keys = self._get_pending_keys()
+        return copy.deepcopy(self.hp_settings[keys[0]]) if len(keys) > 0 else None
+
+    def generate_next_settings(self, hp_settings: list = None, metrics: list = None) -> list:
+        """
+        Returns all settings of the current rung which were not evaluated on the splits of the rung so far
+        """
+        if hp_settings is not None:
+            for hp_setting, metric in zip(hp_settings, metrics):
+                self._update_metric(hp_setting, metric)
+
+        return [copy.deepcopy(self.hp_settings[key]) for key in self._get_pending_keys()]
+
+    def set_split_count(self, split_count: int):
+        assert isinstance(split_count, int) and split_count >= 1, \
+            f"{SuccessiveHalving.__name__}: the number of splits has to be a positive integer, got {split_count} instead."
+        self.split_count = split_count
+
+    def get_split_indices(self, hp_setting: HPSetting, split_count: int) -> list:
+        """
+        Returns the splits of the current rung on which the setting was not evaluated in the previous rungs
+        """
+        assert self.split_count == split_count, \
+            f"{SuccessiveHalving.__name__}: the strategy was set up for {self.split_count} splits with set_split_count(), but the setting " \
+            f"{hp_setting.get_key()} is evaluated on {split_count} splits."
+        return list(range(self.evaluated_split_count[hp_setting.get_key()], self._get_rung_split_count()))
+
+    def _get_rung_split_count(self) -> int:
+        if self.split_count is None:
+            return self.min_split_count
+        elif len(self.survivors) == 1:
+            return self.split_count
+        else:
+            return min(self.split_count, self.min_split_count * self.reduction_factor ** self.rung)
+
+    def _update_metric(self, hp_setting: HPSetting, metric):
+        key = hp_setting.get_key()
+        previous_count, count = self.evaluated_split_count[key], self._get_rung_split_count()
+        previous_metric = self.search_space_metric[key]
+
+        if isinstance(metric, float) and (previous_count == 0 or isinstance(previous_metric, float)):
+            previous_sum = previous_metric * previous_count if previous_count > 0 else 0.
+            self.search_space_metric[key] = (previous_sum + metric * (count - previous_count)) / count
+        else:
+            self.search_space_metric[key] = metric
+
+        self.evaluated_split_count[key] = count
+
+    def _get_pending_keys(self) -> list:
+        keys = self._get_keys_to_evaluate()
+
+        if len(keys) == 0 and self.split_count is not None and self._get_rung_split_count() < self.split_count:
+            self._promote_survivors()
+            keys = self._get_keys_to_evaluate()
+
+        return keys
+
+    def _get_keys_to_evaluate(self) -> list:
+        return [key for key in self.survivors if self.evaluated_split_count[key] < self._get_rung_split_count()]
+
+    def _promote_survivors(self):
+        survivor_count = max(1, math.ceil(len(self.survivors) / self.reduction_factor))
+        ranked = self._rank_survivors()
+        self.survivors = [key for key in self.survivors if key in ranked[:survivor_count]]
+        self.rung += 1
+
+    def _rank_survivors(self) -> list:
+        """sorts the survivors from the best to the worst performing, where the settings without a valid metric value are the worst"""
+        worst_metric = -math.inf if self.search_criterion is max else math.inf
+        return sorted(self.survivors, key=lambda key: self.search_space_metric[key] if isinstance(self.search_space_metric[key], float)
+                      else worst_metric, reverse=self.search_criterion is max)
+
+    def get_optimal_hps(self) -> HPSetting:
+        """
+        Finds the optimal hyperparameter setting among the settings evaluated on all splits, where the optimal is the one with max/min
+        value of the search metric as defined by the search criterion (max or min function). If none of the settings has a valid metric
+        value (e.g. all of them failed), the first one is returned.
+
+        Returns:
+            HPSetting object which had the optimal performance based on the metric value in the search space
+
+        """
+        return self.hp_settings[self._rank_survivors()[0]]
+
+    def get_all_hps(self) -> HPSettingResult:
+        optimal_setting = self.get_optimal_hps()
+        res = HPSettingResult(optimal_setting=optimal_setting, all_settings=self.hp_settings)
+        return res
+
+    def get_performance(self, hp_setting: HPSetting):
+        key = hp_setting.get_key()
+        if key in self.search_space_metric:
+            return self.search_space_metric[key]
+        else:
+            return None
+
+    def clone(self):
+        strategy = SuccessiveHalving(hp_settings=self.hp_settings.values(), search_criterion=self.search_criterion,
+                                     reduction_factor=self.reduction_factor, min_split_count=self.min_split_count)
+        if self.split_count is not None:
+            strategy.set_split_count(self.split_count)
+        return strategy
@@ -12,7 +12,6 @@ from tqdm import tqdm
 
 from immuneML.caching.CacheHandler import CacheHandler
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
-from immuneML.encodings.deeprc.DeepRCEncoder import DeepRCEncoder
 from immuneML.ml_methods.MLMethod import MLMethod
 from immuneML.util.FilenameHandler import FilenameHandler
 from immuneML.util.PathBuilder import PathBuilder
@@ -72,7 +71,7 @@ class DeepRC(MLMethod):
 
         training_batch_size (int): Number of repertoires per minibatch during training.
 
-        n_workers (int): Number of background processes to use for converting dataset to hdf5 container and training set data loader.
+        n_workers (int): Number of background processes to use for the training set data loader.
 
         pytorch_device_name (str): The name of the pytorch device to use. This name will be passed to  torch.device(self.pytorch_device_name). The default value is cuda:0
 
@@ -141,22 +140,6 @@ class DeepRC(MLMethod):
         self.feature_names = None
 
 
-    def _metadata_to_hdf5(self, metadata_filepath: Path, label_name):
-        from deeprc.deeprc_binary.dataset_converters import DatasetToHDF5
-
-        hdf5_filepath = metadata_filepath.parent / f"{metadata_filepath.stem}.hdf5"
-        converter = DatasetToHDF5(metadata_file=str(metadata_filepath),
-                                  id_column=DeepRCEncoder.ID_COLUMN,
-                                  single_class_label_columns=tuple([label_name]),
-                                  sequence_column=DeepRCEncoder.SEQUENCE_COLUMN,
-                                  sequence_counts_column=DeepRCEncoder.COUNTS_COLUMN,
-                                  column_sep=DeepRCEncoder.SEP,
-                                  filename_extension=f".{DeepRCEncoder.EXTENSION}",
-                                  verbose=False)
-        converter.save_data_to_file(output_file=str(hdf5_filepath), n_workers=self.n_workers)
-
-        return hdf5_filepath
-
     def _load_dataset_in_ram(self, hdf5_filepath: Path):
         with h5py.File(str(hdf5_filepath), 'r') as hf:
             pre_loaded_hdf5_file = dict()
@@ -185,8 +168,8 @@ class DeepRC(MLMethod):
         :param pre_loaded_hdf5_file: Optional: It is faster to load the hdf5 file into the RAM as dictionary instead
             of keeping it on the disk. `pre_loaded_hdf5_file` is the loaded hdf5 file as dictionary.
             If None, the hdf5 file will be read from the disk and consume less RAM.
-        :param indices: indices of the subset of repertoires in the data that will be used for this dataset.
-                If 'None', all repertoires will be used.
+        :param indices: indices of the subset of repertoires in the HDF5 file that will be used for this dataset (e.g., the indices stored
+                by DeepRCEncoder for the encoded part of the dataset). If 'None', all repertoires will be used.
         :param label: the label to be predicted
         :param eval_only: whether the dataloader will only be used for evaluation (no training).
                 if false, sample_n_sequences can be set
@@ -207,7 +190,7 @@ class DeepRC(MLMethod):
             pre_loaded_hdf5_file=pre_loaded_hdf5_file,
             verbose=False)
         dataloader = torch.utils.data.DataLoader(dataset, batch_size=training_batch_size,
-                                                 shuffle=True,
+                                                 shuffle=not eval_only,
                                                  num_workers=n_workers,
                                                  collate_fn=no_stack_collate_fn)
         return dataloader
@@ -231,7 +214,8 @@ class DeepRC(MLMethod):
         self.label_classes = label_classes
 
     def _prepare_caching_params(self, encoded_data: EncodedData, type: str, label_name: str):
-        return (("metadata_filepath", str(encoded_data.info["metadata_filepath"])),
+        return (("hdf5_filepath", str(encoded_data.info["hdf5_filepath"])),
+                ("indices", tuple(encoded_data.info["indices"])),
                 ("y", hashlib.sha256(str(encoded_data.labels[label_name]).encode("utf-8")).hexdigest()),
                 ("label_name", label_name),
                 ("type", type),
@@ -266,10 +250,12 @@ class DeepRC(MLMethod):
     def _fit(self, encoded_data: EncodedData, label_name: str, cores_for_training: int = 2):
         self._set_label_classes({label_name: encoded_data.labels[label_name]})
 
-        hdf5_filepath = self._metadata_to_hdf5(encoded_data.info["metadata_filepath"], label_name)
+        hdf5_filepath = encoded_data.info["hdf5_filepath"]
         pre_loaded_hdf5_file = self._load_dataset_in_ram(hdf5_filepath) if self.keep_dataset_in_ram else None
 
-        train_indices, val_indices = self.get_train_val_indices(len(encoded_data.example_ids))
+        indices = np.array(encoded_data.info["indices"], dtype=int)
+        train_indices, val_indices = self.get_train_val_indices(len(indices))
+        train_indices, val_indices = indices[train_indices], indices[val_indices]
         self.max_seq_len = encoded_data.info["max_sequence_length"]
 
         self._fit_for_label(hdf5_filepath, pre_loaded_hdf5_file, train_indices, val_indices, label_name, cores_for_training)
@@ -343,10 +329,11 @@ class DeepRC(MLMethod):
 
         probabilities = {}
 
-        hdf5_filepath = self._metadata_to_hdf5(encoded_data.info["metadata_filepath"], label_name)
+        hdf5_filepath = encoded_data.info["hdf5_filepath"]
         pre_loaded_hdf5_file = self._load_dataset_in_ram(hdf5_filepath) if self.keep_dataset_in_ram else None
 
-        test_dataloader = self.make_data_loader(hdf5_filepath, pre_loaded_hdf5_file, indices=None, label=label_name, eval_only=True, is_train=False)
+        test_dataloader = self.make_data_loader(hdf5_filepath, pre_loaded_hdf5_file, indices=np.array(encoded_data.info["indices"], dtype=int),
+                                                label=label_name, eval_only=True, is_train=False)
 
         probs_pos_class = self._model_predict(self.models[label_name], test_dataloader)
         probabilities[label_name] = np.vstack((probs_pos_class, 1 - probs_pos_class)).T
@@ -1,6 +1,7 @@
 import copy
 
 import numpy as np
+from scipy import sparse
 from sklearn.neighbors import KNeighborsClassifier
 
 from immuneML.ml_methods.SklearnMethod import SklearnMethod
@@ -46,6 +47,14 @@ class TCRdistClassifier(SklearnMethod):
         # compute k (number of nearest neighbors to consider) given the training dataset size (10% in the paper)
         self.k = int(X.shape[0] * self.percentage)
 
+        # with a sparse distance matrix (TCRdist encoder with nearest_neighbours set), only the stored neighbours of each example are known
+        if sparse.issparse(X) and X.shape[0] > 0:
+            stored_neighbours = int(np.diff(X.tocsr().indptr).min())
+            if self.k > stored_neighbours:
+                raise ValueError(f"TCRdistClassifier: {self.k} nearest neighbours ({self.percentage} of {X.shape[0]} training examples) are "
+                                 f"needed, but the encoded data stores only the distances to {stored_neighbours} nearest neighbours per example. "
+                                 f"Set nearest_neighbours of the TCRdist encoder to at least {self.k} or decrease percentage.")
+
         # define function for computing weights which linearly decrease with distance
         def weights_func(distances):
             for point_dist_i, point_dist in enumerate(distances):
@@ -1,8 +1,6 @@
 from datetime import datetime
 
 import numpy as np
-import pkg_resources
-import torch
 
 from immuneML.environment.Constants import Constants
 
@@ -40,11 +38,14 @@ class Util:
 
     @staticmethod
     def setup_pytorch(number_of_threads, random_seed):
+        import torch
         torch.set_num_threads(number_of_threads)
         torch.manual_seed(random_seed)
 
     @staticmethod
     def get_immuneML_version():
+        import pkg_resources
+
         try:
             return 'immuneML ' + pkg_resources.get_distribution('immuneML').version
         except pkg_resources.DistributionNotFound as err:
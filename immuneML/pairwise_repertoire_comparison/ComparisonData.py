@@ -1,34 +1,93 @@
 import logging
-import os
-import pickle
+from functools import partial
 from pathlib import Path
 
 import numpy as np
+from scipy import sparse
 
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
-from immuneML.pairwise_repertoire_comparison.ComparisonDataBatch import ComparisonDataBatch
 from immuneML.util.Logger import log
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class ComparisonData:
+    """
+    Sparse items x repertoires matrix where items are defined by comparison attributes (e.g. receptor sequences or combinations of
+    receptor sequences and V and J genes) and the values show the presence of the item in the repertoire.
+
+    The matrix is built incrementally: each item gets a global integer id from a single hash index the first time it is seen, and for each
+    repertoire only the (item id, repertoire index, value) triplets of the items present in that repertoire are collected. Once all
+    repertoires are added, the triplets are converted to a sparse matrix in CSC format (one column per repertoire) which is stored in
+    path / comparison_data and loaded from there when needed.
+
+    Arguments:
+
+        repertoire_ids (list): identifiers of the repertoires, in the order of the columns of the matrix
+
+        comparison_attributes (list): repertoire attributes which define an item
+
+        sequence_batch_size (int): number of items (rows of the matrix) in one batch when the matrix is accessed in batches of dense arrays
+
+        path (Path): path to the directory where the comparison data is stored
+
+        value_attribute (str): repertoire attribute (e.g. counts) which is summed per item and repertoire to get the values in the matrix;
+        if not set, the values are 1 for all items present in the repertoire
+
+    """
+
+    MATRIX_FILE_NAME = "comparison_matrix.npz"
+    ITEMS_FILE_NAME = "items.npy"
 
     @log
-    def __init__(self, repertoire_ids: list, comparison_attributes, sequence_batch_size: int = 10000, path: Path = None):
+    def __init__(self, repertoire_ids: list, comparison_attributes, sequence_batch_size: int = 10000, path: Path = None,
+                 value_attribute: str = None):
 
         self.path = PathBuilder.build(path / "comparison_data")
         self.sequence_batch_size = sequence_batch_size
         self.item_count = 0
         self.comparison_attributes = comparison_attributes
+        self.value_attribute = value_attribute
         self.repertoire_ids = repertoire_ids
-        self.batches = []
-        self.tmp_batch_paths = []
+        self.repertoire_index_mapping = {repertoire_id: index for index, repertoire_id in enumerate(repertoire_ids)}
+        self._item_index = {}
+        self._triplets = []
+        self._matrix = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_matrix"] = None
+        return state
 
     def build_matching_fn(self):
-        return lambda repertoire: list(set(zip(*[value for value in repertoire.get_attributes(self.comparison_attributes).values() if value is not None])))
+        return partial(ComparisonData.extract_items, comparison_attributes=self.comparison_attributes, value_attribute=self.value_attribute)
+
+    @staticmethod
+    def extract_items(repertoire, comparison_attributes: list, value_attribute: str = None) -> tuple:
+        """
+        :return: unique items (tuples of comparison attribute values) in the repertoire in the order of their first occurrence and the sum
+                 of value_attribute for each item (or None if value_attribute is not set)
+        """
+        attributes = repertoire.get_attributes(comparison_attributes + ([value_attribute] if value_attribute is not None else []))
+        items = zip(*[attributes[attribute] for attribute in comparison_attributes if attributes.get(attribute) is not None])
+
+        if value_attribute is None:
+            return list(dict.fromkeys(items)), None
+        else:
+            item_values = {}
+            values = attributes.get(value_attribute)
+            values = np.nan_to_num(np.asarray(values, dtype=float), nan=1.) if values is not None else np.ones(repertoire.get_element_count())
+            for item, value in zip(items, values):
+                item_values[item] = item_values.get(item, 0.) + value
+            return list(item_values.keys()), list(item_values.values())
 
     def get_item_names(self):
-        return np.array([item for items in [batch.get_items() for batch in self.batches] for item in items])
+        return np.load(self.path / ComparisonData.ITEMS_FILE_NAME, allow_pickle=True)
+
+    def get_matrix(self) -> sparse.csc_matrix:
+        if self._matrix is None:
+            self._matrix = sparse.load_npz(self.path / ComparisonData.MATRIX_FILE_NAME).tocsc()
+        return self._matrix
 
     def get_item_vectors(self, repertoire_ids: list = None):
         for batch in self.get_batches(columns=repertoire_ids):
@@ -36,154 +95,78 @@ class ComparisonData:
                 yield batch[item_index]
 
     def get_repertoire_vectors(self, identifiers: list):
-        repertoire_vectors = {identifier: np.zeros(self.item_count) for identifier in identifiers}
-        for batch_index, batch in enumerate(self.get_batches(columns=identifiers, return_dict=True)):
-            start = batch_index * self.sequence_batch_size
-            for identifier in identifiers:
-                end = start + batch[identifier].shape[0]
-                repertoire_vectors[identifier][start: end] = batch[identifier]
-        return repertoire_vectors
+        matrix = self.get_repertoire_matrix(identifiers)
+        return {identifier: matrix[:, index].toarray().ravel() for index, identifier in enumerate(identifiers)}
 
     def get_repertoire_vector(self, identifier: str):
-        repertoire_vector = np.zeros(self.item_count)
-        for batch_index, batch in enumerate(self.get_batches(columns=[identifier])):
-            start = batch_index * self.sequence_batch_size
-            end = start + batch.shape[0]
-            repertoire_vector[start: end] = batch[:, 0]
-        return repertoire_vector
+        return self.get_matrix()[:, self.repertoire_index_mapping[identifier]].toarray().ravel()
 
     def get_item_vector(self, index: int):
-        batch_index = int(index / self.sequence_batch_size)
-        index_in_batch = index - (batch_index * self.sequence_batch_size)
-        return self.batches[batch_index].get_matrix()[index_in_batch]
+        return self.get_matrix()[index].toarray().ravel()
 
     def get_batches(self, columns: list = None, return_dict: bool = False):
-        for index in range(len(self.batches)):
-            yield self.get_batch(index, columns, return_dict)
-
-    def get_batch(self, index: int, columns: list = None, return_dict: bool = False):
-        batch = self.batches[index].load()
-        if columns is not None and not return_dict:
-            column_indices = [self.batches[index].repertoire_index_mapping[col] for col in columns]
-            return batch.get_matrix()[:, column_indices]
-        elif columns is not None:
-            column_indices = [self.batches[index].repertoire_index_mapping[col] for col in columns]
-            matrix = batch.get_matrix()
-            return {col: matrix[:, column_indices[i]] for i, col in enumerate(columns)}
-        else:
-            return batch.get_matrix()
+        matrix = self.get_repertoire_matrix(columns).tocsr()
+        for start in range(0, self.item_count, self.sequence_batch_size):
+            batch = matrix[start: start + self.sequence_batch_size].toarray()
+            if return_dict and columns is not None:
+                yield {col: batch[:, index] for index, col in enumerate(columns)}
+            else:
+                yield batch
+
+    def get_repertoire_matrix(self, columns: list = None) -> sparse.csc_matrix:
+        """
+        :return: sparse items x repertoires matrix with only the columns of the given repertoires (in the given order) or all repertoires
+        """
+        matrix = self.get_matrix()
+        if columns is not None:
+            matrix = matrix[:, [self.repertoire_index_mapping[col] for col in columns]]
+        return matrix
 
     @log
-    def process_dataset(self, dataset: RepertoireDataset):
+    def process_dataset(self, dataset: RepertoireDataset, pool_size: int = 4):
+        """
+        Extracts the items from the repertoires in parallel (one repertoire per task) and merges them in the order of the repertoires
+        into the item index of this object, so that item ids do not depend on the number of processes.
+        """
         extract_fn = self.build_matching_fn()
         repertoire_count = dataset.get_example_count()
-        for index, repertoire in enumerate(dataset.get_data()):
-            self.process_repertoire(repertoire, str(repertoire.identifier), extract_fn)
+        for index, (repertoire, (items, values)) in enumerate(zip(dataset.get_data(), WorkerPool.imap(extract_fn, dataset.get_data(), pool_size))):
+            self.add_repertoire(items, str(repertoire.identifier), values)
             logging.info("Repertoire {} ({}/{}) processed.".format(repertoire.identifier, index+1, repertoire_count))
             logging.info(f"Currently, there are {self.item_count} items in the comparison data matrix.")
-        self.merge_tmp_batches_to_matrix()
-
-    def merge_tmp_batches_to_matrix(self):
-
-        for index in range(len(self.tmp_batch_paths)):
-
-            batch = self.load_tmp_batch(index)
-            matrix = np.zeros((self.sequence_batch_size, len(self.repertoire_ids)), order='F')
-            items = []
-
-            for item_index, item in enumerate(batch):
-                items.append(item)
-                for repertoire_index, repertoire_id in enumerate(self.repertoire_ids):
-                    if repertoire_id in batch[item]:
-                        matrix[item_index][repertoire_index] = batch[item][repertoire_id]
-
-            df = np.array(matrix[:len(items)], order='F')
-            repertoire_index_mapping = {rep_id: ind for ind, rep_id in enumerate(self.repertoire_ids)}
+        self.build_matrix()
 
-            comp_data_batch = ComparisonDataBatch(matrix=df, items=items, repertoire_index_mapping=repertoire_index_mapping, path=self.path,
-                                                  identifier=index)
-            comp_data_batch.store()
+    def add_repertoire(self, items: list, repertoire_id: str, values=None):
+        """
+        Assigns ids to the items not seen so far and stores the (item id, repertoire index, value) triplets for the repertoire.
 
-            self.batches.append(comp_data_batch)
+        Arguments:
 
-        for path in self.tmp_batch_paths:
-            os.remove(path)
+            items (list): items (tuples of comparison attribute values) present in the repertoire
 
-    @log
-    def process_repertoire(self, repertoire, repertoire_id: str, extract_items_fn):
-        items = extract_items_fn(repertoire)
-        new_items = self.filter_existing_items(items, repertoire_id)
-        self.add_items_for_repertoire(new_items, repertoire_id)
-
-    def filter_existing_items(self, items: list, repertoire_id: str) -> list:
-        new_items = items
-        for batch_index, batch in enumerate(self.get_tmp_batches()):
-            new_items = self._remove_existing_items(new_items, batch, batch_index, repertoire_id)
-        return new_items
-
-    def _match_items_to_batch(self, items, batch):
-
-        keep = set(items).difference(batch)
-
-        item_to_update = set(items).intersection(batch)
-        value = np.ones(len(item_to_update), dtype=np.bool_)
-
-        return keep, value, item_to_update
-
-    def _remove_existing_items(self, new_items: list, batch: dict, batch_index: int, repertoire_id: str) -> list:
-
-        update = {"value": [], "index": []}
-
-        new_items_to_keep, update["value"], update["index"] = self._match_items_to_batch(new_items, batch)
+            repertoire_id (str): identifier of the repertoire
 
-        for index, item in enumerate(update["index"]):
-            batch[item][repertoire_id] = update["value"][index]
+            values: values of the items in the repertoire, by default 1 for each item (the item is present)
 
-        self.store_tmp_batch(batch, batch_index)
+        """
+        item_ids = np.fromiter((self._item_index.setdefault(item, len(self._item_index)) for item in items), dtype=np.int64, count=len(items))
+        self.item_count = len(self._item_index)
+        values = np.ones(len(items)) if values is None else np.asarray(values, dtype=float)
+        self._triplets.append((item_ids, np.full(len(items), self.repertoire_index_mapping[repertoire_id], dtype=np.int64), values))
 
-        return list(new_items_to_keep)
-
-    def store_tmp_batch(self, batch: dict, batch_index: int):
-
-        if len(self.tmp_batch_paths) > batch_index or len(self.tmp_batch_paths) == batch_index:
-            batch_path = self.path / f'tmp_batch_{batch_index}.pickle'
-            with batch_path.open('wb') as file:
-                pickle.dump(batch, file)
-            if len(self.tmp_batch_paths) == batch_index:
-                self.tmp_batch_paths.append(batch_path)
-        else:
-            raise KeyError("ComparisonData: batch_index: {} does not exist. tmp_batches length: {}"
-                           .format(batch_index, len(self.tmp_batch_paths)))
-
-    def get_tmp_batches(self):
-        for i in range(len(self.tmp_batch_paths)):
-            yield self.load_tmp_batch(i)
-
-    def load_tmp_batch(self, batch_index: int) -> dict:
-        if len(self.tmp_batch_paths) > 0 and self.tmp_batch_paths[batch_index].is_file():
-            with self.tmp_batch_paths[batch_index].open("rb") as file:
-                batch = pickle.load(file)
+    def build_matrix(self):
+        """
+        Creates the sparse items x repertoires matrix from the collected triplets and stores it together with the item names; repeated
+        triplets for the same item and repertoire are summed.
+        """
+        if len(self._triplets) > 0:
+            rows, columns, values = (np.concatenate(parts) for parts in zip(*self._triplets))
         else:
-            batch = {}
-        return batch
-
-    def add_items_for_repertoire(self, items: list, repertoire_id: str):
-        last_batch_index = len(self.tmp_batch_paths)-1 if len(self.tmp_batch_paths) > 0 else 0
-        batch = self.load_tmp_batch(last_batch_index)
-
-        self.item_count += len(items)
-
-        item_index = 0
-        while len(batch) < self.sequence_batch_size and item_index < len(items):
-            batch[items[item_index]] = {repertoire_id: 1}
-            item_index += 1
-
-        self.store_tmp_batch(batch, last_batch_index)
+            rows, columns, values = np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
 
-        items = items[item_index:]
+        self._matrix = sparse.csc_matrix((values, (rows, columns)), shape=(self.item_count, len(self.repertoire_ids)))
+        sparse.save_npz(self.path / ComparisonData.MATRIX_FILE_NAME, self._matrix, compressed=False)
+        np.save(self.path / ComparisonData.ITEMS_FILE_NAME, np.array(list(self._item_index.keys())))
 
-        while len(items) > 0:
-            batch = {item: {repertoire_id: 1} for item in items[:self.sequence_batch_size]}
-            last_batch_index += 1
-            self.store_tmp_batch(batch, last_batch_index)
-            items = items[self.sequence_batch_size:]
+        self._item_index = {}
+        self._triplets = []
@@ -13,26 +13,31 @@ from immuneML.util.PathBuilder import PathBuilder
 class PairwiseRepertoireComparison:
 
     @log
-    def __init__(self, matching_columns: list, item_columns: list, path: Path, sequence_batch_size: int):
+    def __init__(self, matching_columns: list, item_columns: list, path: Path, sequence_batch_size: int, pool_size: int = 4,
+                 value_attribute: str = None):
         self.matching_columns = matching_columns
         self.item_columns = item_columns
         self.path = PathBuilder.build(path)
         self.sequence_batch_size = sequence_batch_size
+        self.pool_size = pool_size
+        self.value_attribute = value_attribute
         self.comparison_data = None
         self.comparison_fn = None
 
     @log
     def create_comparison_data(self, dataset: RepertoireDataset) -> ComparisonData:
 
-        comparison_data = ComparisonData(dataset.get_repertoire_ids(), self.matching_columns, self.sequence_batch_size, self.path)
-        comparison_data.process_dataset(dataset)
+        comparison_data = ComparisonData(dataset.get_repertoire_ids(), self.matching_columns, self.sequence_batch_size, self.path,
+                                         self.value_attribute)
+        comparison_data.process_dataset(dataset, self.pool_size)
 
         return comparison_data
 
     def prepare_caching_params(self, dataset: RepertoireDataset):
         return (
             ("dataset_identifier", dataset.identifier),
-            ("item_attributes", self.item_columns)
+            ("item_attributes", self.item_columns),
+            ("value_attribute", self.value_attribute)
         )
 
     def compare(self, dataset: RepertoireDataset, comparison_fn, comparison_fn_name):
@@ -41,6 +46,15 @@ class PairwiseRepertoireComparison:
                                             ("comparison_fn", comparison_fn_name)),
                                            lambda: self.compare_repertoires(dataset, comparison_fn))
 
+    def compare_matrices(self, dataset: RepertoireDataset, comparison_fn, comparison_fn_name, row_ids: list = None,
+                         column_ids: list = None, block_size: int = 100):
+        return CacheHandler.memo_by_params(self.prepare_caching_params(dataset) +
+                                           ("pairwise_comparison_matrix",
+                                            ("comparison_fn", comparison_fn_name),
+                                            ("row_ids", tuple(row_ids) if row_ids is not None else None),
+                                            ("column_ids", tuple(column_ids) if column_ids is not None else None)),
+                                           lambda: self.compare_repertoire_blocks(dataset, comparison_fn, row_ids, column_ids, block_size))
+
     def memo_by_params(self, dataset: RepertoireDataset):
         comparison_data = CacheHandler.memo_by_params(self.prepare_caching_params(dataset), lambda: self.create_comparison_data(dataset))
         return comparison_data
@@ -63,6 +77,30 @@ class PairwiseRepertoireComparison:
 
         return comparison_df
 
+    @log
+    def compare_repertoire_blocks(self, dataset: RepertoireDataset, comparison_fn, row_ids: list = None, column_ids: list = None,
+                                  block_size: int = 100):
+        """
+        Compares the repertoires with row_ids to the repertoires with column_ids (all repertoires in the dataset by default) with a
+        comparison function which takes two sparse items x repertoires matrices and returns the comparison of each pair of their columns
+        (e.g. DistanceMetrics.jaccard_matrix). The rows are compared in blocks of block_size repertoires, so only the requested part of the
+        comparison matrix is computed and the intermediate results stay small.
+
+        :return: data frame of shape (row_ids, column_ids) with repertoire identifiers as index and columns
+        """
+        self.comparison_data = self.memo_by_params(dataset)
+        row_ids = dataset.get_repertoire_ids() if row_ids is None else list(row_ids)
+        column_ids = dataset.get_repertoire_ids() if column_ids is None else list(column_ids)
+
+        column_matrix = self.comparison_data.get_repertoire_matrix(column_ids)
+        comparison_result = np.zeros([len(row_ids), len(column_ids)])
+
+        for start in range(0, len(row_ids), block_size):
+            row_matrix = self.comparison_data.get_repertoire_matrix(row_ids[start: start + block_size])
+            comparison_result[start: start + row_matrix.shape[1]] = comparison_fn(row_matrix, column_matrix)
+
+        return pd.DataFrame(comparison_result, columns=column_ids, index=row_ids)
+
     def prepare_paralellization_arguments(self, repertoire_count: int, repertoire_identifiers: list, comparison_result):
 
         arguments = []
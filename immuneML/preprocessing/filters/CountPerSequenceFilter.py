@@ -1,5 +1,5 @@
 import copy
-from multiprocessing.pool import Pool
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -8,6 +8,7 @@ from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.preprocessing.Preprocessor import Preprocessor
 from immuneML.preprocessing.filters.Filter import Filter
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class CountPerSequenceFilter(Filter):
@@ -56,9 +57,7 @@ class CountPerSequenceFilter(Filter):
 
         processed_dataset = copy.deepcopy(dataset)
 
-        with Pool(params["batch_size"]) as pool:
-            repertoires = pool.starmap(CountPerSequenceFilter.process_repertoire,
-                                       [(repertoire, params) for repertoire in dataset.repertoires])
+        repertoires = WorkerPool.map(partial(CountPerSequenceFilter.process_repertoire, params=params), dataset.repertoires, params["batch_size"])
 
         if params["remove_empty_repertoires"]:
             repertoires = Filter.remove_empty_repertoires(repertoires)
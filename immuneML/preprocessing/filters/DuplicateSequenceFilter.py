@@ -1,5 +1,5 @@
 import copy
-from multiprocessing.pool import Pool
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
@@ -11,6 +11,7 @@ from immuneML.environment.SequenceType import SequenceType
 from immuneML.preprocessing.filters.CountAggregationFunction import CountAggregationFunction
 from immuneML.preprocessing.filters.Filter import Filter
 from immuneML.util.ParameterValidator import ParameterValidator
+from immuneML.util.WorkerPool import WorkerPool
 from immuneML.preprocessing.Preprocessor import Preprocessor
 from scripts.specification_util import update_docs_per_mapping
 
@@ -89,9 +90,7 @@ class DuplicateSequenceFilter(Filter):
 
         processed_dataset = copy.deepcopy(dataset)
 
-        with Pool(params["batch_size"]) as pool:
-            repertoires = pool.starmap(DuplicateSequenceFilter.process_repertoire,
-                                       [(repertoire, params) for repertoire in dataset.repertoires])
+        repertoires = WorkerPool.map(partial(DuplicateSequenceFilter.process_repertoire, params=params), dataset.repertoires, params["batch_size"])
 
         processed_dataset.repertoires = repertoires
 
@@ -81,6 +81,7 @@ class HPHTMLBuilder:
             hp_splits = []
             for hp_item in hp_items:
                 hp_splits.append(HPHTMLBuilder._print_metric(hp_item.performance, state.optimization_metric))
+            hp_splits += [Constants.NOT_COMPUTED] * (state.selection.split_count - len(hp_splits))  # settings discarded by the strategy
             hp_settings.append({
                 "hp_setting": hp_setting,
                 "hp_splits": hp_splits,
@@ -351,8 +352,9 @@ class HPHTMLBuilder:
         performance = {"setting": [], **{f"split {i + 1}": [] for i in range(split_count)}}
         for hp_setting, hp_item_list in selection_state.hp_items.items():
             performance['setting'].append(str(hp_setting))
-            for index, hp_item in enumerate(hp_item_list):
-                performance[f'split {index + 1}'].append(HPHTMLBuilder._print_metric(hp_item.performance, metric))
+            for index in range(split_count):
+                performance[f'split {index + 1}'].append(HPHTMLBuilder._print_metric(hp_item_list[index].performance, metric)
+                                                         if index < len(hp_item_list) else Constants.NOT_COMPUTED)
 
         s = io.StringIO()
         pd.DataFrame(performance).rename(columns={"setting": 'Hyperparameter settings (preprocessing, encoding, ML method)'}).to_csv(s, sep="\t",
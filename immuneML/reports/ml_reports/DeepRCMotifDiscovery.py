@@ -71,11 +71,8 @@ class DeepRCMotifDiscovery(MLReport):
     def _generate(self) -> ReportResult:
         PathBuilder.build(self.result_path)
 
-        test_metadata_filepath = self.test_dataset.encoded_data.info['metadata_filepath']
-        hdf5_filepath = self.method._metadata_to_hdf5(test_metadata_filepath, self.label)
-
-        n_examples_test = len(self.test_dataset.encoded_data.example_ids)
-        indices = np.array(range(n_examples_test))
+        hdf5_filepath = self.test_dataset.encoded_data.info['hdf5_filepath']
+        indices = np.array(self.test_dataset.encoded_data.info['indices'], dtype=int)
 
         dataloader = self.method.make_data_loader(hdf5_filepath, pre_loaded_hdf5_file=None,
                                                   indices=indices, label=self.label, eval_only=True,
@@ -129,8 +129,8 @@ class CVFeaturePerformance(TrainMLModelReport):
 
     def _make_plot_dataframes(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
 
-        performance_training = np.zeros((self.feature_count, self.state.assessment.split_count,
-                                         self.state.selection.split_count))
+        performance_training = np.full((self.feature_count, self.state.assessment.split_count,
+                                        self.state.selection.split_count), np.nan)
         features_test = np.zeros((self.state.assessment.split_count, self.feature_count))
         performance_test = np.zeros((self.state.assessment.split_count, self.feature_count))
 
@@ -142,13 +142,13 @@ class CVFeaturePerformance(TrainMLModelReport):
             performance_test[assessment_split_index] = [item.performance[self.state.optimization_metric.name.lower()] for item in assessment_items]
 
             for hp_index, hp_setting in enumerate(self.relevant_hp_settings):
-                performance_training[hp_index, assessment_split_index] = \
-                    [item.performance[self.state.optimization_metric.name.lower()]
-                     for item in assessment_state.label_states[self.label].selection_state.hp_items[hp_setting.get_key()]]
+                selection_items = assessment_state.label_states[self.label].selection_state.hp_items[hp_setting.get_key()]
+                performance_training[hp_index, assessment_split_index, :len(selection_items)] = \
+                    [item.performance[self.state.optimization_metric.name.lower()] for item in selection_items]
 
         feature_values = self.feature_values.astype(str)
 
         test_dataframe = pd.DataFrame({"x": feature_values, "y": performance_test.mean(axis=0)})
-        training_dataframe = pd.DataFrame({"x": feature_values, "y": performance_training.mean(axis=(1, 2))})
+        training_dataframe = pd.DataFrame({"x": feature_values, "y": np.nanmean(performance_training, axis=(1, 2))})
 
         return training_dataframe, test_dataframe
@@ -1,4 +1,3 @@
-import pickle
 import random
 from pathlib import Path
 
@@ -159,13 +158,10 @@ class RandomDatasetGenerator:
                                                for label, label_dict in labels.items()}, **{"subject": f"subj_{i + 1}"}})
                      for i in range(receptor_count)]
 
-        filename = path / "batch01.pickle"
+        dataset = ReceptorDataset.build(receptors, receptor_count, path)
+        dataset.labels = {label: list(label_dict.keys()) for label, label_dict in labels.items()}
 
-        with filename.open("wb") as file:
-            pickle.dump(receptors, file)
-
-        return ReceptorDataset(labels={label: list(label_dict.keys()) for label, label_dict in labels.items()},
-                               filenames=[filename], file_size=receptor_count)
+        return dataset
 
     @staticmethod
     def _check_sequence_dataset_generation_params(receptor_count: int, length_probabilities: dict, labels: dict, path: Path):
@@ -217,10 +213,7 @@ class RandomDatasetGenerator:
                                                                          for label, label_dict in labels.items()}, **{"subject": f"subj_{i + 1}"}}))
             for i in range(sequence_count)]
 
-        filename = path / "batch01.pickle"
+        dataset = SequenceDataset.build(sequences, sequence_count, path)
+        dataset.labels = {label: list(label_dict.keys()) for label, label_dict in labels.items()}
 
-        with filename.open("wb") as file:
-            pickle.dump(sequences, file)
-
-        return SequenceDataset(labels={label: list(label_dict.keys()) for label, label_dict in labels.items()},
-                               filenames=[filename], file_size=sequence_count)
+        return dataset
@@ -3,7 +3,12 @@ import logging
 import random
 from pathlib import Path
 
+import numpy as np
+
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.SequenceType import SequenceType
 from immuneML.simulation.sequence_implanting.SequenceImplantingStrategy import SequenceImplantingStrategy
 from immuneML.simulation.signal_implanting_strategy.ImplantingComputation import ImplantingComputation, get_implanting_function
 from immuneML.simulation.signal_implanting_strategy.SignalImplantingStrategy import SignalImplantingStrategy
@@ -67,17 +72,17 @@ class HealthySequenceImplanting(SignalImplantingStrategy):
 
     def implant_in_repertoire(self, repertoire: Repertoire, repertoire_implanting_rate: float, signal, path: Path) -> Repertoire:
         max_motif_length = self._calculate_max_motif_length(signal)
-        sequences_to_be_processed, other_sequences = self._choose_sequences_for_implanting(repertoire,
-                                                                                           repertoire_implanting_rate,
-                                                                                           max_motif_length)
-        processed_sequences = self._implant_in_sequences(sequences_to_be_processed, signal)
-        sequences = other_sequences + processed_sequences
+        columns = repertoire.get_attributes(repertoire.fields)
+        indices_to_implant = self._choose_sequences_for_implanting(repertoire, columns, repertoire_implanting_rate, max_motif_length)
+        new_columns = self._implant_in_sequences(columns, indices_to_implant, signal)
         metadata = self._build_new_metadata(repertoire.metadata, signal)
-        new_repertoire = self._build_new_repertoire(sequences, metadata, signal, path)
+        new_repertoire = Repertoire.build_from_columns(new_columns, path, metadata)
 
         return new_repertoire
 
     def _build_new_metadata(self, metadata: dict, signal) -> dict:
+        # when adding implant to a repertoire, only signal id is stored in the repertoire metadata:
+        # more detailed information (specific motif and motif instance) is stored per sequence in the column named after the signal
         new_metadata = copy.deepcopy(metadata) if metadata is not None else {}
         new_metadata[signal.id] = True
         return new_metadata
@@ -86,58 +91,64 @@ class HealthySequenceImplanting(SignalImplantingStrategy):
         max_motif_length = max([motif.get_max_length() for motif in signal.motifs])
         return max_motif_length
 
-    def _build_new_repertoire(self, sequences, repertoire_metadata, signal, path: Path) -> Repertoire:
-        if repertoire_metadata is not None:
-            metadata = copy.deepcopy(repertoire_metadata)
-        else:
-            metadata = {}
-
-        # when adding implant to a repertoire, only signal id is stored:
-        # more detailed information is available in each receptor_sequence
-        # (specific motif and motif instance)
-        metadata[signal.id] = True
-        repertoire = Repertoire.build_from_sequence_objects(sequences, path, metadata)
-
-        return repertoire
-
-    def _implant_in_sequences(self, sequences_to_be_processed: list, signal):
+    def _implant_in_sequences(self, columns: dict, indices_to_implant: np.ndarray, signal) -> dict:
+        """
+        Implants the signal only in the sequences at the given indices: only these sequences are converted to sequence objects, the rest of
+        the repertoire is copied as it is
+        """
         assert self.sequence_implanting_strategy is not None, \
             "HealthySequenceImplanting: add receptor_sequence implanting strategy when creating a HealthySequenceImplanting object."
 
-        sequences = []
-        for sequence in sequences_to_be_processed:
-            processed_sequence = self.implant_in_sequence(sequence, signal)
-            sequences.append(processed_sequence)
+        sequence_type = EnvironmentSettings.get_sequence_type()
+        other_sequence_type = SequenceType.NUCLEOTIDE if sequence_type == SequenceType.AMINO_ACID else SequenceType.AMINO_ACID
+        sequence_count = len(columns[sequence_type.value])
 
-        return sequences
+        new_columns = dict(columns)
+        new_columns[sequence_type.value] = np.array(columns[sequence_type.value], dtype=object)
+        new_columns[signal.id] = np.array(columns[signal.id], dtype=object) if signal.id in columns else np.full(sequence_count, None, dtype=object)
+        if columns.get(other_sequence_type.value) is not None:
+            # the other sequence type no longer matches the implanted sequence
+            new_columns[other_sequence_type.value] = np.array(columns[other_sequence_type.value], dtype=object)
 
-    def _choose_sequences_for_implanting(self, repertoire: Repertoire, repertoire_implanting_rate: float, max_motif_length: int):
-        number_of_sequences_to_implant = self.compute_implanting(repertoire_implanting_rate * len(repertoire.sequences))
+        for index in indices_to_implant:
+            sequence = ReceptorSequence(metadata=None)
+            sequence.set_sequence(new_columns[sequence_type.value][index], sequence_type)
+            processed_sequence = self.implant_in_sequence(sequence, signal)
+
+            new_columns[sequence_type.value][index] = processed_sequence.get_sequence()
+            new_columns[signal.id][index] = str(processed_sequence.annotation.implants[-1])
+            if other_sequence_type.value in new_columns:
+                new_columns[other_sequence_type.value][index] = None
+
+        return new_columns
+
+    def _get_implanted_sequence_mask(self, repertoire: Repertoire, columns: dict, sequence_count: int) -> np.ndarray:
+        # implants are stored in a column per signal and each implanted signal is also listed in the repertoire metadata
+        signal_columns = [field for field in columns if field not in Repertoire.FIELDS and field in repertoire.metadata]
+        mask = np.zeros(sequence_count, dtype=bool)
+        for field in signal_columns:
+            mask |= np.not_equal(np.asarray(columns[field], dtype=object), None)
+        return mask
+
+    def _choose_sequences_for_implanting(self, repertoire: Repertoire, columns: dict, repertoire_implanting_rate: float,
+                                         max_motif_length: int) -> np.ndarray:
+        sequences = columns[EnvironmentSettings.get_sequence_type().value]
+        number_of_sequences_to_implant = self.compute_implanting(repertoire_implanting_rate * len(sequences))
         if number_of_sequences_to_implant == 0:
-            logging.warning(f"HealthySequenceImplanting: there are {len(repertoire.sequences)} sequences in repertoire {repertoire.identifier} "
+            logging.warning(f"HealthySequenceImplanting: there are {len(sequences)} sequences in repertoire {repertoire.identifier} "
                             f"for the given repertoire implanting rate of {repertoire_implanting_rate}; no motif will be implanted. To implant "
                             f"motifs, increase 'repertoire_implanting_rate' in the specification.")
-        unusable_sequences = []
-        unprocessed_sequences = []
-
-        for sequence in repertoire.sequences:
-            if sequence.annotation is not None and sequence.annotation.implants is not None and len(sequence.annotation.implants) > 0:
-                unusable_sequences.append(sequence)
-            elif len(sequence.get_sequence()) < max_motif_length:
-                unusable_sequences.append(sequence)
-            else:
-                unprocessed_sequences.append(sequence)
-
-        assert number_of_sequences_to_implant <= len(unprocessed_sequences), \
+
+        long_enough = np.fromiter((sequence is not None and len(sequence) >= max_motif_length for sequence in sequences), dtype=bool,
+                                  count=len(sequences))
+        unprocessed_indices = np.flatnonzero(long_enough & ~self._get_implanted_sequence_mask(repertoire, columns, len(sequences)))
+
+        assert number_of_sequences_to_implant <= len(unprocessed_indices), \
             "HealthySequenceImplanting: there are not enough sequences in the repertoire to provide given repertoire infection rate. " \
-            f"Reduce repertoire infection rate to proceed. Total unprocessed sequences: {len(unprocessed_sequences)}, " \
+            f"Reduce repertoire infection rate to proceed. Total unprocessed sequences: {len(unprocessed_indices)}, " \
             f"number of sequences to implant: {number_of_sequences_to_implant}."
 
-        random.shuffle(unprocessed_sequences)
-        sequences_to_be_infected = unprocessed_sequences[:number_of_sequences_to_implant]
-        other_sequences = unusable_sequences + unprocessed_sequences[number_of_sequences_to_implant:]
-
-        return sequences_to_be_infected, other_sequences
+        return np.sort(random.sample(unprocessed_indices.tolist(), int(number_of_sequences_to_implant)))
 
     def implant_in_receptor(self, receptor, signal, is_noise: bool):
         raise RuntimeError("HealthySequenceImplanting was called on a receptor object. Check the simulation parameters.")
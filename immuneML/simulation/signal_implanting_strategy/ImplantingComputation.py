@@ -9,11 +9,20 @@ class ImplantingComputation(Enum):
     POISSON = 'Poisson'
 
 
+def round_implanting_count(product):
+    return round(product)
+
+
+def sample_implanting_count(l):
+    return np.random.poisson(l)
+
+
 def get_implanting_function(implanting_computation: ImplantingComputation):
+    # module-level functions instead of lambdas so that the implanting strategies can be sent to worker processes
     if implanting_computation == ImplantingComputation.ROUND:
-        return lambda product: round(product)
+        return round_implanting_count
     elif implanting_computation == ImplantingComputation.POISSON:
-        return lambda l: np.random.poisson(l)
+        return sample_implanting_count
     else:
         raise RuntimeError(f"{ImplantingComputation.__name__}: invalid implanting computation specified: {implanting_computation}. "
                            f"Valid values are: {[el.name.lower() for el in ImplantingComputation]}")
\ No newline at end of file
@@ -57,11 +57,13 @@ class AdaptiveImportHelper:
     @staticmethod
     def parse_germline(dataframe: pd.DataFrame, gene_name_replacement: dict, germline_value_replacement: dict):
 
+        # columns without any values are skipped: regex replacement fails on them and they can occur when the file is imported in chunks
         for column in ["v_genes", "j_genes"]:
-            dataframe.loc[:, column] = dataframe[column].replace(gene_name_replacement, regex=True)
+            if dataframe[column].notnull().any():
+                dataframe.loc[:, column] = dataframe[column].replace(gene_name_replacement, regex=True)
 
         for column in ["v_subgroups", "v_genes", "j_subgroups", "j_genes"]:
-            if column in dataframe.columns:
+            if column in dataframe.columns and dataframe[column].notnull().any():
                 dataframe.loc[:, column] = dataframe[column].replace(germline_value_replacement, regex=True)
 
         for col_gene, col_allele in [["v_genes", "v_alleles"], ["j_genes", "j_alleles"]]:
@@ -1,5 +1,52 @@
 import numpy as np
+from scipy import sparse
 
 
 def jaccard(vector1, vector2, tmp_vector=None):
     return np.sum(np.logical_and(vector1, vector2, out=tmp_vector)) / np.sum(np.logical_or(vector1, vector2, out=tmp_vector))
+
+
+def morisita_horn(vector1, vector2):
+    sum1, sum2 = np.sum(vector1), np.sum(vector2)
+    dominance1, dominance2 = np.sum(np.square(vector1)) / sum1 ** 2, np.sum(np.square(vector2)) / sum2 ** 2
+    return 2 * np.sum(np.multiply(vector1, vector2)) / ((dominance1 + dominance2) * sum1 * sum2)
+
+
+def jaccard_matrix(matrix1, matrix2):
+    """
+    Computes the Jaccard index between each column of matrix1 and each column of matrix2, where the matrices are (sparse) items x
+    repertoires matrices and all nonzero values are treated as presence of the item: the intersections are computed as a product of the
+    binary matrices and the unions from the number of items in each repertoire.
+
+    :return: dense array of shape (columns of matrix1, columns of matrix2)
+    """
+    presence1, presence2 = _to_presence(matrix1), _to_presence(matrix2)
+    intersection = (presence1.T @ presence2).toarray()
+    union = np.asarray(presence1.sum(axis=0)).reshape(-1, 1) + np.asarray(presence2.sum(axis=0)).reshape(1, -1) - intersection
+    return _divide(intersection, union)
+
+
+def morisita_horn_matrix(matrix1, matrix2):
+    """
+    Computes the Morisita-Horn overlap index between each column of matrix1 and each column of matrix2, where the matrices are (sparse)
+    items x repertoires matrices of item counts.
+
+    :return: dense array of shape (columns of matrix1, columns of matrix2)
+    """
+    matrix1, matrix2 = sparse.csc_matrix(matrix1, dtype=float), sparse.csc_matrix(matrix2, dtype=float)
+    product = (matrix1.T @ matrix2).toarray()
+    sums1, sums2 = np.asarray(matrix1.sum(axis=0)).ravel(), np.asarray(matrix2.sum(axis=0)).ravel()
+    dominance1 = _divide(np.asarray(matrix1.multiply(matrix1).sum(axis=0)).ravel(), sums1 ** 2)
+    dominance2 = _divide(np.asarray(matrix2.multiply(matrix2).sum(axis=0)).ravel(), sums2 ** 2)
+    return _divide(2 * product, (dominance1.reshape(-1, 1) + dominance2.reshape(1, -1)) * np.outer(sums1, sums2))
+
+
+def _to_presence(matrix):
+    presence = sparse.csc_matrix(matrix, dtype=float, copy=True)
+    presence.eliminate_zeros()
+    presence.data[:] = 1
+    return presence
+
+
+def _divide(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.full(np.broadcast(numerator, denominator).shape, np.nan), where=denominator != 0)
@@ -41,7 +41,7 @@ class EncoderHelper:
         comp_data = ComparisonData(dataset.get_repertoire_ids(), comparison_attributes,
                                    sequence_batch_size, params.result_path)
 
-        comp_data.process_dataset(dataset)
+        comp_data.process_dataset(dataset, params.pool_size)
 
         return comp_data
 
@@ -1,6 +1,6 @@
 import pickle
 import warnings
-from multiprocessing.pool import Pool
+from functools import partial
 from pathlib import Path
 from typing import List
 
@@ -10,13 +10,12 @@ import pandas as pd
 from immuneML.IO.dataset_export.PickleExporter import PickleExporter
 from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
 from immuneML.IO.dataset_import.PickleImport import PickleImport
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.dataset import Dataset
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
-from immuneML.data_model.receptor.BCKReceptor import BCKReceptor
-from immuneML.data_model.receptor.BCReceptor import BCReceptor
-from immuneML.data_model.receptor.ChainPair import ChainPair
+from immuneML.data_model.receptor.ElementColumns import ElementColumns
 from immuneML.data_model.receptor.Receptor import Receptor
 from immuneML.data_model.receptor.RegionType import RegionType
 from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
@@ -31,6 +30,7 @@ from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.environment.SequenceType import SequenceType
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.WorkerPool import WorkerPool
 
 
 class ImportHelper:
@@ -85,9 +85,8 @@ class ImportHelper:
 
         PathBuilder.build(params.result_path / "repertoires/")
 
-        arguments = [(import_class, row, params) for index, row in metadata.iterrows()]
-        with Pool(params.number_of_processes) as pool:
-            repertoires = pool.starmap(ImportHelper.load_repertoire_as_object, arguments)
+        repertoires = WorkerPool.map(partial(ImportHelper.load_repertoire_as_object, import_class, params=params),
+                                     [row for index, row in metadata.iterrows()], params.number_of_processes)
 
         new_metadata_file = ImportHelper.make_new_metadata_file(repertoires, metadata, params.result_path, dataset_name)
 
@@ -124,27 +123,40 @@ class ImportHelper:
 
     @staticmethod
     def load_repertoire_as_object(import_class, metadata_row, params: DatasetImportParams):
-        alternative_load_func = getattr(import_class, "alternative_load_func", None)
         try:
-            alternative_load_func = getattr(import_class, "alternative_load_func", None)
-
             filename = params.path / f"{metadata_row['filename']}"
 
-            dataframe = ImportHelper.load_sequence_dataframe(filename, params, alternative_load_func)
-            dataframe = import_class.preprocess_dataframe(dataframe, params)
-            sequence_lists = {field: dataframe[field].values.tolist() for field in Repertoire.FIELDS if field in dataframe.columns}
-            sequence_lists["custom_lists"] = {field: dataframe[field].values.tolist()
-                                              for field in list(set(dataframe.columns) - set(Repertoire.FIELDS))}
-
-            repertoire_inputs = {**{"metadata": metadata_row.to_dict(),
-                                    "path": params.result_path / "repertoires/",
-                                    "filename_base": filename.stem}, **sequence_lists}
-            repertoire = Repertoire.build(**repertoire_inputs)
+            if getattr(params, "import_chunk_size", None) is not None:
+                repertoire = ImportHelper.load_repertoire_in_chunks(import_class, filename, metadata_row, params)
+            else:
+                alternative_load_func = getattr(import_class, "alternative_load_func", None)
+                dataframe = ImportHelper.load_sequence_dataframe(filename, params, alternative_load_func)
+                dataframe = import_class.preprocess_dataframe(dataframe, params)
+                sequence_lists = {field: dataframe[field].values for field in Repertoire.FIELDS if field in dataframe.columns}
+                sequence_lists["custom_lists"] = {field: dataframe[field].values
+                                                  for field in list(set(dataframe.columns) - set(Repertoire.FIELDS))}
+
+                repertoire_inputs = {**{"metadata": metadata_row.to_dict(),
+                                        "path": params.result_path / "repertoires/",
+                                        "filename_base": filename.stem}, **sequence_lists}
+                repertoire = Repertoire.build(**repertoire_inputs)
 
             return repertoire
         except Exception as exception:
             raise RuntimeError(f"{ImportHelper.__name__}: error when importing file {metadata_row['filename']}.") from exception
 
+    @staticmethod
+    def load_repertoire_in_chunks(import_class, filename: Path, metadata_row, params: DatasetImportParams) -> Repertoire:
+        """
+        Reads the repertoire file in chunks of params.import_chunk_size rows, preprocesses each chunk with the import class and appends it
+        to the repertoire on disk, so that the memory needed does not depend on the size of the file
+        """
+        chunks = ({field: dataframe[field].values for field in dataframe.columns}
+                  for dataframe in (import_class.preprocess_dataframe(dataframe, params)
+                                    for dataframe in ImportHelper.load_sequence_dataframe_chunks(filename, params, import_class)))
+
+        return Repertoire.build_from_column_chunks(chunks, params.result_path / "repertoires/", metadata_row.to_dict(), filename.stem)
+
     @staticmethod
     def load_sequence_dataframe(filepath, params, alternative_load_func=None):
         try:
@@ -153,11 +165,41 @@ class ImportHelper:
             else:
                 df = pd.read_csv(filepath, sep=params.separator, iterator=False, usecols=params.columns_to_load, dtype=str)
         except Exception as ex:
-            raise Exception(f"{ex}\n\nImportHelper: an error occurred during dataset import while parsing the input file: {filepath}.\n"
-                            f"Please make sure this is a correct immune receptor data file (not metadata).\n"
-                            f"The parameters used for import are {params}.\nFor technical description of the error, see the log above."
-                            f" For details on how to specify the dataset import, see the documentation.")
+            raise ImportHelper._make_parsing_exception(ex, filepath, params)
+
+        return ImportHelper.standardize_dataframe(df, params)
+
+    @staticmethod
+    def load_sequence_dataframe_chunks(filepath, params, import_class):
+        """
+        Yields the data from the file as data frames of at most params.import_chunk_size rows; import classes with a custom way of loading
+        the data can provide alternative_chunk_load_func(filepath, params) to read the file in chunks, otherwise if they only provide
+        alternative_load_func, the whole file is loaded as one chunk
+        """
+        alternative_chunk_load_func = getattr(import_class, "alternative_chunk_load_func", None)
+        alternative_load_func = getattr(import_class, "alternative_load_func", None)
+        try:
+            if alternative_chunk_load_func:
+                chunks = alternative_chunk_load_func(filepath, params)
+            elif alternative_load_func:
+                chunks = [alternative_load_func(filepath, params)]
+            else:
+                chunks = pd.read_csv(filepath, sep=params.separator, usecols=params.columns_to_load, dtype=str, chunksize=params.import_chunk_size)
+
+            for df in chunks:
+                yield ImportHelper.standardize_dataframe(df, params)
+        except Exception as ex:
+            raise ImportHelper._make_parsing_exception(ex, filepath, params)
 
+    @staticmethod
+    def _make_parsing_exception(ex: Exception, filepath, params) -> Exception:
+        return Exception(f"{ex}\n\nImportHelper: an error occurred during dataset import while parsing the input file: {filepath}.\n"
+                         f"Please make sure this is a correct immune receptor data file (not metadata).\n"
+                         f"The parameters used for import are {params}.\nFor technical description of the error, see the log above."
+                         f" For details on how to specify the dataset import, see the documentation.")
+
+    @staticmethod
+    def standardize_dataframe(df: pd.DataFrame, params) -> pd.DataFrame:
         if hasattr(params, "column_mapping") and params.column_mapping is not None:
             df.rename(columns=params.column_mapping, inplace=True)
 
@@ -266,7 +308,7 @@ class ImportHelper:
                 df.loc[:, "sequence_aas"] = df["sequence_aas"].str[1:-1]
             if "sequences" in df:
                 df.loc[:, "sequences"] = df["sequences"].str[3:-3]
-            df.loc[:, "region_types"] = region_type.name
+            df["region_types"] = region_type.name
 
     @staticmethod
     def strip_alleles(df: pd.DataFrame, column_name):
@@ -297,25 +339,40 @@ class ImportHelper:
 
     @staticmethod
     def import_sequence_dataset(import_class, params, dataset_name: str):
+        """
+        Imports the files as a SequenceDataset or ReceptorDataset: the preprocessed data frames are converted directly to columns (see
+        ElementColumns) without creating sequence or receptor objects and the rows are streamed into batch files of
+        params.sequence_file_size elements; the rows which do not fill a whole batch are carried over to the next file, so each row is
+        copied a constant number of times and at most one file (or one chunk of params.import_chunk_size rows) is in memory at a time
+        """
         PathBuilder.build(params.result_path)
 
+        if params.paired and getattr(import_class, "import_receptor_columns", None) is None:
+            raise NotImplementedError(f"{import_class.__name__}: import of paired receptor data has not been implemented.")
+
         filenames = ImportHelper.get_sequence_filenames(params.path, dataset_name)
 
-        file_index = 0
         dataset_filenames = []
-        dataset_params = {}
-        items = None
+        dataset_params = ImportHelper.extract_sequence_dataset_params(params=params)
+        remaining_columns = None
+
+        for filename in filenames:
+            for columns in ImportHelper.import_element_columns(import_class, filename, params):
+                ImportHelper.update_sequence_dataset_params(dataset_params, columns)
+                columns = ImportHelper.concatenate_element_columns([remaining_columns, columns]) if remaining_columns is not None else columns
+                element_count = ImportHelper.get_element_column_count(columns)
+                full_batch_end = element_count - element_count % params.sequence_file_size
 
-        for index, filename in enumerate(filenames):
-            new_items = ImportHelper.import_items(import_class, filename, params)
-            items = np.append(items, new_items) if items is not None else new_items
-            dataset_params = ImportHelper.extract_sequence_dataset_params(items, params)
+                for start in range(0, full_batch_end, params.sequence_file_size):
+                    dataset_filenames.append(ImportHelper.store_element_columns(columns, start, start + params.sequence_file_size,
+                                                                               len(dataset_filenames), params.result_path))
 
-            while len(items) > params.sequence_file_size or (index == len(filenames) - 1 and len(items) > 0):
-                dataset_filenames.append(params.result_path / "batch_{}.pickle".format(file_index))
-                ImportHelper.store_sequence_items(dataset_filenames, items, params.sequence_file_size)
-                items = items[params.sequence_file_size:]
-                file_index += 1
+                remaining_columns = {name: values[full_batch_end:] for name, values in columns.items()} \
+                    if full_batch_end < element_count else None
+
+        if remaining_columns is not None:
+            dataset_filenames.append(ImportHelper.store_element_columns(remaining_columns, 0, ImportHelper.get_element_column_count(remaining_columns),
+                                                                       len(dataset_filenames), params.result_path))
 
         init_kwargs = {"filenames": dataset_filenames, "file_size": params.sequence_file_size, "name": dataset_name, "labels": dataset_params}
 
@@ -325,6 +382,107 @@ class ImportHelper:
 
         return dataset
 
+    @staticmethod
+    def import_element_columns(import_class, path, params):
+        """
+        Yields the content of the file as columns of receptors (if params.paired) or receptor sequences in the format of ElementColumns;
+        unpaired data is read in chunks if params.import_chunk_size is set, while paired data is always read at once since the chains of
+        one receptor can be anywhere in the file
+        """
+        if not params.paired and getattr(params, "import_chunk_size", None) is not None:
+            dataframes = ImportHelper.load_sequence_dataframe_chunks(path, params, import_class)
+        else:
+            dataframes = [ImportHelper.load_sequence_dataframe(path, params, getattr(import_class, "alternative_load_func", None))]
+
+        for df in dataframes:
+            df = import_class.preprocess_dataframe(df, params)
+            yield import_class.import_receptor_columns(df, params) if params.paired else ImportHelper.make_sequence_columns(df, params)
+
+    @staticmethod
+    def make_sequence_columns(df: pd.DataFrame, params) -> dict:
+        metadata_columns = list(params.metadata_column_mapping.values()) if params.metadata_column_mapping else []
+        fields = [field for field in Repertoire.FIELDS if field in df.columns] + \
+                 [column for column in metadata_columns if column in df.columns and column not in Repertoire.FIELDS]
+        return {field: ImportHelper.get_column_values(df, field) for field in fields}
+
+    @staticmethod
+    def make_receptor_columns(df: pd.DataFrame, params) -> dict:
+        """
+        Pairs the rows of the two chains from params.receptor_chains by receptor_identifiers and returns the receptors as columns in the
+        format of ElementColumns; as in import_receptors, only the first row per chain is used for each receptor and receptors with a
+        missing chain are omitted
+        """
+        if params.receptor_chains not in ElementColumns.CHAIN_PAIR_CLASSES:
+            raise NotImplementedError(f"ImportHelper: {params.receptor_chains} chain pair is not supported.")
+
+        receptor_class = ElementColumns.CHAIN_PAIR_CLASSES[params.receptor_chains]
+        identifiers = pd.unique(df["receptor_identifiers"])
+        chain_dfs = []
+
+        for chain in params.receptor_chains.value:
+            chain_df = df.loc[df["chains"] == chain]
+            duplicated = chain_df["receptor_identifiers"].duplicated()
+            if duplicated.any():
+                warnings.warn(f"{ImportHelper.__name__}: multiple {chain} chains found for {chain_df.loc[duplicated, 'receptor_identifiers'].nunique()} "
+                              f"receptors, only the first entry will be loaded for each of them.")
+            chain_dfs.append(chain_df.loc[~duplicated].set_index("receptor_identifiers", drop=False))
+
+        is_complete = np.logical_and.reduce([np.isin(identifiers, chain_df.index) for chain_df in chain_dfs])
+        if not is_complete.all():
+            warnings.warn(f"{ImportHelper.__name__}: {np.sum(~is_complete)} receptors with a missing {' or '.join(params.receptor_chains.value)} "
+                          f"chain will be omitted.")
+        identifiers = identifiers[is_complete]
+        chain_dfs = [chain_df.loc[identifiers] for chain_df in chain_dfs]
+
+        columns = {ElementColumns.RECEPTOR_IDENTIFIER_COLUMN: identifiers,
+                   ElementColumns.RECEPTOR_CLASS_COLUMN: np.full(identifiers.shape[0], receptor_class.__name__, dtype=object)}
+
+        metadata_df = chain_dfs[1] if receptor_class in [TCABReceptor, TCGDReceptor] else chain_dfs[0]
+        metadata_columns = list(params.metadata_column_mapping.values()) if params.metadata_column_mapping else []
+        columns.update({column: ImportHelper.get_column_values(metadata_df, column) for column in metadata_columns if column in metadata_df.columns})
+
+        for chain_name, chain_df in zip(ElementColumns.RECEPTOR_CLASSES[receptor_class], chain_dfs):
+            columns.update({f"{chain_name}{ElementColumns.CHAIN_SEPARATOR}{field}": values
+                            for field, values in ImportHelper.make_sequence_columns(chain_df, params).items()})
+
+        return columns
+
+    @staticmethod
+    def get_column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+        values = df[column].to_numpy(dtype=object)
+        values[pd.isnull(values)] = None
+        return values
+
+    @staticmethod
+    def get_element_column_count(columns: dict) -> int:
+        return len(next(iter(columns.values()))) if len(columns) > 0 else 0
+
+    @staticmethod
+    def concatenate_element_columns(parts: list) -> dict:
+        names = list(dict.fromkeys(name for part in parts for name in part))
+        counts = [ImportHelper.get_element_column_count(part) for part in parts]
+        return {name: np.concatenate([np.asarray(part[name], dtype=object) if name in part else np.full(count, None, dtype=object)
+                                      for part, count in zip(parts, counts)])
+                for name in names}
+
+    @staticmethod
+    def store_element_columns(columns: dict, start: int, end: int, file_index: int, path: Path) -> Path:
+        return ElementColumns.write_columns({name: values[start:end] for name, values in columns.items()},
+                                            path / f"batch_{file_index:05d}{ColumnarStorage.SUFFIX}")
+
+    @staticmethod
+    def update_sequence_dataset_params(dataset_params: dict, columns: dict):
+        """
+        Adds the values of the metadata columns (the columns of custom sequence parameters or receptor metadata) to the label values
+        """
+        reserved_columns = list(Repertoire.FIELDS) + [ElementColumns.RECEPTOR_IDENTIFIER_COLUMN, ElementColumns.RECEPTOR_CLASS_COLUMN]
+        for name, values in columns.items():
+            if name not in reserved_columns and ElementColumns.CHAIN_SEPARATOR not in name:
+                if name not in dataset_params:
+                    dataset_params[name] = set()
+                if isinstance(dataset_params[name], set):
+                    dataset_params[name].update(pd.unique(values))
+
     @staticmethod
     def extract_sequence_dataset_params(items=None, params=None) -> dict:
         result = {}
@@ -387,61 +545,8 @@ class ImportHelper:
 
     @staticmethod
     def import_receptors(df, params) -> List[Receptor]:
-        identifiers = df["receptor_identifiers"].unique()
-        all_receptors = []
-
-        for identifier in identifiers:
-            receptors = ImportHelper.import_receptors_by_id(df, identifier, params)
-            all_receptors.extend(receptors)
-
-        return all_receptors
+        return ImportHelper.build_receptors_from_columns(ImportHelper.make_receptor_columns(df, params))
 
     @staticmethod
-    def import_receptors_by_id(df, identifier, params) -> List[Receptor]:
-        first_row = df.loc[(df["receptor_identifiers"] == identifier) & (df["chains"] == params.receptor_chains.value[0])]
-        second_row = df.loc[(df["receptor_identifiers"] == identifier) & (df["chains"] == params.receptor_chains.value[1])]
-
-        for i, row in enumerate([first_row, second_row]):
-            if row.shape[0] > 1:
-                warnings.warn(
-                    f"Multiple {params.receptor_chains.value[i]} chains found for receptor with identifier {identifier}, only the first entry will be loaded")
-            elif row.shape[0] == 0:
-                warnings.warn(
-                    f"Missing {params.receptor_chains.value[i]} chain for receptor with identifier {identifier}, this receptor will be omitted.")
-                return []
-
-        # todo add options like IRIS import: option to import all dual chains or just the first pair / all V genes when uncertain annotation, etc
-        # todo add possibility to import multiple chain combo's? (BCR heavy-light & heavy-kappa, as seen in 10xGenomics?)
-
-        return [ImportHelper.build_receptor_from_rows(first_row.iloc[0], second_row.iloc[0], identifier, params)]
-
-    @staticmethod
-    def build_receptor_from_rows(first_row, second_row, identifier, params):
-        metadata_columns = params.metadata_column_mapping.values() if params.metadata_column_mapping else None
-        first_sequence = ImportHelper.import_sequence(first_row, metadata_columns=metadata_columns)
-        second_sequence = ImportHelper.import_sequence(second_row, metadata_columns=metadata_columns)
-
-        if params.receptor_chains == ChainPair.TRA_TRB:
-            receptor = TCABReceptor(alpha=first_sequence,
-                                    beta=second_sequence,
-                                    identifier=identifier,
-                                    metadata={**second_sequence.metadata.custom_params})
-        elif params.receptor_chains == ChainPair.TRG_TRD:
-            receptor = TCGDReceptor(gamma=first_sequence,
-                                    delta=second_sequence,
-                                    identifier=identifier,
-                                    metadata={**second_sequence.metadata.custom_params})
-        elif params.receptor_chains == ChainPair.IGH_IGL:
-            receptor = BCReceptor(heavy=first_sequence,
-                                  light=second_sequence,
-                                  identifier=identifier,
-                                  metadata={**first_sequence.metadata.custom_params})
-        elif params.receptor_chains == ChainPair.IGH_IGK:
-            receptor = BCKReceptor(heavy=first_sequence,
-                                   kappa=second_sequence,
-                                   identifier=identifier,
-                                   metadata={**first_sequence.metadata.custom_params})
-        else:
-            raise NotImplementedError(f"ImportHelper: {params.receptor_chains} chain pair is not supported.")
-
-        return receptor
+    def build_receptors_from_columns(columns: dict) -> List[Receptor]:
+        return ElementColumns.columns_to_receptors(columns, ImportHelper.get_element_column_count(columns))
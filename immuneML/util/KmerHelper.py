@@ -2,6 +2,8 @@
 import itertools
 import warnings
 
+import numpy as np
+
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.util.PositionHelper import PositionHelper
@@ -20,6 +22,137 @@ class KmerHelper:
             kmers.append(sequence[i:i + k])
         return kmers
 
+    @staticmethod
+    def count_kmers_in_buffer(buffer, offsets, k: int, weights=None) -> dict:
+        """
+        counts overlapping continuous k-mers in sequences given as a uint8 buffer of concatenated sequences and offsets of each
+        sequence in the buffer (as returned by Repertoire.get_sequence_buffer()) without creating string objects per sequence or k-mer
+        :param buffer: uint8 array with concatenated sequences
+        :param offsets: array of length n_sequences + 1 with the start of each sequence in the buffer and the end of the last one
+        :param k: length of k-mer (int)
+        :param weights: optional weight per sequence (e.g. sequence counts); if not set, each k-mer occurrence is counted once
+        :return: dictionary of k-mers and their counts; sequences shorter than k do not contribute any k-mers
+        """
+        return KmerHelper._count_kmer_windows(buffer, offsets, [(0, k)], weights)
+
+    @staticmethod
+    def count_gapped_kmers_in_buffer(buffer, offsets, k_left: int, max_gap: int, k_right: int = None, min_gap: int = 0,
+                                     weights=None) -> dict:
+        """
+        counts overlapping gapped k-mers (in the same format as create_gapped_kmers_from_string) in sequences given as a buffer and
+        offsets (see count_kmers_in_buffer); sequences shorter than k_left + k_right + max_gap do not contribute any k-mers
+        :return: dictionary of gapped k-mers and their counts
+        """
+        k_right = k_left if k_right is None else k_right
+        counts = {}
+        for gap in range(min_gap, max_gap + 1):
+            gap_counts = KmerHelper._count_kmer_windows(buffer, offsets, [(0, k_left), (k_left + gap, k_right)], weights,
+                                                        min_length=k_left + k_right + max_gap)
+            counts.update({kmer[:k_left] + gap * "." + kmer[k_left:]: count for kmer, count in gap_counts.items()})
+        return counts
+
+    @staticmethod
+    def count_IMGT_kmers_in_buffer(buffer, offsets, k: int, weights=None) -> dict:
+        """
+        counts overlapping continuous k-mers together with their IMGT position (in the same format as create_IMGT_kmers_from_sequence)
+        in sequences given as a buffer and offsets (see count_kmers_in_buffer)
+        :return: dictionary of (k-mer, IMGT position) tuples and their counts
+        """
+        return KmerHelper._count_kmer_windows(buffer, offsets, [(0, k)], weights, with_imgt_positions=True)
+
+    @staticmethod
+    def count_IMGT_gapped_kmers_in_buffer(buffer, offsets, k_left: int, max_gap: int, k_right: int = None, min_gap: int = 0,
+                                          weights=None) -> dict:
+        """
+        counts overlapping gapped k-mers together with their IMGT position (in the same format as
+        create_IMGT_gapped_kmers_from_sequence) in sequences given as a buffer and offsets (see count_kmers_in_buffer)
+        :return: dictionary of (gapped k-mer, IMGT position) tuples and their counts
+        """
+        k_right = k_left if k_right is None else k_right
+        counts = {}
+        for gap in range(min_gap, max_gap + 1):
+            gap_counts = KmerHelper._count_kmer_windows(buffer, offsets, [(0, k_left), (k_left + gap, k_right)], weights,
+                                                        min_length=k_left + k_right + max_gap, with_imgt_positions=True)
+            counts.update({(kmer[:k_left] + gap * "." + kmer[k_left:], position): count for (kmer, position), count in gap_counts.items()})
+        return counts
+
+    @staticmethod
+    def _count_kmer_windows(buffer, offsets, segments: list, weights=None, min_length: int = 0, with_imgt_positions: bool = False) -> dict:
+        """
+        counts k-mers from a sliding window over all sequences at once: segments is a list of (start within the window, length) parts of
+        the window which make up the k-mer (e.g. [(0, 2), (3, 1)] for a k-mer with 2 characters, a gap of 1 and 1 character); k-mers
+        are integer-encoded, counted with np.unique and np.bincount and only the distinct k-mers are decoded to strings
+        """
+        buffer, offsets = np.asarray(buffer), np.asarray(offsets)
+        lengths = np.diff(offsets)
+        window_length = segments[-1][0] + segments[-1][1]
+
+        windows_per_sequence = np.where(lengths >= max(min_length, window_length), lengths - window_length + 1, 0)
+        sequence_indices = np.repeat(np.arange(lengths.shape[0]), windows_per_sequence)
+        window_starts = np.arange(windows_per_sequence.sum()) - np.repeat(np.cumsum(windows_per_sequence) - windows_per_sequence,
+                                                                           windows_per_sequence)
+        kmer_character_indices = np.concatenate([np.arange(start, start + length) for start, length in segments])
+
+        kmer_ids, kmers = KmerHelper._make_kmer_ids(buffer, offsets[:-1][sequence_indices] + window_starts, kmer_character_indices)
+
+        if with_imgt_positions:
+            position_ids, positions = KmerHelper._make_imgt_position_ids(lengths[sequence_indices], window_starts, kmer_character_indices)
+            unique_features, feature_ids = np.unique(kmer_ids * len(positions) + position_ids, return_inverse=True)
+            features = [(kmers[feature // len(positions)], positions[feature % len(positions)]) for feature in unique_features.tolist()]
+        else:
+            feature_ids, features = kmer_ids, kmers
+
+        counts = np.bincount(feature_ids, weights=np.asarray(weights)[sequence_indices] if weights is not None else None,
+                             minlength=len(features))
+
+        return dict(zip(features, counts.tolist()))
+
+    @staticmethod
+    def _make_kmer_ids(buffer, kmer_starts, kmer_character_indices):
+        present_characters = np.zeros(256, dtype=bool)
+        present_characters[buffer] = True
+        alphabet = np.flatnonzero(present_characters).astype(np.uint8)
+        base, kmer_length = max(alphabet.shape[0], 1), kmer_character_indices.shape[0]
+
+        if kmer_length * np.log2(base) < 63:
+            lookup = np.zeros(256, dtype=np.int64)
+            lookup[alphabet] = np.arange(alphabet.shape[0])
+            codes = np.zeros(kmer_starts.shape[0], dtype=np.int64)
+            for index in kmer_character_indices:
+                codes = codes * base + lookup[buffer[kmer_starts + index]]
+
+            unique_codes, kmer_ids = np.unique(codes, return_inverse=True)
+            kmer_characters = alphabet[(unique_codes[:, None] // base ** np.arange(kmer_length - 1, -1, -1, dtype=np.int64)) % base]
+        else:
+            unique_kmers, kmer_ids = np.unique(buffer[kmer_starts[:, None] + kmer_character_indices], axis=0, return_inverse=True)
+            kmer_characters = unique_kmers.reshape(-1, kmer_length)
+
+        kmers = [kmer.decode() for kmer in np.ascontiguousarray(kmer_characters).view(f"S{kmer_length}").ravel().tolist()]
+
+        return kmer_ids.ravel(), kmers
+
+    @staticmethod
+    def _make_imgt_position_ids(sequence_lengths, window_starts, kmer_character_indices):
+        positions, position_ids = [], np.zeros(window_starts.shape[0], dtype=np.int64)
+
+        for length in np.unique(sequence_lengths).tolist():
+            imgt_positions = PositionHelper.gen_imgt_positions_from_length(length)
+            ids_per_start = []
+            for start in range(length - kmer_character_indices[-1]):
+                position = KmerHelper._get_IMGT_kmer_position([imgt_positions[start + index] for index in kmer_character_indices])
+                if position not in positions:
+                    positions.append(position)
+                ids_per_start.append(positions.index(position))
+
+            is_current_length = sequence_lengths == length
+            position_ids[is_current_length] = np.array(ids_per_start, dtype=np.int64)[window_starts[is_current_length]]
+
+        return position_ids, positions
+
+    @staticmethod
+    def _get_IMGT_kmer_position(kmer_positions: list):
+        return min(kmer_positions) if int(min(kmer_positions)) != 112 else max([position for position in kmer_positions if int(position) == 112])
+
     @staticmethod
     def create_IMGT_kmers_from_sequence(sequence: ReceptorSequence, k: int):
         positions = PositionHelper.gen_imgt_positions_from_length(len(sequence.get_sequence()))
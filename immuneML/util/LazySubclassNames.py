@@ -0,0 +1,41 @@
+from collections.abc import Sequence
+
+from immuneML.util.ReflectionHandler import ReflectionHandler
+
+
+class LazySubclassNames(Sequence):
+    """
+    Names of the non-abstract subclasses of a class without drop_part (as returned by
+    ReflectionHandler.all_nonabstract_subclass_basic_names) which are listed only when needed.
+
+    Checking if a name is in the list imports only the module with that name, so that parsing a specification imports only the components
+    it uses (and their dependencies, e.g. PyTorch for DeepRC). All subclasses are imported only when the names are listed, e.g. for an
+    error message.
+    """
+
+    def __init__(self, cls, drop_part: str, subdirectory: str = ""):
+        self.cls = cls
+        self.drop_part = drop_part
+        self.subdirectory = subdirectory
+        self._names = None
+
+    def __contains__(self, name) -> bool:
+        if self._names is None and isinstance(name, str) and \
+                ReflectionHandler.get_nonabstract_subclass_by_basic_name(name, self.cls, self.drop_part, self.subdirectory) is not None:
+            return True
+
+        return name in self.get_names()
+
+    def get_names(self) -> list:
+        if self._names is None:
+            self._names = ReflectionHandler.all_nonabstract_subclass_basic_names(self.cls, self.drop_part, self.subdirectory)
+        return self._names
+
+    def __getitem__(self, index):
+        return self.get_names()[index]
+
+    def __len__(self) -> int:
+        return len(self.get_names())
+
+    def __repr__(self) -> str:
+        return repr(self.get_names())
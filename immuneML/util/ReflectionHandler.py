@@ -6,6 +6,8 @@ from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 
 class ReflectionHandler:
 
+    _file_registry = None
+
     @staticmethod
     def import_function(function: str, module):
         return getattr(module, function)
@@ -34,11 +36,14 @@ class ReflectionHandler:
 
     @staticmethod
     def _import_class(path: Path, class_name: str):
-        module_path = ".".join(path.parts[len(list(path.parts)) - list(path.parts)[::-1].index("immuneML") - 1:])[:-3]
-        mod = import_module(module_path)
+        mod = import_module(ReflectionHandler._get_module_name(path))
         cls = getattr(mod, class_name)
         return cls
 
+    @staticmethod
+    def _get_module_name(path: Path) -> str:
+        return ".".join(path.parts[len(list(path.parts)) - list(path.parts)[::-1].index("immuneML") - 1:])[:-3]
+
     @staticmethod
     def get_class_by_name(class_name: str, subdirectory: str = ""):
         filenames = ReflectionHandler._get_filenames(class_name, subdirectory)
@@ -47,11 +52,32 @@ class ReflectionHandler:
 
         return ReflectionHandler._import_class(filenames[0], class_name)
 
+    @staticmethod
+    def get_file_registry() -> dict:
+        """
+        Builds (once per process) and returns the mapping of module names to the paths of the python files in the immuneML package with
+        that name, which is used to find classes by name instead of searching the package directory on each call.
+
+        Returns:
+             dict with file names without extension as keys and lists of paths to the files as values
+        """
+        if ReflectionHandler._file_registry is None:
+            registry = {}
+            for path in sorted((EnvironmentSettings.root_path / "immuneML").rglob("*.py")):
+                registry.setdefault(path.stem, []).append(path)
+            ReflectionHandler._file_registry = registry
+
+        return ReflectionHandler._file_registry
+
     @staticmethod
     def _get_filenames(class_name: str, subdirectory_name: str = "", partial=False):
-        pattern = f"immuneML/**/*{class_name}.py" if partial else f"immuneML/**/{class_name}.py"
+        registry = ReflectionHandler.get_file_registry()
+
+        if partial:
+            filenames = [filename for name, paths in registry.items() if name.endswith(class_name) for filename in paths]
+        else:
+            filenames = registry.get(class_name, [])
 
-        filenames = list(EnvironmentSettings.root_path.glob(pattern))
         filenames = [f for f in filenames if subdirectory_name in "/".join(f.parts)]
 
         return filenames
@@ -77,6 +103,28 @@ class ReflectionHandler:
             classes = ReflectionHandler.get_classes_by_partial_name(drop_part, subdirectory)
         return [cl for cl in ReflectionHandler.all_subclasses(cls) if not bool(getattr(cl, "__abstractmethods__", False))]
 
+    @staticmethod
+    def get_nonabstract_subclass_by_basic_name(basic_name: str, cls, drop_part: str, subdirectory: str = ""):
+        """ obtain a non-abstract subclass of cls by its name without drop_part, importing only the module with that name
+
+        Args:
+
+            basic_name (str): class name without drop_part, e.g. KmerFrequency for KmerFrequencyEncoder
+            cls: the base class
+            drop_part (str): the part of the class name which is not included in basic_name
+            subdirectory (str): subdirectory of the package where the class is located
+
+        Returns:
+             the class or None if there is no non-abstract subclass of cls with that name in the subdirectory
+        """
+        filenames = ReflectionHandler._get_filenames(f"{basic_name}{drop_part}", subdirectory)
+        if len(filenames) == 1:
+            subclass = getattr(import_module(ReflectionHandler._get_module_name(filenames[0])), filenames[0].stem, None)
+            if isinstance(subclass, type) and issubclass(subclass, cls) and subclass.__name__.replace(drop_part, "") == basic_name \
+                    and not bool(getattr(subclass, "__abstractmethods__", False)):
+                return subclass
+        return None
+
     @staticmethod
     def exists(class_name: str, subdirectory: str = ""):
         filenames = ReflectionHandler._get_filenames(class_name, subdirectory)
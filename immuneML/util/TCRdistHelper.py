@@ -1,9 +1,13 @@
 import logging
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from immuneML.caching.CacheHandler import CacheHandler
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
+from immuneML.data_model.receptor.ElementColumns import ElementColumns
 from immuneML.data_model.receptor.RegionType import RegionType
 
 
@@ -19,17 +23,36 @@ class TCRdistHelper:
         """
         Computes the tcrdist distances by creating a TCRrep object and calling compute_distances() function.
 
+        Args:
+            dataset: receptor dataset for which all pairwise distances between receptors will be computed
+            labels: a list of label names (e.g., specific epitopes) to be used for later classification or reports
+            cores: how many cpus to use for computation
+
+        Returns:
+            an instance of TCRrep object with computed pairwise distances between all receptors in the dataset
+
+        """
+        tcr_rep = TCRdistHelper.prepare_tcr_rep(dataset, labels, cores)
+        tcr_rep.compute_distances()
+
+        return tcr_rep
+
+    @staticmethod
+    def prepare_tcr_rep(dataset: ReceptorDataset, labels: list, cores: int = 1):
+        """
+        Creates a TCRrep object for the dataset without computing any distances.
+
         Parameters `ntrim` and `ctrim` in TCRrep object for CDR3 are adjusted to account for working with IMGT CDR3 definition if IMGT CDR3 was set
         as region_type for the dataset upon importing. `deduplicate` parameter is set to False as we assume that we work with clones in immuneML,
         and not individual receptors.
 
         Args:
-            dataset: receptor dataset for which all pairwise distances between receptors will be computed
+            dataset: receptor dataset to create the TCRrep object for
             labels: a list of label names (e.g., specific epitopes) to be used for later classification or reports
             cores: how many cpus to use for computation
 
         Returns:
-            an instance of TCRrep object with computed pairwise distances between all receptors in the dataset
+            an instance of TCRrep object where clone_df includes all receptors in the dataset
 
         """
         from tcrdist.repertoire import TCRrep
@@ -51,10 +74,57 @@ class TCRdistHelper:
             raise RuntimeError(f"{TCRdistHelper.__name__}: TCRdist metric can be computed only if IMGT_CDR3 or IMGT_JUNCTION are used as region "
                                f"types, but for dataset {dataset.name}, it is set to {dataset.labels['region_type']} instead.")
 
-        tcr_rep.compute_distances()
-
         return tcr_rep
 
+    @staticmethod
+    def compute_distance_blocks(tcr_rep, reference_tcr_rep, block_size: int, path: Path = None, nearest_neighbours: int = None):
+        """
+        Computes the tcrdist distances (sum of alpha and beta chain distances) between the receptors of tcr_rep (rows) and the receptors of
+        reference_tcr_rep (columns) in blocks of block_size rows, so that only one block of rectangular distances is kept in memory at a time.
+
+        Args:
+            tcr_rep: TCRrep object (as returned by prepare_tcr_rep) with the receptors for which the distances are computed
+            reference_tcr_rep: TCRrep object with the receptors to compute the distances to (e.g., receptors from the training dataset)
+            block_size: how many receptors of tcr_rep to compare to all reference receptors at once
+            path: path to the .npy file to which the full distance matrix is written as memory-mapped array; not used if nearest_neighbours is set
+            nearest_neighbours: if set, only the distances to this many nearest reference receptors are kept for each receptor
+
+        Returns:
+            memory-mapped array of shape (receptors, reference receptors) with all distances if nearest_neighbours is None, otherwise a sparse
+            CSR matrix of the same shape with the distances to nearest neighbours (including explicit zeros) sorted by distance in each row
+
+        """
+        row_count, column_count = tcr_rep.clone_df.shape[0], reference_tcr_rep.clone_df.shape[0]
+
+        if nearest_neighbours is None:
+            distances = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(row_count, column_count))
+        else:
+            neighbour_count = min(nearest_neighbours, column_count)
+            neighbour_indices = np.zeros((row_count, neighbour_count), dtype=np.int64)
+            neighbour_distances = np.zeros((row_count, neighbour_count), dtype=np.float32)
+
+        for start in range(0, row_count, block_size):
+            tcr_rep.compute_rect_distances(df=tcr_rep.clone_df.iloc[start: start + block_size], df2=reference_tcr_rep.clone_df, store=False)
+            block = tcr_rep.rw_alpha + tcr_rep.rw_beta
+
+            if nearest_neighbours is None:
+                distances[start: start + block.shape[0]] = block
+            else:
+                indices = np.argpartition(block, neighbour_count - 1, axis=1)[:, :neighbour_count]
+                block_distances = np.take_along_axis(block, indices, axis=1)
+                order = np.argsort(block_distances, axis=1, kind="stable")
+                neighbour_indices[start: start + block.shape[0]] = np.take_along_axis(indices, order, axis=1)
+                neighbour_distances[start: start + block.shape[0]] = np.take_along_axis(block_distances, order, axis=1)
+
+        tcr_rep.rw_alpha, tcr_rep.rw_beta = None, None
+
+        if nearest_neighbours is None:
+            distances.flush()
+            return distances
+        else:
+            return sparse.csr_matrix((neighbour_distances.ravel(), neighbour_indices.ravel(), np.arange(0, row_count * neighbour_count + 1, neighbour_count)),
+                                     shape=(row_count, column_count))
+
     @staticmethod
     def add_default_allele_to_v_gene(v_gene: str):
         if v_gene is not None and "*" not in v_gene:
@@ -69,24 +139,23 @@ class TCRdistHelper:
                                       f"is currently supported in immuneML.")
         label = labels[0]
 
-        subject, epitope, count, v_a_gene, j_a_gene, cdr3_a_aa, v_b_gene, j_b_gene, cdr3_b_aa, clone_id, cdr3_b_nucseq, cdr3_a_nucseq = \
-            [], [], [], [], [], [], [], [], [], [], [], []
-
-        for receptor in dataset.get_data():
-            subject.append(receptor.metadata["subject"] if "subject" in receptor.metadata else "sub" + receptor.identifier)
-            epitope.append(receptor.metadata[label])
-            count.append(receptor.get_chain("alpha").metadata.count
-                         if receptor.get_chain("alpha").metadata.count == receptor.get_chain("beta").metadata.count
-                            and receptor.get_chain("beta").metadata.count is not None else 1)
-            v_a_gene.append(TCRdistHelper.add_default_allele_to_v_gene(receptor.get_chain('alpha').metadata.v_allele))
-            j_a_gene.append(receptor.get_chain('alpha').metadata.j_allele)
-            cdr3_a_aa.append(receptor.get_chain('alpha').amino_acid_sequence)
-            cdr3_a_nucseq.append(receptor.get_chain("alpha").nucleotide_sequence)
-            v_b_gene.append(TCRdistHelper.add_default_allele_to_v_gene(receptor.get_chain('beta').metadata.v_allele))
-            j_b_gene.append(receptor.get_chain('beta').metadata.j_allele)
-            cdr3_b_aa.append(receptor.get_chain('beta').amino_acid_sequence)
-            cdr3_b_nucseq.append(receptor.get_chain("beta").nucleotide_sequence)
-            clone_id.append(receptor.identifier)
+        chain_fields = ["counts", "v_alleles", "j_alleles", "sequence_aas", "sequences"]
+        attributes = dataset.get_attributes([ElementColumns.RECEPTOR_IDENTIFIER_COLUMN, "subject", label] +
+                                            [f"{chain}.{field}" for chain in ["alpha", "beta"] for field in chain_fields])
+
+        clone_id = attributes[ElementColumns.RECEPTOR_IDENTIFIER_COLUMN].tolist()
+        subject = [subj if subj is not None else "sub" + identifier for subj, identifier in zip(attributes["subject"].tolist(), clone_id)]
+        epitope = attributes[label].tolist()
+        count = [alpha_count if alpha_count == beta_count and beta_count is not None else 1
+                 for alpha_count, beta_count in zip(attributes["alpha.counts"].tolist(), attributes["beta.counts"].tolist())]
+        v_a_gene = [TCRdistHelper.add_default_allele_to_v_gene(v_allele) for v_allele in attributes["alpha.v_alleles"].tolist()]
+        j_a_gene = attributes["alpha.j_alleles"].tolist()
+        cdr3_a_aa = attributes["alpha.sequence_aas"].tolist()
+        cdr3_a_nucseq = attributes["alpha.sequences"].tolist()
+        v_b_gene = [TCRdistHelper.add_default_allele_to_v_gene(v_allele) for v_allele in attributes["beta.v_alleles"].tolist()]
+        j_b_gene = attributes["beta.j_alleles"].tolist()
+        cdr3_b_aa = attributes["beta.sequence_aas"].tolist()
+        cdr3_b_nucseq = attributes["beta.sequences"].tolist()
 
         if all(item is not None for item in cdr3_a_nucseq) and all(item is not None for item in cdr3_b_nucseq):
             return pd.DataFrame({"subject": subject, "epitope": epitope, "count": count, "v_a_gene": v_a_gene, "j_a_gene": j_a_gene,
@@ -0,0 +1,196 @@
+import atexit
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import uuid
+from multiprocessing.pool import Pool
+from pathlib import Path
+
+import numpy as np
+
+from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class WorkerPool:
+    """
+    Execution layer for running one function on many items (e.g. encoding or filtering each repertoire of a dataset) in parallel.
+
+    Instead of creating a new multiprocessing pool for every call and sending the function with all its inputs (e.g. the encoder object
+    and the EncoderParams) with every task, the worker processes are started once per run (one pool per number of processes) and reused
+    by all parallel steps until shutdown() is called. For each call, the function (usually a functools.partial with the read-only inputs
+    bound to it) is written once to a file in a temporary directory; the tasks only carry the id of the call, the file path, the index
+    and the item. A worker keeps the function of the last call it worked on and replaces it when it gets a task with a different id, so
+    calls can be interleaved or nested without waiting for each other. Workers also take over the current environment of the main process
+    (environment variables, working directory and the settings in EnvironmentSettings), as they may have been started before it was
+    changed, and do not keep the in-memory cache of the process they were forked from.
+
+    For functions returning large arrays of the same shape for each item (e.g. one-hot encoded repertoires), map_to_array writes the
+    arrays from the workers directly into a preallocated file-backed array instead of sending them back to the main process.
+
+    When all results of a call were received (or the caller stopped iterating over the results or a task failed), the tasks which were
+    not started yet are cancelled and the remaining ones are waited for.
+
+    If only one process is requested or the function is called from a worker process, the items are processed in the current process.
+    """
+
+    CANCEL_FILENAME = "cancelled"
+
+    _pools = {}
+    _pid = None
+    _job = (None, None)
+    _environment = None
+
+    @staticmethod
+    def get_pool(processes: int) -> Pool:
+        if WorkerPool._pid != os.getpid():  # pools inherited from the parent process (e.g. after fork) cannot be used
+            WorkerPool._pools = {}
+            WorkerPool._pid = os.getpid()
+
+        pool = WorkerPool._pools.get(processes, None)
+        if pool is None or pool._state != "RUN":
+            pool = Pool(processes, initializer=WorkerPool._init_worker)
+            WorkerPool._pools[processes] = pool
+        return pool
+
+    @staticmethod
+    def _init_worker():
+        WorkerPool._job = (None, None)
+        WorkerPool._environment = None
+        CacheHandler._memory_cache = None
+
+    @staticmethod
+    def shutdown():
+        """
+        Stops all worker processes; new ones are started when they are needed again
+        """
+        if WorkerPool._pid == os.getpid():
+            for pool in WorkerPool._pools.values():
+                pool.terminate()
+                pool.join()
+        WorkerPool._pools = {}
+
+    @staticmethod
+    def map(function, items, processes: int, chunksize: int = 1) -> list:
+        """
+        Returns the list of function(item) for all items, in the order of the items
+        """
+        return list(WorkerPool.imap(function, items, processes, chunksize))
+
+    @staticmethod
+    def imap(function, items, processes: int, chunksize: int = 1):
+        """
+        Lazy version of map: yields function(item) for one item at a time, in the order of the items
+        """
+        yield from WorkerPool._run(function, list(items), processes, chunksize, None)
+
+    @staticmethod
+    def map_to_array(function, items, processes: int, shape: tuple, dtype, chunksize: int = 1):
+        """
+        Runs function on all items where function(item) returns a tuple (array, result) and the array for the i-th item is stored in the
+        i-th row of the output array of shape (item count, *shape) without being sent back to the main process
+
+        Returns:
+            the output array and the list of the other results in the order of the items
+        """
+        items = list(items)
+        directory = Path(tempfile.mkdtemp(prefix="immuneML_arrays_"))
+        try:
+            output_path = directory / "output.npy"
+            output = np.lib.format.open_memmap(output_path, mode="w+", dtype=dtype, shape=(len(items),) + tuple(shape))
+            del output
+
+            results = list(WorkerPool._run(function, items, processes, chunksize, output_path))
+            array = np.load(output_path)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        return array, results
+
+    @staticmethod
+    def _run(function, items: list, processes: int, chunksize: int, output_path):
+        if processes <= 1 or len(items) <= 1 or multiprocessing.current_process().daemon:
+            for index, item in enumerate(items):
+                yield WorkerPool._store_output(function(item), index, output_path)
+        else:
+            directory = Path(tempfile.mkdtemp(prefix="immuneML_job_"))
+            results, finished = None, False
+            try:
+                job_path = directory / "job.pickle"
+                with job_path.open("wb") as file:
+                    pickle.dump((function, WorkerPool._capture_environment(), output_path), file, pickle.HIGHEST_PROTOCOL)
+
+                pool = WorkerPool.get_pool(processes)
+                job_id = uuid.uuid4().hex
+                tasks = ((job_id, str(job_path), index, item) for index, item in enumerate(items))
+                results = pool.imap(WorkerPool._run_task, tasks, chunksize=chunksize)
+                yield from results
+                finished = True
+            finally:
+                if results is not None and not finished:
+                    (directory / WorkerPool.CANCEL_FILENAME).touch()
+                    WorkerPool._wait_for_tasks(results)
+                shutil.rmtree(directory, ignore_errors=True)
+
+    @staticmethod
+    def _wait_for_tasks(results):
+        while True:
+            try:
+                next(results)
+            except StopIteration:
+                break
+            except Exception:  # the results are not used anymore, so errors of the remaining tasks are ignored
+                pass
+
+    @staticmethod
+    def _run_task(task):
+        job_id, job_path, index, item = task
+
+        if os.path.isfile(os.path.join(os.path.dirname(job_path), WorkerPool.CANCEL_FILENAME)):
+            return None
+
+        if WorkerPool._job[0] != job_id:
+            WorkerPool._job = (None, None)  # the function of the previous call is released before the new one is loaded
+            with open(job_path, "rb") as file:
+                WorkerPool._job = (job_id, pickle.load(file))
+
+        function, environment, output_path = WorkerPool._job[1]
+        WorkerPool._apply_environment(environment)
+
+        return WorkerPool._store_output(function(item), index, output_path)
+
+    @staticmethod
+    def _store_output(result, index: int, output_path):
+        if output_path is None:
+            return result
+
+        array, result = result
+        output = np.lib.format.open_memmap(output_path, mode="r+")
+        output[index] = array
+        output.flush()
+        del output
+
+        return result
+
+    @staticmethod
+    def _capture_environment() -> dict:
+        settings = {name: value for name, value in vars(EnvironmentSettings).items()
+                    if not name.startswith("_") and not isinstance(value, (staticmethod, classmethod)) and not callable(value)}
+        return {"environ": dict(os.environ), "cwd": os.getcwd(), "settings": settings}
+
+    @staticmethod
+    def _apply_environment(environment: dict):
+        if WorkerPool._environment != environment:
+            if dict(os.environ) != environment["environ"]:
+                os.environ.clear()
+                os.environ.update(environment["environ"])
+            if os.getcwd() != environment["cwd"]:
+                os.chdir(environment["cwd"])
+            for name, value in environment["settings"].items():
+                setattr(EnvironmentSettings, name, value)
+            WorkerPool._environment = environment
+
+
+atexit.register(WorkerPool.shutdown)
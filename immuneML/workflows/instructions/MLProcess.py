@@ -45,9 +45,9 @@ class MLProcess:
         self.metrics = metrics
         self.metrics.add(Metric.BALANCED_ACCURACY)
         self.optimization_metric = optimization_metric
-        self.ml_reports = ml_reports if ml_reports is not None else []
-        self.encoding_reports = encoding_reports if encoding_reports is not None else []
-        self.data_reports = data_reports if data_reports is not None else []
+        self.ml_reports = list(ml_reports) if ml_reports is not None else []
+        self.encoding_reports = list(encoding_reports) if encoding_reports is not None else []
+        self.data_reports = list(data_reports) if data_reports is not None else []
         self.report_context = report_context
         self.hp_setting = copy.deepcopy(hp_setting)
         self.store_encoded_data = store_encoded_data
@@ -61,30 +61,54 @@ class MLProcess:
         self.test_predictions_path = self.path / "test_predictions.csv"
         self.report_path = PathBuilder.build(self.path / "reports")
 
-    def run(self, split_index: int) -> HPItem:
+    def run(self, split_index: int, encoding: tuple = None) -> HPItem:
+        """
+        Arguments:
+
+            split_index (int): index of the data split the process is run on
+
+            encoding (tuple): the result of encode_datasets() of another process with the same training and test datasets, preprocessing
+                              and encoder (e.g. a process differing only in the ML method); if set, the datasets are not encoded again
+
+        Returns:
+            HPItem with the trained method and its performance on the test dataset
+        """
 
         print(f"{datetime.datetime.now()}: Evaluating hyperparameter setting: {self.hp_setting}...", flush=True)
 
         PathBuilder.build(self.path)
         self._set_paths()
 
-        processed_dataset = HPUtil.preprocess_dataset(self.train_dataset, self.hp_setting.preproc_sequence, self.path / "preprocessed_train_dataset")
+        if encoding is None:
+            encoding = self.encode_datasets()
 
-        encoded_train_dataset = HPUtil.encode_dataset(processed_dataset, self.hp_setting, self.path / "encoded_datasets", learn_model=True,
-                                                      context=self.report_context, number_of_processes=self.number_of_processes,
-                                                      label_configuration=self.label_config, store_encoded_data=self.store_encoded_data)
+        encoded_train_dataset, encoded_test_dataset, self.hp_setting.encoder = encoding
 
         method = HPUtil.train_method(self.label, encoded_train_dataset, self.hp_setting, self.path, self.train_predictions_path, self.ml_details_path, self.number_of_processes, self.optimization_metric)
 
         encoding_train_results = ReportUtil.run_encoding_reports(encoded_train_dataset, self.encoding_reports, self.report_path / "encoding_train")
 
-        hp_item = self._assess_on_test_dataset(encoded_train_dataset, encoding_train_results, method, split_index)
+        hp_item = self._assess_on_test_dataset(encoded_train_dataset, encoded_test_dataset, encoding_train_results, method, split_index)
 
         print(f"{datetime.datetime.now()}: Completed hyperparameter setting {self.hp_setting}.\n", flush=True)
 
         return hp_item
 
-    def _assess_on_test_dataset(self, encoded_train_dataset, encoding_train_results, method, split_index) -> HPItem:
+    def encode_datasets(self) -> tuple:
+        """
+        Preprocesses and encodes the training dataset (learning the encoder parameters) and the test dataset (if there is one).
+
+        Returns:
+            the encoded training dataset, the encoded test dataset (or None) and the fitted encoder
+        """
+        PathBuilder.build(self.path)
+
+        processed_dataset = HPUtil.preprocess_dataset(self.train_dataset, self.hp_setting.preproc_sequence, self.path / "preprocessed_train_dataset")
+
+        encoded_train_dataset = HPUtil.encode_dataset(processed_dataset, self.hp_setting, self.path / "encoded_datasets", learn_model=True,
+                                                      context=self.report_context, number_of_processes=self.number_of_processes,
+                                                      label_configuration=self.label_config, store_encoded_data=self.store_encoded_data)
+
         if self.test_dataset is not None and self.test_dataset.get_example_count() > 0:
             processed_test_dataset = HPUtil.preprocess_dataset(self.test_dataset, self.hp_setting.preproc_sequence,
                                                                self.path / "preprocessed_test_dataset")
@@ -92,7 +116,13 @@ class MLProcess:
             encoded_test_dataset = HPUtil.encode_dataset(processed_test_dataset, self.hp_setting, self.path / "encoded_datasets",
                                                          learn_model=False, context=self.report_context, number_of_processes=self.number_of_processes,
                                                          label_configuration=self.label_config, store_encoded_data=self.store_encoded_data)
+        else:
+            encoded_test_dataset = None
+
+        return encoded_train_dataset, encoded_test_dataset, self.hp_setting.encoder
 
+    def _assess_on_test_dataset(self, encoded_train_dataset, encoded_test_dataset, encoding_train_results, method, split_index) -> HPItem:
+        if encoded_test_dataset is not None:
             performance = HPUtil.assess_performance(method, self.metrics, self.optimization_metric, encoded_test_dataset, split_index, self.path,
                                                     self.test_predictions_path, self.label, self.ml_score_path)
 
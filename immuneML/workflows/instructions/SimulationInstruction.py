@@ -25,6 +25,10 @@ class SimulationInstruction(Instruction):
 
         export_formats: in which formats to export the dataset after simulation. Valid formats are class names of any non-abstract class inheriting :py:obj:`~immuneML.IO.dataset_export.DataExporter.DataExporter`. Important note: Pickle files might not be compatible between different immuneML (sub)versions.
 
+        number_of_processes (int): how many processes to use to implant the signals in repertoires in parallel
+
+        batch_size (int): how many repertoires a process gets at once
+
     YAML specification:
 
     .. indent with spaces
@@ -35,13 +39,15 @@ class SimulationInstruction(Instruction):
             dataset: my_dataset # which dataset to use for implanting the signals
             simulation: my_simulation # how to implanting the signals - definition of the simulation
             export_formats: [AIRR] # in which formats to export the dataset
+            number_of_processes: 4 # how many repertoires to process in parallel
+            batch_size: 1 # how many repertoires a process gets at once
 
     """
 
     def __init__(self, signals: list, simulation: Simulation, dataset: RepertoireDataset,
-                 name: str = None, exporters: List[DataExporter] = None):
+                 name: str = None, exporters: List[DataExporter] = None, number_of_processes: int = 4, batch_size: int = 1):
         self.exporters = exporters
-        self.state = SimulationState(signals, simulation, dataset, name=name)
+        self.state = SimulationState(signals, simulation, dataset, name=name, number_of_processes=number_of_processes, batch_size=batch_size)
 
     def run(self, result_path: Path):
         self.state.result_path = result_path / self.state.name
@@ -40,7 +40,7 @@ class TrainMLModelInstruction(Instruction):
 
         dataset (Dataset): dataset to use for training and assessing the classifier
 
-        hp_strategy (HPOptimizationStrategy): how to search different hyperparameters; common options include grid search, random search. Valid values are objects of any class inheriting :py:obj:`~immuneML.hyperparameter_optimization.strategy.HPOptimizationStrategy.HPOptimizationStrategy`.
+        hp_strategy (HPOptimizationStrategy): how to search different hyperparameters; common options include grid search, random search. Valid values are objects of any class inheriting :py:obj:`~immuneML.hyperparameter_optimization.strategy.HPOptimizationStrategy.HPOptimizationStrategy`. GridSearch evaluates all settings on all selection splits, while SuccessiveHalving first evaluates all settings on a few selection splits and then evaluates only the best performing ones on the remaining splits. The strategy is specified by its name, or by its name and parameters (e.g., `SuccessiveHalving: {reduction_factor: 3}`).
 
         hp_settings (list): a list of combinations of `preprocessing_sequence`, `encoding` and `ml_method`. `preprocessing_sequence` is optional, while `encoding` and `ml_method` are mandatory. These three options (and their parameters) can be optimized over, choosing the highest performing combination.
 
@@ -1,6 +1,10 @@
 import copy
+import dataclasses
+import random
+from functools import partial
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from immuneML.IO.dataset_import.PickleImport import PickleImport
@@ -12,6 +16,7 @@ from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.simulation.SimulationState import SimulationState
 from immuneML.util.FilenameHandler import FilenameHandler
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.WorkerPool import WorkerPool
 from immuneML.workflows.steps.Step import Step
 
 
@@ -56,7 +61,7 @@ class SignalImplanter(Step):
     def _implant_signals_in_repertoires(simulation_state: SimulationState = None) -> Dataset:
 
         PathBuilder.build(simulation_state.result_path / "repertoires")
-        processed_repertoires = SignalImplanter._implant_signals(simulation_state, SignalImplanter._process_repertoire)
+        processed_repertoires = SignalImplanter._implant_signals_in_parallel(simulation_state, SignalImplanter._process_repertoire)
         processed_dataset = RepertoireDataset(repertoires=processed_repertoires, labels={**(simulation_state.dataset.labels if simulation_state.dataset.labels is not None else {}),
                                                                                          **{signal.id: [True, False] for signal in simulation_state.signals}},
                                               name=simulation_state.dataset.name,
@@ -65,13 +70,46 @@ class SignalImplanter(Step):
 
     @staticmethod
     def _implant_signals(simulation_state: SimulationState, process_element_func):
-        processed_elements = []
+        implantings = SignalImplanter._get_implantings(simulation_state)
+        return [process_element_func(index, element, implanting, simulation_state)
+                for index, (element, implanting) in enumerate(zip(simulation_state.dataset.get_data(), implantings))]
+
+    @staticmethod
+    def _implant_signals_in_parallel(simulation_state: SimulationState, process_element_func):
+        """
+        Processes the elements of the dataset with WorkerPool in simulation_state.number_of_processes processes where each process gets
+        simulation_state.batch_size elements at once. Before processing an element, the random number generators in the process are
+        seeded with a seed derived from the index of the element, so that the result does not depend on the number of processes and can
+        be reproduced by setting the seed of numpy's random number generator before the simulation.
+        """
+        implantings = SignalImplanter._get_implantings(simulation_state)
+        seed = np.random.randint(np.iinfo(np.int32).max)
+        worker_state = dataclasses.replace(simulation_state, dataset=None)
+
+        arguments = ((index, element, implanting, seed + index)
+                     for index, (element, implanting) in enumerate(zip(simulation_state.dataset.get_data(), implantings)))
+
+        return WorkerPool.map(partial(SignalImplanter._process_element_with_seed, process_element_func=process_element_func,
+                                      simulation_state=worker_state),
+                              arguments, simulation_state.number_of_processes, chunksize=simulation_state.batch_size)
+
+    @staticmethod
+    def _process_element_with_seed(arguments: tuple, process_element_func, simulation_state: SimulationState):
+        index, element, implanting, seed = arguments
+        random.seed(seed)
+        np.random.seed(seed)
+        return process_element_func(index, element, implanting, simulation_state)
+
+    @staticmethod
+    def _get_implantings(simulation_state: SimulationState) -> list:
+        """for each element in the dataset returns the implanting to be used for that element or None if no signal should be implanted"""
         simulation_limits = SignalImplanter._prepare_simulation_limits(simulation_state.simulation.implantings,
                                                                        simulation_state.dataset.get_example_count())
+        implantings = []
         current_implanting_index = 0
         current_implanting = simulation_state.simulation.implantings[current_implanting_index]
 
-        for index, element in enumerate(simulation_state.dataset.get_data()):
+        for index in range(simulation_state.dataset.get_example_count()):
 
             if current_implanting is not None and index >= simulation_limits[current_implanting.name]:
                 current_implanting_index += 1
@@ -80,10 +118,9 @@ class SignalImplanter(Step):
                 else:
                     current_implanting = None
 
-            processed_element = process_element_func(index, element, current_implanting, simulation_state)
-            processed_elements.append(processed_element)
+            implantings.append(current_implanting)
 
-        return processed_elements
+        return implantings
 
     @staticmethod
     def _process_receptor(index, receptor, implanting, simulation_state) -> Receptor:
@@ -105,8 +142,8 @@ class SignalImplanter(Step):
             return SignalImplanter._implant_in_repertoire(index, repertoire, current_implanting, simulation_state)
 
         else:
-            new_repertoire = Repertoire.build_from_sequence_objects(repertoire.sequences, simulation_state.result_path / "repertoires",
-                                                                    repertoire.metadata)
+            new_repertoire = Repertoire.build_from_columns(repertoire.get_attributes(repertoire.fields), simulation_state.result_path / "repertoires",
+                                                           copy.deepcopy(repertoire.metadata))
 
             for signal in simulation_state.signals:
                 new_repertoire.metadata[f"{signal.id}"] = False
@@ -138,8 +175,9 @@ class SignalImplanter(Step):
                 new_repertoire.metadata[f"{signal.id}"] = False
             else:
                 new_repertoire.metadata[f"{signal.id}"] = True
+        implanted_signal_ids = {signal.id for signal in implanting.signals}
         for signal in simulation_state.signals:
-            if signal not in implanting.signals:
+            if signal.id not in implanted_signal_ids:
                 new_repertoire.metadata[f"{signal.id}"] = False
 
         return new_repertoire
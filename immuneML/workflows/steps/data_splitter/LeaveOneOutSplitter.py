@@ -48,7 +48,7 @@ class LeaveOneOutSplitter:
 
     @staticmethod
     def _get_unique_param_values(dataset, param, min_count):
-        parameter_values = [receptor.metadata[param] for receptor in dataset.get_data()]
+        parameter_values = dataset.get_attributes([param])[param].tolist()
         unique_values, count = np.unique(parameter_values, return_counts=True)
 
         assert all(el > min_count for el in count), f"DataSplitter: there are not enough examples with different values of the parameter {param} " \
@@ -58,12 +58,8 @@ class LeaveOneOutSplitter:
 
     @staticmethod
     def _get_train_test_indices(dataset, unique_values, param):
-        train_indices, test_indices = {value: [] for value in unique_values}, {value: [] for value in unique_values}
-        for index, receptor in enumerate(dataset.get_data()):
-            for value in unique_values:
-                if receptor.metadata[param] == value:
-                    test_indices[value].append(index)
-                else:
-                    train_indices[value].append(index)
+        parameter_values = dataset.get_attributes([param])[param]
+        train_indices = {value: np.flatnonzero(parameter_values != value).tolist() for value in unique_values}
+        test_indices = {value: np.flatnonzero(parameter_values == value).tolist() for value in unique_values}
 
         return train_indices, test_indices
@@ -24,7 +24,8 @@ setup(
                       "regex", "tzlocal", "airr>=1", "pystache==0.5.4", "torch==1.5.1", "numpy>=1.18", "h5py<=2.10.0", "dill>=0.3", "tqdm>=0.24", # Note: h5py v3 does not work with DeepRC, but works with everything else
                       "tensorboard==1.14.0", "requests>=2.21", "plotly>=4", "logomaker>=0.8", "fishersapi", "matplotlib-venn>=0.11", "scipy"],
     extras_require={
-        "TCRdist": ["parasail==1.2", "tcrdist3>=0.1.6"]
+        "TCRdist": ["parasail==1.2", "tcrdist3>=0.1.6"],
+        "CacheCompression": ["lz4>=3.1", "zstandard>=0.15"]
     },
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -42,7 +43,8 @@ setup(
     entry_points={
         'console_scripts': [
             'immune-ml = immuneML.app.ImmuneMLApp:main',
-            'immune-ml-quickstart = immuneML.workflows.instructions.quickstart:main'
+            'immune-ml-quickstart = immuneML.workflows.instructions.quickstart:main',
+            'immune-ml-cache = immuneML.app.ImmuneMLCacheApp:main'
         ]
     },
 )
@@ -79,6 +79,30 @@ rep2.tsv,2""")
 
         shutil.rmtree(path)
 
+    def test_import_repertoire_dataset_in_chunks(self):
+        path = EnvironmentSettings.root_path / "test/tmp/ioairr_chunks/"
+        PathBuilder.build(path)
+        self.create_dummy_dataset(path, True)
+
+        params = {"is_repertoire": True, "result_path": path, "path": path, "metadata_file": path / "metadata.csv",
+                  "import_out_of_frame": False, "import_with_stop_codon": False, "import_illegal_characters": False,
+                  "import_productive": True, "region_type": "IMGT_CDR3", "import_empty_nt_sequences": True, "import_empty_aa_sequences": False,
+                  "column_mapping": self.get_column_mapping(), "separator": "\t", "import_chunk_size": 2}
+
+        dataset = AIRRImport.import_dataset(params, "airr_repertoire_dataset")
+
+        self.assertEqual(2, dataset.get_example_count())
+        repertoire = dataset.repertoires[0]
+        self.assertListEqual(["IVKNQEJ01BVGQ6", "IVKNQEJ01AQVWS", "IVKNQEJ01EI5S4"], list(repertoire.get_sequence_identifiers()))
+        self.assertListEqual(['IGHV4-31', 'IGHV4-31', 'IGHV4-31'], list(repertoire.get_v_genes()))
+        self.assertListEqual([36, 36, 36], list(repertoire.get_attribute("junction_length")))
+        self.assertListEqual(["ASGVAGTFDY", "ASGVAGTFDY", "ASGVAGTFDY"], list(repertoire.get_sequence_aas()))
+        self.assertListEqual([1247, 4, 2913], list(repertoire.get_counts()))
+        self.assertListEqual([Chain.HEAVY for i in range(3)], list(repertoire.get_chains()))
+        self.assertEqual(2, dataset.repertoires[1].get_element_count())
+
+        shutil.rmtree(path)
+
     def test_sequence_dataset(self):
         path = EnvironmentSettings.root_path / "test/tmp/ioairr/"
         PathBuilder.build(path)
@@ -104,6 +104,41 @@ rep2.tsv,TRB,1234a,no"""
 
         shutil.rmtree(path)
 
+    def test_repertoire_import_in_chunks(self):
+        path = EnvironmentSettings.root_path / "test/tmp/adaptive_chunks/"
+        self.build_dummy_dataset(path, True)
+
+        params = DefaultParamsLoader.load(EnvironmentSettings.default_params_path / "datasets/", "ImmunoSEQRearrangement")
+        params["is_repertoire"] = True
+        params['import_empty_nt_sequences'] = False
+        params['import_empty_aa_sequences'] = True
+        params["metadata_file"] = path / "metadata.csv"
+        params["path"] = path
+        params["import_productive"] = True
+        params["import_with_stop_codon"] = True
+        params["import_out_of_frame"] = True
+
+        params["result_path"] = path / "full/"
+        dataset = ImmunoSEQRearrangementImport.import_dataset(params, "adaptive_dataset_full")
+
+        params["result_path"] = path / "chunks/"
+        params["import_chunk_size"] = 3
+        chunked_dataset = ImmunoSEQRearrangementImport.import_dataset(params, "adaptive_dataset_chunks")
+
+        self.assertEqual(2, chunked_dataset.get_example_count())
+        for repertoire, chunked_repertoire in zip(dataset.get_data(), chunked_dataset.get_data()):
+            self.assertEqual(repertoire.metadata["subject_id"], chunked_repertoire.metadata["subject_id"])
+            self.assertEqual(repertoire.get_element_count(), chunked_repertoire.get_element_count())
+            self.assertEqual(sorted(repertoire.fields), sorted(chunked_repertoire.fields))
+            for field in repertoire.fields:
+                if field != "sequence_identifiers":
+                    self.assertListEqual(list(repertoire.get_attribute(field)), list(chunked_repertoire.get_attribute(field)))
+
+        self.assertListEqual(list(chunked_dataset.repertoires[0].get_counts()), [10, 1772, 1763, None, 566, 506, 398, 394, 363, 363])
+        self.assertFalse((path / "chunks/repertoires/rep1_chunks").exists())
+
+        shutil.rmtree(path)
+
     def test_sequence_import(self):
         path = EnvironmentSettings.root_path / "test/tmp/adaptive/"
         self.build_dummy_dataset(path, False)
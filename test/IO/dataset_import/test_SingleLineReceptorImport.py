@@ -3,6 +3,7 @@ import shutil
 from unittest import TestCase
 
 from immuneML.IO.dataset_import.SingleLineReceptorImport import SingleLineReceptorImport
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.caching.CacheType import CacheType
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
@@ -370,7 +371,7 @@ mouse_subject0045,PA,1,TRAV16D/DV11*03,TRAJ53*01,CAMRGNSGGSNYKLTF,tgtgctatgagggg
 
         self.assertEqual(324, dataset.get_example_count())
         self.assertTrue(all(item.identifier is not None for item in dataset.get_data()))
-        self.assertTrue(os.path.isfile(path / "result/batch1.pickle"))
+        self.assertTrue(ColumnarStorage.is_columnar(path / f"result/batch1{ColumnarStorage.SUFFIX}"))
         self.assertTrue(os.path.isfile(path / "result/dataset name 2.iml_dataset"))
         self.assertEqual("mouse", dataset.labels["organism"])
 
@@ -2,6 +2,7 @@ import shutil
 from unittest import TestCase
 
 from immuneML.IO.dataset_import.GenericImport import GenericImport
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 
@@ -80,3 +81,33 @@ rep1.tsv,TRA,1234e,no"""
         self.assertEqual('ASSSFWGSDTGELF', seqs[2].amino_acid_sequence)
 
         shutil.rmtree(path)
+
+    def test_import_sequence_dataset_in_batches(self):
+        path = EnvironmentSettings.root_path / "test/tmp/generic_batches/"
+        self.make_dummy_dataset(path / "data", False)
+        shutil.copyfile(path / "data/rep1.tsv", path / "data/rep2.tsv")
+
+        params = {"is_repertoire": False, "paired": False, "path": path / "data", "import_illegal_characters": False,
+                  "region_type": "IMGT_CDR3", "separator": "\t", "sequence_file_size": 7,
+                  "column_mapping": {"CDR3B AA Sequence": "sequence_aas", "TRBV Gene": "v_genes", "TRBJ Gene": "j_genes"},
+                  "metadata_column_mapping": {"Antigen Protein": "antigen"}}
+
+        dataset = GenericImport.import_dataset({**params, "result_path": path / "result"}, "generic_dataset")
+        chunked_dataset = GenericImport.import_dataset({**params, "result_path": path / "chunked_result", "import_chunk_size": 4},
+                                                       "generic_dataset")
+
+        for imported_dataset in [dataset, chunked_dataset]:
+            self.assertTrue(all(ColumnarStorage.is_columnar(filename) for filename in imported_dataset.get_filenames()))
+            self.assertListEqual([7, 7, 7, 7, 2], [ColumnarStorage.get_element_count(filename) for filename in imported_dataset.get_filenames()])
+            self.assertEqual(30, imported_dataset.get_example_count())
+            self.assertTrue({"PPI", "GAD", "Insulin B"}.issubset(imported_dataset.labels["antigen"]))
+
+        sequences = list(dataset.get_data())
+        self.assertListEqual([sequence.amino_acid_sequence for sequence in sequences],
+                             [sequence.amino_acid_sequence for sequence in chunked_dataset.get_data()])
+        self.assertEqual('ASSLWEKLAKNIQY', sequences[0].amino_acid_sequence)
+        self.assertEqual('TRBV12-4', sequences[0].metadata.v_gene)
+        self.assertEqual('PPI', sequences[0].metadata.custom_params["antigen"])
+        self.assertEqual('ASSLWEKLAKNIQY', sequences[15].amino_acid_sequence)
+
+        shutil.rmtree(path)
@@ -82,4 +82,39 @@ class TestSequenceMatcher(TestCase):
         result = matcher.match_repertoire(repertoire, 0, sequences, 2, SequenceMatchingSummaryType.CLONAL_PERCENTAGE)
         self.assertEqual(0.8, result["clonal_percentage"])
 
+        repertoire_without_counts = Repertoire.build_from_sequence_objects(sequence_objects=[
+            ReceptorSequence(amino_acid_sequence="AAAAAA", identifier="1", metadata=SequenceMetadata(chain="A")),
+            ReceptorSequence(amino_acid_sequence="CCCCCC", identifier="2", metadata=SequenceMetadata(chain="A"))],
+            metadata={"CD": False}, path=path)
+        result = matcher.match_repertoire(repertoire_without_counts, 0, sequences, 2, SequenceMatchingSummaryType.CLONAL_PERCENTAGE)
+        self.assertEqual(0.5, result["clonal_percentage"])
+
+        shutil.rmtree(path)
+
+    def test_match_parallel(self):
+        path = EnvironmentSettings.root_path / "test/tmp/seqmatchparallel/"
+        PathBuilder.build(path)
+
+        repertoires = [Repertoire.build_from_sequence_objects(sequence_objects=[
+            ReceptorSequence(amino_acid_sequence=sequence, identifier=str(index),
+                             metadata=SequenceMetadata(chain="B", v_gene="V1-1", j_gene="J1", count=index + 1))
+            for index, sequence in enumerate(sequences)], metadata={"subject_id": f"s{repertoire_index}"}, path=path)
+            for repertoire_index, sequences in enumerate([["AAAA", "CCCC", "AAAC"], ["DDDD"], ["AAAA", "AAAA"]])]
+
+        dataset = RepertoireDataset(repertoires=repertoires)
+        reference_sequences = [ReceptorSequence("AAAA", metadata=SequenceMetadata(chain="B", v_gene="V1", j_gene="J1")),
+                               ReceptorSequence("CCCA", metadata=SequenceMetadata(chain="B", v_gene="V1-1", j_gene="J1")),
+                               ReceptorSequence("DDDD", metadata=SequenceMetadata(chain="A", v_gene="V1-1", j_gene="J1"))]
+
+        result = SequenceMatcher().match(dataset, reference_sequences, 1, SequenceMatchingSummaryType.COUNT, number_of_processes=2)
+
+        self.assertEqual([0, 1, 2], [repertoire["repertoire_index"] for repertoire in result["repertoires"]])
+        self.assertEqual([["AAAA"], ["CCCA"], ["AAAA"]], [sequence["matching_sequences"] for sequence in result["repertoires"][0]["sequences"]])
+        self.assertEqual([3, 0, 2], [repertoire["count"] for repertoire in result["repertoires"]])
+        self.assertEqual([1., 0., 1.], [repertoire["percentage"] for repertoire in result["repertoires"]])
+        self.assertEqual("s1", result["repertoires"][1]["metadata"]["subject_id"])
+
+        result = SequenceMatcher().match(dataset, reference_sequences, 0, SequenceMatchingSummaryType.CLONAL_PERCENTAGE, number_of_processes=2)
+        self.assertEqual([1 / 6, 0., 1.], [repertoire["clonal_percentage"] for repertoire in result["repertoires"]])
+
         shutil.rmtree(path)
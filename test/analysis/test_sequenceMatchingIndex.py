@@ -0,0 +1,59 @@
+import os
+import random
+import shutil
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.analysis.SequenceMatcher import SequenceMatcher
+from immuneML.analysis.SequenceMatchingIndex import SequenceMatchingIndex
+from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
+from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestSequenceMatchingIndex(TestCase):
+
+    def setUp(self) -> None:
+        os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+
+    def _make_sequences(self, count: int, prefix: str) -> list:
+        return [ReceptorSequence(amino_acid_sequence="".join(random.choices("ACD", k=random.randint(3, 6))), identifier=f"{prefix}{index}",
+                                 metadata=SequenceMetadata(chain=random.choice(["A", "B"]), v_gene=random.choice(["V1", "V1-1", "V1-2", "V2"]),
+                                                           j_gene="J1", count=random.randint(1, 5)))
+                for index in range(count)]
+
+    def test_find_matches(self):
+        random.seed(1)
+        references, sequences = self._make_sequences(60, "r"), self._make_sequences(100, "s")
+        max_distances = [random.randint(0, 2) for _ in references]
+        matcher = SequenceMatcher()
+
+        index = SequenceMatchingIndex(references, max_distances)
+
+        for sequence in sequences:
+            expected = [reference_index for reference_index, reference in enumerate(references)
+                        if matcher.matches_sequence(reference, sequence, max_distances[reference_index])]
+            self.assertEqual(expected, index.find_matches(sequence.get_sequence(), sequence.metadata.v_gene, sequence.metadata.j_gene,
+                                                          sequence.metadata.chain))
+
+    def test_count_repertoire_matches(self):
+        path = EnvironmentSettings.tmp_test_path / "sequence_matching_index/"
+        PathBuilder.build(path)
+
+        random.seed(2)
+        references, sequences = self._make_sequences(30, "r"), self._make_sequences(80, "s")
+        repertoire = Repertoire.build_from_sequence_objects(sequences + sequences[:10], path=path, metadata={})
+        matcher = SequenceMatcher()
+
+        expected = np.array([sum(sequence.metadata.count for sequence in sequences + sequences[:10] if matcher.matches_sequence(reference, sequence, 1))
+                             for reference in references])
+
+        self.assertTrue(np.array_equal(expected, SequenceMatchingIndex(references, 1).count_repertoire_matches(repertoire)))
+        self.assertEqual({"AB", "AC", "BC", "A", "B", "C", "ABC"}, SequenceMatchingIndex.get_deletion_variants("ABC", 2))
+
+        shutil.rmtree(path)
@@ -6,6 +6,7 @@ from unittest import TestCase
 import yaml
 
 from immuneML.app.ImmuneMLApp import run_immuneML
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 
@@ -52,6 +53,6 @@ class TestDatasetGenerationTool(TestCase):
         self.assertTrue(os.path.isfile(result_path / "result/d1_metadata.csv"))
         self.assertTrue(os.path.isfile(result_path / "result/d1.iml_dataset"))
         self.assertEqual(200, len([name for name in os.listdir(result_path / "result/repertoires/")
-                                   if os.path.isfile(os.path.join(result_path / "result/repertoires/", name))]))
+                                   if os.path.isfile(os.path.join(result_path / "result/repertoires/", name)) or name.endswith(ColumnarStorage.SUFFIX)]))
 
         shutil.rmtree(path)
@@ -8,6 +8,7 @@ import numpy as np
 
 from immuneML.api.api_encoding import encode_dataset_by_kmer_freq
 from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
@@ -113,7 +114,7 @@ class TestAPI(TestCase):
 
         encoded_dataset = encode_dataset_by_kmer_freq(path_to_dataset_directory=str(data_path), result_path=str(result_path))
 
-        self.assertEqual(repertoire_count, len(glob.glob(str(result_path / "repertoires/*.npy"))))
+        self.assertEqual(repertoire_count, len(glob.glob(str(result_path / f"repertoires/*{ColumnarStorage.SUFFIX}"))))
         self.assertTrue(os.path.isfile(result_path / "csv_exported/design_matrix.csv"))
         self.assertTrue(os.path.isfile(result_path / "csv_exported/encoding_details.yaml"))
         self.assertTrue(os.path.isfile(result_path / "csv_exported/labels.csv"))
@@ -0,0 +1,54 @@
+import shutil
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from immuneML.caching.ArraySerializer import ArraySerializer
+from immuneML.caching.CacheCompression import CacheCompression
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestArraySerializer(TestCase):
+
+    def test_dump_and_load(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "array_serializer/")
+
+        obj = (sparse.random(20, 50, density=0.1, format="csr", random_state=1), np.arange(100).reshape(10, 10).T,
+               pd.DataFrame({"a": np.arange(5), "b": list("abcde")}), ["feature1", "feature2"])
+
+        for compression in [CacheCompression.NONE, CacheCompression.ZLIB]:
+            serializer = ArraySerializer(compression)
+            serializer.dump(obj, path / f"{compression.value}.pickle")
+
+            with (path / f"{compression.value}.pickle").open("rb") as file:
+                self.assertTrue(ArraySerializer.can_load(file.read(8)))
+
+            loaded = serializer.load(path / f"{compression.value}.pickle")
+
+            self.assertEqual(0, (loaded[0] != obj[0]).nnz)
+            self.assertTrue(np.array_equal(obj[1], loaded[1]))
+            self.assertTrue(loaded[1].flags.writeable)
+            self.assertTrue(obj[2].equals(loaded[2]))
+            self.assertListEqual(obj[3], loaded[3])
+
+        serializer = ArraySerializer()
+        serializer.dump({"fn": lambda x: x + 1}, path / "lambda.pickle")
+        self.assertEqual(3, serializer.load(path / "lambda.pickle")["fn"](2))
+
+        shutil.rmtree(path)
+
+    def test_dump_and_load_without_out_of_band_buffers(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "array_serializer_in_band/")
+
+        with patch.object(ArraySerializer, "OUT_OF_BAND_BUFFERS", False):
+            serializer = ArraySerializer(CacheCompression.ZLIB)
+            serializer.dump({"array": np.arange(10)}, path / "in_band.pickle")
+            loaded = serializer.load(path / "in_band.pickle")
+
+        self.assertTrue(np.array_equal(np.arange(10), loaded["array"]))
+
+        shutil.rmtree(path)
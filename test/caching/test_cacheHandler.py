@@ -1,15 +1,47 @@
-import hashlib
 import os
 import pickle
+import shutil
+from functools import partial
+from pathlib import Path
 from unittest import TestCase
 
+import numpy as np
+
 from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheIndex import CacheIndex
 from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.caching.CacheType import CacheType
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 
 
+class UnpicklableObject:
+
+    def __init__(self, error_class):
+        self.error_class = error_class
+
+    def __reduce__(self):
+        raise self.error_class("cannot be pickled")
+
+
+class SlotsObject:
+    __slots__ = ("value", "__private")
+
+    def __init__(self, value):
+        self.value = value
+        self.__private = value * 2
+
+
+def scale(value, factor=1, *, offset=0):
+    return value * factor + offset
+
+
+def make_scaler(factor):
+    def scale_by(value):
+        return value * factor
+    return scale_by
+
+
 class TestCacheHandler(TestCase):
 
     def setUp(self) -> None:
@@ -20,7 +52,7 @@ class TestCacheHandler(TestCase):
         obj = "object_example"
         object_type = CacheObjectType.OTHER
 
-        h = hashlib.sha256(str(params).encode('utf-8')).hexdigest()
+        h = CacheHandler.generate_cache_key(params)
         filename = EnvironmentSettings.get_cache_path() / "{}/{}.pickle".format(CacheObjectType.OTHER.name.lower(), h)
         with open(filename, "wb") as file:
             pickle.dump(obj, file)
@@ -69,6 +101,18 @@ class TestCacheHandler(TestCase):
         self.assertEqual(obj, obj2)
         os.remove(filename)
 
+    def test_add_by_key_failed(self):
+        filename = CacheHandler._build_filename("failed_key", CacheObjectType.OTHER)
+
+        CacheHandler.add_by_key("failed_key", UnpicklableObject(AttributeError))
+        self.assertFalse(filename.is_file())
+        self.assertEqual([], list(filename.parent.glob(f"{filename.name}.*.tmp")))
+
+        with self.assertRaises(ValueError):
+            CacheHandler.add_by_key("failed_key", UnpicklableObject(ValueError))
+        self.assertFalse(filename.is_file())
+        self.assertEqual([], list(filename.parent.glob(f"{filename.name}.*.tmp")))
+
     def test_memo(self):
         fn = lambda: "abc"
         cache_key = "a123"
@@ -85,3 +129,83 @@ class TestCacheHandler(TestCase):
         self.assertTrue(os.path.isfile(EnvironmentSettings.get_cache_path() / f"encoding/{cache_key}.pickle"))
 
         os.remove(CacheHandler._build_filename(cache_key, CacheObjectType.ENCODING))
+
+    def test_generate_cache_key(self):
+        self.assertEqual(CacheHandler.generate_cache_key((("params", {"a": 1, "b": Path("x/")}),)),
+                         CacheHandler.generate_cache_key((("params", {"b": Path("x/"), "a": 1}),)))
+        self.assertNotEqual(CacheHandler.generate_cache_key((("k", 1),)), CacheHandler.generate_cache_key((("k", "1"),)))
+        self.assertNotEqual(CacheHandler.generate_cache_key((("k", np.array([1, 2])),)),
+                            CacheHandler.generate_cache_key((("k", np.array([1, 3])),)))
+        self.assertEqual(CacheHandler.generate_cache_key((("k", SlotsObject(1)),)), CacheHandler.generate_cache_key((("k", SlotsObject(1)),)))
+        self.assertNotEqual(CacheHandler.generate_cache_key((("k", SlotsObject(1)),)), CacheHandler.generate_cache_key((("k", SlotsObject(2)),)))
+
+    def test_generate_cache_key_for_functions(self):
+        def key(function):
+            return CacheHandler.generate_cache_key((("fn", function),))
+
+        self.assertEqual(key(make_scaler(2)), key(make_scaler(2)))
+        self.assertNotEqual(key(make_scaler(2)), key(make_scaler(3)))
+
+        scale_with_defaults = partial(scale)
+        self.assertEqual(key(partial(scale, factor=2)), key(partial(scale, factor=2)))
+        self.assertNotEqual(key(partial(scale, factor=2)), key(partial(scale, factor=3)))
+        self.assertNotEqual(key(partial(scale, 1)), key(partial(scale, 2)))
+        self.assertNotEqual(key(partial(scale)), key(partial(make_scaler(1))))
+
+        original_defaults, original_kwdefaults = scale.__defaults__, scale.__kwdefaults__
+        original_key = key(scale_with_defaults)
+        try:
+            scale.__defaults__ = (5,)
+            self.assertNotEqual(original_key, key(scale_with_defaults))
+            scale.__defaults__ = original_defaults
+            scale.__kwdefaults__ = {"offset": 5}
+            self.assertNotEqual(original_key, key(scale_with_defaults))
+        finally:
+            scale.__defaults__, scale.__kwdefaults__ = original_defaults, original_kwdefaults
+        self.assertEqual(original_key, key(scale_with_defaults))
+
+    def test_add_with_max_size(self):
+        cache_path = EnvironmentSettings.tmp_test_path / "cache_with_max_size/"
+        EnvironmentSettings.tmp_cache_path, old_cache_path = cache_path, EnvironmentSettings.tmp_cache_path
+        os.environ[Constants.CACHE_MAX_SIZE] = "3K"
+
+        try:
+            for i in range(5):
+                CacheHandler.add_by_key(f"key{i}", "a" * 1000)
+                CacheHandler.get_by_key("key0", CacheObjectType.OTHER)
+
+            self.assertLessEqual(CacheIndex.get_total_size(cache_path), 3 * 1024)
+            self.assertEqual("a" * 1000, CacheHandler.get_by_key("key0", CacheObjectType.OTHER))
+            self.assertIsNone(CacheHandler.get_by_key("key1", CacheObjectType.OTHER))
+            self.assertEqual("a" * 1000, CacheHandler.get_by_key("key4", CacheObjectType.OTHER))
+        finally:
+            del os.environ[Constants.CACHE_MAX_SIZE]
+            EnvironmentSettings.tmp_cache_path = old_cache_path
+            shutil.rmtree(cache_path)
+
+    def test_get_from_memory(self):
+        self.assertEqual(0, CacheHandler.get_memory_cache().max_size)
+
+        cache_path = EnvironmentSettings.tmp_test_path / "cache_in_memory/"
+        EnvironmentSettings.tmp_cache_path, old_cache_path = cache_path, EnvironmentSettings.tmp_cache_path
+        os.environ[Constants.CACHE_MEMORY_MAX_SIZE] = "1M"
+
+        try:
+            cache_key = "memory_key"
+            CacheHandler.add_by_key(cache_key, ["object_example"])
+            self.assertEqual(0, CacheHandler.get_memory_cache().get_stats()["entry_count"])
+
+            obj = CacheHandler.get_by_key(cache_key, CacheObjectType.OTHER)
+            self.assertListEqual(["object_example"], obj)
+            obj.append("modified")
+            self.assertListEqual(["object_example"], CacheHandler.get_by_key(cache_key, CacheObjectType.OTHER))
+            self.assertListEqual(["object_example"], CacheHandler.get_by_key(cache_key, CacheObjectType.OTHER))
+            self.assertEqual(2, CacheHandler.get_memory_cache().hit_count)
+            self.assertEqual(1, CacheIndex.get_stats(cache_path)["hit_count"])
+
+            os.remove(CacheHandler._build_filename(cache_key, CacheObjectType.OTHER))
+            self.assertIsNone(CacheHandler.get_by_key(cache_key, CacheObjectType.OTHER))
+        finally:
+            del os.environ[Constants.CACHE_MEMORY_MAX_SIZE]
+            EnvironmentSettings.tmp_cache_path = old_cache_path
+            shutil.rmtree(cache_path)
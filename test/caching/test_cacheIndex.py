@@ -0,0 +1,92 @@
+import shutil
+import time
+from unittest import TestCase
+
+from immuneML.caching.CacheEvictionPolicy import CacheEvictionPolicy
+from immuneML.caching.CacheIndex import CacheIndex
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestCacheIndex(TestCase):
+
+    def _create_entries(self, path):
+        PathBuilder.build(path / "encoding")
+        filenames = []
+        for i in range(3):
+            filename = path / f"encoding/entry{i}.pickle"
+            filename.write_bytes(b"a" * 100)
+            CacheIndex.add_entry(path, filename)
+            filenames.append(filename)
+            time.sleep(0.01)
+        return filenames
+
+    def test_evict(self):
+        path = EnvironmentSettings.tmp_test_path / "cache_index_evict/"
+        shutil.rmtree(path, ignore_errors=True)
+
+        filenames = self._create_entries(path)
+        CacheIndex.record_hit(path, filenames[1])
+        time.sleep(0.01)
+        CacheIndex.record_hit(path, filenames[0])
+        CacheIndex.record_hit(path, filenames[0])
+
+        self.assertEqual(["encoding/entry2.pickle"], CacheIndex.evict(path, 250, CacheEvictionPolicy.LFU))
+        self.assertEqual(["encoding/entry1.pickle"], CacheIndex.evict(path, 150, CacheEvictionPolicy.LRU))
+        self.assertTrue(filenames[0].is_file())
+        self.assertFalse(filenames[1].is_file() or filenames[2].is_file())
+
+        stats = CacheIndex.get_stats(path)
+        self.assertEqual(1, stats["entry_count"])
+        self.assertEqual(100, stats["size"])
+        self.assertEqual(2, stats["types"]["encoding"]["hit_count"])
+
+        shutil.rmtree(path)
+
+    def test_synchronize(self):
+        path = EnvironmentSettings.tmp_test_path / "cache_index_synchronize/"
+        shutil.rmtree(path, ignore_errors=True)
+
+        filenames = self._create_entries(path)
+        filenames[0].unlink()
+        (path / "encoding/not_indexed.pickle").write_bytes(b"a" * 50)
+        PathBuilder.build(path / f"{CacheIndex.FILES_DIRECTORY}/deeprc/")
+        (path / f"{CacheIndex.FILES_DIRECTORY}/deeprc/dataset.hdf5").write_bytes(b"a" * 500)
+
+        CacheIndex.synchronize(path)
+
+        self.assertEqual(250, CacheIndex.get_total_size(path))
+        self.assertEqual(3, CacheIndex.get_stats(path)["entry_count"])
+
+        CacheIndex.evict(path, 0)
+        self.assertEqual(0, CacheIndex.get_stats(path)["entry_count"])
+        self.assertTrue((path / f"{CacheIndex.FILES_DIRECTORY}/deeprc/dataset.hdf5").is_file())
+
+        shutil.rmtree(path)
+
+    def test_total_size(self):
+        path = EnvironmentSettings.tmp_test_path / "cache_index_total_size/"
+        shutil.rmtree(path, ignore_errors=True)
+
+        filenames = self._create_entries(path)
+        self.assertIs(CacheIndex._connect(path), CacheIndex._connect(path))
+
+        filenames[0].write_bytes(b"a" * 150)
+        self.assertEqual(350, CacheIndex.add_entry(path, filenames[0]))
+        time.sleep(0.01)
+        CacheIndex.record_hit(path, filenames[1])
+        self.assertEqual(["encoding/entry2.pickle", "encoding/entry0.pickle"], CacheIndex.evict(path, 200))
+        self.assertEqual(100, CacheIndex.get_total_size(path))
+
+        shutil.rmtree(path)
+        self._create_entries(path)
+        self.assertEqual(300, CacheIndex.get_total_size(path))
+
+        CacheIndex.close()
+        shutil.rmtree(path)
+
+    def test_parse_size(self):
+        self.assertEqual(500, CacheIndex.parse_size("500"))
+        self.assertEqual(1536, CacheIndex.parse_size("1.5K"))
+        self.assertEqual(20 * 1024 ** 3, CacheIndex.parse_size("20GB"))
+        self.assertRaises(AssertionError, CacheIndex.parse_size, "20 apples")
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+import numpy as np
+from scipy import sparse
+
+from immuneML.caching.MemoryCache import MemoryCache
+
+
+class TestMemoryCache(TestCase):
+
+    def test_get_and_put(self):
+        cache = MemoryCache(max_size=100)
+
+        self.assertTrue(cache.put("a", "object_a", version=1, size=40))
+        self.assertTrue(cache.put("b", "object_b", version=1, size=40))
+        self.assertEqual("object_a", cache.get("a", version=1))
+
+        cache.put("c", "object_c", version=1, size=40)
+
+        self.assertIsNone(cache.get("b", version=1))
+        self.assertEqual("object_c", cache.get("c", version=1))
+        self.assertIsNone(cache.get("a", version=2))
+        self.assertIsNone(cache.get("a", version=1))
+
+        self.assertFalse(cache.put("d", "object_d", size=200))
+        self.assertIsNone(cache.get("d"))
+
+        self.assertDictEqual({"entry_count": 1, "size": 40, "max_size": 100, "hit_count": 2, "miss_count": 4}, cache.get_stats())
+
+    def test_get_returns_copy(self):
+        cache = MemoryCache(max_size=10 ** 6)
+        obj = {"array": np.arange(10), "values": [1, 2]}
+
+        cache.put("a", obj, version=1)
+
+        cached = cache.get("a", version=1)
+        self.assertIsNot(obj, cached)
+        cached["values"].append(3)
+        cached["array"][0] = 100
+
+        cached = cache.get("a", version=1)
+        self.assertListEqual([1, 2], cached["values"])
+        self.assertEqual(0, cached["array"][0])
+        self.assertFalse(MemoryCache(max_size=0).put("a", obj))
+
+    def test_get_size(self):
+        self.assertGreaterEqual(MemoryCache.get_size(np.zeros(1000)), 8000)
+        self.assertGreaterEqual(MemoryCache.get_size({"a": np.zeros(1000), "b": np.zeros(1000)}), 16000)
+        self.assertGreaterEqual(MemoryCache.get_size(sparse.csr_matrix(np.ones((10, 100)))), 8000)
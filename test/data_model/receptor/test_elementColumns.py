@@ -0,0 +1,61 @@
+import shutil
+from unittest import TestCase
+
+from immuneML.data_model.receptor.BCReceptor import BCReceptor
+from immuneML.data_model.receptor.ElementColumns import ElementColumns
+from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
+from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestElementColumns(TestCase):
+
+    def make_sequence(self, index: int, chain: str):
+        return ReceptorSequence(amino_acid_sequence="CASS" + "A" * index, identifier=f"{chain}{index}",
+                                metadata=SequenceMetadata(v_gene=f"{chain}V{index}-1", chain=chain, count=index,
+                                                          custom_params={"epitope": f"ep{index % 2}"}))
+
+    def test_sequences(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "element_columns_sequences/")
+
+        sequences = [self.make_sequence(index, "TRB") for index in range(5)]
+        sequences[3].metadata.count = None
+        ElementColumns.write(sequences, path / "batch")
+
+        loaded = ElementColumns.read(path / "batch")
+
+        self.assertEqual(5, len(loaded))
+        for sequence, loaded_sequence in zip(sequences, loaded):
+            self.assertEqual(sequence.identifier, loaded_sequence.identifier)
+            self.assertEqual(sequence.amino_acid_sequence, loaded_sequence.amino_acid_sequence)
+            self.assertIsNone(loaded_sequence.nucleotide_sequence)
+            self.assertEqual(sequence.metadata.v_gene, loaded_sequence.metadata.v_gene)
+            self.assertEqual(Chain.BETA, loaded_sequence.metadata.chain)
+            self.assertEqual(sequence.metadata.count, loaded_sequence.metadata.count)
+            self.assertEqual(sequence.metadata.custom_params, loaded_sequence.metadata.custom_params)
+
+        shutil.rmtree(path)
+
+    def test_receptors(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "element_columns_receptors/")
+
+        receptors = [TCABReceptor(alpha=self.make_sequence(index, "TRA"), beta=self.make_sequence(index, "TRB"), identifier=str(index),
+                                  metadata={"epitope": f"ep{index % 2}"}) for index in range(3)] + \
+                    [BCReceptor(heavy=self.make_sequence(3, "IGH"), light=self.make_sequence(3, "IGL"), identifier="3", metadata={})]
+        ElementColumns.write(receptors, path / "batch")
+
+        loaded = ElementColumns.read(path / "batch")
+
+        self.assertListEqual([TCABReceptor] * 3 + [BCReceptor], [type(receptor) for receptor in loaded])
+        self.assertListEqual(["0", "1", "2", "3"], [receptor.identifier for receptor in loaded])
+        self.assertListEqual(["ep0", "ep1", "ep0", None], [receptor.metadata["epitope"] for receptor in loaded])
+        self.assertEqual("CASSAA", loaded[2].alpha.amino_acid_sequence)
+        self.assertEqual("TRB2", loaded[2].beta.identifier)
+        self.assertEqual(Chain.ALPHA, loaded[0].alpha.metadata.chain)
+        self.assertEqual("IGHV3-1", loaded[3].heavy.metadata.v_gene)
+        self.assertEqual("IGL3", loaded[3].light.identifier)
+
+        shutil.rmtree(path)
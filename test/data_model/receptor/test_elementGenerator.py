@@ -2,10 +2,13 @@ import pickle
 import shutil
 from unittest import TestCase
 
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
 from immuneML.data_model.receptor.BCReceptor import BCReceptor
+from immuneML.data_model.receptor.ElementColumns import ElementColumns
 from immuneML.data_model.receptor.ElementGenerator import ElementGenerator
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 
@@ -76,4 +79,54 @@ class TestElementGenerator(TestCase):
 
         shutil.rmtree(path)
 
+    def test_make_subset_columnar(self):
+        sequences = [ReceptorSequence(amino_acid_sequence="A" * (i % 5 + 1), identifier=str(i),
+                                      metadata=SequenceMetadata(custom_params={"l1": i % 2})) for i in range(100)]
+
+        path = EnvironmentSettings.tmp_test_path / "element_generator_columnar_subset/"
+        PathBuilder.build(path)
+
+        d = SequenceDataset.build(sequences, 30, path)
+
+        self.assertTrue(all(ColumnarStorage.is_columnar(filename) for filename in d.get_filenames()))
+        self.assertEqual(100, d.get_example_count())
+        self.assertListEqual([str(i) for i in range(100)], d.get_example_ids())
+
+        attributes = d.get_attributes(["sequence_aas", "l1", "v_genes"])
+        self.assertListEqual([sequence.amino_acid_sequence for sequence in sequences], attributes["sequence_aas"].tolist())
+        self.assertListEqual([i % 2 for i in range(100)], attributes["l1"].tolist())
+        self.assertTrue(all(value is None for value in attributes["v_genes"]))
+
+        indices = [92, 1, 20, 21, 29, 30, 50, 52, 59, 60, 99]
+
+        d2 = d.make_subset(indices, path, SequenceDataset.TRAIN)
+
+        self.assertEqual(4, len(d2.get_filenames()))
+        self.assertEqual(11, d2.get_example_count())
+        self.assertListEqual([str(i) for i in sorted(indices)], d2.get_example_ids())
+        self.assertListEqual([str(i) for i in sorted(indices)], [sequence.identifier for sequence in d2.get_data()])
+        self.assertListEqual([i % 2 for i in sorted(indices)], [sequence.metadata.custom_params["l1"] for sequence in d2.get_data()])
+
+        d3 = d2.make_subset([0, 10], path, SequenceDataset.TEST)
+        self.assertListEqual(["1", "99"], d3.get_example_ids())
+
+        shutil.rmtree(path)
+
+    def test_get_identifiers(self):
+        path = EnvironmentSettings.tmp_test_path / "element_generator_identifiers/"
+        PathBuilder.build(path)
+
+        receptors = [BCReceptor(identifier=str(i), metadata={"l1": i}) for i in range(10)]
+
+        with (path / "batch0.pkl").open("wb") as file:
+            pickle.dump(receptors[:5], file)
+        ElementColumns.write(receptors[5:], path / f"batch1{ColumnarStorage.SUFFIX}")
+
+        generator = ElementGenerator([path / "batch0.pkl", path / f"batch1{ColumnarStorage.SUFFIX}"], file_size=5)
+
+        self.assertEqual(10, generator.get_element_count())
+        self.assertListEqual([str(i) for i in range(10)], generator.get_identifiers())
+        self.assertListEqual(list(range(10)), generator.get_attributes(["l1"])["l1"].tolist())
+
+        shutil.rmtree(path)
 
@@ -28,10 +28,13 @@ class TestRepertoire(TestCase):
 
         obj = Repertoire.build_from_sequence_objects(sequences, path, {"cmv": "yes", 'subject_id': "1"})
 
-        self.assertTrue(os.path.isfile(obj.data_filename))
+        self.assertTrue(os.path.isdir(obj.data_filename))
         self.assertTrue(isinstance(obj, Repertoire))
         self.assertTrue(np.array_equal(np.array(["1", "2"]), obj.get_sequence_identifiers()))
         self.assertTrue(np.array_equal(np.array(["AAA", "CCC"]), obj.get_sequence_aas()))
+        buffer, offsets = obj.get_sequence_buffer()
+        self.assertEqual(b"AAACCC", buffer.tobytes())
+        self.assertListEqual([0, 3, 6], offsets.tolist())
         self.assertTrue(np.array_equal(np.array(["V1", None]), obj.get_v_genes()))
         self.assertTrue(np.array_equal(np.array([None, "J1"]), obj.get_j_genes()))
         self.assertTrue(np.array_equal(np.array(["no", "yes"]), obj.get_attribute("cmv")))
@@ -55,6 +58,21 @@ class TestRepertoire(TestCase):
 
         shutil.rmtree(path)
 
+    def test_get_counts(self):
+        path = EnvironmentSettings.tmp_test_path / "repertoire_counts/"
+        PathBuilder.build(path)
+
+        counts = Repertoire.build(sequence_aas=["AAA", "CCC"], counts=[3, 5], path=path).get_counts()
+        self.assertTrue(np.issubdtype(counts.dtype, np.integer))
+        self.assertListEqual([3, 5], counts.tolist())
+
+        counts = Repertoire.build(sequence_aas=["AAA", "CCC"], counts=[3, None], path=path).get_counts()
+        self.assertListEqual([3, None], counts.tolist())
+
+        self.assertIsNone(Repertoire.build(sequence_aas=["AAA", "CCC"], path=path).get_counts())
+
+        shutil.rmtree(path)
+
     def test_receptor(self):
         path = EnvironmentSettings.tmp_test_path / "receptortestingpathrepertoire/"
         PathBuilder.build(path)
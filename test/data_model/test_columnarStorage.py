@@ -0,0 +1,126 @@
+import shutil
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.data_model.ColumnType import ColumnType
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
+from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestColumnarStorage(TestCase):
+
+    def test_write_and_read(self):
+        path = EnvironmentSettings.tmp_test_path / "columnar_storage/"
+        PathBuilder.build(path)
+
+        columns = {"sequence_aas": ["AAA", "CCCC", None, "ÄD"],
+                   "v_genes": ["V1", "V2", "V1", None],
+                   "chains": [Chain.BETA, Chain.BETA, Chain.ALPHA, Chain.BETA],
+                   "counts": ["1", "20", None, "3"],
+                   "sequence_identifiers": [0, 1, 2, 3],
+                   "score": [0.5, 1., 2, None],
+                   "flag": [True, False, None, True]}
+
+        storage_path = ColumnarStorage.write(path / f"rep{ColumnarStorage.SUFFIX}", columns,
+                                             {"v_genes": ColumnType.CATEGORICAL, "chains": ColumnType.CATEGORICAL,
+                                              "counts": ColumnType.INTEGER})
+
+        self.assertTrue(ColumnarStorage.is_columnar(storage_path))
+        self.assertEqual(4, ColumnarStorage.get_element_count(storage_path))
+        self.assertEqual(list(columns.keys()), ColumnarStorage.get_column_names(storage_path))
+
+        header = ColumnarStorage.read_header(storage_path)
+        self.assertEqual("STRING", header["columns"]["sequence_aas"]["type"])
+        self.assertEqual("CATEGORICAL", header["columns"]["v_genes"]["type"])
+        self.assertEqual("INTEGER", header["columns"]["counts"]["type"])
+        self.assertEqual("OBJECT", header["columns"]["flag"]["type"])
+
+        self.assertListEqual(["AAA", "CCCC", None, "ÄD"], ColumnarStorage.read_column(storage_path, "sequence_aas").tolist())
+        self.assertListEqual(["V1", "V2", "V1", None], ColumnarStorage.read_column(storage_path, "v_genes").tolist())
+        self.assertListEqual([Chain.BETA, Chain.BETA, Chain.ALPHA, Chain.BETA], ColumnarStorage.read_column(storage_path, "chains").tolist())
+        self.assertListEqual([1, 20, None, 3], ColumnarStorage.read_column(storage_path, "counts").tolist())
+        self.assertListEqual([0, 1, 2, 3], ColumnarStorage.read_column(storage_path, "sequence_identifiers").tolist())
+        self.assertListEqual([0.5, 1., 2., None], ColumnarStorage.read_column(storage_path, "score").tolist())
+        self.assertListEqual([True, False, None, True], ColumnarStorage.read_column(storage_path, "flag").tolist())
+        self.assertIsNone(ColumnarStorage.read_column(storage_path, "j_genes"))
+
+        buffer, offsets = ColumnarStorage.read_string_buffer(storage_path, "sequence_aas")
+        self.assertEqual(np.uint8, buffer.dtype)
+        self.assertListEqual([0, 3, 7, 7, 10], offsets.tolist())
+
+        data = ColumnarStorage.read_structured_array(storage_path)
+        self.assertEqual(4, data.shape[0])
+        self.assertEqual("CCCC", data["sequence_aas"][1])
+
+        subset_path = ColumnarStorage.take(storage_path, [3, 1], path / f"subset{ColumnarStorage.SUFFIX}")
+
+        self.assertEqual(2, ColumnarStorage.get_element_count(subset_path))
+        self.assertListEqual(["ÄD", "CCCC"], ColumnarStorage.read_column(subset_path, "sequence_aas").tolist())
+        self.assertListEqual([None, "V2"], ColumnarStorage.read_column(subset_path, "v_genes").tolist())
+        self.assertListEqual([3, 20], ColumnarStorage.read_column(subset_path, "counts").tolist())
+        self.assertFalse(ColumnarStorage.read_header(subset_path)["columns"]["counts"]["has_none"])
+        self.assertListEqual([True, False], ColumnarStorage.read_column(subset_path, "flag").tolist())
+
+        shutil.rmtree(path)
+
+    def test_concatenate(self):
+        path = EnvironmentSettings.tmp_test_path / "columnar_storage_concatenate/"
+
+        column_types = {"v_genes": ColumnType.CATEGORICAL, "counts": ColumnType.INTEGER}
+        first = ColumnarStorage.write(path / f"first{ColumnarStorage.SUFFIX}",
+                                      {"sequence_aas": ["AAA", None], "v_genes": ["V2", "V1"], "counts": [1, 2], "score": [1, 2]}, column_types)
+        second = ColumnarStorage.write(path / f"second{ColumnarStorage.SUFFIX}",
+                                       {"sequence_aas": ["ÄD"], "v_genes": ["V3"], "counts": [None], "score": [0.5], "flag": [True]}, column_types)
+        third = ColumnarStorage.write(path / f"third{ColumnarStorage.SUFFIX}", {"sequence_aas": ["CC", "D"], "v_genes": [None, "V1"],
+                                                                              "counts": [3, 4], "score": [None, 2.5]}, column_types)
+
+        result = ColumnarStorage.concatenate([first, second, third], path / f"result{ColumnarStorage.SUFFIX}", column_types)
+
+        self.assertEqual(5, ColumnarStorage.get_element_count(result))
+        self.assertListEqual(["sequence_aas", "v_genes", "counts", "score", "flag"], ColumnarStorage.get_column_names(result))
+        self.assertListEqual(["AAA", None, "ÄD", "CC", "D"], ColumnarStorage.read_column(result, "sequence_aas").tolist())
+        self.assertListEqual(["V2", "V1", "V3", None, "V1"], ColumnarStorage.read_column(result, "v_genes").tolist())
+        self.assertListEqual([1, 2, None, 3, 4], ColumnarStorage.read_column(result, "counts").tolist())
+        self.assertListEqual([1., 2., 0.5, None, 2.5], ColumnarStorage.read_column(result, "score").tolist())
+        self.assertListEqual([None, None, True, None, None], ColumnarStorage.read_column(result, "flag").tolist())
+        self.assertEqual("FLOAT", ColumnarStorage.read_header(result)["columns"]["score"]["type"])
+
+        shutil.rmtree(path)
+
+    def test_integer_conversion(self):
+        path = EnvironmentSettings.tmp_test_path / "columnar_storage_integer/"
+
+        storage_path = ColumnarStorage.write(path / f"rep{ColumnarStorage.SUFFIX}", {"counts": ["1", 2.0, None], "score": ["1", 2.5, None]},
+                                             {"counts": ColumnType.INTEGER, "score": ColumnType.INTEGER})
+
+        self.assertEqual("INTEGER", ColumnarStorage.get_column_type(storage_path, "counts").name)
+        self.assertListEqual([1, 2, None], ColumnarStorage.read_column(storage_path, "counts").tolist())
+        self.assertNotEqual("INTEGER", ColumnarStorage.get_column_type(storage_path, "score").name)
+        self.assertListEqual(["1", 2.5, None], ColumnarStorage.read_column(storage_path, "score").tolist())
+
+        shutil.rmtree(path)
+
+    def test_invalid_column_names(self):
+        path = EnvironmentSettings.tmp_test_path / "columnar_storage_invalid_names/"
+
+        with self.assertRaises(AssertionError):
+            ColumnarStorage.write(path / f"rep{ColumnarStorage.SUFFIX}", {"sequence_aas": ["AAA"], "sequence_aas_offsets": ["CCC"]})
+        with self.assertRaises(AssertionError):
+            ColumnarStorage.write(path / f"rep{ColumnarStorage.SUFFIX}", {"counts": [1], "counts_none": [2]})
+        with self.assertRaises(AssertionError):
+            ColumnarStorage.write(path / f"rep{ColumnarStorage.SUFFIX}", {"../counts": [1]})
+
+        self.assertFalse(path.exists())
+
+    def test_empty(self):
+        path = EnvironmentSettings.tmp_test_path / "columnar_storage_empty/"
+
+        storage_path = ColumnarStorage.write(path / f"rep{ColumnarStorage.SUFFIX}", {"sequence_aas": [], "counts": []})
+
+        self.assertEqual(0, ColumnarStorage.get_element_count(storage_path))
+        self.assertEqual(0, ColumnarStorage.read_column(storage_path, "sequence_aas").shape[0])
+
+        shutil.rmtree(path)
@@ -1,8 +1,11 @@
+import importlib.util
 import os
 import shutil
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
+import h5py
+import numpy as np
 import pandas as pd
 
 from immuneML.caching.CacheType import CacheType
@@ -23,13 +26,103 @@ class TestDeepRCEncoder(TestCase):
         os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
 
     def create_datasets(self, path: Path):
-        repertoires, metadata = RepertoireBuilder.build([["A", "B"], ["B", "C"], ["D"], ["E", "F"]], path,
+        repertoires, metadata = RepertoireBuilder.build([["A", "C"], ["C", "D"], ["E"], ["F", "G"]], path,
                                                       {"l1": [1, 0, 1, 0], "l2": [2, 3, 2, 3]})
 
         main_dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
         sub_dataset = main_dataset.make_subset([0, 1], path=path, dataset_type="subset")
         return main_dataset, sub_dataset
 
+    def test_write_hdf5_file(self):
+        path = EnvironmentSettings.tmp_test_path / "deeprc_encoder_hdf5/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build([["AC", "CDE"], ["W"]], path, {"l1": [True, False]},
+                                                      seq_metadata=[[{"count": 3}, {"count": 5}], [{"count": 2}]])
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        DeepRCEncoder.write_hdf5_file(dataset, ["l1"], path / "dataset.hdf5")
+
+        with h5py.File(str(path / "dataset.hdf5"), 'r') as hf:
+            self.assertListEqual([2, 3, 1], list(hf['sampledata']['seq_lens'][:]))
+            self.assertListEqual([3, 5, 2], list(hf['sampledata']['counts_per_sequence'][:]))
+            self.assertListEqual([[0, 2], [2, 3]], hf['sampledata']['sample_sequences_start_end'][:].tolist())
+            self.assertListEqual([2, 1], list(hf['sampledata']['n_sequences_per_sample'][:]))
+            self.assertListEqual([[0, 1, -1], [1, 2, 3], [18, -1, -1]], hf['sampledata']['amino_acid_sequences'][:].tolist())
+            self.assertListEqual(dataset.get_repertoire_ids(), [str(key) for key in hf['metadata']['sample_keys'][:]])
+            self.assertListEqual(["l1"], [str(name) for name in hf['metadata']['target_feature_names'][:]])
+            self.assertListEqual([["True"], ["False"]], [[str(value) for value in row] for row in hf['metadata']['target_features'][:]])
+            self.assertEqual(2, hf['metadata']['n_samples'][()])
+
+        shutil.rmtree(path)
+
+    @skipUnless(importlib.util.find_spec("deeprc") is not None, "DeepRC is not installed")
+    def test_write_hdf5_file_as_deeprc(self):
+        from deeprc.deeprc_binary.dataset_converters import DatasetToHDF5
+
+        path = EnvironmentSettings.tmp_test_path / "deeprc_encoder_converter/"
+        PathBuilder.build(path / "tsv/")
+
+        repertoires, metadata = RepertoireBuilder.build([["ACDE", "CDEFGH"], ["WY", "KLMNPQRST"]], path, {"l1": [1, 0]},
+                                                      seq_metadata=[[{"count": 3}, {"count": 5}], [{"count": 2}, {"count": 1}]])
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        for repertoire in dataset.repertoires:
+            pd.DataFrame({"amino_acid": repertoire.get_sequence_aas(), "templates": repertoire.get_counts()}) \
+                .to_csv(path / f"tsv/{repertoire.identifier}.tsv", sep="\t", index=False)
+        pd.DataFrame({"ID": dataset.get_repertoire_ids(), "l1": [1, 0]}).to_csv(path / "tsv/metadata.tsv", sep="\t", index=False)
+
+        DatasetToHDF5(metadata_file=str(path / "tsv/metadata.tsv"), id_column="ID", single_class_label_columns=("l1",),
+                      sequence_column="amino_acid", sequence_counts_column="templates", column_sep="\t", filename_extension=".tsv",
+                      verbose=False).save_data_to_file(output_file=str(path / "deeprc.hdf5"), n_workers=1)
+        DeepRCEncoder.write_hdf5_file(dataset, ["l1"], path / "encoder.hdf5")
+
+        with h5py.File(str(path / "deeprc.hdf5"), 'r') as expected, h5py.File(str(path / "encoder.hdf5"), 'r') as written:
+            for key in expected['sampledata'].keys():
+                self.assertEqual(expected['sampledata'][key].dtype, written['sampledata'][key].dtype, key)
+                self.assertListEqual(expected['sampledata'][key][:].tolist(), written['sampledata'][key][:].tolist(), key)
+            for key in expected['metadata'].keys():
+                self.assertIn(key, written['metadata'], key)
+
+        shutil.rmtree(path)
+
+    @skipUnless(importlib.util.find_spec("deeprc") is not None, "DeepRC is not installed")
+    def test_read_hdf5_file_with_deeprc(self):
+        from deeprc.deeprc_binary.dataset_converters import DatasetToHDF5
+        from deeprc.deeprc_binary.dataset_readers import RepertoireDataReaderBinary
+
+        path = EnvironmentSettings.tmp_test_path / "deeprc_encoder_reader/"
+        PathBuilder.build(path / "tsv/")
+
+        repertoires, metadata = RepertoireBuilder.build([["ACDE", "CDEFGH", "Y"], ["WY", "KLMNPQRST"], ["GGG"]], path, {"l1": [1, 0, 1]},
+                                                      seq_metadata=[[{"count": 3}, {"count": 5}, {"count": 7}],
+                                                                    [{"count": 2}, {"count": 1}], [{"count": 4}]])
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        for repertoire in dataset.repertoires:
+            pd.DataFrame({"amino_acid": repertoire.get_sequence_aas(), "templates": repertoire.get_counts()}) \
+                .to_csv(path / f"tsv/{repertoire.identifier}.tsv", sep="\t", index=False)
+        pd.DataFrame({"ID": dataset.get_repertoire_ids(), "l1": [1, 0, 1]}).to_csv(path / "tsv/metadata.tsv", sep="\t", index=False)
+
+        DatasetToHDF5(metadata_file=str(path / "tsv/metadata.tsv"), id_column="ID", single_class_label_columns=("l1",),
+                      sequence_column="amino_acid", sequence_counts_column="templates", column_sep="\t", filename_extension=".tsv",
+                      verbose=False).save_data_to_file(output_file=str(path / "deeprc.hdf5"), n_workers=1)
+        DeepRCEncoder.write_hdf5_file(dataset, ["l1"], path / "encoder.hdf5")
+
+        indices = [2, 0]
+        expected = RepertoireDataReaderBinary(hdf5_filepath=str(path / "deeprc.hdf5"), set_inds=indices, target_label="l1",
+                                              true_class_label_value="1", verbose=False)
+        written = RepertoireDataReaderBinary(hdf5_filepath=str(path / "encoder.hdf5"), set_inds=indices, target_label="l1",
+                                             true_class_label_value="1", verbose=False)
+
+        self.assertEqual(len(expected), len(written))
+        for expected_sample, written_sample in zip(expected, written):
+            self.assertEqual(len(expected_sample), len(written_sample))
+            for expected_value, written_value in zip(expected_sample, written_sample):
+                self.assertListEqual(np.asarray(expected_value).tolist(), np.asarray(written_value).tolist())
+
+        shutil.rmtree(path)
+
     def test_encode(self):
         path = EnvironmentSettings.tmp_test_path / "deeprc_encoder/"
         PathBuilder.build(path)
@@ -41,20 +134,18 @@ class TestDeepRCEncoder(TestCase):
 
         enc.set_context({"dataset": main_dataset})
 
-        encoded = enc.encode(sub_dataset, EncoderParams(result_path=path / "encoded_data/",
-                                                        label_config=LabelConfiguration([Label("l1", [0, 1]), Label("l2", [2, 3])]),
-                                                        pool_size=4))
+        label_config = LabelConfiguration([Label("l1", [0, 1]), Label("l2", [2, 3])])
+        encoded = enc.encode(sub_dataset, EncoderParams(result_path=path / "encoded_data/", label_config=label_config, pool_size=4))
 
         self.assertListEqual(encoded.encoded_data.example_ids, sub_dataset.get_repertoire_ids())
-        self.assertTrue(os.path.isfile(encoded.encoded_data.info["metadata_filepath"]))
+        self.assertTrue(os.path.isfile(encoded.encoded_data.info["hdf5_filepath"]))
+        self.assertListEqual([0, 1], encoded.encoded_data.info["indices"])
+        self.assertEqual(1, encoded.encoded_data.info["max_sequence_length"])
 
-        metadata_content = pd.read_csv(encoded.encoded_data.info["metadata_filepath"], sep="\t")
-        self.assertListEqual(list(metadata_content["ID"]), sub_dataset.get_repertoire_ids())
+        encoded_main = enc.encode(main_dataset, EncoderParams(result_path=path / "encoded_main/", label_config=label_config, pool_size=4))
 
-        for repertoire in main_dataset.repertoires:
-            rep_path = path / f"encoded_data/encoding/{repertoire.identifier}.tsv"
-            self.assertTrue(os.path.isfile(rep_path))
-            repertoire_tsv = pd.read_csv(rep_path, sep="\t")
-            self.assertListEqual(list(repertoire_tsv["amino_acid"]), list(repertoire.get_sequence_aas()))
+        self.assertEqual(encoded.encoded_data.info["hdf5_filepath"], encoded_main.encoded_data.info["hdf5_filepath"])
+        self.assertEqual(path / "encoded_data", encoded_main.encoded_data.info["hdf5_filepath"].parent)
+        self.assertListEqual([0, 1, 2, 3], encoded_main.encoded_data.info["indices"])
 
         shutil.rmtree(path)
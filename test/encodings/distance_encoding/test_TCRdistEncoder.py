@@ -2,6 +2,8 @@ import os
 import shutil
 from unittest import TestCase
 
+import numpy as np
+
 from immuneML.IO.dataset_import.VDJdbImport import VDJdbImport
 from immuneML.caching.CacheType import CacheType
 from immuneML.dsl.DefaultParamsLoader import DefaultParamsLoader
@@ -11,6 +13,7 @@ from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.environment.Label import Label
 from immuneML.environment.LabelConfiguration import LabelConfiguration
+from immuneML.ml_methods.TCRdistClassifier import TCRdistClassifier
 from immuneML.util.PathBuilder import PathBuilder
 
 
@@ -53,4 +56,18 @@ class TestTCRdistEncoder(TestCase):
         self.assertTrue(encoded_dataset.encoded_data.examples.shape[0] == encoded_dataset.encoded_data.examples.shape[1]
                         and encoded_dataset.encoded_data.examples.shape[0] == dataset.get_example_count())
 
+        encoder = TCRdistEncoder.build_object(dataset, **{"cores": 2, "block_size": 3, "nearest_neighbours": 2})
+        sparse_encoded_dataset = encoder.encode(dataset, EncoderParams(path / "sparse_result/", LabelConfiguration([Label("epitope")])))
+
+        self.assertEqual(encoded_dataset.encoded_data.examples.shape, sparse_encoded_dataset.encoded_data.examples.shape)
+        self.assertTrue(all(sparse_encoded_dataset.encoded_data.examples.getnnz(axis=1) == 2))
+        self.assertTrue(np.allclose(np.sort(encoded_dataset.encoded_data.examples.values, axis=1)[:, :2],
+                                    sparse_encoded_dataset.encoded_data.examples.data.reshape(-1, 2)))
+
+        classifier = TCRdistClassifier(percentage=0.5)
+        classifier.fit(sparse_encoded_dataset.encoded_data, "epitope", cores_for_training=2)
+        predictions = classifier.predict(sparse_encoded_dataset.encoded_data, "epitope")
+        self.assertEqual(dataset.get_example_count(), len(predictions["epitope"]))
+        self.assertEqual(2, classifier.models["epitope"].n_neighbors)
+
         shutil.rmtree(path)
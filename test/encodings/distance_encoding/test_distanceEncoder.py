@@ -55,3 +55,24 @@ class TestDistanceEncoder(TestCase):
         self.assertTrue(np.array_equal([2, 3, 2, 3, 2, 3, 3, 3], encoded.encoded_data.labels["l2"]))
 
         shutil.rmtree(path)
+
+    def test_encode_morisita_horn(self):
+        path = EnvironmentSettings.tmp_test_path / "distance_encoder_morisita_horn/"
+        PathBuilder.build(path)
+
+        dataset = self.create_dataset(path)
+
+        enc = DistanceEncoder.build_object(dataset, **{"distance_metric": DistanceMetricType.MORISITA_HORN.name,
+                                                       "attributes_to_match": ["sequence_aas"],
+                                                       "sequence_batch_size": 20})
+
+        enc.set_context({"dataset": dataset})
+        encoded = enc.encode(dataset, EncoderParams(result_path=path, label_config=LabelConfiguration([Label("l1", [0, 1])]),
+                                                    pool_size=4, filename="dataset.pkl"))
+
+        self.assertEqual((8, 8), encoded.encoded_data.examples.shape)
+        self.assertAlmostEqual(1, encoded.encoded_data.examples.iloc[0, 4])
+        self.assertAlmostEqual(0.5, encoded.encoded_data.examples.iloc[0, 1])
+        self.assertAlmostEqual(0, encoded.encoded_data.examples.iloc[0, 2])
+
+        shutil.rmtree(path)
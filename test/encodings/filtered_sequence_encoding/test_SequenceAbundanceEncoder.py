@@ -16,7 +16,6 @@ from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.environment.Label import Label
 from immuneML.environment.LabelConfiguration import LabelConfiguration
 from immuneML.pairwise_repertoire_comparison.ComparisonData import ComparisonData
-from immuneML.pairwise_repertoire_comparison.ComparisonDataBatch import ComparisonDataBatch
 from immuneML.util.PathBuilder import PathBuilder
 from immuneML.util.RepertoireBuilder import RepertoireBuilder
 
@@ -25,6 +24,13 @@ class TestEmersonSequenceAbundanceEncoder(TestCase):
     def setUp(self) -> None:
         os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
 
+    def add_repertoires(self, comparison_data: ComparisonData, repertoire_ids: list):
+        comparison_data.add_repertoire([('GGG',), ('III',), ('LLL',), ('MMM',)], repertoire_ids[0])
+        comparison_data.add_repertoire([('III',), ('LLL',), ('MMM',), ('DDD',), ('EEE',), ('FFF',)], repertoire_ids[1])
+        comparison_data.add_repertoire([('MMM',), ('FFF',), ('CCC',)], repertoire_ids[2])
+        comparison_data.add_repertoire([('LLL',), ('MMM',), ('EEE',), ('FFF',), ('CCC',), ('AAA',)], repertoire_ids[3])
+        comparison_data.build_matrix()
+
     def test_encode(self):
         path = EnvironmentSettings.tmp_test_path / "abundance_encoder/"
         PathBuilder.build(path)
@@ -63,26 +69,7 @@ class TestEmersonSequenceAbundanceEncoder(TestCase):
 
         comparison_data = ComparisonData(repertoire_ids=["rep_0", "rep_1", "rep_2", "rep_3"],
                                          comparison_attributes=["sequence_aas"], sequence_batch_size=2, path=path)
-        comparison_data.batches = [ComparisonDataBatch(matrix=np.array([[1., 0., 0., 0.],
-                                                                        [1., 1., 0., 0.]]),
-                                                       items=[('GGG',), ('III',)], identifier=0,
-                                                       repertoire_index_mapping={'rep_0': 0, 'rep_1': 1, 'rep_2': 2, 'rep_3': 3}, path=path),
-                                   ComparisonDataBatch(matrix=np.array([[1., 1., 0., 1.],
-                                                                        [1., 1., 1., 1.]]),
-                                                       items=[('LLL',), ('MMM',)], identifier=1, path=path,
-                                                       repertoire_index_mapping={'rep_0': 0, 'rep_1': 1, 'rep_2': 2, 'rep_3': 3}),
-                                   ComparisonDataBatch(matrix=np.array([[0., 1., 0., 0.],
-                                                                        [0., 1., 0., 1.]]),
-                                                       items=[('DDD',), ('EEE',)], identifier=2, path=path,
-                                                       repertoire_index_mapping={'rep_0': 0, 'rep_1': 1, 'rep_2': 2, 'rep_3': 3}),
-                                   ComparisonDataBatch(matrix=np.array([[0., 1., 1., 1.],
-                                                                        [0., 0., 1., 1.]]),
-                                                       items=[('FFF',), ('CCC',)], identifier=3, path=path,
-                                                       repertoire_index_mapping={'rep_0': 0, 'rep_1': 1, 'rep_2': 2, 'rep_3': 3}),
-                                   ComparisonDataBatch(matrix=np.array([[0., 0., 0., 1.]]),
-                                                       items=[('AAA',)], identifier=4, path=path,
-                                                       repertoire_index_mapping={'rep_0': 0, 'rep_1': 1, 'rep_2': 2, 'rep_3': 3})]
-        comparison_data.item_count = 9
+        self.add_repertoires(comparison_data, ["rep_0", "rep_1", "rep_2", "rep_3"])
 
         p_value = 0.4
         sequence_p_value_indices = np.array([1., 0.3333333333333334, 1., 1., 1., 1., 1., 0.3333333333333334, 1.]) < p_value
@@ -106,29 +93,9 @@ class TestEmersonSequenceAbundanceEncoder(TestCase):
             "l1": val, "subject_id": subject_id
         }) for val, subject_id in zip([True, True, False, False], ["rep_0", "rep_1", "rep_2", "rep_3"])]
 
-        col_name_index = {repertoires[index].identifier: index for index in range(len(repertoires))}
-
         comparison_data = ComparisonData(repertoire_ids=[repertoire.identifier for repertoire in repertoires],
                                          comparison_attributes=["sequence_aas"], sequence_batch_size=4, path=path)
-        comparison_data.batches = [ComparisonDataBatch(**{'matrix': np.array([[1., 0., 0., 0.],
-                                                                              [1., 1., 0., 0.]]),
-                                                          'items': [('GGG',), ('III',)],
-                                                          'repertoire_index_mapping': col_name_index, 'path': path, 'identifier': 0}),
-                                   ComparisonDataBatch(**{'matrix': np.array([[1., 1., 0., 1.],
-                                                                              [1., 1., 1., 1.]]),
-                                                          'items': [('LLL',), ('MMM',)],
-                                                          'repertoire_index_mapping': col_name_index, 'path': path, 'identifier': 1}),
-                                   ComparisonDataBatch(**{'matrix': np.array([[0., 1., 0., 0.],
-                                                                              [0., 1., 0., 1.]]),
-                                                          'items': [('DDD',), ('EEE',)],
-                                                          'repertoire_index_mapping': col_name_index, 'path': path, 'identifier': 2}),
-                                   ComparisonDataBatch(**{'matrix': np.array([[0., 1., 1., 1.],
-                                                                              [0., 0., 1., 1.]]),
-                                                          'items': [('FFF',), ('CCC',)],
-                                                          'repertoire_index_mapping': col_name_index, 'path': path, 'identifier': 3}),
-                                   ComparisonDataBatch(**{'matrix': np.array([[0., 0., 0., 1.]]),
-                                                          'items': [('AAA',)],
-                                                          'repertoire_index_mapping': col_name_index, 'path': path, 'identifier': 4})]
+        self.add_repertoires(comparison_data, [repertoire.identifier for repertoire in repertoires])
 
         p_values = SequenceFilterHelper.find_label_associated_sequence_p_values(comparison_data, repertoires, Label('l1', [True, False], positive_class=True))
 
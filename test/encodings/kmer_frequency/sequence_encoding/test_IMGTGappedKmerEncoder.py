@@ -2,6 +2,7 @@ import os
 from unittest import TestCase
 
 from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.kmer_frequency.sequence_encoding.IMGTGappedKmerEncoder import IMGTGappedKmerEncoder
@@ -33,3 +34,13 @@ class TestIMGTGappedKmerEncoder(TestCase):
                           'CA///115', 'AY///116', 'C.S///105', 'A.S///106', 'S.P///107', 'S.R///108', 'P.E///109',
                           'R.R///110', 'E.A///111', 'R.T///111.001', 'A.Y///112.002', 'T.E///112.001', 'Y.Q///112',
                           'E.C///113', 'Q.A///114', 'C.Y///115'}, set(kmers))
+
+    def test_encode_sequence_buffer(self):
+        params = EncoderParams(model={"k_left": 1, "max_gap": 1}, label_config=LabelConfiguration(), result_path="")
+        buffer, offsets = ColumnarStorage.encode_strings(["AHCDE", "CASSPRERATYEQCAY", "AH"])
+
+        kmers = IMGTGappedKmerEncoder.encode_sequence_buffer(buffer, offsets, params)
+
+        expected = IMGTGappedKmerEncoder.encode_sequence(ReceptorSequence("AHCDE", None, None), params) \
+                   + IMGTGappedKmerEncoder.encode_sequence(ReceptorSequence("CASSPRERATYEQCAY", None, None), params)
+        self.assertDictEqual({kmer: expected.count(kmer) for kmer in expected}, kmers)
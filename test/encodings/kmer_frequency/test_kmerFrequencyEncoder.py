@@ -97,4 +97,77 @@ class TestKmerFrequencyEncoder(TestCase):
         self.assertTrue(isinstance(d2, RepertoireDataset))
         self.assertEqual(0.67, np.round(d2.encoded_data.examples[0, 2], 2))
         self.assertEqual(0.0, np.round(d3.encoded_data.examples[0, 1], 2))
-        self.assertTrue(isinstance(encoder, KmerFrequencyEncoder))
\ No newline at end of file
+        self.assertTrue(isinstance(encoder, KmerFrequencyEncoder))
+
+    def test_encode_cached_with_different_paths(self):
+        path = EnvironmentSettings.root_path / "test/tmp/kmerfreqenc_paths/"
+
+        PathBuilder.build(path)
+
+        rep1 = Repertoire.build_from_sequence_objects([ReceptorSequence("AAAC", identifier="1"), ReceptorSequence("ATAC", identifier="2")],
+                                                      metadata={"l1": 1, "subject_id": "1"}, path=path)
+        rep2 = Repertoire.build_from_sequence_objects([ReceptorSequence("ATAA", identifier="1"), ReceptorSequence("TAAC", identifier="2")],
+                                                      metadata={"l1": 0, "subject_id": "2"}, path=path)
+
+        lc = LabelConfiguration()
+        lc.add_label("l1", [0, 1])
+
+        dataset = RepertoireDataset(repertoires=[rep1, rep2])
+        encoder_params = {"normalization_type": NormalizationType.RELATIVE_FREQUENCY.name, "reads": ReadsType.UNIQUE.name,
+                          "sequence_encoding": SequenceEncodingType.CONTINUOUS_KMER.name, "k": 3, "scale_to_unit_variance": True,
+                          "scale_to_zero_mean": False}
+
+        encoded = []
+        for index in range(2):
+            encoder = KmerFrequencyEncoder.build_object(dataset, **encoder_params)
+            result_path = path / f"{index}/"
+            encoded.append(encoder.encode(dataset, EncoderParams(result_path=result_path, label_config=lc, learn_model=True, model={},
+                                                                 filename="dataset.pkl")))
+
+            self.assertTrue(encoder.vectorizer_path.is_file())
+            self.assertTrue(encoder.scaler_path.is_file())
+            self.assertEqual(result_path, encoder.vectorizer_path.parent)
+
+            encoded.append(encoder.encode(dataset, EncoderParams(result_path=result_path, label_config=lc, learn_model=False, model={},
+                                                                 filename="dataset.pkl")))
+
+        for encoded_dataset in encoded[1:]:
+            self.assertTrue(np.allclose(encoded[0].encoded_data.examples.toarray(), encoded_dataset.encoded_data.examples.toarray()))
+
+        shutil.rmtree(path)
+
+    def test_encode_cached_replaces_fitted_models(self):
+        path = EnvironmentSettings.root_path / "test/tmp/kmerfreqenc_replace/"
+
+        PathBuilder.build(path)
+
+        rep1 = Repertoire.build_from_sequence_objects([ReceptorSequence("AAAC", identifier="1"), ReceptorSequence("ATAC", identifier="2")],
+                                                      metadata={"l1": 1, "subject_id": "1"}, path=path)
+        rep2 = Repertoire.build_from_sequence_objects([ReceptorSequence("ATAA", identifier="1"), ReceptorSequence("TAAC", identifier="2")],
+                                                      metadata={"l1": 0, "subject_id": "2"}, path=path)
+
+        lc = LabelConfiguration()
+        lc.add_label("l1", [0, 1])
+
+        dataset = RepertoireDataset(repertoires=[rep1, rep2])
+        encoder_params = {"normalization_type": NormalizationType.RELATIVE_FREQUENCY.name, "reads": ReadsType.UNIQUE.name,
+                          "sequence_encoding": SequenceEncodingType.CONTINUOUS_KMER.name, "k": 3, "scale_to_unit_variance": True,
+                          "scale_to_zero_mean": False}
+
+        first_encoder = KmerFrequencyEncoder.build_object(dataset, **encoder_params)
+        first_encoder.encode(dataset, EncoderParams(result_path=path / "first/", label_config=lc, learn_model=True, model={},
+                                                    filename="dataset.pkl"))
+
+        encoder = KmerFrequencyEncoder.build_object(dataset, **encoder_params)
+        encoder.vectorizer_path = PathBuilder.build(path / "second/") / "vectorizer.pickle"
+        encoder.scaler_path = path / "second/scaler.pickle"
+        encoder.vectorizer_path.write_bytes(b"vectorizer from an earlier fit")
+        encoder.scaler_path.write_bytes(b"scaler from an earlier fit")
+
+        encoder.encode(dataset, EncoderParams(result_path=path / "second/", label_config=lc, learn_model=True, model={},
+                                              filename="dataset.pkl"))
+
+        self.assertEqual(first_encoder.vectorizer_path.read_bytes(), encoder.vectorizer_path.read_bytes())
+        self.assertEqual(first_encoder.scaler_path.read_bytes(), encoder.scaler_path.read_bytes())
+
+        shutil.rmtree(path)
@@ -0,0 +1,26 @@
+import pickle
+from unittest import TestCase
+
+from immuneML.encodings.kmer_frequency.KmerVectorizer import KmerVectorizer
+
+
+class TestKmerVectorizer(TestCase):
+
+    def test_build(self):
+        vectorizer = KmerVectorizer()
+        vectorizer.add_row(["CAS", "ASS"], [2, 1])
+        vectorizer.add_row([], [])
+        vectorizer.add_row(["SSL", "CAS"], [3, 1])
+
+        matrix, feature_names = vectorizer.build()
+
+        self.assertListEqual(["ASS", "CAS", "SSL"], feature_names)
+        self.assertListEqual([[1, 2, 0], [0, 0, 0], [0, 1, 3]], matrix.toarray().tolist())
+
+        vectorizer = pickle.loads(pickle.dumps(vectorizer))
+        vectorizer.add_row(["SSL", "AAA"], [4, 5])
+
+        matrix, feature_names = vectorizer.build()
+
+        self.assertListEqual(["ASS", "CAS", "SSL"], feature_names)
+        self.assertListEqual([[0, 0, 4]], matrix.toarray().tolist())
@@ -144,4 +144,34 @@ class TestMatchedReceptorsEncoder(TestCase):
         self.assertListEqual(["1_IGL", "1_IGH", "2_IGH", "3_IGL", "4_IGL"], encoded.encoded_data.feature_names)
         self.assertListEqual(["subject_1", "subject_2", "subject_3"], encoded.encoded_data.example_ids)
 
-        shutil.rmtree(path)
\ No newline at end of file
+        shutil.rmtree(path)
+    def test_encode_parallel(self):
+        path = EnvironmentSettings.root_path / "test/tmp/regex_matches_encoder_parallel/"
+
+        dataset, label_config, motif_filepath, labels = self.create_dummy_data(path)
+
+        with open(motif_filepath, "a") as file:
+            file.write("5\t\t\t(C)\\1\t\n")
+
+        encoder = MatchedRegexEncoder.build_object(dataset, **{
+            "motif_filepath": motif_filepath,
+            "match_v_genes": False,
+            "sum_counts": True
+        })
+
+        encoded = encoder.encode(dataset, EncoderParams(
+            result_path=path,
+            label_config=label_config,
+            filename="dataset.csv",
+            pool_size=2
+        ))
+
+        expected_outcome = [[20, 10, 0, 0, 0], [0, 0, 10, 0, 0], [0, 0, 0, 5, 2]]
+
+        for index, row in enumerate(expected_outcome):
+            self.assertListEqual(list(encoded.encoded_data.examples[index]), expected_outcome[index])
+
+        self.assertListEqual(["1_IGL", "1_IGH", "2_IGH", "3_IGL", "5_IGL"], encoded.encoded_data.feature_names)
+        self.assertDictEqual({"subject_id": labels["subject_id"], "label": labels["label"]}, encoded.encoded_data.labels)
+
+        shutil.rmtree(path)
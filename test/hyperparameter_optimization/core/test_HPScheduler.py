@@ -0,0 +1,82 @@
+import os
+import shutil
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
+from immuneML.encodings.kmer_frequency.KmerFrequencyEncoder import KmerFrequencyEncoder
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.Label import Label
+from immuneML.environment.LabelConfiguration import LabelConfiguration
+from immuneML.environment.Metric import Metric
+from immuneML.hyperparameter_optimization.HPSetting import HPSetting
+from immuneML.hyperparameter_optimization.config.ReportConfig import ReportConfig
+from immuneML.hyperparameter_optimization.config.SplitConfig import SplitConfig
+from immuneML.hyperparameter_optimization.config.SplitType import SplitType
+from immuneML.hyperparameter_optimization.core.HPScheduler import HPScheduler
+from immuneML.hyperparameter_optimization.strategy.GridSearch import GridSearch
+from immuneML.ml_methods.LogisticRegression import LogisticRegression
+from immuneML.ml_methods.SVM import SVM
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.RepertoireBuilder import RepertoireBuilder
+from immuneML.util.WorkerPool import WorkerPool
+from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
+
+
+class TestHPScheduler(TestCase):
+
+    def setUp(self) -> None:
+        os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+
+    def test_run(self):
+        path = EnvironmentSettings.tmp_test_path / "hp_scheduler/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build(sequences=[["AAAC", "CCCA", "DDDA"], ["AAAE", "CCCE", "DDDE"]] * 6, path=path,
+                                                        labels={"l1": [1, 2] * 6, "l2": [0, 0, 1, 1] * 3})
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata, labels={"l1": [1, 2], "l2": [0, 1]})
+
+        encoder_params = {"normalization_type": "relative_frequency", "reads": "unique", "sequence_encoding": "continuous_kmer", "k": 3}
+        hp_settings = [HPSetting(KmerFrequencyEncoder.build_object(dataset, **encoder_params), encoder_params, ml_method,
+                                 {"model_selection_cv": False, "model_selection_n_folds": -1}, [], encoder_name="kmer",
+                                 ml_method_name=ml_method_name) for ml_method, ml_method_name in [(LogisticRegression(), "lr"), (SVM(), "svm")]]
+
+        label_config = LabelConfiguration([Label("l1", [1, 2]), Label("l2", [0, 1])])
+
+        instruction = TrainMLModelInstruction(dataset, GridSearch(hp_settings), hp_settings,
+                                              SplitConfig(SplitType.RANDOM, 2, 0.7, reports=ReportConfig()),
+                                              SplitConfig(SplitType.RANDOM, 2, 0.7, reports=ReportConfig()),
+                                              {Metric.BALANCED_ACCURACY}, Metric.BALANCED_ACCURACY, label_config, path, number_of_processes=2)
+
+        state = instruction.run(result_path=path)
+
+        self.assertEqual(2, len(state.assessment_states))
+        for assessment_state in state.assessment_states:
+            for label in ["l1", "l2"]:
+                label_state = assessment_state.label_states[label]
+                self.assertEqual({"kmer_lr", "kmer_svm"}, set(label_state.assessment_items.keys()))
+                self.assertTrue(all(len(items) == 2 for items in label_state.selection_state.hp_items.values()))
+                self.assertTrue(all(isinstance(item.performance["balanced_accuracy"], float) for item in label_state.assessment_items.values()))
+                self.assertTrue((assessment_state.path / f"{label}_{label_state.optimal_hp_setting}_optimal").is_dir())
+
+                encoders = [item.encoder for item in label_state.assessment_items.values()]
+                self.assertEqual(encoders[0].vectorizer_path, encoders[1].vectorizer_path)
+                self.assertEqual(1, len(list(assessment_state.path.glob(f"{label}_*/encoded_datasets"))))
+
+        shutil.rmtree(path)
+
+    def test_run_core_budget(self):
+        for group_count, number_of_processes, expected_workers, expected_cores in [(1, 8, 1, 8), (2, 8, 2, 4), (3, 8, 3, 2), (12, 8, 8, 1)]:
+            ml_processes = [SimpleNamespace(number_of_processes=None) for _ in range(group_count)]
+            groups = [[index] for index in range(group_count)]
+
+            with patch.object(HPScheduler, "group_by_encoding", return_value=groups), \
+                    patch.object(WorkerPool, "map", return_value=[[index] for index in range(group_count)]) as worker_map:
+                hp_items = HPScheduler.run(ml_processes, [0] * group_count, number_of_processes)
+
+            self.assertEqual(list(range(group_count)), hp_items)
+            self.assertEqual(expected_workers, worker_map.call_args[0][2])
+            self.assertTrue(all(ml_process.number_of_processes == expected_cores for ml_process in ml_processes))
@@ -42,3 +42,18 @@ class TestGridSearch(TestCase):
         optimal = grid_search.get_optimal_hps()
 
         self.assertEqual(hp_settings[1], optimal)
+
+    def test_generate_next_settings(self):
+        hp_settings = [HPSetting(encoder=KmerFrequencyEncoder, encoder_params={}, encoder_name="e1", ml_method=LogisticRegression(),
+                                 ml_params={"model_selection_cv": False, "model_selection_n_fold": -1}, ml_method_name="ml1",
+                                 preproc_sequence=[]),
+                       HPSetting(encoder=Word2VecEncoder, encoder_params={}, encoder_name='e2', ml_method=LogisticRegression(),
+                                 ml_params={"model_selection_cv": False, "model_selection_n_fold": -1}, ml_method_name="ml2",
+                                 preproc_sequence=[])]
+
+        grid_search = GridSearch(hp_settings)
+        settings = grid_search.generate_next_settings()
+
+        self.assertEqual(["e1_ml1", "e2_ml2"], [setting.get_key() for setting in settings])
+        self.assertEqual([], grid_search.generate_next_settings(settings, [0.8, 0.7]))
+        self.assertEqual(hp_settings[0], grid_search.get_optimal_hps())
@@ -0,0 +1,124 @@
+import os
+import shutil
+from unittest import TestCase
+
+from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
+from immuneML.dsl.instruction_parsers.TrainMLModelParser import TrainMLModelParser
+from immuneML.encodings.kmer_frequency.KmerFrequencyEncoder import KmerFrequencyEncoder
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.Label import Label
+from immuneML.environment.LabelConfiguration import LabelConfiguration
+from immuneML.environment.Metric import Metric
+from immuneML.hyperparameter_optimization.HPSetting import HPSetting
+from immuneML.hyperparameter_optimization.config.ReportConfig import ReportConfig
+from immuneML.hyperparameter_optimization.config.SplitConfig import SplitConfig
+from immuneML.hyperparameter_optimization.config.SplitType import SplitType
+from immuneML.hyperparameter_optimization.strategy.SuccessiveHalving import SuccessiveHalving
+from immuneML.ml_methods.LogisticRegression import LogisticRegression
+from immuneML.presentation.html.HPHTMLBuilder import HPHTMLBuilder
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.RepertoireBuilder import RepertoireBuilder
+from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
+
+
+class TestSuccessiveHalving(TestCase):
+
+    def setUp(self) -> None:
+        os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+
+    def _make_settings(self, k_values: list, dataset=None) -> list:
+        settings = []
+        for k in k_values:
+            encoder_params = {"normalization_type": "relative_frequency", "reads": "unique", "sequence_encoding": "continuous_kmer", "k": k}
+            encoder = KmerFrequencyEncoder.build_object(dataset, **encoder_params) if dataset is not None else KmerFrequencyEncoder
+            settings.append(HPSetting(encoder=encoder, encoder_params=encoder_params, encoder_name=f"e{k}", ml_method=LogisticRegression(),
+                                      ml_params={"model_selection_cv": False, "model_selection_n_folds": -1}, ml_method_name="ml",
+                                      preproc_sequence=[]))
+        return settings
+
+    def test_generate_next_settings(self):
+        successive_halving = SuccessiveHalving(self._make_settings([1, 2, 3, 4]), reduction_factor=2)
+        successive_halving.set_split_count(4)
+        metrics = {"e1_ml": [0.5, 0.5, 0.5, 0.5], "e2_ml": [0.9, 0.5, 0.6, 0.6], "e3_ml": [0.8, 0.8, 0.8, 0.8], "e4_ml": [0.6, 0.9, 0.9, 0.9]}
+
+        settings = successive_halving.generate_next_settings()
+        rungs = []
+        while len(settings) > 0:
+            split_indices = [successive_halving.get_split_indices(setting, 4) for setting in settings]
+            rungs.append(({setting.get_key() for setting in settings}, split_indices))
+            performances = [sum(metrics[setting.get_key()][index] for index in indices) / len(indices)
+                            for setting, indices in zip(settings, split_indices)]
+            settings = successive_halving.generate_next_settings(settings, performances)
+
+        self.assertEqual([({"e1_ml", "e2_ml", "e3_ml", "e4_ml"}, [[0]] * 4), ({"e2_ml", "e3_ml"}, [[1]] * 2), ({"e3_ml"}, [[2, 3]])], rungs)
+        self.assertEqual("e3_ml", successive_halving.get_optimal_hps().get_key())
+        self.assertAlmostEqual(0.7, successive_halving.get_performance(successive_halving.hp_settings["e2_ml"]))
+        self.assertAlmostEqual(0.8, successive_halving.get_performance(successive_halving.hp_settings["e3_ml"]))
+
+    def test_generate_next_setting(self):
+        successive_halving = SuccessiveHalving(self._make_settings([1, 2, 3]), search_criterion=min, reduction_factor=3)
+        successive_halving.set_split_count(2)
+        metrics = {"e1_ml": 0.3, "e2_ml": 0.1, "e3_ml": 0.2}
+
+        evaluated = []
+        setting = successive_halving.generate_next_setting()
+        while setting is not None:
+            evaluated.append((setting.get_key(), successive_halving.get_split_indices(setting, 2)))
+            setting = successive_halving.generate_next_setting(setting, metrics[setting.get_key()])
+
+        self.assertEqual([("e1_ml", [0]), ("e2_ml", [0]), ("e3_ml", [0]), ("e2_ml", [1])], evaluated)
+        self.assertEqual("e2_ml", successive_halving.get_optimal_hps().get_key())
+        self.assertEqual(3, successive_halving.clone().reduction_factor)
+        self.assertEqual(2, successive_halving.clone().split_count)
+
+        with self.assertRaises(AssertionError):
+            successive_halving.get_split_indices(successive_halving.hp_settings["e1_ml"], 3)
+
+    def test_get_optimal_hps_without_metric(self):
+        successive_halving = SuccessiveHalving(self._make_settings([1, 2, 3]), reduction_factor=2)
+        successive_halving.set_split_count(2)
+
+        settings = successive_halving.generate_next_settings()
+        while len(settings) > 0:
+            settings = successive_halving.generate_next_settings(settings, [None] * len(settings))
+
+        self.assertEqual(["e1_ml", "e2_ml"], successive_halving.survivors)
+        self.assertEqual("e1_ml", successive_halving.get_optimal_hps().get_key())
+
+    def test_parse(self):
+        successive_halving = TrainMLModelParser()._parse_strategy({"SuccessiveHalving": {"reduction_factor": 3}}, self._make_settings([1, 2]), min)
+
+        self.assertTrue(isinstance(successive_halving, SuccessiveHalving))
+        self.assertEqual(3, successive_halving.reduction_factor)
+        self.assertEqual(min, successive_halving.search_criterion)
+
+        with self.assertRaises(AssertionError):
+            TrainMLModelParser()._parse_strategy({"SuccessiveHalving": {"eta": 3}}, self._make_settings([1, 2]), min)
+
+    def test_run_instruction(self):
+        path = EnvironmentSettings.tmp_test_path / "successive_halving/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build(sequences=[["AAAC", "CCCA", "DDDA"], ["AAAE", "CCCE", "DDDE"]] * 8, path=path,
+                                                        labels={"l1": [1, 2] * 8})
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata, labels={"l1": [1, 2]})
+        hp_settings = self._make_settings([1, 2, 3, 4], dataset)
+
+        instruction = TrainMLModelInstruction(dataset, SuccessiveHalving(hp_settings), hp_settings,
+                                              SplitConfig(SplitType.RANDOM, 1, 0.7, reports=ReportConfig()),
+                                              SplitConfig(SplitType.K_FOLD, 3, reports=ReportConfig()),
+                                              {Metric.BALANCED_ACCURACY}, Metric.BALANCED_ACCURACY,
+                                              LabelConfiguration([Label("l1", [1, 2])]), path / "result/", number_of_processes=1)
+
+        state = instruction.run(result_path=path / "result/")
+        selection_state = state.assessment_states[0].label_states["l1"].selection_state
+
+        self.assertEqual(7, sum(len(items) for items in selection_state.hp_items.values()))
+        self.assertEqual(3, len(selection_state.hp_items[selection_state.optimal_hp_setting.get_key()]))
+        self.assertEqual([1, 2, 3], [item.split_index for item in selection_state.hp_items[selection_state.optimal_hp_setting.get_key()]])
+
+        self.assertTrue(HPHTMLBuilder.build(state).is_file())
+
+        shutil.rmtree(path)
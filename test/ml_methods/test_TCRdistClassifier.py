@@ -5,6 +5,7 @@ from unittest import TestCase
 
 import dill
 import numpy as np
+from scipy import sparse
 from sklearn.neighbors import KNeighborsClassifier
 
 from immuneML.caching.CacheType import CacheType
@@ -40,6 +41,22 @@ class TestTCRdistClassifier(TestCase):
         predictions = knn.predict(encoded_data, 'test')
         self.assertTrue(np.array_equal([0], predictions["test"]))
 
+    def test_fit_sparse(self):
+        x, y, encoded_data = self._prepare_data()
+        # distances to the 2 nearest neighbours of each example, sorted by distance, with explicit zeros
+        encoded_data.examples = sparse.csr_matrix((np.array([0., 1., 0., 1., 0., 1., 0., 1.]), np.array([0, 1, 1, 0, 2, 1, 3, 2]),
+                                                   np.array([0, 2, 4, 6, 8])), shape=(4, 4))
+
+        knn = TCRdistClassifier(percentage=0.5)
+        knn.fit(encoded_data, "test", cores_for_training=4)
+        predictions = knn.predict(encoded_data, 'test')
+        self.assertEqual(0, predictions["test"][0])
+        self.assertEqual(1, predictions["test"][3])
+
+        knn = TCRdistClassifier(percentage=0.75)
+        with self.assertRaises(ValueError):
+            knn.fit(encoded_data, "test", cores_for_training=4)
+
     def test_store(self):
         x, y, encoded_data = self._prepare_data()
 
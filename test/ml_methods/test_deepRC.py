@@ -1,15 +1,15 @@
+import importlib.util
 import logging
 import os
 import random as rn
 import shutil
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
-
-import pandas as pd
 import torch
 
 from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.dsl.DefaultParamsLoader import DefaultParamsLoader
 from immuneML.encodings.deeprc.DeepRCEncoder import DeepRCEncoder
@@ -17,8 +17,10 @@ from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.ml_methods.DeepRC import DeepRC
 from immuneML.util.PathBuilder import PathBuilder
-from deeprc.deeprc_binary.architectures import DeepRC as DeepRCInternal
+from immuneML.util.RepertoireBuilder import RepertoireBuilder
+
 
+@skipUnless(importlib.util.find_spec("deeprc") is not None, "DeepRC is not installed")
 class TestDeepRC(TestCase):
 
     def setUp(self) -> None:
@@ -28,25 +30,23 @@ class TestDeepRC(TestCase):
         return "".join([rn.choice(alphabet) for i in range(rn.choice(range(15, 30)))])
 
     def make_encoded_data(self, path: Path):
-        metadata_filepath = path / f"metadata.tsv"
-
         rep_ids = [f"REP{i}" for i in range(10)]
         status_label = [chr((i % 2) + 65) for i in range(10)]  # List of alternating strings "A" "B"
 
-        metadata = pd.DataFrame({"ID": rep_ids, "status": status_label})
-        metadata.to_csv(sep="\t", index=False, path_or_buf=metadata_filepath)
+        repertoires, metadata = RepertoireBuilder.build([[self.get_random_sequence() for i in range(100)] for rep_id in rep_ids], path,
+                                                      labels={"status": status_label},
+                                                      seq_metadata=[[{"count": rn.choice(range(1, 1000))} for i in range(100)]
+                                                                    for rep_id in rep_ids],
+                                                      subject_ids=rep_ids)
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
 
-        for rep_id in rep_ids:
-            repertoire_seqs = [self.get_random_sequence() for i in range(100)]
-
-            repertoire_data = pd.DataFrame({"amino_acid": repertoire_seqs,
-                                            "templates": [rn.choice(range(1, 1000)) for i in range(100)]})
-
-            repertoire_data.to_csv(sep="\t", index=False, path_or_buf=path / f"{rep_id}.tsv")
+        hdf5_filepath = path / "metadata.hdf5"
+        DeepRCEncoder.write_hdf5_file(dataset, ["status"], hdf5_filepath)
 
         return EncodedData(examples=None, labels={"status": status_label},
-                           example_ids=rep_ids, encoding=DeepRCEncoder.__name__,
-                           info={"metadata_filepath": metadata_filepath,
+                           example_ids=dataset.get_repertoire_ids(), encoding=DeepRCEncoder.__name__,
+                           info={"hdf5_filepath": hdf5_filepath,
+                                 "indices": list(range(10)),
                                  "max_sequence_length": 30})
 
     def dummy_training_function(self, *args, **kwargs):
@@ -55,6 +55,8 @@ class TestDeepRC(TestCase):
         pass
 
     def test(self):
+        from deeprc.deeprc_binary.architectures import DeepRC as DeepRCInternal
+
         logging.warning("DeepRC test is temporarily excluded")
         path = EnvironmentSettings.tmp_test_path / "deeprc_classifier"
         data_path = path / "encoded_data"
@@ -3,14 +3,14 @@ import shutil
 from unittest import TestCase
 
 import numpy as np
-import pandas as pd
 
 from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.pairwise_repertoire_comparison.ComparisonData import ComparisonData
-from immuneML.pairwise_repertoire_comparison.ComparisonDataBatch import ComparisonDataBatch
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.RepertoireBuilder import RepertoireBuilder
 
 
 class TestComparisonData(TestCase):
@@ -22,28 +22,13 @@ class TestComparisonData(TestCase):
         comparison_data = ComparisonData(repertoire_ids=["1", "2", "3", "4", "5", "6"], comparison_attributes=["col1", "col2"],
                                          sequence_batch_size=3, path=path)
 
-        comparison_data.tmp_batch_paths = []
-        batch0 = {("a", 1): {"1": 1}, ("b", 2): {"2": 1}, ("c", 3): {"3": 1}}
-        comparison_data.store_tmp_batch(batch0, 0)
-
-        batch1 = {("d", 4): {"1": 1}, ("e", 5): {"5": 1}}
-        comparison_data.store_tmp_batch(batch1, 1)
-        comparison_data.matching_columns = ["col1", "col2"]
-        comparison_data.item_count = 5
-        df1 = pd.DataFrame({"1": [1, 0, 0], "2": [0, 1, 0], "3": [0, 0, 1], "4": [0, 0, 0],
-                            "5": [0, 0, 0], "6": [0, 0, 0]})
-        comp_data_batch = ComparisonDataBatch(matrix=df1.values, items=[("a", 1), ("b", 2), ("c", 3)],
-                                              repertoire_index_mapping={"1": 0, "2": 1, "3": 2, "4": 3, "5": 4, "6": 7},
-                                              path=path, identifier=0)
-        comp_data_batch.store()
-        comparison_data.batches.append(comp_data_batch)
-        df2 = pd.DataFrame({"1": [1, 0], "2": [0, 0], "3": [0, 0], "4": [0, 0],
-                            "5": [0, 1], "6": [0, 0]})
-        comp_data_batch = ComparisonDataBatch(matrix=df2.values, items=[("d", 4), ("e", 5)],
-                                              repertoire_index_mapping={"1": 0, "2": 1, "3": 2, "4": 3, "5": 4, "6": 7},
-                                              path=path, identifier=1)
-        comp_data_batch.store()
-        comparison_data.batches.append(comp_data_batch)
+        comparison_data.add_repertoire([("a", 1)], "1")
+        comparison_data.add_repertoire([("b", 2)], "2")
+        comparison_data.add_repertoire([("c", 3)], "3")
+        comparison_data.add_repertoire([("d", 4)], "1")
+        comparison_data.add_repertoire([("e", 5)], "5")
+        comparison_data.build_matrix()
+
         return comparison_data
 
     def test_get_repertoire_vector(self):
@@ -89,24 +74,48 @@ class TestComparisonData(TestCase):
 
         shutil.rmtree(path)
 
-    def test_filter_existing_items(self):
+    def test_add_repertoire(self):
 
-        path = EnvironmentSettings.tmp_test_path / "comparison_rep_filter_existing/"
+        path = EnvironmentSettings.tmp_test_path / "comparison_data_add_repertoire/"
         PathBuilder.build(path)
 
         comparison_data = self.create_comparison_data(path=path)
-        unique_items = comparison_data.filter_existing_items([("f", 6), ("g", 7), ("a", 1)], "6")
 
-        self.assertEqual(2, len(unique_items))
-        self.assertTrue("f" in [unique_items[0][0], unique_items[1][0]])
-        self.assertTrue("g" in [unique_items[0][0], unique_items[1][0]])
+        self.assertEqual(5, comparison_data.item_count)
+        self.assertTrue(np.array_equal(np.array([["a", "1"], ["b", "2"], ["c", "3"], ["d", "4"], ["e", "5"]]), comparison_data.get_item_names()))
+        self.assertEqual((5, 6), comparison_data.get_matrix().shape)
+        self.assertEqual(5, comparison_data.get_matrix().nnz)
 
-        comparison_data = self.create_comparison_data(path=path)
-        comparison_data.batch_paths = comparison_data.tmp_batch_paths
-        unique_items = comparison_data.filter_existing_items([("f", 6), ("g", 7), ("a", 1), ("b", 2), ("c", 3), ("d", 4)], "6")
+        comparison_data = ComparisonData(repertoire_ids=["1", "2"], comparison_attributes=["col1"], sequence_batch_size=3, path=path)
+        comparison_data.add_repertoire([("f",), ("g",)], "1", values=[2, 3])
+        comparison_data.add_repertoire([("g",), ("h",)], "2")
+        comparison_data.build_matrix()
+
+        self.assertEqual(3, comparison_data.item_count)
+        self.assertTrue(np.array_equal([[2, 0], [3, 1], [0, 1]], comparison_data.get_matrix().toarray()))
+        self.assertTrue(np.array_equal([0, 1, 1], comparison_data.get_repertoire_vectors(["2"])["2"]))
+
+        shutil.rmtree(path)
+
+    def test_process_dataset(self):
+
+        path = EnvironmentSettings.tmp_test_path / "comparison_data_process_dataset/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build([["AAA", "CCC", "AAA"], ["CCC", "DDD"], ["EEE"], ["AAA", "EEE", "FFF"]], path)
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        matrices = []
+        for pool_size in [1, 3]:
+            comparison_data = ComparisonData(repertoire_ids=dataset.get_repertoire_ids(), comparison_attributes=["sequence_aas"],
+                                             sequence_batch_size=2, path=path / str(pool_size))
+            comparison_data.process_dataset(dataset, pool_size)
+
+            self.assertEqual(5, comparison_data.item_count)
+            self.assertTrue(np.array_equal([["AAA"], ["CCC"], ["DDD"], ["EEE"], ["FFF"]], comparison_data.get_item_names()))
+            matrices.append(comparison_data.get_matrix().toarray())
 
-        self.assertEqual(2, len(unique_items))
-        self.assertTrue("f" in [unique_items[0][0], unique_items[1][0]])
-        self.assertTrue("g" in [unique_items[0][0], unique_items[1][0]])
+        self.assertTrue(np.array_equal([[1, 0, 0, 1], [1, 1, 0, 0], [0, 1, 0, 0], [0, 0, 1, 1], [0, 0, 0, 1]], matrices[0]))
+        self.assertTrue(np.array_equal(matrices[0], matrices[1]))
 
         shutil.rmtree(path)
@@ -47,6 +47,26 @@ class TestPairwiseRepertoireComparison(TestCase):
 
         shutil.rmtree(path)
 
+    def test_compare_repertoire_blocks(self):
+
+        path = EnvironmentSettings.tmp_test_path / "pairwise_comparison_rep_blocks/"
+        PathBuilder.build(path)
+
+        dataset = self.create_dataset(path)
+        repertoire_ids = dataset.get_repertoire_ids()
+
+        comparison = PairwiseRepertoireComparison(["sequence_aas"], ["sequence_aas"], path, 4)
+
+        full_result = comparison.compare_repertoires(dataset, DistanceMetrics.jaccard)
+        result = comparison.compare_repertoire_blocks(dataset, DistanceMetrics.jaccard_matrix, row_ids=repertoire_ids,
+                                                      column_ids=repertoire_ids[1:4], block_size=2)
+
+        self.assertEqual(repertoire_ids, list(result.index))
+        self.assertEqual(repertoire_ids[1:4], list(result.columns))
+        self.assertTrue(np.allclose(full_result.loc[repertoire_ids, repertoire_ids[1:4]].values, result.values))
+
+        shutil.rmtree(path)
+
     def test_comparison_data_io(self):
         path = EnvironmentSettings.tmp_test_path / "comparison_data_io/"
         PathBuilder.build(path)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+import numpy as np
+from scipy import sparse
+
+from immuneML.util import DistanceMetrics
+
+
+class TestDistanceMetrics(TestCase):
+
+    def test_jaccard_matrix(self):
+        matrix = np.array([[1, 0, 2, 0], [1, 1, 0, 0], [0, 1, 1, 0], [0, 0, 1, 0]])
+
+        result = DistanceMetrics.jaccard_matrix(sparse.csc_matrix(matrix), sparse.csc_matrix(matrix[:, [1, 3]]))
+
+        self.assertEqual((4, 2), result.shape)
+        for index1 in range(4):
+            for index2, column in enumerate([1, 3]):
+                if index1 != 3 or column != 3:
+                    self.assertAlmostEqual(DistanceMetrics.jaccard(matrix[:, index1], matrix[:, column]), result[index1, index2])
+        self.assertTrue(np.isnan(result[3, 1]))
+
+    def test_morisita_horn_matrix(self):
+        matrix = np.array([[5, 0, 2, 3], [1, 4, 0, 1], [0, 2, 7, 0], [3, 0, 1, 2]])
+
+        result = DistanceMetrics.morisita_horn_matrix(sparse.csc_matrix(matrix), sparse.csc_matrix(matrix))
+
+        self.assertEqual((4, 4), result.shape)
+        for index1 in range(4):
+            for index2 in range(4):
+                self.assertAlmostEqual(DistanceMetrics.morisita_horn(matrix[:, index1], matrix[:, index2]), result[index1, index2])
+        self.assertTrue(np.allclose(1, np.diag(result)))
@@ -2,7 +2,10 @@ import os
 import shutil
 from unittest import TestCase
 
+import numpy as np
+
 from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.ColumnarStorage import ColumnarStorage
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.environment.Constants import Constants
@@ -32,6 +35,41 @@ class TestKmerHelper(TestCase):
         kmers = KmerHelper.create_kmers_from_sequence(ReceptorSequence(amino_acid_sequence="AB"), 3)
         self.assertTrue(len(kmers) == 0)
 
+    def test_count_kmers_in_buffer(self):
+        buffer, offsets = ColumnarStorage.encode_strings(["ABCAB", "AB", "CABC"])
+
+        kmers = KmerHelper.count_kmers_in_buffer(buffer, offsets, 3)
+        self.assertDictEqual({"ABC": 2, "BCA": 1, "CAB": 2}, kmers)
+
+        kmers = KmerHelper.count_kmers_in_buffer(buffer, offsets, 3, weights=np.array([2, 5, 10]))
+        self.assertDictEqual({"ABC": 12, "BCA": 2, "CAB": 12}, kmers)
+
+        kmers = KmerHelper.count_kmers_in_buffer(buffer, offsets, 3, weights=np.array([0.5, 1., 0.25]))
+        self.assertDictEqual({"ABC": 0.75, "BCA": 0.5, "CAB": 0.75}, kmers)
+
+        self.assertDictEqual({}, KmerHelper.count_kmers_in_buffer(buffer, offsets, 6))
+
+    def test_count_gapped_and_IMGT_kmers_in_buffer(self):
+        sequences = ["CASSRYUF", "CAS", "CASSPRERATYEQCAY"]
+        buffer, offsets = ColumnarStorage.encode_strings(sequences)
+        weights = np.array([3, 1, 2])
+
+        expected = {}
+        for sequence, weight in zip(sequences[::2], weights[::2]):
+            for kmer in KmerHelper.create_IMGT_gapped_kmers_from_sequence(ReceptorSequence(sequence), 2, 1, 1, 1):
+                expected[kmer] = expected.get(kmer, 0) + weight
+        self.assertDictEqual(expected, KmerHelper.count_IMGT_gapped_kmers_in_buffer(buffer, offsets, 2, 1, 1, 1, weights))
+
+        kmers = KmerHelper.count_gapped_kmers_in_buffer(buffer, offsets, 2, 1, 1, 1)
+        self.assertEqual(2, kmers["CA.S"])
+        self.assertEqual(1, kmers["RY.F"])
+        self.assertTrue("CAS" not in kmers)
+
+        kmers = KmerHelper.count_IMGT_kmers_in_buffer(buffer, offsets, 3)
+        self.assertEqual(3, kmers[("CAS", 105)])
+        self.assertEqual(1, kmers[("RAT", 111.001)])
+        self.assertEqual(1, kmers[("YEQ", 112)])
+
     def test_create_sentences_from_repertoire(self):
 
         path = EnvironmentSettings.tmp_test_path / "kmer/"
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from immuneML.encodings.DatasetEncoder import DatasetEncoder
+from immuneML.ml_methods.MLMethod import MLMethod
+from immuneML.util.LazySubclassNames import LazySubclassNames
+from immuneML.util.ReflectionHandler import ReflectionHandler
+
+
+class TestLazySubclassNames(TestCase):
+
+    def test_contains(self):
+        names = LazySubclassNames(DatasetEncoder, "Encoder", "encodings")
+
+        self.assertTrue("Distance" in names)
+        self.assertIsNone(names._names)
+
+        self.assertFalse("KmerFrequency" in names)
+        self.assertFalse("DatasetEncoder" in names)
+        self.assertFalse("Dataset" in names)
+        self.assertFalse("RandomName" in names)
+        self.assertIsNotNone(names._names)
+
+        self.assertFalse("MLMethod" in LazySubclassNames(MLMethod, "", "ml_methods/"))
+
+    def test_get_names(self):
+        names = LazySubclassNames(MLMethod, "", "ml_methods/")
+        expected = ReflectionHandler.all_nonabstract_subclass_basic_names(MLMethod, "", "ml_methods/")
+
+        self.assertEqual(len(expected), len(names))
+        self.assertListEqual(expected, list(names))
+        self.assertEqual(str(expected), str(names))
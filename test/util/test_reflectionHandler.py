@@ -34,4 +34,11 @@ class TestReflectionHandler(TestCase):
 
     def test_get_classes_by_partial_name(self):
         classes = ReflectionHandler.get_classes_by_partial_name("Implanting", "simulation/signal_implanting_strategy/")
-        self.assertSetEqual({HealthySequenceImplanting, ReceptorImplanting, FullSequenceImplanting}, set(classes))
\ No newline at end of file
+        self.assertSetEqual({HealthySequenceImplanting, ReceptorImplanting, FullSequenceImplanting}, set(classes))
+
+    def test_get_file_registry(self):
+        registry = ReflectionHandler.get_file_registry()
+
+        self.assertEqual([EnvironmentSettings.root_path / "immuneML/util/KmerHelper.py"], registry["KmerHelper"])
+        self.assertTrue(registry is ReflectionHandler.get_file_registry())
+        self.assertTrue(all(path.suffix == ".py" for paths in registry.values() for path in paths))
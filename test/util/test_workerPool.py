@@ -0,0 +1,97 @@
+import os
+from functools import partial
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.WorkerPool import WorkerPool
+
+
+def multiply(item, factor):
+    return item * factor
+
+
+def get_environment_variable(item, name):
+    return os.environ.get(name, None), item
+
+
+def make_row(item, length):
+    return np.full(length, item, dtype=float), str(item)
+
+
+def get_job_id(item):
+    return WorkerPool._job[0]
+
+
+def get_max_sequence_length(item):
+    return EnvironmentSettings.max_sequence_length
+
+
+class TestWorkerPool(TestCase):
+
+    def test_map(self):
+        for processes in [1, 2]:
+            self.assertEqual([0, 3, 6, 9, 12], WorkerPool.map(partial(multiply, factor=3), range(5), processes))
+            self.assertEqual([0, 3, 6, 9, 12], list(WorkerPool.imap(partial(multiply, factor=3), range(5), processes, chunksize=2)))
+
+        pool = WorkerPool.get_pool(2)
+        self.assertEqual([0, 2], WorkerPool.map(partial(multiply, factor=2), range(2), 2))
+        self.assertIs(pool, WorkerPool.get_pool(2))
+
+        os.environ["immuneML_worker_pool_test"] = "value"
+        self.assertEqual([("value", 0), ("value", 1)], WorkerPool.map(partial(get_environment_variable, name="immuneML_worker_pool_test"),
+                                                                    range(2), 2))
+        del os.environ["immuneML_worker_pool_test"]
+
+        WorkerPool.shutdown()
+        self.assertEqual(0, len(WorkerPool._pools))
+
+    def test_map_to_array(self):
+        for processes in [1, 2]:
+            array, results = WorkerPool.map_to_array(partial(make_row, length=3), range(4), processes, shape=(3,), dtype=float)
+
+            self.assertEqual((4, 3), array.shape)
+            self.assertTrue(np.array_equal(np.repeat(np.arange(4), 3).reshape(4, 3), array))
+            self.assertEqual(["0", "1", "2", "3"], results)
+
+        WorkerPool.shutdown()
+
+    def test_imap_stopped_early(self):
+        results = WorkerPool.imap(partial(multiply, factor=2), range(20), 2)
+        self.assertEqual(0, next(results))
+        results.close()
+
+        self.assertEqual([0, 2, 4], WorkerPool.map(partial(multiply, factor=2), range(3), 2))
+
+        WorkerPool.shutdown()
+
+    def test_job_replaced(self):
+        first_ids = set(WorkerPool.map(get_job_id, range(6), 2))
+        second_ids = set(WorkerPool.map(get_job_id, range(6), 2))
+
+        self.assertEqual(1, len(first_ids))
+        self.assertEqual(1, len(second_ids))
+        self.assertNotEqual(first_ids, second_ids)
+
+        WorkerPool.shutdown()
+
+    def test_interleaved_imap(self):
+        first = WorkerPool.imap(partial(multiply, factor=2), range(10), 2)
+        second = WorkerPool.imap(partial(multiply, factor=3), range(10), 2)
+
+        results = [(next(first), next(second)) for _ in range(10)]
+        self.assertEqual([(index * 2, index * 3) for index in range(10)], results)
+
+        WorkerPool.shutdown()
+
+    def test_settings_taken_over(self):
+        WorkerPool.get_pool(2)
+        max_sequence_length = EnvironmentSettings.max_sequence_length
+        EnvironmentSettings.max_sequence_length = max_sequence_length + 5
+        try:
+            self.assertEqual([max_sequence_length + 5] * 2, WorkerPool.map(get_max_sequence_length, range(2), 2))
+        finally:
+            EnvironmentSettings.max_sequence_length = max_sequence_length
+
+        WorkerPool.shutdown()
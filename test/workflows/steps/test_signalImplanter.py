@@ -2,6 +2,8 @@ import os
 import shutil
 from unittest import TestCase
 
+import numpy as np
+
 from immuneML.caching.CacheType import CacheType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
@@ -74,6 +76,37 @@ class TestSignalImplanter(TestCase):
 
         shutil.rmtree(path)
 
+    def test_run_in_parallel(self):
+
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "signalImplanter_parallel/")
+
+        dataset = RandomDatasetGenerator.generate_repertoire_dataset(6, {20: 1}, {10: 1}, {}, path / "dataset/")
+        m1 = Motif(identifier="m1", instantiation=GappedKmerInstantiation(), seed="CAS")
+        s1 = Signal(identifier="s1", motifs=[m1], implanting_strategy=HealthySequenceImplanting(GappedMotifImplanting(), implanting_computation=ImplantingComputation.ROUND))
+        s2 = Signal(identifier="s2", motifs=[m1], implanting_strategy=HealthySequenceImplanting(GappedMotifImplanting(), implanting_computation=ImplantingComputation.ROUND))
+        simulation = Simulation([Implanting(dataset_implanting_rate=0.5, repertoire_implanting_rate=0.5, signals=[s1, s2], name="i1")])
+
+        sequences = []
+        for number_of_processes, batch_size in [(1, 1), (3, 2)]:
+            np.random.seed(1)
+            state = SimulationState(dataset=dataset, result_path=path / f"result_{number_of_processes}/", simulation=simulation, signals=[s1, s2],
+                                    number_of_processes=number_of_processes, batch_size=batch_size)
+            new_dataset = SignalImplanter.run(state)
+            sequences.append([list(repertoire.get_sequence_aas()) for repertoire in new_dataset.get_data()])
+
+            for index, repertoire in enumerate(new_dataset.get_data()):
+                self.assertEqual(index < 3, repertoire.metadata["s1"])
+                if index < 3:
+                    implants = repertoire.get_attributes(["s1", "s2"])
+                    self.assertEqual(10, sum(implant is not None for implant in implants["s1"]))
+                    self.assertEqual(10, sum(implant is not None for implant in implants["s2"]))
+                    self.assertFalse(any(implant1 is not None and implant2 is not None
+                                         for implant1, implant2 in zip(implants["s1"], implants["s2"])))
+
+        self.assertEqual(sequences[0], sequences[1])
+
+        shutil.rmtree(path)
+
     def test_run_with_receptors(self):
 
         path = PathBuilder.build(EnvironmentSettings.root_path / "test/tmp/signalImplanter_receptor/")